@@ -32,6 +32,88 @@ def project_check_config(directory):
     cli_message("<green>Your config file appears valid!</green>")
 
 
+@project.command(name="rebuild-store-indexes")
+@click.option(
+    "--directory",
+    "-d",
+    default="./great_expectations",
+    help="The project's great_expectations directory.",
+)
+def project_rebuild_store_indexes(directory):
+    """Rebuild the key indexes of the stores of a project from their files."""
+    try:
+        context = DataContext(context_root_dir=directory)
+    except ge_exceptions.GreatExpectationsError as err:
+        cli_message("<red>{}</red>".format(err.message))
+        sys.exit(1)
+
+    rebuilt_key_counts = rebuild_store_indexes(context)
+    if len(rebuilt_key_counts) == 0:
+        cli_message("None of the stores of this project have a key index.")
+        return
+    for store_name, key_count in rebuilt_key_counts.items():
+        cli_message("Rebuilt the key index of store <green>{}</green> ({} keys)".format(store_name, key_count))
+
+
+def rebuild_store_indexes(context):
+    """Rebuild the key index of every store of a context that has one.
+
+    Returns:
+        a dict of the number of indexed keys by store name
+    """
+    rebuilt_key_counts = {}
+    for store_name in sorted(context.stores.keys()):
+        store_backend = getattr(context.stores[store_name], "store_backend", None)
+        if getattr(store_backend, "key_index", None) is not None:
+            rebuilt_key_counts[store_name] = store_backend.rebuild_key_index()
+    return rebuilt_key_counts
+
+
+@project.command(name="apply-retention-policies")
+@click.option(
+    "--directory",
+    "-d",
+    default="./great_expectations",
+    help="The project's great_expectations directory.",
+)
+@click.option(
+    "--store",
+    "-s",
+    "store_names",
+    multiple=True,
+    help="The name of a store whose retention policy to apply (may be repeated). Defaults to all the stores that "
+         "have a retention_policy.",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    default=False,
+    help="Only report what would be removed, archived or downsampled.",
+)
+def project_apply_retention_policies(directory, store_names, dry_run):
+    """Remove, archive or downsample the results and metrics of old runs, as configured by the retention_policy of
+    the stores of a project."""
+    try:
+        context = DataContext(context_root_dir=directory)
+        reports = context.apply_retention_policies(store_names=list(store_names) or None, dry_run=dry_run)
+    except ge_exceptions.GreatExpectationsError as err:
+        cli_message("<red>{}</red>".format(err.message))
+        sys.exit(1)
+
+    if len(reports) == 0:
+        cli_message("None of the stores of this project have a retention policy.")
+        return
+    for store_name, report in reports.items():
+        counts = ", ".join(
+            "{} {}".format(len(report[report_key]), report_key.replace("_keys", ""))
+            for report_key in ["removed_keys", "archived_keys", "downsampled_keys"] if report_key in report
+        )
+        if dry_run:
+            cli_message("Store <green>{}</green> would have: {}".format(store_name, counts))
+        else:
+            cli_message("Applied the retention policy of store <green>{}</green>: {}".format(store_name, counts))
+
+
 def do_config_check(target_directory):
     try:
         DataContext(context_root_dir=target_directory)
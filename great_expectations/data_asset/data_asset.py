@@ -8,6 +8,7 @@ import traceback
 import warnings
 import logging
 import datetime
+from contextlib import contextmanager
 
 from marshmallow import ValidationError
 from six import PY3, string_types
@@ -222,11 +223,13 @@ class DataAsset(object):
                 raised_exception = False
                 exception_traceback = None
                 exception_message = None
+                evaluation_meta = {}
 
                 # Finally, execute the expectation method itself
                 if self._config.get("interactive_evaluation", True) or self._active_validation:
                     try:
-                        return_obj = func(self, **evaluation_args)
+                        with self._expectation_evaluation_scope(expectation_config, evaluation_meta):
+                            return_obj = func(self, **evaluation_args)
                         if isinstance(return_obj, dict):
                             return_obj = ExpectationValidationResult(**return_obj)
 
@@ -271,6 +274,8 @@ class DataAsset(object):
                 # Add meta to return object
                 if meta is not None:
                     return_obj.meta = meta
+                if evaluation_meta:
+                    return_obj.meta = dict(return_obj.meta, **evaluation_meta)
 
                 return_obj = recursively_convert_to_json_serializable(
                     return_obj)
@@ -284,6 +289,15 @@ class DataAsset(object):
 
         return outer_wrapper
 
+    @contextmanager
+    def _expectation_evaluation_scope(self, expectation_config, evaluation_meta):
+        """Context in which an expectation is evaluated.
+
+        Subclasses can override it to gather information about the evaluation of the expectation; anything added to
+        the evaluation_meta dictionary is added to the meta of the expectation's result.
+        """
+        yield
+
     def _initialize_expectations(self, expectation_suite=None, expectation_suite_name=None):
         """Instantiates `_expectation_suite` as empty by default or with a specified expectation `config`.
         In addition, this always sets the `default_expectation_args` to:
@@ -7,8 +7,11 @@ import logging
 import os
 import shutil
 import sys
+import threading
 import warnings
 import webbrowser
+from multiprocessing import Pool
+from multiprocessing.pool import ThreadPool
 
 from marshmallow import ValidationError
 from ruamel.yaml import YAML, YAMLError
@@ -27,6 +30,7 @@ from great_expectations.data_context.util import (
     substitute_config_variable,
 )
 from great_expectations.dataset import Dataset
+from great_expectations.datasource import PandasDatasource
 from great_expectations.profile.basic_dataset_profiler import (
     BasicDatasetProfiler,
 )
@@ -66,6 +70,36 @@ logger = logging.getLogger(__name__)
 yaml = YAML()
 yaml.indent(mapping=2, sequence=4, offset=2)
 yaml.default_flow_style = False
+# The YAML instance is not thread-safe, and the config variables are read by every validation, including those run
+# concurrently by the column workers of a profiler
+_yaml_load_lock = threading.Lock()
+
+# DataContext used by the data asset profiling worker in each process of a profiling process pool
+_profiling_process_context = None
+
+
+def _initialize_profiling_process(context_root_dir):
+    global _profiling_process_context
+    _profiling_process_context = DataContext(context_root_dir)
+
+
+def _profile_data_asset_in_process(args):
+    name, profile_data_asset_kwargs = args
+    # The parent process saves the expectation suite and validation results, since stores configured in memory are
+    # not shared with the worker processes
+    profile_data_asset_kwargs = dict(profile_data_asset_kwargs, save_results=False)
+    return _profile_data_asset_capturing_errors(_profiling_process_context, name, profile_data_asset_kwargs)
+
+
+def _profile_data_asset_capturing_errors(context, name, profile_data_asset_kwargs):
+    """Profile one data asset, returning a (name, (expectation_suite, validation_results), error) tuple so that
+    errors raised in a worker can be handled by the caller in data asset order."""
+    logger.info("\tProfiling '%s'..." % name)
+    try:
+        result = context.profile_data_asset(data_asset_name=name, **profile_data_asset_kwargs)["results"][0]
+        return name, result, None
+    except Exception as err:
+        return name, None, err
 
 
 class BaseDataContext(object):
@@ -336,14 +370,15 @@ class BaseDataContext(object):
             try:
                 with open(os.path.join(self.root_directory,
                                        substitute_config_variable(config_variables_file_path, {})),
-                          "r") as config_variables_file:
+                          "r") as config_variables_file, _yaml_load_lock:
                     return yaml.load(config_variables_file) or {}
             except IOError as e:
                 if e.errno != errno.ENOENT:
                     raise
                 logger.debug("Generating empty config variables file.")
                 # TODO this might be the comment problem?
-                base_config_variables_store = yaml.load("{}")
+                with _yaml_load_lock:
+                    base_config_variables_store = yaml.load("{}")
                 base_config_variables_store.yaml_set_start_comment(CONFIG_VARIABLES_INTRO)
                 return base_config_variables_store
         else:
@@ -746,6 +781,7 @@ class BaseDataContext(object):
         expectation_suite_name = validation_results.meta["expectation_suite_name"]
         run_id = validation_results.meta["run_id"]
 
+        metric_items = []
         for expectation_suite_dependency, metrics_list in requested_metrics.items():
             if (expectation_suite_dependency != "*") and (expectation_suite_dependency != expectation_suite_name):
                 continue
@@ -759,7 +795,7 @@ class BaseDataContext(object):
                 for metric_name, metric_kwargs in metric_configurations:
                     try:
                         metric_value = validation_results.get_metric(metric_name, **metric_kwargs)
-                        self.stores[target_store_name].set(
+                        metric_items.append((
                             ValidationMetricIdentifier(
                                 run_id=run_id,
                                 expectation_suite_identifier=ExpectationSuiteIdentifier(expectation_suite_name),
@@ -767,12 +803,14 @@ class BaseDataContext(object):
                                 metric_kwargs_id=get_metric_kwargs_id(metric_name, metric_kwargs)
                             ),
                             metric_value
-                        )
+                        ))
                     except ge_exceptions.UnavailableMetricError:
                         # This will happen frequently in larger pipelines
                         logger.debug("metric {} was requested by another expectation suite but is not available in "
                                      "this validation result.".format(metric_name))
 
+        self.stores[target_store_name].set_many(metric_items)
+
     def store_validation_result_metrics(self, requested_metrics, validation_results, target_store_name):
         self._store_metrics(requested_metrics, validation_results, target_store_name)
 
@@ -801,6 +839,36 @@ class BaseDataContext(object):
     def validations_store(self):
         return self.stores[self.validations_store_name]
 
+    def apply_retention_policies(self, store_names=None, dry_run=False):
+        """Apply the retention policies of stores, removing (and archiving or downsampling) the results and metrics
+        of old runs.
+
+        Args:
+            store_names: the names of the stores whose retention policies to apply; by default, all the stores that
+                have a retention_policy in their configuration
+            dry_run: only report what would be removed, archived or downsampled, without changing the stores
+
+        Returns:
+            a dict of the report of each store by store name: a dict of the lists of removed keys ("removed_keys")
+            and of archived ("archived_keys") or downsampled ("downsampled_keys") keys
+        """
+        if store_names is None:
+            store_names = [
+                store_name for store_name, store in self.stores.items()
+                if getattr(store, "retention_policy", None) is not None
+            ]
+        reports = {}
+        for store_name in sorted(store_names):
+            try:
+                store = self.stores[store_name]
+            except KeyError:
+                raise ge_exceptions.DataContextError("Unable to find store {} in your DataContext configuration."
+                                                     .format(store_name))
+            if getattr(store, "retention_policy", None) is None:
+                raise ge_exceptions.DataContextError("Store {} has no retention_policy.".format(store_name))
+            reports[store_name] = store.apply_retention_policy(dry_run=dry_run)
+        return reports
+
     def _compile_evaluation_parameter_dependencies(self):
         self._evaluation_parameter_dependencies = {}
         for key in self.stores[self.expectations_store_name].list_keys():
@@ -837,30 +905,20 @@ class BaseDataContext(object):
         selected_store = self.stores[validations_store_name]
 
         if run_id is None or batch_identifier is None:
-            #Get most recent run id
-            # NOTE : This method requires a (potentially very inefficient) list_keys call.
-            # It should probably move to live in an appropriate Store class,
-            # but when we do so, that Store will need to function as more than just a key-value Store.
-            key_list = selected_store.list_keys()
-            filtered_key_list = []
-            for key in key_list:
-                if run_id is not None and key.run_id != run_id:
-                    continue
-                if batch_identifier is not None and key.batch_identifier != batch_identifier:
-                    continue
-                filtered_key_list.append(key)
-
-            # run_id_set = set([key.run_id for key in filtered_key_list])
-            if len(filtered_key_list) == 0:
+            # Get the most recent run of the suite (and batch) from the store
+            run_keys = selected_store.list_run_keys(
+                expectation_suite_name,
+                batch_identifier=batch_identifier,
+                start_run_id=run_id,
+                end_run_id=run_id,
+                limit=1
+            )
+            if len(run_keys) == 0:
                 logger.warning("No valid run_id values found.")
                 return {}
 
-            filtered_key_list = sorted(filtered_key_list, key=lambda x: x.run_id)
-
-            if run_id is None:
-                run_id = filtered_key_list[-1].run_id
-            if batch_identifier is None:
-                batch_identifier = filtered_key_list[-1].batch_identifier
+            run_id = run_keys[0].run_id
+            batch_identifier = run_keys[0].batch_identifier
 
         key = ValidationResultIdentifier(
                 expectation_suite_identifier=ExpectationSuiteIdentifier(
@@ -955,7 +1013,10 @@ class BaseDataContext(object):
                            profiler=BasicDatasetProfiler,
                            dry_run=False,
                            run_id="profiling",
-                           additional_batch_kwargs=None):
+                           additional_batch_kwargs=None,
+                           sample=None,
+                           max_workers=1,
+                           max_column_workers=None):
         """Profile the named datasource using the named profiler.
 
         Args:
@@ -968,6 +1029,12 @@ class BaseDataContext(object):
             profiler: the profiler class to use
             dry_run: when true, the method checks arguments and reports if can profile or specifies the arguments that are missing
             additional_batch_kwargs: Additional keyword arguments to be provided to get_batch when loading the data asset.
+            sample: optional - profile a random sample of each data asset instead of all of its rows; either an int row
+                limit, a float fraction of rows, or a dict with "n" or "fraction" and an optional "seed"
+            max_workers: the number of data assets to profile concurrently; this also caps the number of batches
+                loaded at once. Pandas data assets are profiled in separate processes when the context has a root
+                directory; other data assets are profiled on threads.
+            max_column_workers: the number of columns of each data asset to validate concurrently
         Returns:
             A dictionary::
 
@@ -1090,30 +1157,38 @@ class BaseDataContext(object):
             total_columns, total_expectations, total_rows, skipped_data_assets = 0, 0, 0, 0
             total_start_time = datetime.datetime.now()
 
-            for name in data_asset_names_to_profiled:
-                logger.info("\tProfiling '%s'..." % name)
-                try:
-                    profiling_results['results'].append(
-                        self.profile_data_asset(
-                            datasource_name=datasource_name,
-                            generator_name=generator_name,
-                            data_asset_name=name,
-                            profiler=profiler,
-                            run_id=run_id,
-                            additional_batch_kwargs=additional_batch_kwargs
-                        )["results"][0]
-                    )
-
-                except ge_exceptions.ProfilerError as err:
+            profile_data_asset_kwargs = {
+                "datasource_name": datasource_name,
+                "generator_name": generator_name,
+                "profiler": profiler,
+                "run_id": run_id,
+                "additional_batch_kwargs": additional_batch_kwargs,
+                "sample": sample,
+                "max_column_workers": max_column_workers
+            }
+            profiled_data_assets = self._profile_data_assets(
+                data_asset_names_to_profiled,
+                profile_data_asset_kwargs,
+                max_workers=max_workers,
+                use_processes=isinstance(datasource, PandasDatasource)
+            )
+            for i, (name, result, err) in enumerate(profiled_data_assets):
+                if err is None:
+                    profiling_results['results'].append(result)
+                    logger.info("\tProfiled '%s' (%d of %d data assets)" % (
+                        name, i + 1, len(data_asset_names_to_profiled)))
+                elif isinstance(err, ge_exceptions.ProfilerError):
                     logger.warning(err.message)
-                except IOError as err:
+                elif isinstance(err, IOError):
                     logger.warning("IOError while profiling %s. (Perhaps a loading error?) Skipping." % name[1])
                     logger.debug(str(err))
                     skipped_data_assets += 1
-                except SQLAlchemyError as e:
+                elif isinstance(err, SQLAlchemyError):
                     logger.warning("SqlAlchemyError while profiling %s. Skipping." % name[1])
-                    logger.debug(str(e))
+                    logger.debug(str(err))
                     skipped_data_assets += 1
+                else:
+                    raise err
 
             total_duration = (datetime.datetime.now() - total_start_time).total_seconds()
             logger.info("""
@@ -1132,6 +1207,47 @@ class BaseDataContext(object):
         profiling_results['success'] = True
         return profiling_results
 
+    def _profile_data_assets(self, data_asset_names, profile_data_asset_kwargs, max_workers=1, use_processes=False):
+        """Profile data assets on a pool of up to max_workers threads or processes.
+
+        Yields (name, (expectation_suite, validation_results), error) tuples in the order of data_asset_names. Each
+        worker profiles one data asset at a time, so at most max_workers batches are loaded at once.
+        """
+        if max_workers is None or max_workers <= 1 or len(data_asset_names) <= 1:
+            for name in data_asset_names:
+                yield _profile_data_asset_capturing_errors(self, name, profile_data_asset_kwargs)
+            return
+
+        max_workers = min(max_workers, len(data_asset_names))
+        if use_processes and isinstance(self, DataContext):
+            logger.info("Profiling %d data assets on %d processes" % (len(data_asset_names), max_workers))
+            pool = Pool(max_workers, initializer=_initialize_profiling_process, initargs=(self.root_directory,))
+            profiled_data_assets = pool.imap(
+                _profile_data_asset_in_process,
+                [(name, profile_data_asset_kwargs) for name in data_asset_names]
+            )
+        else:
+            logger.info("Profiling %d data assets on %d threads" % (len(data_asset_names), max_workers))
+            pool = ThreadPool(max_workers)
+            profiled_data_assets = pool.imap(
+                lambda name: _profile_data_asset_capturing_errors(self, name, profile_data_asset_kwargs),
+                data_asset_names
+            )
+
+        try:
+            for name, result, err in profiled_data_assets:
+                if result is not None and not isinstance(pool, ThreadPool):
+                    expectation_suite, validation_results = result
+                    self.save_expectation_suite(expectation_suite)
+                    self.validations_store.set(
+                        key=ValidationResultIdentifier.from_object(validation_results),
+                        value=validation_results
+                    )
+                yield name, result, err
+        finally:
+            pool.close()
+            pool.join()
+
     def profile_data_asset(self,
                            datasource_name,
                            generator_name=None,
@@ -1140,7 +1256,10 @@ class BaseDataContext(object):
                            expectation_suite_name=None,
                            profiler=BasicDatasetProfiler,
                            run_id="profiling",
-                           additional_batch_kwargs=None):
+                           additional_batch_kwargs=None,
+                           sample=None,
+                           max_column_workers=None,
+                           save_results=True):
         """
         Profile a data asset
 
@@ -1151,6 +1270,11 @@ class BaseDataContext(object):
         :param profiler: the profiler class to use
         :param run_id: optional - if set, the validation result created by the profiler will be under the provided run_id
         :param additional_batch_kwargs:
+        :param sample: optional - profile a random sample of the batch instead of all of its rows; either an int row
+            limit, a float fraction of rows, or a dict with "n" or "fraction" and an optional "seed"
+        :param max_column_workers: optional - the number of columns to validate concurrently
+        :param save_results: optional - if False, the expectation suite and validation results are returned without
+            being saved to the stores of the data context
         :returns
             A dictionary::
 
@@ -1206,14 +1330,17 @@ class BaseDataContext(object):
                 expectation_suite_name = datasource_name + "." + generator_name + "." + data_asset_name + "." + \
                                          profiler.__name__
 
-        self.create_expectation_suite(
-            expectation_suite_name=expectation_suite_name,
-            overwrite_existing=True
-        )
+        if save_results:
+            expectation_suite = self.create_expectation_suite(
+                expectation_suite_name=expectation_suite_name,
+                overwrite_existing=True
+            )
+        else:
+            expectation_suite = ExpectationSuite(expectation_suite_name=expectation_suite_name)
 
         # TODO: Add batch_parameters
         batch = self.get_batch(
-            expectation_suite_name=expectation_suite_name,
+            expectation_suite_name=expectation_suite,
             batch_kwargs=batch_kwargs,
         )
 
@@ -1224,19 +1351,22 @@ class BaseDataContext(object):
 
         # Note: This logic is specific to DatasetProfilers, which profile a single batch. Multi-batch profilers
         # will have more to unpack.
-        expectation_suite, validation_results = profiler.profile(batch, run_id=run_id)
+        expectation_suite, validation_results = profiler.profile(
+            batch, run_id=run_id, sample=sample, max_workers=max_column_workers
+        )
         profiling_results['results'].append((expectation_suite, validation_results))
 
-        self.validations_store.set(
-            key=ValidationResultIdentifier(
-                expectation_suite_identifier=ExpectationSuiteIdentifier(
-                    expectation_suite_name=expectation_suite_name
+        if save_results:
+            self.validations_store.set(
+                key=ValidationResultIdentifier(
+                    expectation_suite_identifier=ExpectationSuiteIdentifier(
+                        expectation_suite_name=expectation_suite_name
+                    ),
+                    run_id=run_id,
+                    batch_identifier=batch.batch_id
                 ),
-                run_id=run_id,
-                batch_identifier=batch.batch_id
-            ),
-            value=validation_results
-        )
+                value=validation_results
+            )
 
         if isinstance(batch, Dataset):
             # For datasets, we can produce some more detailed statistics
@@ -1248,7 +1378,8 @@ class BaseDataContext(object):
         new_expectation_count = len(expectation_suite.expectations)
         total_expectations += new_expectation_count
 
-        self.save_expectation_suite(expectation_suite)
+        if save_results:
+            self.save_expectation_suite(expectation_suite)
         duration = (datetime.datetime.now() - start_time).total_seconds()
         logger.info("\tProfiled %d columns using %d rows from %s (%.3f sec)" %
                     (new_column_count, row_count, name, duration))
@@ -1669,12 +1800,14 @@ def _get_metric_configuration_tuples(metric_configuration, base_kwargs=None):
                                                in metric_configuration[kwarg_name][metric_kwargs_id]]
         else:
             for kwarg_value in metric_configuration[kwarg_name].keys():
-                base_kwargs.update({kwarg_name: kwarg_value})
+                # Each value gets its own kwargs so that sibling values do not overwrite each other
+                metric_kwargs = dict(base_kwargs)
+                metric_kwargs.update({kwarg_name: kwarg_value})
                 if not isinstance(metric_configuration[kwarg_name][kwarg_value], list):
                     raise ge_exceptions.DataContextError("Invalid metric_configuration: each value must contain a "
                                                          "list.")
                 for nested_configuration in metric_configuration[kwarg_name][kwarg_value]:
                     metric_configurations_list += _get_metric_configuration_tuples(nested_configuration,
-                                                                                   base_kwargs=base_kwargs)
+                                                                                   base_kwargs=metric_kwargs)
 
     return metric_configurations_list
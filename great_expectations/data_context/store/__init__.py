@@ -3,6 +3,7 @@ from .validations_store import ValidationsStore
 from .expectations_store import ExpectationsStore
 from .html_site_store import HtmlSiteStore
 from .metric_store import MetricStore, EvaluationParameterStore
+from .retention import RetentionPolicy
 
 from .store_backend import StoreBackend, InMemoryStoreBackend
 from .tuple_store_backend import (
@@ -11,3 +12,4 @@ from .tuple_store_backend import (
     TupleGCSStoreBackend
 )
 from .database_store_backend import DatabaseStoreBackend
+from .caching_store_backend import CachingStoreBackend
@@ -0,0 +1,208 @@
+import threading
+import time
+from collections import OrderedDict
+
+from great_expectations.data_context.store.store_backend import StoreBackend
+from great_expectations.data_context.util import instantiate_class_from_config
+from great_expectations.exceptions import DataContextError
+
+
+class CachingStoreBackend(StoreBackend):
+    """A read-through cache of the values of another store backend.
+
+    Values read with get (or get_many) are kept in a least recently used cache of at most max_size values. A cached
+    value is served until it is older than ttl seconds (if ttl is set), until it is set through this backend, or, if
+    validate is True, until the version of the value in the wrapped backend changes: the modification time and size
+    of a file for a TupleFilesystemStoreBackend, or the ETag of an object for a TupleS3StoreBackend and
+    TupleGCSStoreBackend. Checking the version of a value is much cheaper than reading and deserializing it. Other
+    backends do not report versions, so their cached values are only refreshed by the ttl or by a set through this
+    backend.
+
+    A cache is usually configured with the cache key of the store_backend of a store in great_expectations.yml:
+
+        expectations_store:
+          class_name: ExpectationsStore
+          store_backend:
+            class_name: TupleFilesystemStoreBackend
+            base_directory: expectations/
+            cache:
+              max_size: 256
+              ttl: 600
+    """
+
+    def __init__(self, store_backend, max_size=128, ttl=None, validate=True, runtime_environment=None):
+        if isinstance(store_backend, dict):
+            store_backend = instantiate_class_from_config(
+                config=store_backend,
+                runtime_environment=runtime_environment or {},
+                config_defaults={
+                    "module_name": "great_expectations.data_context.store"
+                }
+            )
+        if not isinstance(store_backend, StoreBackend):
+            raise DataContextError("Invalid StoreBackend configuration: expected a StoreBackend instance.")
+        super(CachingStoreBackend, self).__init__(fixed_length_key=store_backend.fixed_length_key)
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self._store_backend = store_backend
+        self._max_size = max_size
+        self._ttl = ttl
+        self._validate = validate
+        # key and get options -> (value, version, time cached)
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def store_backend(self):
+        return self._store_backend
+
+    @property
+    def key_index(self):
+        return getattr(self._store_backend, "key_index", None)
+
+    @property
+    def cache_info(self):
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "size": len(self._cache),
+                "max_size": self._max_size,
+            }
+
+    def clear_cache(self):
+        with self._lock:
+            self._cache.clear()
+
+    def rebuild_key_index(self):
+        self.clear_cache()
+        return self._store_backend.rebuild_key_index()
+
+    def _validate_key(self, key):
+        self._store_backend._validate_key(key)
+
+    def _validate_value(self, value):
+        self._store_backend._validate_value(value)
+
+    def _get_version(self, key):
+        if not self._validate:
+            return None
+        return self._store_backend.get_value_version(key)
+
+    def _get_cached(self, cache_key, version):
+        """Returns the cached entry of cache_key if it is still valid, and None otherwise."""
+        with self._lock:
+            entry = self._cache.get(cache_key)
+            if entry is not None:
+                value, cached_version, cached_at = entry
+                if (self._ttl is not None and time.time() - cached_at > self._ttl) or cached_version != version:
+                    del self._cache[cache_key]
+                    entry = None
+                else:
+                    self._move_to_end(cache_key)
+            if entry is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return entry
+
+    def _cache_value(self, cache_key, value, version):
+        with self._lock:
+            self._cache[cache_key] = (value, version, time.time())
+            self._move_to_end(cache_key)
+            while len(self._cache) > self._max_size:
+                self._cache.popitem(last=False)
+
+    def _move_to_end(self, cache_key):
+        # OrderedDict.move_to_end is not available in python 2
+        self._cache[cache_key] = self._cache.pop(cache_key)
+
+    def _invalidate(self, key):
+        with self._lock:
+            for cache_key in [cache_key for cache_key in self._cache.keys() if cache_key[0] == key]:
+                del self._cache[cache_key]
+
+    def _get(self, key, **kwargs):
+        cache_key = (key, tuple(sorted(kwargs.items())))
+        # The version is read before the value so that a concurrent update cannot be cached with a newer version
+        version = self._get_version(key)
+        entry = self._get_cached(cache_key, version)
+        if entry is not None:
+            return entry[0]
+
+        value = self._store_backend.get(key, **kwargs)
+        self._cache_value(cache_key, value, version)
+        return value
+
+    def _get_many(self, keys):
+        values = {}
+        missing_keys = []
+        versions = {}
+        for key in keys:
+            versions[key] = self._get_version(key)
+            entry = self._get_cached((key, ()), versions[key])
+            if entry is None:
+                missing_keys.append(key)
+            else:
+                values[key] = entry[0]
+
+        if len(missing_keys) > 0:
+            for key, value in zip(missing_keys, self._store_backend.get_many(missing_keys)):
+                self._cache_value((key, ()), value, versions[key])
+                values[key] = value
+        return [values[key] for key in keys]
+
+    def _set(self, key, value, **kwargs):
+        try:
+            return self._store_backend.set(key, value, **kwargs)
+        finally:
+            self._invalidate(key)
+
+    def set_many(self, items, **kwargs):
+        items = list(items)
+        try:
+            return self._store_backend.set_many(items, **kwargs)
+        finally:
+            for key, _ in items:
+                self._invalidate(key)
+
+    def _has_key(self, key):
+        return self._store_backend.has_key(key)
+
+    def _remove_key(self, key):
+        try:
+            return self._store_backend.remove_key(key)
+        finally:
+            self._invalidate(key)
+
+    def remove_many(self, keys):
+        keys = list(keys)
+        try:
+            return self._store_backend.remove_many(keys)
+        finally:
+            for key in keys:
+                self._invalidate(key)
+
+    def get_value_version(self, key):
+        return self._store_backend.get_value_version(key)
+
+    def get_url_for_key(self, key, protocol=None):
+        return self._store_backend.get_url_for_key(key, protocol=protocol)
+
+    def list_keys(self, prefix=()):
+        if len(prefix) == 0:
+            # Not all backends accept a prefix
+            return self._store_backend.list_keys()
+        return self._store_backend.list_keys(prefix)
+
+    def list_items(self, prefix=()):
+        return self._store_backend.list_items(prefix)
+
+    def list_keys_in_range(self, prefix=(), start=None, end=None, descending=False):
+        return self._store_backend.list_keys_in_range(prefix=prefix, start=start, end=end, descending=descending)
+
+    def list_items_matching(self, key_pattern, range_position=None, start=None, end=None):
+        return self._store_backend.list_items_matching(key_pattern, range_position=range_position, start=start,
+                                                       end=end)
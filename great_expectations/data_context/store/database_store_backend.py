@@ -1,9 +1,15 @@
 import json
+from collections import OrderedDict
 import great_expectations.exceptions as ge_exceptions
 
+from six import string_types
+
 try:
     import sqlalchemy
-    from sqlalchemy import create_engine, Column, String, MetaData, Table, select, and_, column
+    from sqlalchemy import (
+        create_engine, Column, String, MetaData, Table, Index, select, and_, or_, column, bindparam, JSON,
+        LargeBinary
+    )
     from sqlalchemy.engine.url import URL
 except ImportError:
     sqlalchemy = None
@@ -13,8 +19,26 @@ from great_expectations.data_context.store.store_backend import StoreBackend
 
 
 class DatabaseStoreBackend(StoreBackend):
+    """Stores values in a database table with one primary key column per key element and a value column.
+
+    Values are written with the upsert of the dialect (INSERT ... ON CONFLICT on PostgreSQL and SQLite 3.24+,
+    INSERT ... ON DUPLICATE KEY UPDATE on MySQL). Other dialects select which of the keys already exist, then update
+    those rows and insert the others with one executemany each. set_many writes all of its values in one transaction.
+    The value column holds strings by default; value_type "json" stores the (string) values in a JSON column so that
+    the database can query them, and value_type "binary" stores bytes (strings are encoded as UTF-8). The connection
+    pool of the engine can be configured with the pool_size, max_overflow, pool_timeout, pool_recycle and
+    pool_pre_ping arguments of sqlalchemy.create_engine.
 
-    def __init__(self, credentials, table_name, key_columns, fixed_length_key=True):
+    The key columns form the primary key of the table; indexes is a list of lists of key columns on which to create
+    secondary indexes, for queries that filter on key columns other than the first ones (see list_items_matching).
+    """
+    # The number of keys fetched by each query of get_many
+    get_many_chunk_size = 500
+    value_types = ["string", "json", "binary"]
+
+    def __init__(self, credentials, table_name, key_columns, fixed_length_key=True, value_type="string",
+                 indexes=None, pool_size=None, max_overflow=None, pool_timeout=None, pool_recycle=None,
+                 pool_pre_ping=None):
         super(DatabaseStoreBackend, self).__init__(fixed_length_key=fixed_length_key)
         if not sqlalchemy:
             raise ge_exceptions.DataContextError("ModuleNotFoundError: No module named 'sqlalchemy'")
@@ -22,6 +46,10 @@ class DatabaseStoreBackend(StoreBackend):
         if not self.fixed_length_key:
             raise ValueError("DatabaseStoreBackend requires use of a fixed-length-key")
 
+        if value_type not in self.value_types:
+            raise ValueError("value_type must be one of %s" % ", ".join(self.value_types))
+        self._value_type = value_type
+
         meta = MetaData()
         self.key_columns = key_columns
         # Dynamically construct a SQLAlchemy table with the name and column names we'll use
@@ -31,35 +59,219 @@ class DatabaseStoreBackend(StoreBackend):
                 raise ValueError("'value' cannot be used as a key_element name")
             cols.append(Column(column, String, primary_key=True))
 
-        cols.append(Column("value", String))
+        if value_type == "json":
+            cols.append(Column("value", JSON))
+        elif value_type == "binary":
+            cols.append(Column("value", LargeBinary))
+        else:
+            cols.append(Column("value", String))
         self._table = Table(
             table_name, meta,
             *cols
         )
+        table_indexes = []
+        for idx, index_columns in enumerate(indexes or []):
+            if not set(index_columns).issubset(key_columns):
+                raise ValueError("Indexes of a DatabaseStoreBackend must be on key columns")
+            table_indexes.append(Index(
+                "ix_%s_%d" % (table_name, idx),
+                *[getattr(self._table.columns, index_column) for index_column in index_columns]
+            ))
 
         drivername = credentials.pop("drivername")
         options = URL(drivername, **credentials)
-        self.engine = create_engine(options)
+        pool_kwargs = dict(
+            (key, value) for key, value in [
+                ("pool_size", pool_size),
+                ("max_overflow", max_overflow),
+                ("pool_timeout", pool_timeout),
+                ("pool_recycle", pool_recycle),
+                ("pool_pre_ping", pool_pre_ping),
+            ] if value is not None
+        )
+        self.engine = create_engine(options, **pool_kwargs)
         meta.create_all(self.engine)
+        for index in table_indexes:
+            # The table may have been created before the index was configured
+            index.create(self.engine, checkfirst=True)
+        self._upsert_statement = self._build_upsert_statement()
 
-    def _get(self, key):
-        sel = select([column("value")]).select_from(self._table).where(
-            and_(
-                *[getattr(self._table.columns, key_col) == val for key_col, val in zip(self.key_columns, key)]
+    @property
+    def value_type(self):
+        return self._value_type
+
+    def _build_upsert_statement(self):
+        """Returns the insert statement of the dialect that updates the value of existing keys, or None if the
+        dialect has no upsert."""
+        dialect_name = self.engine.dialect.name
+        if dialect_name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+            statement = insert(self._table)
+            return statement.on_conflict_do_update(
+                index_elements=self.key_columns,
+                set_={"value": statement.excluded.value}
             )
+        if dialect_name == "mysql":
+            from sqlalchemy.dialects.mysql import insert
+            statement = insert(self._table)
+            return statement.on_duplicate_key_update(value=statement.inserted.value)
+        if dialect_name == "sqlite" and getattr(self.engine.dialect.dbapi, "sqlite_version_info", (0,)) >= (3, 24):
+            try:
+                from sqlalchemy.dialects.sqlite import insert
+            except ImportError:
+                # The SQLite insert construct is available from SQLAlchemy 1.4
+                return None
+            statement = insert(self._table)
+            return statement.on_conflict_do_update(
+                index_elements=self.key_columns,
+                set_={"value": statement.excluded.value}
+            )
+        return None
+
+    def _to_column_value(self, value):
+        if self._value_type == "json" and isinstance(value, string_types):
+            return json.loads(value)
+        if self._value_type == "binary" and isinstance(value, string_types) and not isinstance(value, bytes):
+            return value.encode("utf-8")
+        return value
+
+    def _from_column_value(self, value):
+        if value is None:
+            return None
+        if self._value_type == "json":
+            return json.dumps(value)
+        if self._value_type == "binary":
+            # Some drivers return buffers
+            return bytes(value)
+        return value
+
+    def _key_condition(self, key):
+        return and_(
+            *[getattr(self._table.columns, key_col) == val for key_col, val in zip(self.key_columns, key)]
         )
+
+    def _to_row(self, key, value):
+        row = dict(zip(self.key_columns, key))
+        row["value"] = self._to_column_value(value)
+        return row
+
+    def _upsert_rows(self, connection, rows):
+        if self._upsert_statement is not None:
+            connection.execute(self._upsert_statement, rows)
+            return
+
+        # Without an upsert, select which keys already exist, then update those rows and insert the others with one
+        # executemany each; when a key is set more than once, its last value is written
+        rows_by_key = OrderedDict((tuple(row[key_col] for key_col in self.key_columns), row) for row in rows)
+        keys = list(rows_by_key.keys())
+        key_columns = [getattr(self._table.columns, key_col) for key_col in self.key_columns]
+        existing_keys = set()
+        for chunk_start in range(0, len(keys), self.get_many_chunk_size):
+            chunk = keys[chunk_start:chunk_start + self.get_many_chunk_size]
+            sel = select(key_columns).where(or_(*[self._key_condition(key) for key in chunk]))
+            existing_keys.update(tuple(row) for row in connection.execute(sel))
+
+        update_params = []
+        insert_rows = []
+        for key, row in rows_by_key.items():
+            if key in existing_keys:
+                params = dict(("key_" + key_col, row[key_col]) for key_col in self.key_columns)
+                params["new_value"] = row["value"]
+                update_params.append(params)
+            else:
+                insert_rows.append(row)
+        if len(update_params) > 0:
+            update_statement = self._table.update().where(
+                and_(*[key_col == bindparam("key_" + key_col.name) for key_col in key_columns])
+            ).values(value=bindparam("new_value"))
+            connection.execute(update_statement, update_params)
+        if len(insert_rows) > 0:
+            connection.execute(self._table.insert(), insert_rows)
+
+    def _get(self, key):
+        sel = select([self._table.columns.value]).where(self._key_condition(key))
         res = self.engine.execute(sel).fetchone()
         if res:
-            return self.engine.execute(sel).fetchone()[0]
+            return self._from_column_value(res[0])
+
+    def _get_many(self, keys):
+        key_columns = [getattr(self._table.columns, key_col) for key_col in self.key_columns]
+        values = {}
+        for chunk_start in range(0, len(keys), self.get_many_chunk_size):
+            chunk = keys[chunk_start:chunk_start + self.get_many_chunk_size]
+            sel = select(key_columns + [self._table.columns.value]).where(
+                or_(*[self._key_condition(key) for key in chunk])
+            )
+            for row in self.engine.execute(sel):
+                values[tuple(row[:-1])] = self._from_column_value(row[-1])
+        return [values.get(tuple(key)) for key in keys]
+
+    def list_items(self, prefix=()):
+        sel = select(
+            [getattr(self._table.columns, key_col) for key_col in self.key_columns] + [self._table.columns.value]
+        )
+        if len(prefix) > 0:
+            sel = sel.where(
+                and_(
+                    *[getattr(self._table.columns, key_col) == val for key_col, val in
+                      zip(self.key_columns[:len(prefix)], prefix)]
+                )
+            )
+        return [(tuple(row[:-1]), self._from_column_value(row[-1])) for row in self.engine.execute(sel)]
+
+    def list_items_matching(self, key_pattern, range_position=None, start=None, end=None):
+        if len(key_pattern) != len(self.key_columns):
+            raise ValueError("A key pattern must have one element per key column")
+        key_columns = [getattr(self._table.columns, key_col) for key_col in self.key_columns]
+        conditions = [key_col == val for key_col, val in zip(key_columns, key_pattern) if val is not None]
+        order_by = key_columns
+        if range_position is not None:
+            range_column = key_columns[range_position]
+            if start is not None:
+                conditions.append(range_column >= start)
+            if end is not None:
+                conditions.append(range_column <= end)
+            order_by = [range_column] + key_columns
+
+        sel = select(key_columns + [self._table.columns.value])
+        if len(conditions) > 0:
+            sel = sel.where(and_(*conditions))
+        return [
+            (tuple(row[:-1]), self._from_column_value(row[-1]))
+            for row in self.engine.execute(sel.order_by(*order_by))
+        ]
 
     def _set(self, key, value, **kwargs):
-        cols = {k: v for (k, v) in zip(self.key_columns, key)}
-        cols["value"] = value
-        ins = self._table.insert().values(**cols)
-        self.engine.execute(ins)
+        with self.engine.begin() as connection:
+            self._upsert_rows(connection, [self._to_row(key, value)])
+
+    def set_many(self, items, **kwargs):
+        rows = []
+        for key, value in items:
+            self._validate_key(key)
+            self._validate_value(value)
+            rows.append(self._to_row(key, value))
+        if len(rows) == 0:
+            return
+        with self.engine.begin() as connection:
+            self._upsert_rows(connection, rows)
 
     def _has_key(self, key):
-        pass
+        # The key columns are the primary key, so this is an index lookup
+        sel = select([getattr(self._table.columns, self.key_columns[0])]).where(self._key_condition(key)).limit(1)
+        return self.engine.execute(sel).fetchone() is not None
+
+    def _remove_key(self, key):
+        self.remove_many([key])
+
+    def remove_many(self, keys):
+        keys = list(keys)
+        for key in keys:
+            self._validate_key(key)
+        with self.engine.begin() as connection:
+            for chunk_start in range(0, len(keys), self.get_many_chunk_size):
+                chunk = keys[chunk_start:chunk_start + self.get_many_chunk_size]
+                connection.execute(self._table.delete().where(or_(*[self._key_condition(key) for key in chunk])))
 
     def list_keys(self, prefix=()):
         sel = select([column(col) for col in self.key_columns]).select_from(self._table).where(
@@ -69,3 +281,24 @@ class DatabaseStoreBackend(StoreBackend):
             )
         )
         return [tuple(row) for row in self.engine.execute(sel).fetchall()]
+
+    def list_keys_in_range(self, prefix=(), start=None, end=None, descending=False):
+        if len(prefix) >= len(self.key_columns):
+            raise ValueError("A key prefix must have fewer elements than the key columns")
+        range_column = getattr(self._table.columns, self.key_columns[len(prefix)])
+        conditions = [
+            getattr(self._table.columns, key_col) == val for key_col, val in zip(self.key_columns, prefix)
+            if val is not None
+        ]
+        if start is not None:
+            conditions.append(range_column >= start)
+        if end is not None:
+            conditions.append(range_column <= end)
+        order_by = [range_column] + [getattr(self._table.columns, key_col) for key_col in self.key_columns]
+        if descending:
+            order_by = [order_column.desc() for order_column in order_by]
+
+        sel = select([column(col) for col in self.key_columns]).select_from(self._table)
+        if len(conditions) > 0:
+            sel = sel.where(and_(*conditions))
+        return (tuple(row) for row in self.engine.execute(sel.order_by(*order_by)))
@@ -98,6 +98,23 @@ class HtmlSiteStore(object):
         ].set(key.resource_identifier.to_tuple(), serialized_value,
               content_encoding='utf-8', content_type='text/html; charset=utf-8')
 
+    def set_many(self, items):
+        """Set several pages; items is a list of (key, serialized_value) pairs. Pages are written with the set_many
+        method of the store backends, so that backends that can write several pages at once (e.g.
+        TupleS3StoreBackend) do so."""
+        items_by_type = {}
+        for key, serialized_value in items:
+            self._validate_key(key)
+            self.keys.add(key)
+            items_by_type.setdefault(type(key.resource_identifier), []).append(
+                (key.resource_identifier.to_tuple(), serialized_value)
+            )
+
+        for type_, type_items in items_by_type.items():
+            self.store_backends[type_].set_many(
+                type_items, content_encoding='utf-8', content_type='text/html; charset=utf-8'
+            )
+
     def get_url_for_resource(self, resource_identifier=None):
         """
         Return the URL of the HTML document that renders a resource
@@ -171,12 +188,28 @@ class HtmlSiteStore(object):
         Copies static assets, using a special "static_assets" backend store that accepts variable-length tuples as
         keys, with no filepath_template.
         """
-        file_exclusions = [".DS_Store"]
-        dir_exclusions = []
-
         if not static_assets_source_dir:
             static_assets_source_dir = file_relative_path(__file__, os.path.join("..", "..", "render", "view", "static"))
 
+        # Assets are written together, in one set_many for each content type
+        items_by_content_type = {}
+        for store_key, source_name, content_type, content_encoding in self._list_static_assets(
+                static_assets_source_dir):
+            with open(source_name, 'rb') as f:
+                items_by_content_type.setdefault((content_type, content_encoding), []).append((store_key, f.read()))
+
+        for (content_type, content_encoding), items in items_by_content_type.items():
+            self.store_backends["static_assets"].set_many(
+                items,
+                content_encoding=content_encoding,
+                content_type=content_type
+            )
+
+    def _list_static_assets(self, static_assets_source_dir):
+        """Yields the store key, file path, content type and content encoding of each static asset."""
+        file_exclusions = [".DS_Store"]
+        dir_exclusions = []
+
         for item in os.listdir(static_assets_source_dir):
             # Directory
             if os.path.isdir(os.path.join(static_assets_source_dir, item)):
@@ -184,31 +217,25 @@ class HtmlSiteStore(object):
                     continue
                 # Recurse
                 new_source_dir = os.path.join(static_assets_source_dir, item)
-                self.copy_static_assets(new_source_dir)
+                for static_asset in self._list_static_assets(new_source_dir):
+                    yield static_asset
             # File
             else:
-                # Copy file over using static assets store backend
                 if item in file_exclusions:
                     continue
                 source_name = os.path.join(static_assets_source_dir, item)
-                with open(source_name, 'rb') as f:
-                    # Only use path elements starting from static/ for key
-                    store_key = tuple(os.path.normpath(source_name).split(os.sep))
-                    store_key = store_key[store_key.index('static'):]
-                    content_type, content_encoding = guess_type(item, strict=False)
-
-                    if content_type is None:
-                        # Use GE-known content-type if possible
-                        if source_name.endswith(".otf"):
-                            content_type = "font/opentype"
-                        else:
-                            # fallback
-                            logger.warning("Unable to automatically determine content_type for {}".format(source_name))
-                            content_type = "text/html; charset=utf8"
-
-                    self.store_backends["static_assets"].set(
-                        store_key,
-                        f.read(),
-                        content_encoding=content_encoding,
-                        content_type=content_type
-                    )
\ No newline at end of file
+                # Only use path elements starting from static/ for key
+                store_key = tuple(os.path.normpath(source_name).split(os.sep))
+                store_key = store_key[store_key.index('static'):]
+                content_type, content_encoding = guess_type(item, strict=False)
+
+                if content_type is None:
+                    # Use GE-known content-type if possible
+                    if source_name.endswith(".otf"):
+                        content_type = "font/opentype"
+                    else:
+                        # fallback
+                        logger.warning("Unable to automatically determine content_type for {}".format(source_name))
+                        content_type = "text/html; charset=utf8"
+
+                yield store_key, source_name, content_type, content_encoding
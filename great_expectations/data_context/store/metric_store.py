@@ -1,16 +1,39 @@
 import json
+from collections import defaultdict
+
+import pandas as pd
 
 from great_expectations.core import ensure_json_serializable
 from great_expectations.core.metric import ValidationMetricIdentifier
 from great_expectations.data_context.store.database_store_backend import DatabaseStoreBackend
+from great_expectations.data_context.store.retention import RetentionPolicy
 from great_expectations.data_context.store.store import Store
+from great_expectations.data_context.util import to_run_id
+from great_expectations.exceptions import DataContextError
 from great_expectations.util import load_class
 
 
 class MetricStore(Store):
+    """A MetricStore stores the metrics of validation results, keyed by ValidationMetricIdentifier.
+
+    get_metric_series returns the history of metrics across runs as a DataFrame. With a DatabaseStoreBackend, the
+    default table has an index on the suite, metric name and metric kwargs id followed by the run id, so that the
+    series of a metric is read with one indexed query.
+
+    A retention_policy (see RetentionPolicy) applied with apply_retention_policy removes the metrics of old runs,
+    keeping the keep_last_runs most recent runs of each expectation suite and the runs not older than max_age_days,
+    and downsamples each metric series to one run per downsample_period after downsample_after_days.
+    """
     _key_class = ValidationMetricIdentifier
 
-    def __init__(self, store_backend=None):
+    def __init__(self, store_backend=None, retention_policy=None):
+        if isinstance(retention_policy, dict):
+            retention_policy = RetentionPolicy(**retention_policy)
+        if retention_policy is not None and retention_policy.archive_after_days is not None:
+            raise DataContextError("{} does not support archive_after_days in its retention_policy".format(
+                type(self).__name__))
+        self._retention_policy = retention_policy
+
         if store_backend is not None:
             store_backend_module_name = store_backend.get("module_name", "great_expectations.data_context.store")
             store_backend_class_name = store_backend.get("class_name", "InMemoryStoreBackend")
@@ -19,17 +42,25 @@ class MetricStore(Store):
             if issubclass(store_backend_class, DatabaseStoreBackend):
                 # Provide defaults for this common case
                 store_backend["table_name"] = store_backend.get("table_name", "ge_metrics")
-                store_backend["key_columns"] = store_backend.get(
-                    "key_columns", [
+                if "key_columns" not in store_backend:
+                    store_backend["key_columns"] = [
                         "run_id",
                         "expectation_suite_identifier",
                         "metric_name",
                         "metric_kwargs_id",
                     ]
-                )
+                    store_backend["indexes"] = store_backend.get(
+                        "indexes", [
+                            ["expectation_suite_identifier", "metric_name", "metric_kwargs_id", "run_id"]
+                        ]
+                    )
 
         super(MetricStore, self).__init__(store_backend=store_backend)
 
+    @property
+    def retention_policy(self):
+        return self._retention_policy
+
     # noinspection PyMethodMayBeStatic
     def _validate_value(self, value):
         # Values must be json serializable since they must be inputs to expectation configurations
@@ -42,10 +73,112 @@ class MetricStore(Store):
         if value:
             return json.loads(value)["value"]
 
+    def get_metric_series(self, expectation_suite_name=None, metric_name=None, metric_kwargs_id=None,
+                          start_run_id=None, end_run_id=None):
+        """Get the values of metrics across runs.
+
+        Args:
+            expectation_suite_name: only return metrics of this expectation suite
+            metric_name: only return metrics with this name, e.g.
+                "expect_column_mean_to_be_between.result.observed_value"
+            metric_kwargs_id: only return metrics with this metric_kwargs_id, e.g. "column=Age"
+            start_run_id (str or datetime): only return metrics of runs with a run_id greater than or equal to this
+                one; datetimes are formatted like the default run ids ("%Y%m%dT%H%M%S.%fZ")
+            end_run_id (str or datetime): only return metrics of runs with a run_id less than or equal to this one
+
+        Returns:
+            a DataFrame with run_id, expectation_suite_name, metric_name, metric_kwargs_id and value columns, ordered
+            by run_id
+        """
+        start_run_id = to_run_id(start_run_id)
+        end_run_id = to_run_id(end_run_id)
+
+        if self._use_fixed_length_key:
+            # Elements that are not filtered on (None) match any value
+            key_pattern = (None, expectation_suite_name, metric_name, metric_kwargs_id)
+            items = [
+                (self.tuple_to_key(key_tuple), value) for key_tuple, value in
+                self._store_backend.list_items_matching(
+                    key_pattern, range_position=0, start=start_run_id, end=end_run_id
+                )
+            ]
+        else:
+            # The suite name of variable-length keys spans a variable number of elements, so only the run range (the
+            # first element) is handed to the store backend
+            keys = []
+            for key_tuple in self._store_backend.list_keys_in_range(prefix=(), start=start_run_id, end=end_run_id):
+                key = self.tuple_to_key(key_tuple)
+                if expectation_suite_name is not None and \
+                        key.expectation_suite_identifier.expectation_suite_name != expectation_suite_name:
+                    continue
+                if metric_name is not None and key.metric_name != metric_name:
+                    continue
+                if metric_kwargs_id is not None and key.metric_kwargs_id != metric_kwargs_id:
+                    continue
+                keys.append(key)
+            items = list(zip(keys, self._store_backend.get_many([self.key_to_tuple(key) for key in keys])))
+
+        return pd.DataFrame(
+            [
+                (
+                    key.run_id,
+                    key.expectation_suite_identifier.expectation_suite_name,
+                    key.metric_name,
+                    key.metric_kwargs_id,
+                    self.deserialize(key, value)
+                ) for key, value in items
+            ],
+            columns=["run_id", "expectation_suite_name", "metric_name", "metric_kwargs_id", "value"]
+        )
+
+    def apply_retention_policy(self, dry_run=False, now=None):
+        """Remove the metrics selected by the retention_policy of the store.
+
+        Args:
+            dry_run: only select the metrics to remove, without changing the store
+            now (datetime): the time at which the policy is applied, in UTC; defaults to the current time
+
+        Returns:
+            a dict with the ValidationMetricIdentifiers of the metrics removed because of the age or number of their
+            runs ("removed_keys") and of the metrics removed by downsampling ("downsampled_keys")
+        """
+        if self._retention_policy is None:
+            raise DataContextError("This {} has no retention_policy".format(type(self).__name__))
+
+        keys_by_suite = defaultdict(list)
+        for key in self.list_keys():
+            keys_by_suite[key.expectation_suite_identifier].append(key)
+
+        removed_keys = []
+        keys_by_series = defaultdict(list)
+        for suite_keys in keys_by_suite.values():
+            removed_run_ids = self._retention_policy.select_runs_to_remove([key.run_id for key in suite_keys], now)
+            for key in suite_keys:
+                if key.run_id in removed_run_ids:
+                    removed_keys.append(key)
+                else:
+                    keys_by_series[
+                        (key.expectation_suite_identifier, key.metric_name, key.metric_kwargs_id)
+                    ].append(key)
+
+        downsampled_keys = []
+        for series_keys in keys_by_series.values():
+            downsampled_run_ids = self._retention_policy.select_runs_to_downsample(
+                [key.run_id for key in series_keys], now
+            )
+            downsampled_keys += [key for key in series_keys if key.run_id in downsampled_run_ids]
+
+        if not dry_run and len(removed_keys) + len(downsampled_keys) > 0:
+            self.remove_many(removed_keys + downsampled_keys)
+        return {
+            "removed_keys": removed_keys,
+            "downsampled_keys": downsampled_keys,
+        }
+
 
 class EvaluationParameterStore(MetricStore):
 
-    def __init__(self, store_backend=None):
+    def __init__(self, store_backend=None, retention_policy=None):
         if store_backend is not None:
             store_backend_module_name = store_backend.get("module_name", "great_expectations.data_context.store")
             store_backend_class_name = store_backend.get("class_name", "InMemoryStoreBackend")
@@ -54,11 +187,11 @@ class EvaluationParameterStore(MetricStore):
             if issubclass(store_backend_class, DatabaseStoreBackend):
                 # Provide defaults for this common case
                 store_backend["table_name"] = store_backend.get("table_name", "ge_evaluation_parameters")
-        super(EvaluationParameterStore, self).__init__(store_backend=store_backend)
+        super(EvaluationParameterStore, self).__init__(store_backend=store_backend, retention_policy=retention_policy)
 
     def get_bind_params(self, run_id):
         params = {}
-        for k in self._store_backend.list_keys((run_id,)):
-            key = self.tuple_to_key(k)
-            params[key.to_evaluation_parameter_urn()] = self.get(key)
+        for key_tuple, value in self._store_backend.list_items((run_id,)):
+            key = self.tuple_to_key(key_tuple)
+            params[key.to_evaluation_parameter_urn()] = self.deserialize(key, value)
         return params
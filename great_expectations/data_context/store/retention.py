@@ -0,0 +1,118 @@
+import datetime
+
+from great_expectations.data_context.util import run_id_to_datetime
+
+
+class RetentionPolicy(object):
+    """A RetentionPolicy selects the runs whose results a store no longer keeps.
+
+    Runs are kept if they are among the keep_last_runs most recent runs of their group (e.g. of an expectation suite)
+    or if they are not older than max_age_days; when neither option is set, all runs are kept. The time of a run is
+    read from its run_id, formatted like the default run ids ("%Y%m%dT%H%M%S.%fZ") or as an ISO 8601 date or time;
+    runs whose run_id is not a time (e.g. "profiling") are always kept.
+
+    Runs older than downsample_after_days are downsampled: only the most recent run of each downsample_period ("day",
+    "week" or "month") is kept. Results of runs older than archive_after_days are compacted into one archive per
+    month. The stores that support these options are listed in their docstrings.
+
+    A retention policy is usually configured with the retention_policy key of a store in great_expectations.yml:
+
+        validations_store:
+          class_name: ValidationsStore
+          retention_policy:
+            keep_last_runs: 30
+            max_age_days: 90
+            archive_after_days: 30
+          store_backend:
+            class_name: TupleFilesystemStoreBackend
+            base_directory: uncommitted/validations/
+    """
+    downsample_periods = ["day", "week", "month"]
+
+    def __init__(self, keep_last_runs=None, max_age_days=None, downsample_after_days=None, downsample_period="day",
+                 archive_after_days=None):
+        for name, value in [
+            ("keep_last_runs", keep_last_runs),
+            ("max_age_days", max_age_days),
+            ("downsample_after_days", downsample_after_days),
+            ("archive_after_days", archive_after_days),
+        ]:
+            if value is not None and value < 0:
+                raise ValueError("{} must not be negative".format(name))
+        if downsample_period not in self.downsample_periods:
+            raise ValueError("downsample_period must be one of {}, not {}".format(
+                ", ".join(self.downsample_periods), downsample_period))
+        self.keep_last_runs = keep_last_runs
+        self.max_age_days = max_age_days
+        self.downsample_after_days = downsample_after_days
+        self.downsample_period = downsample_period
+        self.archive_after_days = archive_after_days
+
+    @staticmethod
+    def _get_timed_runs(run_ids):
+        """Returns the (time, run_id) of the runs whose run_id is a time, most recent first."""
+        timed_runs = []
+        for run_id in set(run_ids):
+            run_time = run_id_to_datetime(run_id)
+            if run_time is not None:
+                timed_runs.append((run_time, run_id))
+        return sorted(timed_runs, reverse=True)
+
+    def select_runs_to_remove(self, run_ids, now=None):
+        """Returns the set of the run_ids of a group that are not kept by keep_last_runs or max_age_days."""
+        if self.keep_last_runs is None and self.max_age_days is None:
+            return set()
+        now = now or datetime.datetime.utcnow()
+
+        timed_runs = self._get_timed_runs(run_ids)
+        kept_run_ids = set()
+        if self.keep_last_runs is not None:
+            kept_run_ids.update(run_id for _, run_id in timed_runs[:self.keep_last_runs])
+        if self.max_age_days is not None:
+            oldest_time = now - datetime.timedelta(days=self.max_age_days)
+            kept_run_ids.update(run_id for run_time, run_id in timed_runs if run_time >= oldest_time)
+        return set(run_id for _, run_id in timed_runs) - kept_run_ids
+
+    def select_runs_to_downsample(self, run_ids, now=None):
+        """Returns the set of the run_ids of a series that are older than downsample_after_days and are not the most
+        recent run of their downsample_period."""
+        if self.downsample_after_days is None:
+            return set()
+        now = now or datetime.datetime.utcnow()
+
+        newest_downsampled_time = now - datetime.timedelta(days=self.downsample_after_days)
+        periods = set()
+        downsampled_run_ids = set()
+        for run_time, run_id in self._get_timed_runs(run_ids):
+            if run_time >= newest_downsampled_time:
+                continue
+            period = self._get_period(run_time)
+            if period in periods:
+                downsampled_run_ids.add(run_id)
+            else:
+                periods.add(period)
+        return downsampled_run_ids
+
+    def _get_period(self, run_time):
+        if self.downsample_period == "day":
+            return run_time.date()
+        elif self.downsample_period == "week":
+            return tuple(run_time.isocalendar()[:2])
+        return run_time.year, run_time.month
+
+    def select_runs_to_archive(self, run_ids, now=None):
+        """Returns the set of run_ids older than archive_after_days."""
+        if self.archive_after_days is None:
+            return set()
+        now = now or datetime.datetime.utcnow()
+
+        newest_archived_time = now - datetime.timedelta(days=self.archive_after_days)
+        return set(run_id for run_time, run_id in self._get_timed_runs(run_ids) if run_time < newest_archived_time)
+
+    @staticmethod
+    def get_archive_month(run_id):
+        """Returns the month ("%Y-%m") of the archive of the results of a run, or None if its run_id is not a time."""
+        run_time = run_id_to_datetime(run_id)
+        if run_time is None:
+            return None
+        return run_time.strftime("%Y-%m")
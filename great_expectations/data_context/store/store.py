@@ -1,6 +1,7 @@
 import logging
 
 from great_expectations.core.data_context_key import DataContextKey
+from great_expectations.data_context.store.caching_store_backend import CachingStoreBackend
 from great_expectations.data_context.store.store_backend import StoreBackend
 from great_expectations.data_context.util import instantiate_class_from_config
 from great_expectations.exceptions import DataContextError
@@ -28,6 +29,10 @@ class Store(object):
             store_backend = {
                 "class_name": "InMemoryStoreBackend"
             }
+        cache_config = None
+        if "cache" in store_backend:
+            store_backend = dict(store_backend)
+            cache_config = store_backend.pop("cache")
         logger.debug("Building store_backend.")
         self._store_backend = instantiate_class_from_config(
             config=store_backend,
@@ -38,8 +43,17 @@ class Store(object):
         )
         if not isinstance(self._store_backend, StoreBackend):
             raise DataContextError("Invalid StoreBackend configuration: expected a StoreBackend instance.")
+        if cache_config is not None and cache_config is not False:
+            # Values are read through a cache, configured by the cache key of the store_backend
+            if cache_config is True:
+                cache_config = {}
+            self._store_backend = CachingStoreBackend(self._store_backend, **cache_config)
         self._use_fixed_length_key = self._store_backend.fixed_length_key
 
+    @property
+    def store_backend(self):
+        return self._store_backend
+
     def _validate_key(self, key):
         if not isinstance(key, self._key_class):
             raise TypeError("key must be an instance of %s, not %s" % (self._key_class.__name__, type(key)))
@@ -67,12 +81,34 @@ class Store(object):
         self._validate_key(key)
         return self.deserialize(key, self._store_backend.get(self.key_to_tuple(key)))
 
+    def get_many(self, keys):
+        for key in keys:
+            self._validate_key(key)
+        values = self._store_backend.get_many([self.key_to_tuple(key) for key in keys])
+        return [self.deserialize(key, value) for key, value in zip(keys, values)]
+
     def set(self, key, value):
         self._validate_key(key)
         return self._store_backend.set(self.key_to_tuple(key), self.serialize(key, value))
 
+    def set_many(self, items):
+        """Set the values of several keys; items is a list of (key, value) pairs."""
+        for key, value in items:
+            self._validate_key(key)
+        return self._store_backend.set_many([(self.key_to_tuple(key), self.serialize(key, value))
+                                             for key, value in items])
+
     def list_keys(self):
         return [self.tuple_to_key(key) for key in self._store_backend.list_keys()]
 
     def has_key(self, key):
         return self._store_backend.has_key(key.to_tuple())
+
+    def remove_key(self, key):
+        self._validate_key(key)
+        return self._store_backend.remove_key(self.key_to_tuple(key))
+
+    def remove_many(self, keys):
+        for key in keys:
+            self._validate_key(key)
+        return self._store_backend.remove_many([self.key_to_tuple(key) for key in keys])
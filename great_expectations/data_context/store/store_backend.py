@@ -23,9 +23,10 @@ class StoreBackend(object):
     def fixed_length_key(self):
         return self._fixed_length_key
 
-    def get(self, key):
+    def get(self, key, **kwargs):
         self._validate_key(key)
-        value = self._get(key)
+        # Allow the implementing getter to accept options (e.g. to read binary values)
+        value = self._get(key, **kwargs)
         return value
 
     def set(self, key, value, **kwargs):
@@ -34,10 +35,68 @@ class StoreBackend(object):
         # Allow the implementing setter to return something (e.g. a path used for its key)
         return self._set(key, value, **kwargs)
 
+    def set_many(self, items, **kwargs):
+        """Set the values of several keys; items is a list of (key, value) pairs, and kwargs are the options of each
+        set. Backends that can write several values in one request (or transaction), or at once, override this
+        method."""
+        for key, value in items:
+            self.set(key, value, **kwargs)
+
+    def get_many(self, keys):
+        """Get the values of several keys, in the order of the keys."""
+        for key in keys:
+            self._validate_key(key)
+        return self._get_many(keys)
+
+    def list_items(self, prefix=()):
+        """List the (key, value) pairs of the keys listed by list_keys(prefix)."""
+        keys = self.list_keys(prefix)
+        return list(zip(keys, self._get_many(keys)))
+
+    def list_items_matching(self, key_pattern, range_position=None, start=None, end=None):
+        """List the (key, value) pairs of the keys that match key_pattern, a tuple with one element per key element
+        in which None matches any value, and whose element at range_position is between start and end (inclusive).
+        Items are ordered by the element at range_position and then by key.
+
+        Backends that can filter their keys natively override this method; by default, all keys are listed and
+        filtered.
+        """
+        keys = []
+        for key in self.list_keys():
+            if len(key) != len(key_pattern):
+                continue
+            if any(element is not None and key[idx] != element for idx, element in enumerate(key_pattern)):
+                continue
+            if range_position is not None and (
+                    (start is not None and key[range_position] < start) or
+                    (end is not None and key[range_position] > end)):
+                continue
+            keys.append(key)
+        if range_position is not None:
+            keys = sorted(keys, key=lambda key: (key[range_position], key))
+        else:
+            keys = sorted(keys)
+        return list(zip(keys, self._get_many(keys)))
+
     def has_key(self, key):
         self._validate_key(key)
         return self._has_key(key)
 
+    def remove_key(self, key):
+        self._validate_key(key)
+        return self._remove_key(key)
+
+    def remove_many(self, keys):
+        """Remove several keys. Backends that can remove several keys in one request (or transaction) override this
+        method."""
+        for key in keys:
+            self.remove_key(key)
+
+    def get_value_version(self, key):
+        """Get a token that changes when the value of key changes (e.g. a modification time or an ETag), or None if
+        the backend cannot tell. Used to validate cached values."""
+        return None
+
     def get_url_for_key(self, key, protocol=None):
         raise NotImplementedError(
             "Store backend of type {0:s} does not have an implementation of get_url_for_key".format(
@@ -71,13 +130,40 @@ class StoreBackend(object):
     def _set(self, key, value, **kwargs):
         raise NotImplementedError
 
+    def _get_many(self, keys):
+        # Backends that can fetch several values in one request override this method
+        return [self._get(key) for key in keys]
+
     @abstractmethod
     def list_keys(self, prefix=()):
         raise NotImplementedError
 
+    def list_keys_in_range(self, prefix=(), start=None, end=None, descending=False):
+        """List the keys that start with prefix and whose next element is between start and end (inclusive), ordered
+        by that element and then by the whole key.
+
+        Elements of prefix that are None match any value. Backends that index their keys override this method to
+        answer from the index; by default, all keys are listed and filtered.
+        """
+        position = len(prefix)
+        keys = []
+        for key in self.list_keys():
+            if len(key) <= position:
+                continue
+            if any(element is not None and key[idx] != element for idx, element in enumerate(prefix)):
+                continue
+            if (start is not None and key[position] < start) or (end is not None and key[position] > end):
+                continue
+            keys.append(key)
+        return sorted(keys, key=lambda key: (key[position], key), reverse=descending)
+
     def _has_key(self, key):
         raise NotImplementedError
 
+    def _remove_key(self, key):
+        raise NotImplementedError(
+            "Store backend of type {0:s} does not support removing keys".format(type(self).__name__))
+
 
 class InMemoryStoreBackend(StoreBackend):
     """Uses an in-memory dictionary as a store backend.
@@ -94,8 +180,17 @@ class InMemoryStoreBackend(StoreBackend):
     def _set(self, key, value, **kwargs):
         self._store[key] = value
 
+    def _get_many(self, keys):
+        return [self._store[key] for key in keys]
+
     def list_keys(self, prefix=()):
         return [key for key in self._store.keys() if key[:len(prefix)] == prefix]
 
+    def list_items(self, prefix=()):
+        return [(key, value) for key, value in self._store.items() if key[:len(prefix)] == prefix]
+
     def _has_key(self, key):
         return key in self._store
+
+    def _remove_key(self, key):
+        del self._store[key]
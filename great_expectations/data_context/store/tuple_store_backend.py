@@ -2,6 +2,10 @@ import os
 import random
 import re
 import logging
+import sqlite3
+import threading
+from contextlib import closing
+from multiprocessing.pool import ThreadPool
 # PYTHON 2 - py2 - update to ABC direct use rather than __metaclass__ once we drop py2 support
 from abc import ABCMeta
 
@@ -171,13 +175,109 @@ class TupleStoreBackend(StoreBackend):
                 ))
 
 
+class TupleStoreKeyIndex(object):
+    """A persistent index of the keys of a TupleFilesystemStoreBackend, kept in a SQLite file.
+
+    Keys are stored with their elements joined by a separator that cannot appear in file names, ordered so that the
+    keys starting with a given prefix are found by a range query on the primary key.
+    """
+    separator = "\x1f"
+
+    def __init__(self, index_path):
+        self._index_path = index_path
+        with closing(self._connect()) as connection, connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS ge_store_keys (key_path TEXT PRIMARY KEY)")
+
+    @property
+    def index_path(self):
+        return self._index_path
+
+    def _connect(self):
+        return sqlite3.connect(self._index_path, timeout=30)
+
+    def _to_key_path(self, key):
+        return self.separator.join(key)
+
+    def add(self, key):
+        with closing(self._connect()) as connection, connection:
+            connection.execute("INSERT OR IGNORE INTO ge_store_keys (key_path) VALUES (?)", (self._to_key_path(key),))
+
+    def remove(self, keys):
+        with closing(self._connect()) as connection, connection:
+            connection.executemany("DELETE FROM ge_store_keys WHERE key_path = ?",
+                                   [(self._to_key_path(key),) for key in keys])
+
+    def list_keys(self, prefix=()):
+        """Returns the indexed keys whose first elements are the elements of prefix, in key order."""
+        with closing(self._connect()) as connection:
+            if len(prefix) == 0:
+                rows = connection.execute("SELECT key_path FROM ge_store_keys ORDER BY key_path")
+            else:
+                prefix_path = self._to_key_path(prefix)
+                # The separator is followed by the space character in code point order
+                rows = connection.execute(
+                    "SELECT key_path FROM ge_store_keys WHERE key_path = ? OR (key_path >= ? AND key_path < ?) "
+                    "ORDER BY key_path",
+                    (prefix_path, prefix_path + self.separator, prefix_path + " ")
+                )
+            return [tuple(row[0].split(self.separator)) for row in rows]
+
+    def list_keys_in_range(self, prefix=(), start=None, end=None, descending=False):
+        """Yields the indexed keys that start with prefix and whose next element is between start and end
+        (inclusive), in key order."""
+        if len(prefix) == 0:
+            element_prefix = ""
+        else:
+            element_prefix = self._to_key_path(prefix) + self.separator
+        conditions = []
+        params = []
+        if start is not None or len(prefix) > 0:
+            conditions.append("key_path >= ?")
+            params.append(element_prefix + (start or ""))
+        if end is not None:
+            conditions.append("key_path < ?")
+            params.append(element_prefix + end + " ")
+        elif len(prefix) > 0:
+            conditions.append("key_path < ?")
+            params.append(self._to_key_path(prefix) + " ")
+        query = "SELECT key_path FROM ge_store_keys"
+        if len(conditions) > 0:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY key_path DESC" if descending else " ORDER BY key_path"
+
+        with closing(self._connect()) as connection:
+            for row in connection.execute(query, params):
+                yield tuple(row[0].split(self.separator))
+
+    def rebuild(self, keys):
+        """Replaces the content of the index with keys. Returns the number of indexed keys."""
+        key_paths = sorted(set(self._to_key_path(key) for key in keys))
+        with closing(self._connect()) as connection, connection:
+            connection.execute("DELETE FROM ge_store_keys")
+            connection.executemany("INSERT INTO ge_store_keys (key_path) VALUES (?)",
+                                   [(key_path,) for key_path in key_paths])
+        return len(key_paths)
+
+    def __len__(self):
+        with closing(self._connect()) as connection:
+            return connection.execute("SELECT count(*) FROM ge_store_keys").fetchone()[0]
+
+
 class TupleFilesystemStoreBackend(TupleStoreBackend):
     """Uses a local filepath as a store.
 
     The key to this StoreBackend must be a tuple with fixed length based on the filepath_template,
     or a variable-length tuple may be used and returned with an optional filepath_suffix (to be) added.
     The filepath_template is a string template used to convert the key to a filepath.
+
+    Listing the keys of a large store walks its whole directory tree. If key_index is True, the keys are also
+    recorded in a SQLite index file in the base directory when they are set, and list_keys queries the index
+    instead (prefixes are then matched against the elements of the keys). The index is built from the files of the
+    store when it is first enabled; rebuild_key_index brings it back in sync after files have been added or removed
+    by other means (the `great_expectations project rebuild-store-indexes` command rebuilds the indexes of all the
+    stores of a project).
     """
+    key_index_filename = ".ge_store_key_index.db"
 
     def __init__(self,
                  base_directory,
@@ -187,7 +287,8 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
                  forbidden_substrings=None,
                  platform_specific_separator=True,
                  root_directory=None,
-                 fixed_length_key=False):
+                 fixed_length_key=False,
+                 key_index=False):
         super(TupleFilesystemStoreBackend, self).__init__(
             filepath_template=filepath_template,
             filepath_prefix=filepath_prefix,
@@ -208,12 +309,33 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
 
         safe_mmkdir(str(os.path.dirname(self.full_base_directory)))
 
-    def _get(self, key):
+        if key_index:
+            safe_mmkdir(str(self.full_base_directory))
+            index_path = os.path.join(self.full_base_directory, self.key_index_filename)
+            is_new_index = not os.path.isfile(index_path)
+            self._key_index = TupleStoreKeyIndex(index_path)
+            if is_new_index:
+                self.rebuild_key_index()
+        else:
+            self._key_index = None
+
+    @property
+    def key_index(self):
+        return self._key_index
+
+    def rebuild_key_index(self):
+        """Rebuild the key index from the files of the store. Returns the number of keys, or None if the store has no
+        key index."""
+        if self._key_index is None:
+            return None
+        return self._key_index.rebuild(self._list_keys_from_files())
+
+    def _get(self, key, binary=False):
         filepath = os.path.join(
             self.full_base_directory,
             self._convert_key_to_filepath(key)
         )
-        with open(filepath, 'r') as infile:
+        with open(filepath, 'rb' if binary else 'r') as infile:
             return infile.read()
 
     def _set(self, key, value, **kwargs):
@@ -235,12 +357,38 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
                     outfile.write(value)
             else:
                 outfile.write(value)
+        if self._key_index is not None:
+            self._key_index.add(key)
         return filepath
 
     def list_keys(self, prefix=()):
+        if self._key_index is not None:
+            return self._key_index.list_keys(prefix)
+        return self._list_keys_from_files(prefix)
+
+    def list_keys_in_range(self, prefix=(), start=None, end=None, descending=False):
+        if self._key_index is None or None in prefix:
+            return super(TupleFilesystemStoreBackend, self).list_keys_in_range(
+                prefix=prefix, start=start, end=end, descending=descending
+            )
+        return self._key_index.list_keys_in_range(prefix=prefix, start=start, end=end, descending=descending)
+
+    def _list_keys_from_files(self, prefix=()):
+        prefix = tuple(prefix)
         key_list = []
-        for root, dirs, files in os.walk(os.path.join(self.full_base_directory, *prefix)):
+        list_directory = self.full_base_directory
+        if self.filepath_template is None and len(prefix) > 0:
+            # The elements of the prefix are directories, unless the prefix is itself a key
+            if os.path.isfile(os.path.join(self.full_base_directory, self._convert_key_to_filepath(prefix))):
+                key_list.append(prefix)
+            list_directory = os.path.join(
+                list_directory, *([self.filepath_prefix] if self.filepath_prefix else []) + list(prefix)
+            )
+        for root, dirs, files in os.walk(list_directory):
             for file_ in files:
+                if root == self.full_base_directory and file_.startswith(self.key_index_filename):
+                    # The key index and its journal are not values of the store
+                    continue
                 full_path, file_name = os.path.split(os.path.join(root, file_))
                 relative_path = os.path.relpath(
                     full_path,
@@ -260,7 +408,7 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
                     continue
                 else:
                     key = self._convert_filepath_to_key(filepath)
-                if key:
+                if key and key[:len(prefix)] == prefix:
                     key_list.append(key)
 
         return key_list
@@ -277,6 +425,31 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
     def _has_key(self, key):
         return os.path.isfile(os.path.join(self.full_base_directory, self._convert_key_to_filepath(key)))
 
+    def _remove_key(self, key):
+        self.remove_many([key])
+
+    def remove_many(self, keys):
+        keys = list(keys)
+        for key in keys:
+            self._validate_key(key)
+        for key in keys:
+            filepath = os.path.join(self.full_base_directory, self._convert_key_to_filepath(key))
+            os.remove(filepath)
+            # Directories left empty are removed, up to the base directory
+            path = os.path.dirname(filepath)
+            while os.path.normpath(path) != os.path.normpath(self.full_base_directory) and not os.listdir(path):
+                os.rmdir(path)
+                path = os.path.dirname(path)
+        if self._key_index is not None:
+            self._key_index.remove(keys)
+
+    def get_value_version(self, key):
+        try:
+            stat = os.stat(os.path.join(self.full_base_directory, self._convert_key_to_filepath(key)))
+        except OSError:
+            return None
+        return stat.st_mtime, stat.st_size
+
 
 class TupleS3StoreBackend(TupleStoreBackend):
     """
@@ -285,6 +458,10 @@ class TupleS3StoreBackend(TupleStoreBackend):
     The key to this StoreBackend must be a tuple with fixed length based on the filepath_template,
     or a variable-length tuple may be used and returned with an optional filepath_suffix (to be) added.
     The filepath_template is a string template used to convert the key to a filepath.
+
+    A single S3 client, and its pool of connections, is shared by all requests of the store backend. get_many and
+    set_many send up to max_workers requests at once. endpoint_url may point the client to an S3-compatible service
+    other than AWS, for example a local stand-in used in tests.
     """
 
     def __init__(
@@ -296,7 +473,9 @@ class TupleS3StoreBackend(TupleStoreBackend):
             filepath_suffix=None,
             forbidden_substrings=None,
             platform_specific_separator=False,
-            fixed_length_key=False
+            fixed_length_key=False,
+            max_workers=8,
+            endpoint_url=None
     ):
         super(TupleS3StoreBackend, self).__init__(
             filepath_template=filepath_template,
@@ -306,76 +485,123 @@ class TupleS3StoreBackend(TupleStoreBackend):
             platform_specific_separator=platform_specific_separator,
             fixed_length_key=fixed_length_key
         )
+        if max_workers < 1:
+            raise ValueError("max_workers must be positive")
         self.bucket = bucket
         self.prefix = prefix
-
-    def _get(self, key):
-        s3_object_key = os.path.join(
-            self.prefix,
-            self._convert_key_to_filepath(key)
-        )
-
-        import boto3
-        s3 = boto3.client('s3')
-        s3_response_object = s3.get_object(Bucket=self.bucket, Key=s3_object_key)
-        return s3_response_object['Body'].read().decode(s3_response_object.get("ContentEncoding", 'utf-8'))
+        self.max_workers = max_workers
+        self.endpoint_url = endpoint_url
+        self._s3_client = None
+        self._lock = threading.Lock()
+
+    def _get_s3_client(self):
+        with self._lock:
+            if self._s3_client is None:
+                import boto3
+                from botocore.config import Config
+
+                # Clients are thread-safe: the pool of connections is sized for the concurrent requests of a worker
+                self._s3_client = boto3.client(
+                    's3',
+                    endpoint_url=self.endpoint_url,
+                    config=Config(max_pool_connections=max(10, self.max_workers))
+                )
+            return self._s3_client
+
+    def _map(self, function, iterable):
+        iterable = list(iterable)
+        if len(iterable) < 2 or self.max_workers < 2:
+            return [function(item) for item in iterable]
+
+        # The threads only live for the call, so a store backend never leaves idle threads behind
+        pool = ThreadPool(min(self.max_workers, len(iterable)))
+        try:
+            return pool.map(function, iterable)
+        finally:
+            pool.close()
+            pool.join()
+
+    def _build_s3_object_key(self, key):
+        if self.prefix:
+            return self.prefix.rstrip("/") + "/" + self._convert_key_to_filepath(key)
+        return self._convert_key_to_filepath(key)
+
+    def _get(self, key, binary=False):
+        s3_response_object = self._get_s3_client().get_object(Bucket=self.bucket, Key=self._build_s3_object_key(key))
+        if binary:
+            return s3_response_object['Body'].read()
+        # The encoding may be followed by encodings applied in transfer, e.g. "utf-8,aws-chunked"
+        content_encoding = s3_response_object.get("ContentEncoding") or 'utf-8'
+        return s3_response_object['Body'].read().decode(content_encoding.split(",")[0].strip())
+
+    def _get_many(self, keys):
+        return self._map(self._get, keys)
 
     def _set(self, key, value, content_encoding='utf-8', content_type='application/json'):
-        s3_object_key = os.path.join(
-            self.prefix,
-            self._convert_key_to_filepath(key)
-        )
+        s3_object_key = self._build_s3_object_key(key)
 
-        import boto3
-        s3 = boto3.resource('s3')
-        result_s3 = s3.Object(self.bucket, s3_object_key)
+        s3 = self._get_s3_client()
         if isinstance(value, string_types):
             # Following try/except is to support py2, since both str and bytes objects pass above condition
             try:
-                result_s3.put(Body=value.encode(content_encoding), ContentEncoding=content_encoding,
-                              ContentType=content_type)
+                s3.put_object(Bucket=self.bucket, Key=s3_object_key, Body=value.encode(content_encoding),
+                              ContentEncoding=content_encoding, ContentType=content_type)
             except TypeError:
-                result_s3.put(Body=value, ContentType=content_type)
+                s3.put_object(Bucket=self.bucket, Key=s3_object_key, Body=value, ContentType=content_type)
         else:
-            result_s3.put(Body=value, ContentType=content_type)
+            s3.put_object(Bucket=self.bucket, Key=s3_object_key, Body=value, ContentType=content_type)
         return s3_object_key
 
-    def list_keys(self):
-        key_list = []
+    def set_many(self, items, **kwargs):
+        items = list(items)
+        for key, value in items:
+            self._validate_key(key)
+            self._validate_value(value)
+        return self._map(lambda item: self._set(item[0], item[1], **kwargs), items)
 
-        import boto3
-        s3 = boto3.client('s3')
+    def _get_list_prefix(self, prefix=()):
+        """Returns the longest S3 key prefix shared by all objects whose keys start with the elements of prefix."""
+        list_prefix = self.prefix.rstrip("/") + "/" if self.prefix else ""
+        if self.filepath_prefix:
+            list_prefix += self.filepath_prefix + "/"
+        if self.filepath_template is None:
+            return list_prefix + "/".join(prefix)
+
+        # Substitute the known key elements into the template, up to the first unknown one
+        for part in re.split(r"({\d+})", self.filepath_template):
+            match = re.match(r"{(\d+)}$", part)
+            if match is None:
+                list_prefix += part
+            elif int(match.group(1)) < len(prefix):
+                list_prefix += prefix[int(match.group(1))]
+            else:
+                break
+        return list_prefix
 
-        s3_objects = s3.list_objects(Bucket=self.bucket, Prefix=self.prefix)
-        if "Contents" in s3_objects:
-            objects = s3_objects["Contents"]
-        elif "CommonPrefixes" in s3_objects:
-            logger.warning("TupleS3StoreBackend returned CommonPrefixes, but delimiter should not have been set.")
-            objects = []
-        else:
-            # No objects found in store
-            objects = []
+    def list_keys(self, prefix=()):
+        prefix = tuple(prefix)
+        key_list = []
 
-        for s3_object_info in objects:
-            s3_object_key = s3_object_info['Key']
-            s3_object_key = os.path.relpath(
-                s3_object_key,
-                self.prefix,
-            )
-            if self.filepath_prefix and not s3_object_key.startswith(self.filepath_prefix):
-                # There can be other keys located in the same bucket; they are *not* our keys
-                continue
+        paginator = self._get_s3_client().get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=self._get_list_prefix(prefix)):
+            for s3_object_info in page.get("Contents", []):
+                s3_object_key = s3_object_info['Key']
+                if self.prefix:
+                    s3_object_key = s3_object_key[len(self.prefix.rstrip("/")) + 1:]
+                if self.filepath_prefix and not s3_object_key.startswith(self.filepath_prefix):
+                    # There can be other keys located in the same bucket; they are *not* our keys
+                    continue
+                if self.filepath_suffix and not s3_object_key.endswith(self.filepath_suffix):
+                    continue
 
-            key = self._convert_filepath_to_key(s3_object_key)
-            if key:
-                key_list.append(key)
+                key = self._convert_filepath_to_key(s3_object_key)
+                if key and key[:len(prefix)] == prefix:
+                    key_list.append(key)
 
         return key_list
 
     def get_url_for_key(self, key, protocol=None):
-        import boto3
-
-        location = boto3.client('s3').get_bucket_location(Bucket=self.bucket)['LocationConstraint']
+        location = self._get_s3_client().get_bucket_location(Bucket=self.bucket)['LocationConstraint']
         if location is None:
             location = "s3"
         else:
@@ -383,9 +609,31 @@ class TupleS3StoreBackend(TupleStoreBackend):
         s3_key = self._convert_key_to_filepath(key)
         return "https://%s.amazonaws.com/%s/%s%s" % (location, self.bucket, self.prefix, s3_key)
 
+    def get_value_version(self, key):
+        from botocore.exceptions import ClientError
+
+        try:
+            return self._get_s3_client().head_object(Bucket=self.bucket, Key=self._build_s3_object_key(key))["ETag"]
+        except ClientError:
+            return None
+
     def _has_key(self, key):
-        all_keys = self.list_keys()
-        return key in all_keys
+        return self.get_value_version(key) is not None
+
+    def _remove_key(self, key):
+        self._get_s3_client().delete_object(Bucket=self.bucket, Key=self._build_s3_object_key(key))
+
+    def remove_many(self, keys):
+        s3_object_keys = []
+        for key in keys:
+            self._validate_key(key)
+            s3_object_keys.append(self._build_s3_object_key(key))
+        # A request deletes at most 1000 objects
+        for idx in range(0, len(s3_object_keys), 1000):
+            self._get_s3_client().delete_objects(Bucket=self.bucket, Delete={
+                "Objects": [{"Key": s3_object_key} for s3_object_key in s3_object_keys[idx:idx + 1000]],
+                "Quiet": True
+            })
 
 
 class TupleGCSStoreBackend(TupleStoreBackend):
@@ -422,7 +670,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         self.prefix = prefix
         self.project = project
 
-    def _get(self, key):
+    def _get(self, key, binary=False):
         gcs_object_key = os.path.join(
             self.prefix,
             self._convert_key_to_filepath(key)
@@ -432,6 +680,8 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         gcs = storage.Client(project=self.project)
         bucket = gcs.get_bucket(self.bucket)
         gcs_response_object = bucket.get_blob(gcs_object_key)
+        if binary:
+            return gcs_response_object.download_as_string()
         return gcs_response_object.download_as_string().decode("utf-8")
 
     def _set(self, key, value, content_encoding='utf-8', content_type='application/json'):
@@ -455,7 +705,8 @@ class TupleGCSStoreBackend(TupleStoreBackend):
             blob.upload_from_string(value, content_type=content_type)
         return gcs_object_key
 
-    def list_keys(self):
+    def list_keys(self, prefix=()):
+        prefix = tuple(prefix)
         key_list = []
 
         from google.cloud import storage
@@ -467,14 +718,42 @@ class TupleGCSStoreBackend(TupleStoreBackend):
                 gcs_object_name,
                 self.prefix,
             )
+            if self.filepath_prefix and not gcs_object_key.startswith(self.filepath_prefix):
+                # There can be other keys located in the same bucket; they are *not* our keys
+                continue
+            if self.filepath_suffix and not gcs_object_key.endswith(self.filepath_suffix):
+                continue
 
             key = self._convert_filepath_to_key(gcs_object_key)
-            if key:
+            if key and key[:len(prefix)] == prefix:
                 key_list.append(key)
 
         return key_list
 
+    def get_value_version(self, key):
+        gcs_object_key = os.path.join(
+            self.prefix,
+            self._convert_key_to_filepath(key)
+        )
+
+        from google.cloud import storage
+        gcs = storage.Client(project=self.project)
+        blob = gcs.get_bucket(self.bucket).get_blob(gcs_object_key)
+        if blob is None:
+            return None
+        return blob.etag
+
     def _has_key(self, key):
         all_keys = self.list_keys()
         return key in all_keys
 
+    def _remove_key(self, key):
+        gcs_object_key = os.path.join(
+            self.prefix,
+            self._convert_key_to_filepath(key)
+        )
+
+        from google.cloud import storage
+        gcs = storage.Client(project=self.project)
+        gcs.get_bucket(self.bucket).delete_blob(gcs_object_key)
+
@@ -1,16 +1,59 @@
+from collections import defaultdict
+
 from great_expectations.core import ExpectationSuiteValidationResultSchema
 from great_expectations.data_context.store.database_store_backend import DatabaseStoreBackend
 from great_expectations.data_context.store.store import Store
 from great_expectations.data_context.store.tuple_store_backend import TupleStoreBackend
-from great_expectations.data_context.types.resource_identifiers import ValidationResultIdentifier
-from great_expectations.data_context.util import load_class
+from great_expectations.data_context.types.resource_identifiers import (
+    ExpectationSuiteIdentifier,
+    ValidationResultIdentifier,
+)
+from great_expectations.data_context.store.retention import RetentionPolicy
+from great_expectations.data_context.store.value_formats import (
+    GzipJsonFormat,
+    JsonFormat,
+    get_store_value_format,
+    loads_store_value,
+)
+from great_expectations.data_context.util import instantiate_class_from_config, load_class, to_run_id
+from great_expectations.exceptions import DataContextError
 
 
 class ValidationsStore(Store):
+    """A ValidationsStore stores validation results, keyed by ValidationResultIdentifier.
+
+    Validation results are stored as json by default. serialization_format "gzip_json", "zstd_json" (which requires
+    the zstandard package) or "msgpack" (which requires the msgpack package) writes them compressed or packed
+    instead, with a matching default filepath_suffix (".json.gz", ".json.zst" or ".msgpack") on tuple store backends
+    and a binary value column on a DatabaseStoreBackend. Validation results previously written as ".json" files
+    remain readable and listed after the format of a tuple store backend is changed.
+
+    A retention_policy (see RetentionPolicy) applied with apply_retention_policy removes the results of old runs,
+    keeping the keep_last_runs most recent runs of each expectation suite and the runs not older than max_age_days.
+    With a tuple store backend, the results of runs older than archive_after_days are compacted into one gzipped
+    archive per month (an "archives/<YYYY-MM>.ge_archive.gz" file or object in the store); archived results are
+    still read, listed and removed through the store while archive_after_days is set.
+    """
     _key_class = ValidationResultIdentifier
+    archive_key_prefix = "archives"
+    archive_filepath_suffix = ".ge_archive.gz"
 
-    def __init__(self, store_backend=None, runtime_environment=None):
+    def __init__(self, store_backend=None, runtime_environment=None, serialization_format="json",
+                 retention_policy=None):
         self._expectationSuiteValidationResultSchema = ExpectationSuiteValidationResultSchema(strict=True)
+        self._value_format = get_store_value_format(serialization_format)
+        self._legacy_store_backend = None
+        self._archive_store_backend = None
+        self._archive_format = GzipJsonFormat()
+        # archive month -> (version of the archive, content of the archive)
+        self._archive_cache = {}
+        self._has_tuple_store_backend = False
+
+        if isinstance(retention_policy, dict):
+            retention_policy = RetentionPolicy(**retention_policy)
+        if retention_policy is not None and retention_policy.downsample_after_days is not None:
+            raise DataContextError("ValidationsStore does not support downsample_after_days in its retention_policy")
+        self._retention_policy = retention_policy
 
         if store_backend is not None:
             store_backend_module_name = store_backend.get("module_name", "great_expectations.data_context.store")
@@ -18,9 +61,39 @@ class ValidationsStore(Store):
             store_backend_class = load_class(store_backend_class_name, store_backend_module_name)
 
             if issubclass(store_backend_class, TupleStoreBackend):
+                self._has_tuple_store_backend = True
                 # Provide defaults for this common case
-                store_backend["filepath_suffix"] = store_backend.get("filepath_suffix", ".json")
+                if self._value_format.suffix != JsonFormat.suffix and "filepath_suffix" not in store_backend:
+                    # Results written before the serialization format was changed are read from ".json" files
+                    legacy_store_backend = dict(store_backend)
+                    legacy_store_backend["filepath_suffix"] = JsonFormat.suffix
+                    legacy_store_backend.pop("key_index", None)
+                    legacy_store_backend.pop("cache", None)
+                    self._legacy_store_backend = instantiate_class_from_config(
+                        config=legacy_store_backend,
+                        runtime_environment=runtime_environment or {},
+                        config_defaults={
+                            "module_name": "great_expectations.data_context.store"
+                        }
+                    )
+                store_backend["filepath_suffix"] = store_backend.get("filepath_suffix", self._value_format.suffix)
+
+                if retention_policy is not None and retention_policy.archive_after_days is not None:
+                    # Archives are written next to the results, with a suffix that the store backend does not list
+                    archive_store_backend = dict(store_backend)
+                    for option in ["filepath_template", "fixed_length_key", "key_index", "cache"]:
+                        archive_store_backend.pop(option, None)
+                    archive_store_backend["filepath_suffix"] = self.archive_filepath_suffix
+                    self._archive_store_backend = instantiate_class_from_config(
+                        config=archive_store_backend,
+                        runtime_environment=runtime_environment or {},
+                        config_defaults={
+                            "module_name": "great_expectations.data_context.store"
+                        }
+                    )
             elif issubclass(store_backend_class, DatabaseStoreBackend):
+                if self._is_binary_format:
+                    store_backend["value_type"] = store_backend.get("value_type", "binary")
                 # Provide defaults for this common case
                 store_backend["table_name"] = store_backend.get("table_name", "ge_validations_store")
                 store_backend["key_columns"] = store_backend.get(
@@ -30,10 +103,383 @@ class ValidationsStore(Store):
                         "batch_identifier"
                     ]
                 )
+        if retention_policy is not None and retention_policy.archive_after_days is not None and \
+                not self._has_tuple_store_backend:
+            raise DataContextError("archive_after_days in the retention_policy of a ValidationsStore requires a "
+                                   "TupleStoreBackend")
         super(ValidationsStore, self).__init__(store_backend=store_backend, runtime_environment=runtime_environment)
 
+    @property
+    def retention_policy(self):
+        return self._retention_policy
+
+    @property
+    def serialization_format(self):
+        return self._value_format.name
+
+    @property
+    def _is_binary_format(self):
+        return self._value_format.name != JsonFormat.name
+
     def serialize(self, key, value):
-        return self._expectationSuiteValidationResultSchema.dumps(value).data
+        if not self._is_binary_format:
+            return self._expectationSuiteValidationResultSchema.dumps(value).data
+        return self._value_format.dumps(self._expectationSuiteValidationResultSchema.dump(value).data)
 
     def deserialize(self, key, value):
-        return self._expectationSuiteValidationResultSchema.loads(value).data
+        if not self._is_binary_format:
+            return self._expectationSuiteValidationResultSchema.loads(value).data
+        # Values of any format are read, so that results written before the format was changed can be loaded
+        return self._expectationSuiteValidationResultSchema.load(loads_store_value(value)).data
+
+    def get(self, key):
+        self._validate_key(key)
+        try:
+            return self._get_stored(key)
+        except Exception:
+            archived_value = self._get_archived_value(key)
+            if archived_value is None:
+                raise
+            return self._expectationSuiteValidationResultSchema.load(archived_value).data
+
+    def _get_stored(self, key):
+        if not self._is_binary_format or not self._has_tuple_store_backend:
+            return super(ValidationsStore, self).get(key)
+
+        key_tuple = self.key_to_tuple(key)
+        try:
+            value = self._store_backend.get(key_tuple, binary=True)
+        except Exception:
+            if self._legacy_store_backend is None or not self._legacy_store_backend.has_key(key_tuple):
+                raise
+            value = self._legacy_store_backend.get(key_tuple, binary=True)
+        return self.deserialize(key, value)
+
+    def set(self, key, value):
+        if not self._is_binary_format:
+            return super(ValidationsStore, self).set(key, value)
+
+        self._validate_key(key)
+        return self._store_backend.set(
+            self.key_to_tuple(key), self.serialize(key, value), content_type=self._value_format.content_type
+        )
+
+    def list_keys(self):
+        keys = super(ValidationsStore, self).list_keys()
+        other_key_tuples = []
+        if self._legacy_store_backend is not None:
+            other_key_tuples += self._legacy_store_backend.list_keys()
+        if self._archive_store_backend is not None:
+            other_key_tuples += self._list_archived_key_tuples()
+        if len(other_key_tuples) > 0:
+            listed_keys = set(keys)
+            for key in [self.tuple_to_key(key_tuple) for key_tuple in other_key_tuples]:
+                if key not in listed_keys:
+                    listed_keys.add(key)
+                    keys.append(key)
+        return keys
+
+    def has_key(self, key):
+        key_tuple = self.key_to_tuple(key)
+        if self._store_backend.has_key(key_tuple):
+            return True
+        if self._legacy_store_backend is not None and self._legacy_store_backend.has_key(key_tuple):
+            return True
+        return self._get_archived_value(key) is not None
+
+    def _list_keys_in_range(self, prefix, start, end):
+        key_tuples = self._store_backend.list_keys_in_range(prefix=prefix, start=start, end=end, descending=True)
+        other_key_tuples = []
+        if self._legacy_store_backend is not None:
+            other_key_tuples.append(
+                self._legacy_store_backend.list_keys_in_range(prefix=prefix, start=start, end=end, descending=True)
+            )
+        # Only the archives of the months that the range covers are read
+        archive_months = self._list_archive_months(start, end)
+        if len(archive_months) > 0:
+            position = len(prefix)
+            archived_key_tuples = []
+            for key_tuple in self._list_archived_key_tuples(archive_months):
+                if len(key_tuple) <= position or \
+                        any(element is not None and key_tuple[idx] != element for idx, element in enumerate(prefix)):
+                    continue
+                if (start is not None and key_tuple[position] < start) or \
+                        (end is not None and key_tuple[position] > end):
+                    continue
+                archived_key_tuples.append(key_tuple)
+            other_key_tuples.append(
+                sorted(archived_key_tuples, key=lambda key_tuple: (key_tuple[position], key_tuple), reverse=True)
+            )
+        if len(other_key_tuples) == 0:
+            return key_tuples
+        return self._merge_descending([key_tuples] + other_key_tuples, len(prefix))
+
+    @staticmethod
+    def _merge_descending(key_tuple_iterables, position):
+        """Lazily merge iterables of key tuples that are each ordered by descending run id, skipping duplicates, so
+        that a limited listing only reads the keys it returns."""
+        iterators = [iter(key_tuples) for key_tuples in key_tuple_iterables]
+        heads = {}
+        for idx, iterator in enumerate(iterators):
+            head = next(iterator, None)
+            if head is not None:
+                heads[idx] = head
+        merged_key_tuples = set()
+        while len(heads) > 0:
+            idx = max(heads, key=lambda head_idx: (heads[head_idx][position], heads[head_idx]))
+            key_tuple = heads[idx]
+            head = next(iterators[idx], None)
+            if head is None:
+                del heads[idx]
+            else:
+                heads[idx] = head
+            if key_tuple not in merged_key_tuples:
+                merged_key_tuples.add(key_tuple)
+                yield key_tuple
+
+    def remove_key(self, key):
+        self.remove_many([key])
+
+    def remove_many(self, keys):
+        """Remove the validation results of several keys, whether they are stored, stored in the legacy format or
+        archived."""
+        stored_key_tuples = []
+        legacy_key_tuples = []
+        archived_key_tuples = defaultdict(list)
+        for key in keys:
+            self._validate_key(key)
+            key_tuple = self.key_to_tuple(key)
+            if self._store_backend.has_key(key_tuple):
+                stored_key_tuples.append(key_tuple)
+            elif self._legacy_store_backend is not None and self._legacy_store_backend.has_key(key_tuple):
+                legacy_key_tuples.append(key_tuple)
+            elif self._get_archived_value(key) is not None:
+                archived_key_tuples[RetentionPolicy.get_archive_month(key.run_id)].append(key_tuple)
+            else:
+                raise DataContextError("Unable to remove validation result {}: it is not in the store".format(key))
+
+        if len(stored_key_tuples) > 0:
+            self._store_backend.remove_many(stored_key_tuples)
+        if len(legacy_key_tuples) > 0:
+            self._legacy_store_backend.remove_many(legacy_key_tuples)
+        for archive_month, key_tuples in archived_key_tuples.items():
+            archive = dict(self._read_archive(archive_month))
+            for key_tuple in key_tuples:
+                del archive[self._to_archive_path(key_tuple)]
+            self._write_archive(archive_month, archive)
+
+    def _to_archive_path(self, key_tuple):
+        return "/".join(key_tuple)
+
+    def _get_archive_key(self, archive_month):
+        return self.archive_key_prefix, archive_month
+
+    def _read_archive(self, archive_month):
+        """Returns the content of the archive of a month, a dict of validation results (as dicts) by key path."""
+        archive_key = self._get_archive_key(archive_month)
+        version = self._archive_store_backend.get_value_version(archive_key)
+        cached_archive = self._archive_cache.get(archive_month)
+        if cached_archive is not None and version is not None and cached_archive[0] == version:
+            return cached_archive[1]
+        if not self._archive_store_backend.has_key(archive_key):
+            return {}
+        archive = self._archive_format.loads(self._archive_store_backend.get(archive_key, binary=True))
+        self._archive_cache[archive_month] = (version, archive)
+        return archive
+
+    def _write_archive(self, archive_month, archive):
+        archive_key = self._get_archive_key(archive_month)
+        self._archive_cache.pop(archive_month, None)
+        if len(archive) == 0:
+            self._archive_store_backend.remove_key(archive_key)
+        else:
+            self._archive_store_backend.set(archive_key, self._archive_format.dumps(archive),
+                                            content_type="application/gzip")
+
+    def _list_archive_months(self, start=None, end=None):
+        """Returns the months of the archives of the store, restricted to the months of the runs between start and
+        end when they are times."""
+        if self._archive_store_backend is None:
+            return []
+        start_month = RetentionPolicy.get_archive_month(start) if start is not None else None
+        end_month = RetentionPolicy.get_archive_month(end) if end is not None else None
+        archive_months = []
+        for archive_key in self._archive_store_backend.list_keys((self.archive_key_prefix,)):
+            if len(archive_key) != 2:
+                continue
+            archive_month = archive_key[1]
+            if (start_month is not None and archive_month < start_month) or \
+                    (end_month is not None and archive_month > end_month):
+                continue
+            archive_months.append(archive_month)
+        return sorted(archive_months)
+
+    def _list_archived_key_tuples(self, archive_months=None):
+        if archive_months is None:
+            archive_months = self._list_archive_months()
+        key_tuples = []
+        for archive_month in archive_months:
+            key_tuples += [tuple(archive_path.split("/")) for archive_path in self._read_archive(archive_month)]
+        return key_tuples
+
+    def _get_archived_value(self, key):
+        if self._archive_store_backend is None:
+            return None
+        archive_month = RetentionPolicy.get_archive_month(key.run_id)
+        if archive_month is None:
+            return None
+        return self._read_archive(archive_month).get(self._to_archive_path(self.key_to_tuple(key)))
+
+    def archive(self, keys):
+        """Compact the stored validation results of keys into the archives of the months of their runs."""
+        if self._archive_store_backend is None:
+            raise DataContextError("Validation results can only be archived by a ValidationsStore with a "
+                                   "TupleStoreBackend")
+        keys_by_month = defaultdict(list)
+        for key in keys:
+            self._validate_key(key)
+            archive_month = RetentionPolicy.get_archive_month(key.run_id)
+            if archive_month is None:
+                raise DataContextError("Unable to archive validation result {}: its run_id is not a time".format(key))
+            keys_by_month[archive_month].append(key)
+
+        for archive_month, month_keys in sorted(keys_by_month.items()):
+            archive = dict(self._read_archive(archive_month))
+            stored_key_tuples = []
+            legacy_key_tuples = []
+            for key in month_keys:
+                key_tuple = self.key_to_tuple(key)
+                if self._store_backend.has_key(key_tuple):
+                    value = self._store_backend.get(key_tuple, binary=True)
+                    stored_key_tuples.append(key_tuple)
+                else:
+                    value = self._legacy_store_backend.get(key_tuple, binary=True)
+                    legacy_key_tuples.append(key_tuple)
+                archive[self._to_archive_path(key_tuple)] = loads_store_value(value)
+            # The archive is written before the results are removed, so that no result is lost if the store fails
+            self._write_archive(archive_month, archive)
+            if len(stored_key_tuples) > 0:
+                self._store_backend.remove_many(stored_key_tuples)
+            if len(legacy_key_tuples) > 0:
+                self._legacy_store_backend.remove_many(legacy_key_tuples)
+
+    def apply_retention_policy(self, dry_run=False, now=None):
+        """Remove (and archive) the validation results selected by the retention_policy of the store.
+
+        Args:
+            dry_run: only select the results to remove and archive, without changing the store
+            now (datetime): the time at which the policy is applied, in UTC; defaults to the current time
+
+        Returns:
+            a dict with the ValidationResultIdentifiers of the removed results ("removed_keys") and of the results
+            archived ("archived_keys")
+        """
+        if self._retention_policy is None:
+            raise DataContextError("This ValidationsStore has no retention_policy")
+
+        keys_by_suite = defaultdict(list)
+        for key in self.list_keys():
+            keys_by_suite[key.expectation_suite_identifier].append(key)
+
+        removed_keys = []
+        for suite_keys in keys_by_suite.values():
+            removed_run_ids = self._retention_policy.select_runs_to_remove([key.run_id for key in suite_keys], now)
+            removed_keys += [key for key in suite_keys if key.run_id in removed_run_ids]
+
+        archived_keys = []
+        if self._retention_policy.archive_after_days is not None:
+            archived_key_tuples = set(self._list_archived_key_tuples())
+            removed_key_set = set(removed_keys)
+            remaining_keys = [
+                key for suite_keys in keys_by_suite.values() for key in suite_keys
+                if key not in removed_key_set and self.key_to_tuple(key) not in archived_key_tuples
+            ]
+            archived_run_ids = self._retention_policy.select_runs_to_archive(
+                [key.run_id for key in remaining_keys], now
+            )
+            archived_keys = [key for key in remaining_keys if key.run_id in archived_run_ids]
+
+        if not dry_run:
+            if len(removed_keys) > 0:
+                self.remove_many(removed_keys)
+            if len(archived_keys) > 0:
+                self.archive(archived_keys)
+        return {
+            "removed_keys": removed_keys,
+            "archived_keys": archived_keys,
+        }
+
+    def get_latest_run_key(self, expectation_suite_name, batch_identifier=None):
+        """Get the key of the most recent validation result of an expectation suite (and batch).
+
+        Returns:
+            a ValidationResultIdentifier, or None if the suite has no validation results
+        """
+        run_keys = self.list_run_keys(expectation_suite_name, batch_identifier=batch_identifier, limit=1)
+        if len(run_keys) == 0:
+            return None
+        return run_keys[0]
+
+    def list_run_keys(self, expectation_suite_name=None, batch_identifier=None, start_run_id=None, end_run_id=None,
+                      limit=None):
+        """List the keys of validation results, most recent run first.
+
+        Runs are ordered by run_id, like the default run ids (UTC timestamps formatted as "%Y%m%dT%H%M%S.%fZ"), which
+        sort chronologically. When the store backend indexes its keys (a DatabaseStoreBackend, or a
+        TupleFilesystemStoreBackend with a key_index), the results of a suite are looked up in the index instead of
+        listing all keys.
+
+        Args:
+            expectation_suite_name: only list validation results of this suite
+            batch_identifier: only list validation results of this batch
+            start_run_id (str or datetime): only list runs with a run_id greater than or equal to this one
+            end_run_id (str or datetime): only list runs with a run_id less than or equal to this one
+            limit: the maximum number of keys to return
+
+        Returns:
+            a list of ValidationResultIdentifiers
+        """
+        start_run_id = to_run_id(start_run_id)
+        end_run_id = to_run_id(end_run_id)
+
+        if expectation_suite_name is not None:
+            prefix = self.key_to_tuple(ValidationResultIdentifier(
+                expectation_suite_identifier=ExpectationSuiteIdentifier(expectation_suite_name),
+                run_id=None,
+                batch_identifier=None
+            ))[:-2]
+        elif self._use_fixed_length_key:
+            # Any suite name
+            prefix = (None,)
+        else:
+            prefix = None
+
+        if prefix is not None:
+            keys = (
+                self.tuple_to_key(key_tuple) for key_tuple in self._list_keys_in_range(
+                    prefix, start_run_id, end_run_id
+                )
+                # Variable-length keys of suites whose name extends this one also have this prefix
+                if len(key_tuple) == len(prefix) + 2
+            )
+        else:
+            # The suite name of variable-length keys spans a variable number of elements, so their run ids cannot be
+            # ranged by the store backend
+            keys = sorted(
+                [
+                    key for key in self.list_keys()
+                    if (start_run_id is None or key.run_id >= start_run_id) and
+                       (end_run_id is None or key.run_id <= end_run_id)
+                ],
+                key=lambda key: (key.run_id, key.to_tuple()),
+                reverse=True
+            )
+
+        run_keys = []
+        for key in keys:
+            if batch_identifier is not None and key.batch_identifier != batch_identifier:
+                continue
+            run_keys.append(key)
+            if limit is not None and len(run_keys) >= limit:
+                break
+        return run_keys
@@ -0,0 +1,122 @@
+import gzip
+import json
+from io import BytesIO
+
+from six import string_types
+
+import great_expectations.exceptions as ge_exceptions
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+class StoreValueFormat(object):
+    """A StoreValueFormat converts the json-serializable dicts of stored objects to the values written by a store
+    backend, and back. Its suffix and content_type describe the values it writes."""
+    name = None
+    suffix = None
+    content_type = None
+
+    def dumps(self, value_dict):
+        raise NotImplementedError
+
+    def loads(self, value):
+        raise NotImplementedError
+
+
+class JsonFormat(StoreValueFormat):
+    name = "json"
+    suffix = ".json"
+    content_type = "application/json"
+
+    def dumps(self, value_dict):
+        return json.dumps(value_dict, indent=2)
+
+    def loads(self, value):
+        if isinstance(value, bytes):
+            value = value.decode("utf-8")
+        return json.loads(value)
+
+
+class GzipJsonFormat(JsonFormat):
+    name = "gzip_json"
+    suffix = ".json.gz"
+
+    def dumps(self, value_dict):
+        buffer = BytesIO()
+        # mtime is fixed so that equal values are written as equal bytes
+        with gzip.GzipFile(fileobj=buffer, mode="wb", mtime=0) as gzip_file:
+            gzip_file.write(json.dumps(value_dict).encode("utf-8"))
+        return buffer.getvalue()
+
+    def loads(self, value):
+        with gzip.GzipFile(fileobj=BytesIO(value), mode="rb") as gzip_file:
+            return super(GzipJsonFormat, self).loads(gzip_file.read())
+
+
+class ZstdJsonFormat(JsonFormat):
+    name = "zstd_json"
+    suffix = ".json.zst"
+
+    def __init__(self):
+        if zstandard is None:
+            raise ge_exceptions.DataContextError("ModuleNotFoundError: No module named 'zstandard'")
+
+    def dumps(self, value_dict):
+        return zstandard.ZstdCompressor().compress(json.dumps(value_dict).encode("utf-8"))
+
+    def loads(self, value):
+        return super(ZstdJsonFormat, self).loads(zstandard.ZstdDecompressor().decompressobj().decompress(value))
+
+
+class MsgpackFormat(StoreValueFormat):
+    name = "msgpack"
+    suffix = ".msgpack"
+    content_type = "application/msgpack"
+
+    def __init__(self):
+        if msgpack is None:
+            raise ge_exceptions.DataContextError("ModuleNotFoundError: No module named 'msgpack'")
+
+    def dumps(self, value_dict):
+        return msgpack.packb(value_dict, use_bin_type=True)
+
+    def loads(self, value):
+        return msgpack.unpackb(value, raw=False)
+
+
+store_value_formats = {
+    value_format.name: value_format for value_format in [JsonFormat, GzipJsonFormat, ZstdJsonFormat, MsgpackFormat]
+}
+
+
+def get_store_value_format(name):
+    try:
+        return store_value_formats[name]()
+    except KeyError:
+        raise ValueError("Unknown serialization_format '%s'; available formats are %s" % (
+            name, ", ".join(sorted(store_value_formats.keys()))
+        ))
+
+
+def loads_store_value(value):
+    """Load a value written in any of the store value formats, recognized from its content."""
+    if isinstance(value, string_types) and not isinstance(value, bytes):
+        return JsonFormat().loads(value)
+    if value.startswith(_GZIP_MAGIC):
+        return GzipJsonFormat().loads(value)
+    if value.startswith(_ZSTD_MAGIC):
+        return ZstdJsonFormat().loads(value)
+    if value.lstrip()[:1] in (b"{", b"["):
+        return JsonFormat().loads(value)
+    return MsgpackFormat().loads(value)
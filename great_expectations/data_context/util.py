@@ -1,3 +1,4 @@
+import datetime
 import logging
 import os
 import errno
@@ -198,6 +199,41 @@ def substitute_all_config_variables(data, replace_variables_dict):
     return substitute_config_variable(data, replace_variables_dict)
 
 
+def to_run_id(run_id):
+    """Format datetimes like default run ids, which sort chronologically."""
+    if isinstance(run_id, datetime.datetime):
+        return run_id.strftime("%Y%m%dT%H%M%S.%fZ")
+    return run_id
+
+
+_run_id_time_formats = [
+    "%Y%m%dT%H%M%S.%fZ",
+    "%Y%m%dT%H%M%S.%f",
+    "%Y%m%dT%H%M%SZ",
+    "%Y%m%dT%H%M%S",
+    "%Y-%m-%dT%H:%M:%S.%fZ",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y%m%d",
+    "%Y-%m-%d",
+]
+
+
+def run_id_to_datetime(run_id):
+    """Parse the time of a run id formatted like the default run ids (or as an ISO 8601 date or time).
+
+    Returns:
+        a naive datetime (in UTC for the default run ids), or None if the run id is not a time (e.g. "profiling")
+    """
+    for time_format in _run_id_time_formats:
+        try:
+            return datetime.datetime.strptime(run_id, time_format)
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
 def file_relative_path(dunderfile, relative_path):
     """
     This function is useful when one needs to load a file that is
@@ -2,9 +2,16 @@ from __future__ import division
 
 import inspect
 import sys
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
+try:
+    from collections.abc import Hashable
+except ImportError:  # Python 2.7
+    from collections import Hashable
 from six import PY3, string_types
+from six.moves import queue
 from functools import wraps
-from numbers import Number
+from numbers import Integral, Number
 from dateutil.parser import parse
 from datetime import datetime, timedelta
 
@@ -15,14 +22,30 @@ elif sys.version_info.major == 3:  # If python 3
     from itertools import zip_longest
     from functools import lru_cache
 
-from great_expectations.data_asset.data_asset import DataAsset
+from great_expectations.core import (
+    ExpectationConfiguration,
+    ExpectationSuite,
+    ExpectationSuiteValidationResult,
+    convert_to_json_serializable,
+    expectationSuiteSchema,
+)
+from great_expectations.data_asset.data_asset import DataAsset, _calc_validation_statistics
 from great_expectations.data_asset.util import DocInherit, parse_result_format
 from great_expectations.dataset.util import (
     build_continuous_partition_object,
     build_categorical_partition_object,
+    get_sample_config,
     is_valid_partition_object,
-    is_valid_categorical_partition_object
+    is_valid_categorical_partition_object,
+    wilson_interval,
+)
+from great_expectations.dataset.sketch import (
+    FrequentItemsSketch,
+    HyperLogLogSketch,
+    KLLSketch,
 )
+from great_expectations.dataset.partial_metrics import PartialMetrics
+from great_expectations.exceptions import GreatExpectationsError
 
 import pandas as pd
 import numpy as np
@@ -105,6 +128,9 @@ class MetaDataset(DataAsset):
             nonnull_count = self.get_column_nonnull_count(column)
             null_count = element_count - nonnull_count
 
+            if "result_format" in argspec:
+                # Let the expectation skip computing what the result format does not report
+                kwargs["result_format"] = result_format
             evaluation_result = func(self, column, *args, **kwargs)
 
             if 'success' not in evaluation_result:
@@ -167,19 +193,195 @@ class Dataset(MetaDataset):
         'get_column_count',
         'get_table_columns',
         'get_column_count_in_range',
+        'get_column_cardinality_sketch',
+        'get_column_quantile_sketch',
+        'get_column_frequent_items_sketch',
+    ]
+
+    # column aggregates computed by aggregate expectations, which validate(partition_by=...) computes for every
+    # partition in the grouped pass that identifies the partitions
+    expectation_column_aggregates = {
+        'expect_column_min_to_be_between': ['min'],
+        'expect_column_max_to_be_between': ['max'],
+        'expect_column_mean_to_be_between': ['mean'],
+        'expect_column_stdev_to_be_between': ['stdev'],
+        'expect_column_unique_value_count_to_be_between': ['unique_count'],
+        'expect_column_proportion_of_unique_values_to_be_between': ['unique_count'],
+    }
+
+    # single-column aggregates that backends may compute for many columns at once (see prefetch_column_aggregates);
+    # each name corresponds to the getter "get_column_<name>"
+    prefetchable_column_aggregates = [
+        'nonnull_count',
+        'unique_count',
+        'min',
+        'max',
+        'mean',
+        'stdev',
     ]
 
     def __init__(self, *args, **kwargs):
         # NOTE: using caching makes the strong assumption that the user will not modify the core data store
         # (e.g. self.spark_df) over the lifetime of the dataset instance
         self.caching = kwargs.pop("caching", True)
+        self._prefetched_column_aggregates = {}
+        # results of the cached getters, shared with the worker copies of the dataset (see _get_worker_copy)
+        self._shared_getter_results = {}
+        self._prior_metrics = kwargs.pop("prior_metrics", None)
 
         super(Dataset, self).__init__(*args, **kwargs)
 
+        prefetchable_getters = ["get_row_count"] + \
+            ["get_column_" + aggregate for aggregate in self.prefetchable_column_aggregates]
+        combinable_getters = PartialMetrics.combinable_getters + ["get_column_mean"]
+        for func in self.hashable_getters:
+            getter = getattr(self, func)
+            if self.caching and func in prefetchable_getters:
+                getter = self._use_prefetched_column_aggregates(getter)
+            if func in combinable_getters:
+                getter = self._combine_with_prior_metrics(func, getter)
+            if self.caching:
+                getter = self._use_shared_getter_results(func, getter)
+                getter = lru_cache(maxsize=None)(getter)
+            setattr(self, func, getter)
+
+    def _use_prefetched_column_aggregates(self, getter):
+        """Wraps get_row_count or a single-column getter so that it returns a prefetched value when one is available.
+        Prefetched values are only used when the getter is called with its default options (e.g.
+        get_column_min(column))."""
+        @wraps(getter)
+        def wrapper(*args, **kwargs):
+            if not any(args[1:]) and not any(kwargs.values()):
+                try:
+                    return self._prefetched_column_aggregates[(getter.__name__,) + tuple(args[:1])]
+                except KeyError:
+                    pass
+            return getter(*args, **kwargs)
+
+        return wrapper
+
+    def _use_shared_getter_results(self, func, getter):
+        """Wraps a cached getter so that its results are also recorded in _shared_getter_results, which worker
+        copies of the dataset share: a worker copy does not compute again an aggregate that the dataset or another
+        worker copy already computed."""
+        @wraps(getter)
+        def wrapper(*args, **kwargs):
+            key = (func, args, tuple(sorted(kwargs.items())))
+            try:
+                return self._shared_getter_results[key]
+            except KeyError:
+                pass
+            result = getter(*args, **kwargs)
+            self._shared_getter_results[key] = result
+            return result
+
+        return wrapper
+
+    def _combine_with_prior_metrics(self, func, getter):
+        """Wraps a getter so that, when the dataset has prior_metrics, it returns its result for the rows of the
+        prior metrics and of this dataset."""
+        @wraps(getter)
+        def wrapper(*args, **kwargs):
+            if self._prior_metrics is None:
+                return getter(*args, **kwargs)
+            if func == "get_column_mean":
+                column = args[0] if len(args) > 0 else kwargs["column"]
+                nonnull_count = self.get_column_nonnull_count(column)
+                if nonnull_count == 0:
+                    return None
+                return self.get_column_sum(column) / nonnull_count
+            return self._prior_metrics.combine(func, getter(*args, **kwargs), *args, **kwargs)
+
+        return wrapper
+
+    @property
+    def prior_metrics(self):
+        return self._prior_metrics
+
+    def set_prior_metrics(self, prior_metrics):
+        """Set the partial metrics of rows that precede this dataset's rows, for example the rows of an append-only
+        table that were validated by earlier runs.
+
+        The row count, non-null counts, min, max, sum, mean and sketches of the dataset then describe the rows of
+        the prior metrics and of the dataset together, so table-level and aggregate expectations evaluate the whole
+        data asset while only reading the new rows. Map expectations, and aggregates that cannot be combined (such
+        as exact unique counts, quantiles or standard deviations), evaluate only the rows of the dataset.
+        expect_column_proportion_of_unique_values_to_be_between then estimates the number of unique values with the
+        combined cardinality sketch, and the expectations that compare the value counts of the rows of the dataset
+        with the combined non-null count (expect_column_chisquare_test_p_value_to_be_greater_than and
+        expect_column_kl_divergence_to_be_less_than) raise an error.
+
+        Args:
+            prior_metrics (PartialMetrics or None): the metrics of the preceding rows; None to evaluate only the \
+                rows of the dataset
+
+        Returns:
+            None
+        """
+        self._prior_metrics = prior_metrics
         if self.caching:
-            for func in self.hashable_getters:
-                caching_func = lru_cache(maxsize=None)(getattr(self, func))
-                setattr(self, func, caching_func)
+            combinable_getters = PartialMetrics.combinable_getters + ["get_column_mean"]
+            for func in combinable_getters:
+                getattr(self, func).cache_clear()
+            # Worker copies made from now on share the results computed with the new prior metrics only
+            self._shared_getter_results = dict(
+                (key, result) for key, result in self._shared_getter_results.items()
+                if key[0] not in combinable_getters
+            )
+
+    def _check_no_prior_metrics(self, expectation_type):
+        """Raise an error if the dataset has prior_metrics, for expectations that weigh metrics of the rows of the
+        dataset by metrics that are combined with the prior metrics."""
+        if self._prior_metrics is not None:
+            raise GreatExpectationsError(
+                "%s cannot be evaluated with prior_metrics: the value counts of the rows of the dataset cannot be "
+                "combined with the prior metrics" % expectation_type
+            )
+
+    def get_partial_metrics(self, columns=None):
+        """Get the PartialMetrics of the dataset, including the rows of its prior_metrics, if any.
+
+        Args:
+            columns (list or None): the columns to summarize; all columns by default
+
+        Returns:
+            PartialMetrics
+        """
+        return PartialMetrics.from_dataset(self, columns=columns)
+
+    def prefetch_column_aggregates(self, column_aggregates):
+        """Compute single-column aggregates for many columns in as few engine calls as the backend allows.
+
+        Subsequent calls to the corresponding getters (for example ``get_column_min(column)``) return the prefetched
+        values instead of querying the data again, so expectations evaluated afterwards produce exactly the same
+        results. Prefetching has no effect when caching is disabled.
+
+        Args:
+            column_aggregates (dict): maps column names to lists of aggregate names drawn from \
+                `prefetchable_column_aggregates`
+
+        Returns:
+            None
+        """
+        if not self.caching:
+            return
+
+        for aggregate_list in column_aggregates.values():
+            for aggregate in aggregate_list:
+                if aggregate not in self.prefetchable_column_aggregates:
+                    raise ValueError("Unrecognized column aggregate: %s" % aggregate)
+
+        for column, aggregates in self._get_column_aggregates(column_aggregates).items():
+            for aggregate, value in aggregates.items():
+                self._prefetched_column_aggregates[("get_column_" + aggregate, column)] = value
+
+    def _get_column_aggregates(self, column_aggregates):
+        """Compute the requested aggregates in bulk; returns a dict mapping columns to dicts of aggregate values.
+
+        Backends that can compute several aggregates in a single pass override this method. Aggregates that are
+        left out of the returned dict are computed by the usual getters. The default implementation computes
+        nothing in bulk."""
+        return {}
     
     @classmethod
     def from_dataset(cls, dataset=None):
@@ -207,7 +409,7 @@ class Dataset(MetaDataset):
         """Returns: float"""
         raise NotImplementedError
 
-    def get_column_value_counts(self, column, sort="value", collate=None):
+    def get_column_value_counts(self, column, sort="value", collate=None, top_k=None, max_distinct=None):
         """Get a series containing the frequency counts of unique values from the named column.
 
         Args:
@@ -217,6 +419,10 @@ class Dataset(MetaDataset):
                 - if "count" then values will be sorted according to descending count (frequency)
                 - if "none" then values will not be sorted
             collate (string): the collate (sort) method to be used on supported backends (SqlAlchemy only)
+            top_k (int or None): if set, only the top_k most frequent values are returned (ties broken arbitrarily)
+            max_distinct (int or None): if set and the column has more than max_distinct distinct values, only \
+                max_distinct + 1 of them are returned, so that callers can tell that the limit was exceeded without \
+                fetching every value
 
 
         Returns:
@@ -326,6 +532,533 @@ class Dataset(MetaDataset):
         """Returns: int"""
         raise NotImplementedError
 
+    def get_column_type_list_index(self, column, type_lists):
+        """Returns the index of the first of type_lists that expect_column_values_to_be_in_type_list (without
+        mostly) would accept for the column, or None if it would accept none of them.
+
+        The column type is read from the dtype, schema or reflected columns of the dataset; only pandas columns of
+        the generic object dtype are read, once, to collect the types of their non-null values.
+
+        Args:
+            column (string): name of column
+            type_lists (list): the lists of type names to try, in order
+
+        Returns:
+            int or None
+        """
+        raise NotImplementedError
+
+    def get_column_cardinality_sketch(self, column, precision=12):
+        """Get a mergeable sketch estimating the number of distinct non-null values in the column.
+
+        Args:
+            column (string): name of column
+            precision (int): number of bits used to select a HyperLogLog register; higher values use more memory \
+            but give more accurate estimates
+
+        Returns:
+            HyperLogLogSketch
+        """
+        return self._build_column_sketch(column, HyperLogLogSketch(precision=precision))
+
+    def get_column_quantile_sketch(self, column, k=200):
+        """Get a mergeable sketch estimating the quantiles of the non-null values in the column.
+
+        Args:
+            column (string): name of column
+            k (int): the size parameter of the KLL sketch; higher values use more memory but give more accurate \
+            estimates
+
+        Returns:
+            KLLSketch
+        """
+        return self._build_column_sketch(column, KLLSketch(k=k))
+
+    def get_column_frequent_items_sketch(self, column, max_items=100):
+        """Get a mergeable sketch estimating the most frequent non-null values in the column.
+
+        Args:
+            column (string): name of column
+            max_items (int): the maximum number of values tracked by the sketch
+
+        Returns:
+            FrequentItemsSketch
+        """
+        return self._build_column_sketch(column, FrequentItemsSketch(max_items=max_items))
+
+    def _build_column_sketch(self, column, sketch):
+        """Update the provided empty sketch with every non-null value of the column in a single pass.
+
+        Returns: the updated sketch"""
+        raise NotImplementedError
+
+    def random_sample(self, n=None, fraction=None, seed=None):
+        """Returns a new dataset of the same type containing a uniform random sample of this dataset's rows.
+
+        Exactly one of n and fraction must be provided. The expectation suite, batch kwargs, batch markers, batch
+        parameters and data context of this dataset are carried over to the sample.
+
+        Args:
+            n (int): the number of rows to sample; if the dataset has fewer rows, all rows are returned
+            fraction (float): the fraction of rows to sample, between 0 and 1
+            seed (int): seed for the random number generator, honored where the backend supports it
+
+        Returns:
+            Dataset
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def _validate_random_sample_args(n, fraction):
+        if (n is None) == (fraction is None):
+            raise ValueError("Exactly one of n and fraction must be provided to random_sample")
+        if n is not None and (not isinstance(n, Integral) or isinstance(n, bool) or n < 0):
+            raise ValueError("n must be a non-negative integer")
+        if fraction is not None and not 0 < fraction <= 1:
+            raise ValueError("fraction must be between 0 and 1")
+
+    def _get_worker_copy(self):
+        """Returns a new dataset of the same type over the same data, for use by another thread, or None if the
+        backend cannot safely evaluate expectations from several threads. The copy shares any prefetched column
+        aggregates and the results of the cached getters (see _share_worker_state), so no dataset object is ever
+        used concurrently and no aggregate is computed twice."""
+        return None
+
+    def _share_worker_state(self, worker_copy):
+        """Share the prefetched column aggregates, the results of the cached getters and the prior metrics of the
+        dataset with one of its worker copies.
+
+        Returns:
+            the worker copy
+        """
+        worker_copy._prefetched_column_aggregates = self._prefetched_column_aggregates
+        worker_copy._shared_getter_results = self._shared_getter_results
+        worker_copy._prior_metrics = self._prior_metrics
+        return worker_copy
+
+    def _validate_columns_concurrently(self, expectation_suite, max_workers, map_function=None,
+                                       only_return_failures=False, **validate_kwargs):
+        """Validate the expectation suite with the expectations of each column evaluated concurrently.
+
+        Expectations are grouped by column in the same order DataAsset.validate uses, and each group is validated
+        on a worker copy of the dataset, so the combined results match a sequential validation.
+
+        Args:
+            expectation_suite (ExpectationSuite): the suite to validate
+            max_workers (int): the number of columns validated at once
+            map_function (callable): calls a function on each item of a list and returns the results in order, \
+                e.g. the map of a pool shared with other datasets; by default, a pool of max_workers threads is used
+
+        See DataAsset.validate for the other arguments.
+
+        Returns:
+            An ExpectationSuiteValidationResult, or None if the suite has fewer than two groups of expectations or \
+            the dataset cannot be validated concurrently (see _get_worker_copy)
+        """
+        expectation_groups = OrderedDict()
+        for expectation in expectation_suite.expectations:
+            expectation_groups.setdefault(self._get_result_column(expectation), []).append(expectation)
+        if len(expectation_groups) < 2:
+            return None
+
+        worker_datasets = queue.Queue()
+        for _ in range(min(max_workers, len(expectation_groups))):
+            worker_dataset = self._get_worker_copy()
+            if worker_dataset is None:
+                return None
+            worker_datasets.put(worker_dataset)
+
+        def validate_group(expectations):
+            worker_dataset = worker_datasets.get()
+            try:
+                return worker_dataset.validate(self._get_expectation_subsuite(expectation_suite, expectations),
+                                               **validate_kwargs)
+            finally:
+                worker_datasets.put(worker_dataset)
+
+        if map_function is not None:
+            group_results = map_function(validate_group, list(expectation_groups.values()))
+        else:
+            pool = ThreadPool(worker_datasets.qsize())
+            try:
+                group_results = pool.map(validate_group, list(expectation_groups.values()))
+            finally:
+                pool.close()
+                pool.join()
+
+        results = []
+        for group_result in group_results:
+            results.extend(group_result.results)
+        statistics = _calc_validation_statistics(results)
+        if only_return_failures:
+            results = [result for result in results if not result.success]
+        return ExpectationSuiteValidationResult(
+            results=results,
+            success=statistics.success,
+            statistics={
+                "evaluated_expectations": statistics.evaluated_expectations,
+                "successful_expectations": statistics.successful_expectations,
+                "unsuccessful_expectations": statistics.unsuccessful_expectations,
+                "success_percent": statistics.success_percent,
+            },
+            evaluation_parameters=group_results[0].evaluation_parameters,
+            meta=group_results[0].meta
+        )
+
+    def _get_partitions(self, partition_by, column_aggregates):
+        """Split the dataset by the values of the partition_by columns.
+
+        Backends identify the partitions in a single grouped pass over the data, which also computes the row count
+        and the requested column aggregates of every partition; the partition datasets return these from their
+        getters without reading the data again.
+
+        Args:
+            partition_by (list): the names of the columns whose values identify a partition
+            column_aggregates (dict): maps column names to lists of aggregate names drawn from \
+                `prefetchable_column_aggregates`
+
+        Returns:
+            OrderedDict mapping the tuple of partition_by values of each partition to a dataset of its rows, in the \
+            order of the partition keys
+        """
+        raise NotImplementedError
+
+    def _get_partition_dataset_kwargs(self):
+        """Returns the kwargs used to construct the dataset of a partition of this dataset"""
+        partition_kwargs = self._get_derived_dataset_kwargs()
+        # Expectations are only evaluated when the partitions are validated
+        partition_kwargs["expectation_suite"] = None
+        return partition_kwargs
+
+    def _get_suite_column_aggregates(self, expectation_suite):
+        """Returns the column aggregates computed by the aggregate expectations of the suite (see
+        expectation_column_aggregates)."""
+        if expectation_suite is None:
+            expectation_suite = self.get_expectation_suite(discard_failed_expectations=False, suppress_warnings=True)
+        column_aggregates = {}
+        for expectation in getattr(expectation_suite, "expectations", []):
+            column = expectation.kwargs.get("column")
+            if not isinstance(column, string_types):
+                continue
+            aggregates = column_aggregates.setdefault(column, ["nonnull_count"])
+            for aggregate in self.expectation_column_aggregates.get(expectation.expectation_type, []):
+                if aggregate not in aggregates:
+                    aggregates.append(aggregate)
+        return column_aggregates
+
+    def _validate_partitions(self, partition_by, expectation_suite=None, **validate_kwargs):
+        if isinstance(partition_by, string_types):
+            partition_by = [partition_by]
+        partition_by = list(partition_by)
+        if len(partition_by) == 0:
+            raise ValueError("partition_by must name at least one column")
+        for column in partition_by:
+            if column not in self.get_table_columns():
+                raise ValueError("Unable to partition by column %s: no such column" % column)
+
+        if expectation_suite is None:
+            expectation_suite = self.get_expectation_suite(discard_failed_expectations=False, suppress_warnings=True)
+
+        partitions = self._get_partitions(partition_by, self._get_suite_column_aggregates(expectation_suite))
+        results = OrderedDict()
+        for partition_key, partition_dataset in partitions.items():
+            result = partition_dataset.validate(expectation_suite=expectation_suite, **validate_kwargs)
+            result.meta["partition"] = dict(
+                (column, convert_to_json_serializable(value)) for column, value in zip(partition_by, partition_key)
+            )
+            results[partition_key] = result
+        return results
+
+    def validate(self, expectation_suite=None, run_id=None, data_context=None, evaluation_parameters=None,
+                 catch_exceptions=True, result_format=None, only_return_failures=False, sample=None,
+                 sample_confidence=0.95, escalate_inconclusive=False, partition_by=None):
+        """Validates the dataset as DataAsset.validate does, or, if sample is provided, evaluates map expectations on
+        a random sample of the dataset, or, if partition_by is provided, validates each partition of the dataset.
+
+        With partition_by, the suite is evaluated separately on the rows that share each combination of values of
+        the partition_by columns, as if each partition were a batch of its own, but the partitions are identified,
+        and their row counts and the column aggregates used by the suite are computed, in a single grouped pass
+        (GROUP BY on SqlAlchemy, groupBy on Spark, groupby on pandas). On SqlAlchemy, the counts of column map
+        expectations are also computed for all partitions by one grouped query per expectation.
+
+        For each map expectation evaluated on the sample, the Wilson score interval of the proportion of its
+        (non-null) values that meet the expectation decides the outcome: "pass" if the whole interval is at least
+        mostly (1 if mostly is not set), "fail" if it is entirely below mostly, and "inconclusive" otherwise. The
+        outcome is recorded in the "sample" meta of the result; an inconclusive result keeps the success observed on
+        the sample, unless escalate_inconclusive is True, in which case the expectation is evaluated on the full
+        dataset. Other expectations, whose results cannot be extrapolated from a sample, are only evaluated on the
+        full dataset, and the dataset is not sampled if the suite has no map expectations.
+
+        Args:
+            sample (int, float or dict): the number of rows to sample, the fraction of rows to sample, or a dict with \
+                the keys n or fraction and optionally seed; see random_sample
+            sample_confidence (float): the confidence level of the intervals
+            escalate_inconclusive (boolean): if True, evaluate expectations whose outcome on the sample is \
+                inconclusive on the full dataset
+            partition_by (str or list): the column(s) whose values identify the partitions to validate
+
+        See DataAsset.validate for the other arguments.
+
+        Returns:
+            An ExpectationSuiteValidationResult or, with partition_by, an OrderedDict mapping the tuple of \
+            partition_by values of each partition to its ExpectationSuiteValidationResult, whose meta records the \
+            partition values under "partition"
+        """
+        if partition_by is not None:
+            if sample is not None:
+                raise ValueError("sample and partition_by cannot be used together")
+            return self._validate_partitions(
+                partition_by,
+                expectation_suite=expectation_suite,
+                run_id=run_id,
+                data_context=data_context,
+                evaluation_parameters=evaluation_parameters,
+                catch_exceptions=catch_exceptions,
+                result_format=result_format,
+                only_return_failures=only_return_failures
+            )
+
+        if sample is None:
+            return super(Dataset, self).validate(
+                expectation_suite=expectation_suite,
+                run_id=run_id,
+                data_context=data_context,
+                evaluation_parameters=evaluation_parameters,
+                catch_exceptions=catch_exceptions,
+                result_format=result_format,
+                only_return_failures=only_return_failures
+            )
+
+        sample_config = get_sample_config(sample)
+        expectation_suite = self._load_expectation_suite(expectation_suite)
+        parsed_result_format = parse_result_format(
+            result_format if result_format is not None else self.default_expectation_args["result_format"]
+        )
+        if parsed_result_format["result_format"] == "BOOLEAN_ONLY":
+            # Outcomes are computed from the counts reported by the BASIC result format
+            sample_result_format = dict(parsed_result_format, result_format="BASIC")
+        else:
+            sample_result_format = parsed_result_format
+
+        # Only map expectations are evaluated on the sample; the others are evaluated on the full dataset
+        map_expectations = []
+        full_scan_expectations = []
+        for expectation in expectation_suite.expectations:
+            if self._is_map_expectation(expectation.expectation_type):
+                map_expectations.append(expectation)
+            else:
+                full_scan_expectations.append(expectation)
+
+        results = []
+        validation_meta = None
+        validation_evaluation_parameters = None
+        sample_size = 0
+        outcome_counts = {"pass": 0, "fail": 0, "inconclusive": 0}
+        escalated_results = []
+        if len(map_expectations) > 0:
+            sampled_dataset = self.random_sample(**sample_config)
+            sample_size = sampled_dataset.get_row_count()
+            sample_results = sampled_dataset.validate(
+                expectation_suite=self._get_expectation_subsuite(expectation_suite, map_expectations),
+                run_id=run_id,
+                data_context=data_context,
+                evaluation_parameters=evaluation_parameters,
+                catch_exceptions=catch_exceptions,
+                result_format=sample_result_format
+            )
+            validation_meta = sample_results.meta
+            validation_evaluation_parameters = sample_results.evaluation_parameters
+
+            for result in sample_results.results:
+                results.append(result)
+                if result_format is not None and sample_result_format is not parsed_result_format:
+                    result.expectation_config.kwargs["result_format"] = result_format
+                if result.exception_info and result.exception_info.get("raised_exception"):
+                    continue
+                sample_meta = self._get_sampled_result_meta(result, sample_confidence)
+                if sample_meta is None:
+                    # e.g. an expectation whose mostly is an evaluation parameter
+                    escalated_results.append(result)
+                    continue
+                outcome_counts[sample_meta["outcome"]] += 1
+                if sample_meta["outcome"] == "inconclusive" and escalate_inconclusive:
+                    sample_meta["escalated"] = True
+                    escalated_results.append(result)
+                elif sample_meta["outcome"] != "inconclusive":
+                    result.success = sample_meta["outcome"] == "pass"
+                if parsed_result_format["result_format"] == "BOOLEAN_ONLY":
+                    result.result = {}
+                result.meta = dict(result.meta, sample=sample_meta)
+            full_scan_expectations += [self._without_result_format(result.expectation_config)
+                                       for result in escalated_results]
+
+        if len(full_scan_expectations) > 0:
+            full_results = super(Dataset, self).validate(
+                expectation_suite=self._get_expectation_subsuite(expectation_suite, full_scan_expectations),
+                run_id=run_id,
+                data_context=data_context,
+                evaluation_parameters=evaluation_parameters,
+                catch_exceptions=catch_exceptions,
+                result_format=result_format
+            )
+            if validation_meta is None:
+                validation_meta = full_results.meta
+                validation_evaluation_parameters = full_results.evaluation_parameters
+            for full_result in full_results.results:
+                full_config = self._without_result_format(full_result.expectation_config)
+                escalated_result = next((result for result in escalated_results
+                                         if self._without_result_format(result.expectation_config) == full_config),
+                                        None)
+                if escalated_result is None:
+                    results.append(full_result)
+                    continue
+                # Results may be reordered by validation, so they are matched to the sampled results by configuration
+                escalated_results.remove(escalated_result)
+                if "sample" in escalated_result.meta:
+                    full_result.meta = dict(full_result.meta, sample=escalated_result.meta["sample"])
+                results[results.index(escalated_result)] = full_result
+
+        # Results are returned in the order in which the whole suite would have been validated
+        results = self._sort_results_by_column(results, expectation_suite)
+        if only_return_failures:
+            results = [result for result in results if not result.success]
+        statistics = _calc_validation_statistics(results)
+        meta = dict(validation_meta or {})
+        meta["sample"] = dict(
+            sample_config,
+            sample_size=sample_size,
+            confidence_level=sample_confidence,
+            outcomes=outcome_counts
+        )
+        return ExpectationSuiteValidationResult(
+            results=results,
+            success=statistics.success,
+            statistics={
+                "evaluated_expectations": statistics.evaluated_expectations,
+                "successful_expectations": statistics.successful_expectations,
+                "unsuccessful_expectations": statistics.unsuccessful_expectations,
+                "success_percent": statistics.success_percent,
+            },
+            evaluation_parameters=validation_evaluation_parameters,
+            meta=meta
+        )
+
+    def _is_map_expectation(self, expectation_type):
+        """Returns True if the expectation is implemented by one of the map expectation decorators of the dataset's
+        backend, which mark the expectations that they build with a map_expectation attribute."""
+        return getattr(getattr(self, expectation_type, None), "map_expectation", False)
+
+    def _load_expectation_suite(self, expectation_suite):
+        """Returns the ExpectationSuite to validate, loading it as DataAsset.validate does."""
+        if expectation_suite is None:
+            return self.get_expectation_suite(
+                discard_failed_expectations=False,
+                discard_result_format_kwargs=False,
+                discard_include_config_kwargs=False,
+                discard_catch_exceptions_kwargs=False,
+                suppress_warnings=True
+            )
+        if isinstance(expectation_suite, string_types):
+            try:
+                with open(expectation_suite, 'r') as infile:
+                    return expectationSuiteSchema.loads(infile.read()).data
+            except IOError:
+                raise GreatExpectationsError(
+                    "Unable to load expectation suite: IO error while reading %s" % expectation_suite)
+        if not isinstance(expectation_suite, ExpectationSuite):
+            raise GreatExpectationsError("Unable to validate using the provided value for expectation suite")
+        return expectation_suite
+
+    @staticmethod
+    def _get_expectation_subsuite(expectation_suite, expectations):
+        return ExpectationSuite(
+            expectation_suite.expectation_suite_name,
+            expectations=expectations,
+            evaluation_parameters=expectation_suite.evaluation_parameters,
+            data_asset_type=expectation_suite.data_asset_type,
+            meta=expectation_suite.meta
+        )
+
+    def _sort_results_by_column(self, results, expectation_suite):
+        """Sort results in the order in which DataAsset.validate evaluates the expectations of the suite: grouped by
+        column, in the order in which each column first appears in the suite."""
+        column_positions = {}
+        expectation_configs = []
+        for expectation in expectation_suite.expectations:
+            column_positions.setdefault(self._get_result_column(expectation), len(column_positions))
+            expectation_configs.append(self._without_result_format(expectation))
+
+        def get_position(result):
+            expectation_config = self._without_result_format(result.expectation_config)
+            column_position = column_positions.get(self._get_result_column(expectation_config), len(column_positions))
+            try:
+                return column_position, expectation_configs.index(expectation_config)
+            except ValueError:
+                return column_position, len(expectation_configs)
+
+        return sorted(results, key=get_position)
+
+    @staticmethod
+    def _get_result_column(expectation_config):
+        if "column" in expectation_config.kwargs and isinstance(expectation_config.kwargs["column"], Hashable):
+            return expectation_config.kwargs["column"]
+        return "_nocolumn"
+
+    @staticmethod
+    def _without_result_format(expectation_config):
+        return ExpectationConfiguration(
+            expectation_type=expectation_config.expectation_type,
+            kwargs=dict((key, value) for key, value in expectation_config.kwargs.items() if key != "result_format"),
+            meta=expectation_config.meta
+        )
+
+    @staticmethod
+    def _get_sampled_result_meta(result, confidence):
+        """Returns the outcome of a map expectation evaluated on a sample, or None for other expectations."""
+        if "element_count" not in result.result or "unexpected_count" not in result.result:
+            return None
+        # Expectations about nulls evaluate every value, and do not report a missing count
+        nonnull_count = result.result["element_count"] - result.result.get("missing_count", 0)
+        if nonnull_count == 0:
+            return None
+        mostly = result.expectation_config.kwargs.get("mostly")
+        if mostly is None:
+            mostly = 1.
+        elif not isinstance(mostly, Number):
+            # e.g. an evaluation parameter, which is only resolved when the expectation is evaluated
+            return None
+        interval = wilson_interval(nonnull_count - result.result["unexpected_count"], nonnull_count, confidence)
+        if interval[0] >= mostly:
+            outcome = "pass"
+        elif interval[1] < mostly:
+            outcome = "fail"
+        else:
+            outcome = "inconclusive"
+        return {
+            "outcome": outcome,
+            "sample_size": nonnull_count,
+            "success_ratio_interval": interval,
+            "confidence_level": confidence,
+        }
+
+    def _get_derived_dataset_kwargs(self):
+        """Returns the kwargs used to construct a dataset derived from this one (e.g. a random sample) that keeps
+        this dataset's expectation suite, batch information and data context"""
+        return {
+            "expectation_suite": self.get_expectation_suite(
+                discard_failed_expectations=False,
+                discard_result_format_kwargs=False,
+                discard_include_config_kwargs=False,
+                discard_catch_exceptions_kwargs=False,
+                suppress_warnings=True
+            ),
+            "data_context": self._data_context,
+            "batch_kwargs": self.batch_kwargs,
+            "batch_markers": self.batch_markers,
+            "batch_parameters": self.batch_parameters,
+            "caching": self.caching,
+        }
+
     def test_column_map_expectation_function(self, function, *args, **kwargs):
         """Test a column map expectation function
 
@@ -2083,7 +2816,13 @@ class Dataset(MetaDataset):
 
         """
 
-        observed_value_counts = self.get_column_value_counts(column)
+        if value_set is None or parse_strings_as_datetimes or not self._only_success_needed(result_format):
+            max_distinct = None
+        else:
+            # The observed values cannot be a subset of the value set if there are more of them, so there is no
+            # need to count them all when only success is reported
+            max_distinct = len(set(value_set))
+        observed_value_counts = self.get_column_value_counts(column, max_distinct=max_distinct)
 
         if value_set is None:
             # Vacuously true
@@ -2184,7 +2923,14 @@ class Dataset(MetaDataset):
         else:
             parsed_value_set = value_set
 
-        observed_value_counts = self.get_column_value_counts(column)
+        if parse_strings_as_datetimes or not self._only_success_needed(result_format):
+            max_distinct = None
+        else:
+            # The observed values cannot equal the value set if there are more of them, so there is no need to count
+            # them all when only success is reported
+            max_distinct = len(set(value_set))
+
+        observed_value_counts = self.get_column_value_counts(column, max_distinct=max_distinct)
         expected_value_set = set(parsed_value_set)
         observed_value_set = set(observed_value_counts.index)
 
@@ -2198,6 +2944,10 @@ class Dataset(MetaDataset):
             }
         }
 
+    @staticmethod
+    def _only_success_needed(result_format):
+        return result_format is not None and parse_result_format(result_format)["result_format"] == "BOOLEAN_ONLY"
+
     # noinspection PyUnusedLocal
     @DocInherit
     @MetaDataset.column_aggregate_expectation
@@ -2520,6 +3270,7 @@ class Dataset(MetaDataset):
         column,
         quantile_ranges,
         allow_relative_error=False,
+        approximate=False,
         result_format=None, include_config=True, catch_exceptions=None,
         meta=None,
     ):
@@ -2582,6 +3333,9 @@ class Dataset(MetaDataset):
                 Quantiles and associated value ranges for the column. See above for details.
             allow_relative_error (boolean): \
                 Whether to allow relative error in quantile communications on backends that support or require it.
+            approximate (boolean): \
+                If True, estimate the quantiles using a mergeable KLL sketch, which requires only a single pass over \
+                the data and works on every backend. The sketch is included in the result details.
 
         Other Parameters:
             result_format (str or None): \
@@ -2624,7 +3378,12 @@ class Dataset(MetaDataset):
         if len(quantiles) != len(quantile_value_ranges):
             raise ValueError("quntile_values and quantiles must have the same number of elements")
 
-        quantile_vals = self.get_column_quantiles(column, tuple(quantiles), allow_relative_error=allow_relative_error)
+        if approximate:
+            sketch = self.get_column_quantile_sketch(column)
+            quantile_vals = sketch.get_quantiles(quantiles)
+        else:
+            quantile_vals = self.get_column_quantiles(column, tuple(quantiles),
+                                                      allow_relative_error=allow_relative_error)
         # We explicitly allow "None" to be interpreted as +/- infinity
         comparison_quantile_ranges = [
             [lower_bound or -np.inf, upper_bound or np.inf]
@@ -2635,6 +3394,12 @@ class Dataset(MetaDataset):
             for idx, range_ in enumerate(comparison_quantile_ranges)
         ]
 
+        details = {
+            "success_details": success_details
+        }
+        if approximate:
+            details["sketch"] = sketch.to_json_dict()
+
         return {
             "success": np.all(success_details),
             "result": {
@@ -2642,9 +3407,7 @@ class Dataset(MetaDataset):
                     "quantiles": quantiles,
                     "values": quantile_vals
                 },
-                "details": {
-                    "success_details": success_details
-                }
+                "details": details
             }
         }
 
@@ -2757,6 +3520,7 @@ class Dataset(MetaDataset):
         self,
         column,
         min_value=None, max_value=None,
+        approximate=False,
         result_format=None, include_config=True, catch_exceptions=None,
         meta=None,
     ):
@@ -2773,6 +3537,11 @@ class Dataset(MetaDataset):
             max_value (int or None): \
                 The maximum number of unique values allowed.
 
+        Keyword Args:
+            approximate (boolean): \
+                If True, estimate the number of unique values using a mergeable HyperLogLog sketch, which requires \
+                only a single pass over the data. The sketch is included in the result details.
+
         Other Parameters:
             result_format (str or None): \
                 Which output mode to use: `BOOLEAN_ONLY`, `BASIC`, `COMPLETE`, or `SUMMARY`.
@@ -2802,6 +3571,7 @@ class Dataset(MetaDataset):
                 }
 
             * min_value and max_value are both inclusive.
+            * If approximate is True, the observed_value has a relative standard error of about 1.6%
             * If min_value is None, then max_value is treated as an upper bound
             * If max_value is None, then min_value is treated as a lower bound
 
@@ -2810,7 +3580,11 @@ class Dataset(MetaDataset):
             <great_expectations.dataset.dataset.Dataset.expect_column_proportion_of_unique_values_to_be_between>`
 
         """
-        unique_value_count = self.get_column_unique_count(column)
+        if approximate:
+            sketch = self.get_column_cardinality_sketch(column)
+            unique_value_count = int(round(sketch.get_estimate()))
+        else:
+            unique_value_count = self.get_column_unique_count(column)
 
         if unique_value_count is None:
             return {
@@ -2832,11 +3606,17 @@ class Dataset(MetaDataset):
 
         success = above_min and below_max
 
+        result = {
+            "observed_value": unique_value_count
+        }
+        if approximate:
+            result["details"] = {
+                "sketch": sketch.to_json_dict()
+            }
+
         return {
             "success": success,
-            "result": {
-                "observed_value": unique_value_count
-            }
+            "result": result
         }
 
     # noinspection PyUnusedLocal
@@ -2847,6 +3627,7 @@ class Dataset(MetaDataset):
         column,
         min_value=0, max_value=1,
         strict_min=False, strict_max=False,  # tolerance=1e-9,
+        approximate=False,
         result_format=None, include_config=True, catch_exceptions=None,
         meta=None,
     ):
@@ -2871,6 +3652,12 @@ class Dataset(MetaDataset):
             strict_max (boolean):
                 If True, the maximum proportion of unique values must be strictly smaller than max_value, default=False
 
+        Keyword Args:
+            approximate (boolean): \
+                If True, estimate the number of unique values using a mergeable HyperLogLog sketch, which requires \
+                only a single pass over the data. The sketch is included in the result details. The number of \
+                unique values is always estimated when the dataset has prior_metrics.
+
         Other Parameters:
             result_format (str or None): \
                 Which output mode to use: `BOOLEAN_ONLY`, `BASIC`, `COMPLETE`, or `SUMMARY`. \
@@ -2912,8 +3699,16 @@ class Dataset(MetaDataset):
         # Tolerance docstring for later use:
         # tolerance (float):
         #     tolerance for strict_min, strict_max, default=1e-9
-        unique_value_count = self.get_column_unique_count(column)
         total_value_count = self.get_column_nonnull_count(column)
+        # Exact unique counts cannot be combined with prior metrics, so the number of unique values of the rows of
+        # the prior metrics and of the dataset is estimated from their combined sketch
+        sketch = None
+        if approximate or self._prior_metrics is not None:
+            sketch = self.get_column_cardinality_sketch(column)
+            # The estimate may slightly exceed the number of values, but the proportion cannot
+            unique_value_count = min(int(round(sketch.get_estimate())), total_value_count)
+        else:
+            unique_value_count = self.get_column_unique_count(column)
 
         if total_value_count > 0:
             proportion_unique = float(unique_value_count) / total_value_count
@@ -2946,11 +3741,17 @@ class Dataset(MetaDataset):
 
         success = above_min and below_max
 
+        result = {
+            "observed_value": proportion_unique
+        }
+        if sketch is not None:
+            result["details"] = {
+                "sketch": sketch.to_json_dict()
+            }
+
         return {
             "success": success,
-            "result": {
-                "observed_value": proportion_unique
-            }
+            "result": result
         }
 
     # noinspection PyUnusedLocal
@@ -2961,6 +3762,7 @@ class Dataset(MetaDataset):
         column,
         value_set,
         ties_okay=None,
+        approximate=False,
         result_format=None, include_config=True, catch_exceptions=None,
         meta=None,
     ):
@@ -2979,6 +3781,9 @@ class Dataset(MetaDataset):
             ties_okay (boolean or None): \
                 If True, then the expectation will still succeed if values outside the designated set are as common \
                 (but not more common) than designated values
+            approximate (boolean): \
+                If True, find the most common values using a mergeable frequent items sketch, which requires only a \
+                single pass over the data and bounded memory. The sketch is included in the result details.
 
         Other Parameters:
             result_format (str or None): \
@@ -3013,7 +3818,11 @@ class Dataset(MetaDataset):
             `observed_value` will contain a single copy of each most common value.
 
         """
-        mode_list = self.get_column_modes(column)
+        if approximate:
+            sketch = self.get_column_frequent_items_sketch(column)
+            mode_list = sketch.get_modes()
+        else:
+            mode_list = self.get_column_modes(column)
         intersection_count = len(set(value_set).intersection(mode_list))
 
         if ties_okay:
@@ -3021,11 +3830,17 @@ class Dataset(MetaDataset):
         else:
             success = len(mode_list) == 1 and intersection_count == 1
 
+        result = {
+            'observed_value': mode_list
+        }
+        if approximate:
+            result['details'] = {
+                'sketch': sketch.to_json_dict()
+            }
+
         return {
             'success': success,
-            'result': {
-                'observed_value': mode_list
-            }
+            'result': result
         }
 
     # noinspection PyUnusedLocal
@@ -3485,6 +4300,7 @@ class Dataset(MetaDataset):
                     }
                 }
         """
+        self._check_no_prior_metrics("expect_column_chisquare_test_p_value_to_be_greater_than")
         if not is_valid_categorical_partition_object(partition_object):
             raise ValueError("Invalid partition object.")
 
@@ -3743,6 +4559,7 @@ class Dataset(MetaDataset):
             <great_expectations.dataset.dataset.Dataset.expect_column_unique_value_count_to_be_between>`
 
         """
+        self._check_no_prior_metrics("expect_column_kl_divergence_to_be_less_than")
         if partition_object is None:
             if bucketize_data:
                 partition_object = build_continuous_partition_object(dataset=self, column=column, bins='auto')
@@ -129,6 +129,7 @@ class MetaPandasDataset(Dataset):
 
         inner_wrapper.__name__ = func.__name__
         inner_wrapper.__doc__ = func.__doc__
+        inner_wrapper.map_expectation = True
 
         return inner_wrapper
 
@@ -204,6 +205,7 @@ class MetaPandasDataset(Dataset):
 
         inner_wrapper.__name__ = func.__name__
         inner_wrapper.__doc__ = func.__doc__
+        inner_wrapper.map_expectation = True
         return inner_wrapper
 
     @classmethod
@@ -260,6 +262,7 @@ class MetaPandasDataset(Dataset):
 
         inner_wrapper.__name__ = func.__name__
         inner_wrapper.__doc__ = func.__doc__
+        inner_wrapper.map_expectation = True
         return inner_wrapper
 
 
@@ -289,6 +292,9 @@ class PandasDataset(MetaPandasDataset, pd.DataFrame):
         '_expectation_suite',
         '_config',
         'caching',
+        '_prefetched_column_aggregates',
+        '_shared_getter_results',
+        '_prior_metrics',
         'default_expectation_args',
         'discard_subset_failing_expectations'
     ]
@@ -318,6 +324,39 @@ class PandasDataset(MetaPandasDataset, pd.DataFrame):
         self.discard_subset_failing_expectations = kwargs.get(
             'discard_subset_failing_expectations', False)
 
+    def random_sample(self, n=None, fraction=None, seed=None):
+        # The data is already in memory, so DataFrame.sample gives the same uniform sample without replacement
+        # that reservoir sampling would, in a single vectorized step
+        self._validate_random_sample_args(n, fraction)
+        if n is not None:
+            n = min(n, self.shape[0])
+        df = pd.DataFrame(self).sample(n=n, frac=fraction, random_state=seed)
+        return self.__class__(df, **self._get_derived_dataset_kwargs())
+
+    def _get_worker_copy(self):
+        worker_copy = self.__class__(pd.DataFrame(self, copy=False), **self._get_derived_dataset_kwargs())
+        return self._share_worker_state(worker_copy)
+
+    def _get_partitions(self, partition_by, column_aggregates):
+        # A single groupby splits the dataframe; aggregates are computed on each partition's slice when requested
+        df = pd.DataFrame(self, copy=False)
+        try:
+            groups = df.groupby(partition_by, sort=True, dropna=False)
+        except TypeError:
+            # pandas < 1.1 drops rows whose partition values are null
+            groups = df.groupby(partition_by, sort=True)
+
+        partitions = collections.OrderedDict()
+        for partition_key, partition_df in groups:
+            if not isinstance(partition_key, tuple):
+                partition_key = (partition_key,)
+            partition_key = tuple(
+                None if pd.isnull(value) else value.item() if isinstance(value, np.generic) else value
+                for value in partition_key
+            )
+            partitions[partition_key] = self.__class__(partition_df, **self._get_partition_dataset_kwargs())
+        return partitions
+
     def get_row_count(self):
         return self.shape[0]
 
@@ -351,7 +390,7 @@ class PandasDataset(MetaPandasDataset, pd.DataFrame):
         nonnull_values = series[null_indexes == False]
         return len(nonnull_values)
 
-    def get_column_value_counts(self, column, sort="value", collate=None):
+    def get_column_value_counts(self, column, sort="value", collate=None, top_k=None, max_distinct=None):
         if sort not in ["value", "count", "none"]:
             raise ValueError(
                 "sort must be either 'value', 'count', or 'none'"
@@ -360,7 +399,12 @@ class PandasDataset(MetaPandasDataset, pd.DataFrame):
             raise ValueError(
                 "collate parameter is not supported in PandasDataset"
             )
+        # value_counts sorts by descending count, so the top values come first
         counts = self[column].value_counts()
+        if top_k is not None:
+            counts = counts.iloc[:top_k]
+        if max_distinct is not None:
+            counts = counts.iloc[:max_distinct + 1]
         if sort == "value":
             try:
                 counts.sort_index(inplace=True)
@@ -377,7 +421,7 @@ class PandasDataset(MetaPandasDataset, pd.DataFrame):
         return counts
 
     def get_column_unique_count(self, column):
-        return self.get_column_value_counts(column).shape[0]
+        return self[column].nunique()
 
     def get_column_modes(self, column):
         return list(self[column].mode().values)
@@ -393,6 +437,49 @@ class PandasDataset(MetaPandasDataset, pd.DataFrame):
     def get_column_stdev(self, column):
         return self[column].std()
 
+    def get_column_type_list_index(self, column, type_lists):
+        series = self[column]
+        if series.dtype != "object":
+            # As in _expect_column_values_to_be_in_type_list__aggregate
+            for index, type_list in enumerate(type_lists):
+                if series.dtype.type in self._get_type_list_types(type_list):
+                    return index
+            return None
+
+        # As in _expect_column_values_to_be_in_type_list__map, which ignores null values
+        value_types = set(type(value) for value in series[series.notnull()])
+        for index, type_list in enumerate(type_lists):
+            types = tuple(self._get_type_list_types(type_list))
+            if len(types) > 0 and all(issubclass(value_type, types) for value_type in value_types):
+                return index
+        return None
+
+    @classmethod
+    def _get_type_list_types(cls, type_list):
+        comp_types = []
+        for type_ in type_list:
+            try:
+                comp_types.append(np.dtype(type_).type)
+            except TypeError:
+                try:
+                    pd_type = getattr(pd, type_)
+                    if isinstance(pd_type, type):
+                        comp_types.append(pd_type)
+                except AttributeError:
+                    pass
+
+                try:
+                    pd_type = getattr(pd.core.dtypes.dtypes, type_)
+                    if isinstance(pd_type, type):
+                        comp_types.append(pd_type)
+                except AttributeError:
+                    pass
+
+            native_type = cls._native_type_type_map(type_)
+            if native_type is not None:
+                comp_types.extend(native_type)
+        return comp_types
+
     def get_column_hist(self, column, bins):
         hist, bin_edges = np.histogram(self[column], bins, density=False)
         return list(hist)
@@ -417,6 +504,9 @@ class PandasDataset(MetaPandasDataset, pd.DataFrame):
                 result = result[result <= max_val]
         return len(result)
 
+    def _build_column_sketch(self, column, sketch):
+        return sketch.update(self[column].dropna())
+
 
     ### Expectation methods ###
 
@@ -762,30 +852,7 @@ class PandasDataset(MetaPandasDataset, pd.DataFrame):
         if type_list is None:
             success = True
         else:
-            comp_types = []
-            for type_ in type_list:
-                try:
-                    comp_types.append(np.dtype(type_).type)
-                except TypeError:
-                    try:
-                        pd_type = getattr(pd, type_)
-                        if isinstance(pd_type, type):
-                            comp_types.append(pd_type)
-                    except AttributeError:
-                        pass
-
-                    try:
-                        pd_type = getattr(pd.core.dtypes.dtypes, type_)
-                        if isinstance(pd_type, type):
-                            comp_types.append(pd_type)
-                    except AttributeError:
-                        pass
-
-                native_type = self._native_type_type_map(type_)
-                if native_type is not None:
-                    comp_types.extend(native_type)
-
-            success = (self[column].dtype.type in comp_types)
+            success = (self[column].dtype.type in self._get_type_list_types(type_list))
 
         return {
             "success": success,
@@ -801,29 +868,7 @@ class PandasDataset(MetaPandasDataset, pd.DataFrame):
             mostly=None,
             result_format=None, include_config=True, catch_exceptions=None, meta=None):
 
-        comp_types = []
-        for type_ in type_list:
-            try:
-                comp_types.append(np.dtype(type_).type)
-            except TypeError:
-                try:
-                    pd_type = getattr(pd, type_)
-                    if isinstance(pd_type, type):
-                        comp_types.append(pd_type)
-                except AttributeError:
-                    pass
-
-                try:
-                    pd_type = getattr(pd.core.dtypes.dtypes, type_)
-                    if isinstance(pd_type, type):
-                        comp_types.append(pd_type)
-                except AttributeError:
-                    pass
-
-            native_type = self._native_type_type_map(type_)
-            if native_type is not None:
-                comp_types.extend(native_type)
-
+        comp_types = self._get_type_list_types(type_list)
         if len(comp_types) < 1:
             raise ValueError("No recognized numpy/python type in list: %s" % type_list)
 
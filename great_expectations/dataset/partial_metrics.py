@@ -0,0 +1,202 @@
+# Mergeable partial metrics for incremental validation of append-only data assets
+
+from __future__ import division
+
+from datetime import datetime
+from decimal import Decimal
+from numbers import Number
+
+from dateutil.parser import parse
+from six import string_types
+
+from great_expectations.core import convert_to_json_serializable
+from great_expectations.dataset.sketch import sketch_from_json_dict
+from great_expectations.exceptions import GreatExpectationsError
+
+
+class PartialMetrics(object):
+    """PartialMetrics summarize the rows of a data asset with metrics that can be combined with the same metrics
+    computed on other rows: the row count and, for each column, the number of non-null values, their min, max and
+    (for numeric columns) sum, and cardinality, frequent value and (for numeric columns) quantile sketches.
+
+    They make it possible to validate a growing, append-only data asset incrementally: the partial metrics of the
+    rows that were already validated are stored, and a Dataset of the new rows only that is given them as
+    prior_metrics reports the row count, non-null counts, min, max, sum, mean and sketches of the whole asset, so
+    that table-level and aggregate expectations cost O(new rows) instead of O(asset). See
+    Dataset.set_prior_metrics.
+    """
+
+    # The getters whose whole-asset result is computed from partial metrics and the result on the new rows
+    combinable_getters = [
+        "get_row_count",
+        "get_column_nonnull_count",
+        "get_column_min",
+        "get_column_max",
+        "get_column_sum",
+        "get_column_cardinality_sketch",
+        "get_column_quantile_sketch",
+        "get_column_frequent_items_sketch",
+    ]
+
+    _sketch_metrics = {
+        "get_column_cardinality_sketch": "cardinality_sketch",
+        "get_column_quantile_sketch": "quantile_sketch",
+        "get_column_frequent_items_sketch": "frequent_items_sketch",
+    }
+
+    def __init__(self, row_count=0, columns=None):
+        self._row_count = row_count
+        if columns is None:
+            columns = {}
+        self._columns = columns
+
+    @property
+    def row_count(self):
+        return self._row_count
+
+    @property
+    def columns(self):
+        return list(self._columns.keys())
+
+    @classmethod
+    def from_dataset(cls, dataset, columns=None):
+        """Compute the partial metrics of a dataset.
+
+        If the dataset has prior_metrics, the result summarizes the rows of the prior metrics and of the dataset.
+
+        Args:
+            dataset (Dataset): the dataset to summarize
+            columns (list or None): the columns to summarize; all columns of the dataset by default
+
+        Returns:
+            PartialMetrics
+        """
+        if columns is None:
+            columns = dataset.get_table_columns()
+
+        column_metrics = {}
+        for column in columns:
+            metrics = {"nonnull_count": dataset.get_column_nonnull_count(column)}
+            if metrics["nonnull_count"] > 0:
+                metrics["min"] = dataset.get_column_min(column)
+                metrics["max"] = dataset.get_column_max(column)
+                metrics["cardinality_sketch"] = dataset.get_column_cardinality_sketch(column)
+                metrics["frequent_items_sketch"] = dataset.get_column_frequent_items_sketch(column)
+                if isinstance(metrics["min"], Number) and not isinstance(metrics["min"], bool):
+                    metrics["sum"] = _to_number(dataset.get_column_sum(column))
+                    metrics["quantile_sketch"] = dataset.get_column_quantile_sketch(column)
+            column_metrics[column] = metrics
+
+        return cls(row_count=dataset.get_row_count(), columns=column_metrics)
+
+    def combine(self, getter_name, value, *args, **kwargs):
+        """Combine the result of a getter on new rows with these partial metrics.
+
+        Args:
+            getter_name (str): one of combinable_getters
+            value: the result of the getter on the new rows
+            *args, **kwargs: the arguments with which the getter was called
+
+        Returns:
+            the result of the getter on the rows of these partial metrics and the new rows
+        """
+        if getter_name not in self.combinable_getters:
+            raise ValueError("Unable to combine the result of %s with partial metrics" % getter_name)
+
+        if getter_name == "get_row_count":
+            return self._row_count + value
+
+        column = args[0] if len(args) > 0 else kwargs["column"]
+        column_metrics = self._get_column_metrics(column)
+        if getter_name == "get_column_nonnull_count":
+            return column_metrics["nonnull_count"] + value
+        if column_metrics["nonnull_count"] == 0:
+            return value
+
+        if getter_name in ("get_column_min", "get_column_max"):
+            metric_name = "min" if getter_name == "get_column_min" else "max"
+            prior_value = self._get_metric(column, metric_name)
+            parse_strings_as_datetimes = args[1] if len(args) > 1 else kwargs.get("parse_strings_as_datetimes")
+            if isinstance(prior_value, string_types) and (parse_strings_as_datetimes or isinstance(value, datetime)):
+                # datetimes are stored as iso strings
+                prior_value = parse(prior_value)
+            if value is None:
+                return prior_value
+            return min(prior_value, value) if metric_name == "min" else max(prior_value, value)
+
+        if getter_name == "get_column_sum":
+            if value is None:
+                value = 0
+            return self._get_metric(column, "sum") + _to_number(value)
+
+        prior_sketch = self._get_metric(column, self._sketch_metrics[getter_name])
+        if getter_name == "get_column_frequent_items_sketch" and \
+                any(isinstance(item, datetime) for item, _ in value.get_frequent_items()):
+            # datetimes are stored as iso strings
+            return _parse_datetime_items(prior_sketch).merge(value)
+        return prior_sketch.copy().merge(value)
+
+    def _get_column_metrics(self, column):
+        try:
+            return self._columns[column]
+        except KeyError:
+            if self._row_count == 0:
+                return {"nonnull_count": 0}
+            raise GreatExpectationsError("No prior metrics are available for column '%s'" % column)
+
+    def _get_metric(self, column, metric_name):
+        try:
+            return self._columns[column][metric_name]
+        except KeyError:
+            raise GreatExpectationsError("Prior metrics for column '%s' do not include %s" % (column, metric_name))
+
+    def to_json_dict(self):
+        columns = {}
+        for column, metrics in self._columns.items():
+            columns[column] = dict(
+                (metric_name, convert_to_json_serializable(
+                    value.to_json_dict() if metric_name.endswith("_sketch") else value
+                ))
+                for metric_name, value in metrics.items()
+            )
+        return {
+            "row_count": self._row_count,
+            "columns": columns
+        }
+
+    @classmethod
+    def from_json_dict(cls, metrics_dict):
+        columns = {}
+        for column, metrics in metrics_dict["columns"].items():
+            columns[column] = dict(
+                (metric_name, sketch_from_json_dict(value) if metric_name.endswith("_sketch") else value)
+                for metric_name, value in metrics.items()
+            )
+        return cls(row_count=metrics_dict["row_count"], columns=columns)
+
+    def __eq__(self, other):
+        if not isinstance(other, PartialMetrics):
+            return NotImplemented
+        return self.to_json_dict() == other.to_json_dict()
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return "PartialMetrics(row_count=%d, columns=%s)" % (self._row_count, self.columns)
+
+
+def _to_number(value):
+    """Sums of SQL numeric columns are returned as Decimals, which cannot be added to the floats stored as json."""
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+def _parse_datetime_items(sketch):
+    """Returns a copy of a frequent items sketch in which the values stored as iso strings are parsed as datetimes."""
+    sketch_dict = sketch.to_json_dict()
+    sketch_dict["items"] = [
+        [parse(value) if isinstance(value, string_types) else value, count] for value, count in sketch_dict["items"]
+    ]
+    return sketch_from_json_dict(sketch_dict)
@@ -0,0 +1,443 @@
+# Mergeable sketches for approximate Dataset metrics
+
+from __future__ import division
+
+import base64
+import hashlib
+import math
+import random
+import struct
+from collections import Counter
+
+import numpy as np
+from six import binary_type, text_type
+
+from great_expectations.exceptions import GreatExpectationsError
+
+
+def _to_python_value(value):
+    """Converts numpy scalars to their python equivalent so that values hash and serialize consistently."""
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _stable_hash(value):
+    """Returns a 64-bit hash of value that is stable across processes and engines.
+
+    Python's built-in hash is salted per-process for strings, which would make sketches built in different processes
+    (e.g. on Spark executors or on different days) impossible to merge.
+    """
+    value = _to_python_value(value)
+    if isinstance(value, float) and value.is_integer():
+        # 1 and 1.0 are the same value regardless of the engine that produced them
+        value = int(value)
+    if not isinstance(value, binary_type):
+        value = text_type(value).encode("utf-8")
+    return struct.unpack("<Q", hashlib.md5(value).digest()[:8])[0]
+
+
+class Sketch(object):
+    """A Sketch is a compact, serializable summary of a stream of values that can be merged with other sketches of
+    the same type and configuration.
+
+    Sketches make it possible to compute approximate metrics in a single pass, and to combine metrics computed on
+    separate batches (or partitions of a batch) without rereading the underlying data.
+
+    An implementation of a sketch must define the following:
+      - sketch_type
+      - update
+      - merge
+      - get_config
+      - to_json_dict
+      - from_json_dict
+    """
+    sketch_type = None
+
+    def update(self, values):
+        """Add every element of the iterable values to the sketch. Returns the sketch."""
+        raise NotImplementedError
+
+    def merge(self, other):
+        """Merge other into this sketch in place. Returns the sketch."""
+        raise NotImplementedError
+
+    def get_config(self):
+        """Returns: dict, the constructor arguments required to build an empty sketch compatible with this one"""
+        raise NotImplementedError
+
+    def to_json_dict(self):
+        raise NotImplementedError
+
+    @classmethod
+    def from_json_dict(cls, sketch_dict):
+        raise NotImplementedError
+
+    def empty_copy(self):
+        """Returns: a new, empty sketch which can be merged with this one"""
+        return self.__class__(**self.get_config())
+
+    def copy(self):
+        return self.from_json_dict(self.to_json_dict())
+
+    def _validate_mergeable(self, other):
+        if not isinstance(other, self.__class__):
+            raise GreatExpectationsError("Unable to merge sketch of type {} into sketch of type {}".format(
+                type(other).__name__, type(self).__name__))
+        if other.get_config() != self.get_config():
+            raise GreatExpectationsError("Unable to merge sketches with different configurations: {} and {}".format(
+                other.get_config(), self.get_config()))
+
+    def __eq__(self, other):
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self.to_json_dict() == other.to_json_dict()
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return "<{} {}>".format(self.__class__.__name__, self.get_config())
+
+
+class HyperLogLogSketch(Sketch):
+    """HyperLogLogSketch estimates the number of distinct values in a stream.
+
+    The relative standard error of the estimate is approximately 1.04 / sqrt(2 ** precision); the default precision
+    of 12 gives an error of about 1.6% using 4096 single-byte registers.
+    """
+    sketch_type = "hll"
+
+    def __init__(self, precision=12):
+        if not 4 <= precision <= 18:
+            raise ValueError("HyperLogLogSketch precision must be between 4 and 18")
+        self._precision = precision
+        self._registers = bytearray(1 << precision)
+
+    @property
+    def precision(self):
+        return self._precision
+
+    def get_config(self):
+        return {"precision": self._precision}
+
+    def update(self, values):
+        precision = self._precision
+        value_bits = 64 - precision
+        value_mask = (1 << value_bits) - 1
+        registers = self._registers
+        for value in values:
+            hashed = _stable_hash(value)
+            register = hashed >> value_bits
+            remainder = hashed & value_mask
+            # rank is the position of the leftmost 1-bit in the remaining bits
+            rank = value_bits - remainder.bit_length() + 1
+            if rank > registers[register]:
+                registers[register] = rank
+        return self
+
+    def merge(self, other):
+        self._validate_mergeable(other)
+        self._registers = bytearray(max(a, b) for a, b in zip(self._registers, other._registers))
+        return self
+
+    def get_estimate(self):
+        """Returns: float, the estimated number of distinct values added to the sketch"""
+        m = len(self._registers)
+        if m >= 128:
+            alpha = 0.7213 / (1 + 1.079 / m)
+        elif m == 64:
+            alpha = 0.709
+        elif m == 32:
+            alpha = 0.697
+        else:
+            alpha = 0.673
+        raw_estimate = alpha * m * m / sum(2.0 ** -register for register in self._registers)
+        zero_registers = sum(1 for register in self._registers if register == 0)
+        if raw_estimate <= 2.5 * m and zero_registers > 0:
+            # Small range correction: linear counting is more accurate while registers remain empty
+            return m * math.log(m / zero_registers)
+        return raw_estimate
+
+    def to_json_dict(self):
+        return {
+            "sketch_type": self.sketch_type,
+            "precision": self._precision,
+            "registers": base64.b64encode(bytes(self._registers)).decode("ascii")
+        }
+
+    @classmethod
+    def from_json_dict(cls, sketch_dict):
+        sketch = cls(precision=sketch_dict["precision"])
+        registers = bytearray(base64.b64decode(sketch_dict["registers"]))
+        if len(registers) != 1 << sketch.precision:
+            raise GreatExpectationsError("Invalid HyperLogLogSketch: register count does not match precision")
+        sketch._registers = registers
+        return sketch
+
+
+class KLLSketch(Sketch):
+    """KLLSketch estimates quantiles of a stream of orderable values.
+
+    The sketch keeps a hierarchy of compactors, each of which holds items carrying a weight of 2 ** level. When a
+    compactor is full, it is sorted and every other item is promoted to the next level. With the default k of 200, the
+    rank error of a quantile estimate is typically below 1.5%. The exact minimum and maximum are always retained.
+    """
+    sketch_type = "kll"
+    _c = 2. / 3.
+
+    def __init__(self, k=200, seed=None):
+        if k < 8:
+            raise ValueError("KLLSketch k must be at least 8")
+        self._k = k
+        self._compactors = [[]]
+        self._size = 0
+        self._max_size = self._capacity(0)
+        self._n = 0
+        self._min = None
+        self._max = None
+        self._random = random.Random(seed)
+
+    @property
+    def n(self):
+        return self._n
+
+    def get_config(self):
+        return {"k": self._k}
+
+    def _capacity(self, level):
+        depth = len(self._compactors) - level - 1
+        return int(math.ceil((self._c ** depth) * self._k)) + 1
+
+    def _compress(self):
+        while True:
+            self._size = sum(len(compactor) for compactor in self._compactors)
+            self._max_size = sum(self._capacity(level) for level in range(len(self._compactors)))
+            if self._size < self._max_size:
+                return
+            for level in range(len(self._compactors)):
+                if len(self._compactors[level]) >= self._capacity(level):
+                    if level + 1 >= len(self._compactors):
+                        self._compactors.append([])
+                    compactor = sorted(self._compactors[level])
+                    # An odd item out stays at this level so that no weight is lost
+                    leftover = [compactor.pop()] if len(compactor) % 2 else []
+                    offset = self._random.randint(0, 1)
+                    self._compactors[level + 1].extend(compactor[offset::2])
+                    self._compactors[level] = leftover
+                    break
+
+    def update(self, values):
+        level_zero = self._compactors[0]
+        for value in values:
+            value = _to_python_value(value)
+            level_zero.append(value)
+            self._size += 1
+            self._n += 1
+            if self._min is None or value < self._min:
+                self._min = value
+            if self._max is None or value > self._max:
+                self._max = value
+            if self._size >= self._max_size:
+                self._compress()
+                level_zero = self._compactors[0]
+        return self
+
+    def merge(self, other):
+        self._validate_mergeable(other)
+        if other._n == 0:
+            return self
+        while len(self._compactors) < len(other._compactors):
+            self._compactors.append([])
+        for level, compactor in enumerate(other._compactors):
+            self._compactors[level].extend(compactor)
+        self._n += other._n
+        self._min = other._min if self._min is None else min(self._min, other._min)
+        self._max = other._max if self._max is None else max(self._max, other._max)
+        self._compress()
+        return self
+
+    def _weighted_items(self):
+        items = []
+        for level, compactor in enumerate(self._compactors):
+            weight = 2 ** level
+            items.extend((item, weight) for item in compactor)
+        items.sort(key=lambda item: item[0])
+        return items
+
+    def get_quantiles(self, quantiles):
+        """Returns: List[any], the estimated value at each of the requested quantiles"""
+        if self._n == 0:
+            return [None for _ in quantiles]
+        items = self._weighted_items()
+        total_weight = sum(weight for _, weight in items)
+        results = []
+        for quantile in quantiles:
+            if not 0 <= quantile <= 1:
+                raise ValueError("quantiles must be between 0 and 1")
+            if quantile == 0:
+                results.append(self._min)
+                continue
+            if quantile == 1:
+                results.append(self._max)
+                continue
+            target = quantile * total_weight
+            cumulative_weight = 0
+            value = items[-1][0]
+            for item, weight in items:
+                cumulative_weight += weight
+                if cumulative_weight >= target:
+                    value = item
+                    break
+            results.append(value)
+        return results
+
+    def get_rank(self, value):
+        """Returns: float, the estimated fraction of values less than or equal to value"""
+        if self._n == 0:
+            return None
+        items = self._weighted_items()
+        total_weight = sum(weight for _, weight in items)
+        return sum(weight for item, weight in items if item <= value) / total_weight
+
+    def to_json_dict(self):
+        return {
+            "sketch_type": self.sketch_type,
+            "k": self._k,
+            "n": self._n,
+            "min": self._min,
+            "max": self._max,
+            "compactors": [list(compactor) for compactor in self._compactors]
+        }
+
+    @classmethod
+    def from_json_dict(cls, sketch_dict):
+        sketch = cls(k=sketch_dict["k"])
+        sketch._n = sketch_dict["n"]
+        sketch._min = sketch_dict["min"]
+        sketch._max = sketch_dict["max"]
+        sketch._compactors = [list(compactor) for compactor in sketch_dict["compactors"]] or [[]]
+        sketch._compress()
+        return sketch
+
+
+class FrequentItemsSketch(Sketch):
+    """FrequentItemsSketch tracks the most frequent values in a stream using the mergeable Misra-Gries summary.
+
+    At most max_items counters are kept. Every estimated count is a lower bound on the true count, and the true count
+    of any value is at most its estimate plus `max_error`, which is itself at most n / (max_items + 1).
+    """
+    sketch_type = "frequent_items"
+
+    def __init__(self, max_items=100):
+        if max_items < 1:
+            raise ValueError("FrequentItemsSketch max_items must be positive")
+        self._max_items = max_items
+        self._counters = Counter()
+        self._n = 0
+        self._max_error = 0
+
+    @property
+    def n(self):
+        return self._n
+
+    @property
+    def max_error(self):
+        return self._max_error
+
+    def get_config(self):
+        return {"max_items": self._max_items}
+
+    def _purge(self):
+        if len(self._counters) <= self._max_items:
+            return
+        # Subtracting the (max_items + 1)th largest count from every counter preserves the error guarantee
+        threshold = sorted(self._counters.values(), reverse=True)[self._max_items]
+        self._counters = Counter({
+            value: count - threshold for value, count in self._counters.items() if count > threshold
+        })
+        self._max_error += threshold
+
+    def update(self, values):
+        chunk = Counter()
+        for value in values:
+            chunk[_to_python_value(value)] += 1
+            if len(chunk) > 10 * self._max_items:
+                self._add_counts(chunk)
+                chunk = Counter()
+        self._add_counts(chunk)
+        return self
+
+    def _add_counts(self, counts):
+        self._n += sum(counts.values())
+        self._counters.update(counts)
+        self._purge()
+
+    def merge(self, other):
+        self._validate_mergeable(other)
+        self._n += other._n
+        self._max_error += other._max_error
+        self._counters.update(other._counters)
+        self._purge()
+        return self
+
+    def get_frequent_items(self):
+        """Returns: List[tuple], (value, estimated_count) pairs ordered by descending estimated count"""
+        return sorted(self._counters.items(), key=lambda item: (-item[1], text_type(item[0])))
+
+    def get_modes(self):
+        """Returns: List[any], the value(s) with the highest estimated count (ties OK)"""
+        if not self._counters:
+            return []
+        max_count = max(self._counters.values())
+        return [value for value, count in self.get_frequent_items() if count == max_count]
+
+    def to_json_dict(self):
+        return {
+            "sketch_type": self.sketch_type,
+            "max_items": self._max_items,
+            "n": self._n,
+            "max_error": self._max_error,
+            "items": [[value, count] for value, count in self.get_frequent_items()]
+        }
+
+    @classmethod
+    def from_json_dict(cls, sketch_dict):
+        sketch = cls(max_items=sketch_dict["max_items"])
+        sketch._n = sketch_dict["n"]
+        sketch._max_error = sketch_dict["max_error"]
+        sketch._counters = Counter({value: count for value, count in sketch_dict["items"]})
+        return sketch
+
+
+_sketch_types = {
+    sketch_class.sketch_type: sketch_class
+    for sketch_class in (HyperLogLogSketch, KLLSketch, FrequentItemsSketch)
+}
+
+
+def sketch_from_json_dict(sketch_dict):
+    """Rebuilds a sketch from the output of its to_json_dict method, for example a value read from a MetricStore."""
+    try:
+        sketch_class = _sketch_types[sketch_dict["sketch_type"]]
+    except (KeyError, TypeError):
+        raise GreatExpectationsError("Unable to load sketch: unrecognized sketch_type")
+    return sketch_class.from_json_dict(sketch_dict)
+
+
+def merge_sketches(sketches):
+    """Merges an iterable of compatible sketches (or their json dicts) into a new sketch.
+
+    The inputs are not modified.
+    """
+    merged = None
+    for sketch in sketches:
+        if isinstance(sketch, dict):
+            sketch = sketch_from_json_dict(sketch)
+        if merged is None:
+            merged = sketch.copy()
+        else:
+            merged.merge(sketch)
+    if merged is None:
+        raise ValueError("merge_sketches requires at least one sketch")
+    return merged
@@ -3,6 +3,7 @@ from __future__ import division
 import copy
 import inspect
 import logging
+from collections import OrderedDict
 from datetime import datetime
 from functools import wraps
 
@@ -23,11 +24,15 @@ try:
         udf, col, lit,
         desc,
         stddev_samp,
+        avg,
+        min as min_,
+        max as max_,
         length as length_,
         when,
         year,
         count,
         countDistinct,
+        rand,
         monotonically_increasing_id
     )
     import pyspark.sql.types as sparktypes
@@ -176,6 +181,7 @@ class MetaSparkDFDataset(Dataset):
 
         inner_wrapper.__name__ = func.__name__
         inner_wrapper.__doc__ = func.__doc__
+        inner_wrapper.map_expectation = True
 
         return inner_wrapper
 
@@ -314,6 +320,7 @@ class MetaSparkDFDataset(Dataset):
 
         inner_wrapper.__name__ = func.__name__
         inner_wrapper.__doc__ = func.__doc__
+        inner_wrapper.map_expectation = True
 
         return inner_wrapper
 
@@ -346,6 +353,18 @@ class SparkDFDataset(MetaSparkDFDataset):
             )
         )
 
+    def random_sample(self, n=None, fraction=None, seed=None):
+        self._validate_random_sample_args(n, fraction)
+        if fraction is not None:
+            df = self.spark_df.sample(withReplacement=False, fraction=fraction, seed=seed)
+        else:
+            df = self.spark_df.orderBy(rand(seed)).limit(n)
+        return self.__class__(df, **self._get_derived_dataset_kwargs())
+
+    def _get_worker_copy(self):
+        worker_copy = self.__class__(self.spark_df, **self._get_derived_dataset_kwargs())
+        return self._share_worker_state(worker_copy)
+
     def get_row_count(self):
         return self.spark_df.count()
 
@@ -369,19 +388,61 @@ class SparkDFDataset(MetaSparkDFDataset):
     def get_column_sum(self, column):
         return self.spark_df.select(column).groupBy().sum().collect()[0][0]
 
-    # TODO: consider getting all basic statistics in one go:
-    def _describe_column(self, column):
-        # temp_column = self.spark_df.select(column).where(col(column).isNotNull())
-        # return self.spark_df.select(
-        #     [
-        #         count(temp_column),
-        #         mean(temp_column),
-        #         stddev(temp_column),
-        #         min(temp_column),
-        #         max(temp_column)
-        #     ]
-        # )
-        pass
+    def _get_column_aggregate_columns(self, column_aggregates):
+        """Returns the (column, aggregate) pairs that can be computed in bulk and the matching aggregate columns"""
+        types = dict(self.spark_df.dtypes)
+        aggregate_functions = {
+            "nonnull_count": lambda column: count(col(column)),
+            "unique_count": lambda column: countDistinct(col(column)),
+            "min": lambda column: min_(col(column)),
+            "max": lambda column: max_(col(column)),
+            "mean": lambda column: avg(col(column)),
+            "stdev": lambda column: stddev_samp(col(column)),
+        }
+
+        requested = []
+        for column, aggregates in column_aggregates.items():
+            for aggregate in aggregates:
+                if aggregate == "mean" and types[column] not in ('int', 'float', 'double', 'bigint'):
+                    # get_column_mean raises for non-numeric columns; keep that behavior
+                    continue
+                requested.append((column, aggregate))
+        return requested, [aggregate_functions[aggregate](column) for column, aggregate in requested]
+
+    def _get_column_aggregates(self, column_aggregates):
+        # All requested aggregates are computed by a single agg over the dataframe
+        requested, aggregate_columns = self._get_column_aggregate_columns(column_aggregates)
+        if len(requested) == 0:
+            return {}
+
+        row = self.spark_df.agg(*aggregate_columns).collect()[0]
+
+        results = {}
+        for (column, aggregate), value in zip(requested, row):
+            results.setdefault(column, {})[aggregate] = value
+        return results
+
+    def _get_partitions(self, partition_by, column_aggregates):
+        # One groupBy identifies the partitions and computes their row counts and column aggregates
+        requested, aggregate_columns = self._get_column_aggregate_columns(column_aggregates)
+        rows = self.spark_df.groupBy(*partition_by).agg(count(lit(1)), *aggregate_columns)\
+            .orderBy(*partition_by).collect()
+
+        partitions = OrderedDict()
+        for row in rows:
+            partition_key = tuple(row[:len(partition_by)])
+            condition = None
+            for column, value in zip(partition_by, partition_key):
+                column_condition = col(column).isNull() if value is None else col(column) == value
+                condition = column_condition if condition is None else condition & column_condition
+            partition_dataset = self.__class__(self.spark_df.where(condition),
+                                               **self._get_partition_dataset_kwargs())
+            prefetched_column_aggregates = partition_dataset._prefetched_column_aggregates
+            prefetched_column_aggregates[("get_row_count",)] = row[len(partition_by)]
+            for (column, aggregate), value in zip(requested, row[len(partition_by) + 1:]):
+                prefetched_column_aggregates[("get_column_" + aggregate, column)] = value
+            partitions[partition_key] = partition_dataset
+        return partitions
 
     def get_column_max(self, column, parse_strings_as_datetimes=False):
         temp_column = self.spark_df.select(column).where(col(column).isNotNull())
@@ -401,7 +462,7 @@ class SparkDFDataset(MetaSparkDFDataset):
             return None
         return result[0][0]
 
-    def get_column_value_counts(self, column, sort="value", collate=None):
+    def get_column_value_counts(self, column, sort="value", collate=None, top_k=None, max_distinct=None):
         if sort not in ["value", "count", "none"]:
             raise ValueError(
                 "sort must be either 'value', 'count', or 'none'"
@@ -414,6 +475,10 @@ class SparkDFDataset(MetaSparkDFDataset):
             .where(col(column).isNotNull())\
             .groupBy(column)\
             .count()
+        if top_k is not None:
+            value_counts = value_counts.orderBy(desc("count")).limit(top_k)
+        if max_distinct is not None:
+            value_counts = value_counts.limit(max_distinct + 1)
         if sort == "value":
             value_counts = value_counts.orderBy(column)
         elif sort == "count":
@@ -433,9 +498,16 @@ class SparkDFDataset(MetaSparkDFDataset):
         return self.spark_df.agg(countDistinct(column)).collect()[0][0]
 
     def get_column_modes(self, column):
-        """leverages computation done in _get_column_value_counts"""
-        s = self.get_column_value_counts(column)
-        return list(s[s == s.max()].index)
+        # Only the most frequent values are collected, rather than the counts of every value
+        value_counts = self.spark_df.select(column)\
+            .where(col(column).isNotNull())\
+            .groupBy(column)\
+            .count()
+        max_count = value_counts.agg({"count": "max"}).collect()[0][0]
+        if max_count is None:
+            return []
+        modes = value_counts.where(col("count") == max_count).orderBy(column).collect()
+        return [row[column] for row in modes]
 
     def get_column_median(self, column):
         # We will get the two middle values by choosing an epsilon to add
@@ -518,6 +590,39 @@ class SparkDFDataset(MetaSparkDFDataset):
 
         return hist
 
+    def get_column_type_list_index(self, column, type_lists):
+        col_type = self._get_column_type_class(column)
+        for index, type_list in enumerate(type_lists):
+            try:
+                if issubclass(col_type, self._get_type_list_classes(type_list)):
+                    return index
+            except ValueError:
+                # The expectation raises, so does not succeed, for a type_list without any spark type
+                continue
+        return None
+
+    def _get_column_type_class(self, column):
+        try:
+            col_data = [f for f in self.spark_df.schema.fields if f.name == column][0]
+            return type(col_data.dataType)
+        except IndexError:
+            raise ValueError("Unrecognized column: %s" % column)
+        except KeyError:
+            raise ValueError("No database type data available for column: %s" % column)
+
+    @staticmethod
+    def _get_type_list_classes(type_list):
+        types = []
+        for type_ in type_list:
+            try:
+                type_class = getattr(sparktypes, type_)
+                types.append(type_class)
+            except AttributeError:
+                logger.debug("Unrecognized type: %s" % type_)
+        if len(types) == 0:
+            raise ValueError("No recognized spark types in type_list")
+        return tuple(types)
+
     def get_column_count_in_range(self, column, min_val=None, max_val=None, strict_min=False, strict_max=True):
         if min_val is None and max_val is None:
             raise ValueError('Must specify either min or max value')
@@ -537,6 +642,17 @@ class SparkDFDataset(MetaSparkDFDataset):
                 result = result.filter(col(column) <= max_val)
         return result.count()
 
+    def _build_column_sketch(self, column, sketch):
+        # Each partition builds its own sketch on an executor; only the sketches are sent back to be merged
+        def build_partition_sketch(rows):
+            partition_sketch = sketch.empty_copy()
+            partition_sketch.update(row[0] for row in rows)
+            yield partition_sketch
+
+        return self.spark_df.select(column).where(col(column).isNotNull()).rdd \
+            .mapPartitions(build_partition_sketch) \
+            .fold(sketch.empty_copy(), lambda left, right: left.merge(right))
+
     # Utils
     @staticmethod
     def _apply_dateutil_parse(column):
@@ -790,28 +906,11 @@ class SparkDFDataset(MetaSparkDFDataset):
         if mostly is not None:
             raise ValueError("SparkDFDataset does not support column map semantics for column types")
 
-        try:
-            col_data = [f for f in self.spark_df.schema.fields if f.name == column][0]
-            col_type = type(col_data.dataType)
-        except IndexError:
-            raise ValueError("Unrecognized column: %s" % column)
-        except KeyError:
-            raise ValueError("No database type data available for column: %s" % column)
-
+        col_type = self._get_column_type_class(column)
         if type_list is None:
             success = True
         else:
-            types = []
-            for type_ in type_list:
-                try:
-                    type_class = getattr(sparktypes, type_)
-                    types.append(type_class)
-                except AttributeError:
-                    logger.debug("Unrecognized type: %s" % type_)
-            if len(types) == 0:
-                raise ValueError("No recognized spark types in type_list")
-            types = tuple(types)
-            success = issubclass(col_type, types)
+            success = issubclass(col_type, self._get_type_list_classes(type_list))
         return {
             "success": success,
             "result": {
@@ -1,13 +1,25 @@
 from __future__ import division
-from six import PY3, string_types
+from six import PY3, integer_types, string_types
 
 import uuid
+import base64
+import hashlib
+import json
+import os
+import sqlite3
+from contextlib import contextmanager
 from functools import wraps
 import inspect
 import logging
+import threading
+import time
 import warnings
-from datetime import datetime
+from collections import OrderedDict
+from datetime import date, datetime, time as datetime_time, timedelta
+from decimal import Decimal
 from importlib import import_module
+from multiprocessing.pool import ThreadPool
+
 
 import pandas as pd
 import numpy as np
@@ -16,8 +28,13 @@ from dateutil.parser import parse
 
 from .dataset import Dataset
 from .pandas_dataset import PandasDataset
+from great_expectations.core import ExpectationSuiteValidationResult
 from great_expectations.data_asset import DataAsset
-from great_expectations.data_asset.util import DocInherit, parse_result_format
+from great_expectations.data_asset.util import (
+    DocInherit,
+    parse_result_format,
+    recursively_convert_to_json_serializable,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -51,9 +68,372 @@ except ImportError:
     pybigquery = None
 
 
+class SqlAlchemyReflectionCache(object):
+    """SqlAlchemyReflectionCache keeps the reflected columns of tables for ttl seconds, so that the batches of a
+    table built in that time do not each reflect it again. A cache must only be shared by datasets of one engine."""
+
+    def __init__(self, ttl=300):
+        self._ttl = ttl
+        self._columns = {}
+        self._lock = threading.Lock()
+
+    def get_columns(self, engine, table_name, schema=None):
+        key = (table_name, schema)
+        with self._lock:
+            cached = self._columns.get(key)
+        if cached is not None and time.time() - cached[0] < self._ttl:
+            return [dict(column) for column in cached[1]]
+
+        columns = reflection.Inspector.from_engine(engine).get_columns(table_name, schema=schema)
+        with self._lock:
+            self._columns[key] = (time.time(), columns)
+        return [dict(column) for column in columns]
+
+    def clear(self):
+        with self._lock:
+            self._columns = {}
+
+
+class SqlAlchemyCachedRow(tuple):
+    """A row read from a SqlAlchemyMetricCache, whose values can be read by position or by column name like those of
+    the rows of a query result."""
+
+    def __new__(cls, keys, values):
+        row = super(SqlAlchemyCachedRow, cls).__new__(cls, values)
+        row._keys = list(keys)
+        return row
+
+    def keys(self):
+        return list(self._keys)
+
+    def __getitem__(self, key):
+        if isinstance(key, string_types):
+            try:
+                key = self._keys.index(key)
+            except ValueError:
+                raise KeyError(key)
+        return super(SqlAlchemyCachedRow, self).__getitem__(key)
+
+
+class SqlAlchemyMetricCache(object):
+    """SqlAlchemyMetricCache persists the rows returned by metric queries in a local SQLite file, so that validating
+    a table that has not changed since a previous run does not query the database again.
+
+    Rows are keyed by the database, the compiled query and its parameters, and a version marker of the validated
+    table (see SqlAlchemyDataset). Entries expire ttl seconds after they were written, if ttl is set; beyond
+    max_entries entries, the least recently used ones are evicted.
+
+    Rows are stored as JSON, so reading the cache never runs code from the file. Numbers, strings, booleans, dates,
+    times, decimals and bytes are read back with their type; rows with values of other types are not cached.
+    """
+
+    def __init__(self, cache_path, ttl=None, max_entries=10000):
+        cache_directory = os.path.dirname(os.path.abspath(cache_path))
+        if not os.path.isdir(cache_directory):
+            os.makedirs(cache_directory)
+        self._cache_path = cache_path
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS ge_metric_cache "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+
+    @property
+    def cache_path(self):
+        return self._cache_path
+
+    @contextmanager
+    def _connect(self):
+        # A connection per operation, so that the cache can be used from any thread, and by several processes
+        connection = sqlite3.connect(self._cache_path, timeout=30)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    @staticmethod
+    def get_key(engine, query, version):
+        """Return the key of the rows of query on engine for the given table version."""
+        compiled = query.compile(dialect=engine.dialect)
+        return hashlib.sha256(json.dumps(
+            [str(engine.engine.url), str(compiled), compiled.params, version], sort_keys=True, default=str
+        ).encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        """Return the cached rows for key, or None."""
+        with self._lock, self._connect() as connection:
+            entry = connection.execute(
+                "SELECT value, created_at FROM ge_metric_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if entry is None:
+                return None
+            if self._ttl is not None and time.time() - entry[1] > self._ttl:
+                connection.execute("DELETE FROM ge_metric_cache WHERE key = ?", (key,))
+                return None
+            try:
+                rows = self._decode_rows(entry[0])
+            except (TypeError, ValueError, KeyError):
+                # e.g. an entry written by an earlier version of the cache
+                connection.execute("DELETE FROM ge_metric_cache WHERE key = ?", (key,))
+                return None
+            connection.execute("UPDATE ge_metric_cache SET accessed_at = ? WHERE key = ?", (time.time(), key))
+        return rows
+
+    def set(self, key, rows):
+        try:
+            value = self._encode_rows(rows)
+        except TypeError as e:
+            logger.debug("Unable to cache metric rows: %s" % str(e))
+            return
+        now = time.time()
+        with self._lock, self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO ge_metric_cache (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, value, now, now)
+            )
+            connection.execute(
+                "DELETE FROM ge_metric_cache WHERE key IN "
+                "(SELECT key FROM ge_metric_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self._max_entries,)
+            )
+
+    def __len__(self):
+        with self._connect() as connection:
+            return connection.execute("SELECT count(*) FROM ge_metric_cache").fetchone()[0]
+
+    @classmethod
+    def _encode_rows(cls, rows):
+        encoded_rows = []
+        for row in rows:
+            keys = list(row.keys()) if hasattr(row, "keys") else None
+            encoded_rows.append({"keys": keys, "values": [cls._encode_value(value) for value in row]})
+        return json.dumps(encoded_rows)
+
+    @classmethod
+    def _decode_rows(cls, value):
+        rows = []
+        for encoded_row in json.loads(value):
+            values = [cls._decode_value(encoded_value) for encoded_value in encoded_row["values"]]
+            if encoded_row["keys"] is None:
+                rows.append(tuple(values))
+            else:
+                rows.append(SqlAlchemyCachedRow(encoded_row["keys"], values))
+        return rows
+
+    @staticmethod
+    def _encode_value(value):
+        # Values that JSON cannot represent are tagged with their type; rows hold scalars, so tags are unambiguous
+        if value is None or isinstance(value, (bool, float) + integer_types + string_types):
+            return value
+        if isinstance(value, Decimal):
+            return {"decimal": str(value)}
+        if isinstance(value, datetime):
+            return {"datetime": value.isoformat()}
+        if isinstance(value, date):
+            return {"date": value.isoformat()}
+        if isinstance(value, datetime_time):
+            return {"time": value.isoformat()}
+        if isinstance(value, timedelta):
+            return {"timedelta": [value.days, value.seconds, value.microseconds]}
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return {"bytes": base64.b64encode(bytes(value)).decode("ascii")}
+        raise TypeError("values of type %s cannot be cached" % type(value).__name__)
+
+    @staticmethod
+    def _decode_value(value):
+        if not isinstance(value, dict):
+            return value
+        (type_name, encoded), = value.items()
+        if type_name == "decimal":
+            return Decimal(encoded)
+        if type_name == "datetime":
+            return parse(encoded)
+        if type_name == "date":
+            return parse(encoded).date()
+        if type_name == "time":
+            return parse(encoded).timetz()
+        if type_name == "timedelta":
+            return timedelta(*encoded)
+        if type_name == "bytes":
+            return base64.b64decode(encoded)
+        raise ValueError("Unknown cached value type: %s" % type_name)
+
+    def clear(self):
+        with self._lock, self._connect() as connection:
+            connection.execute("DELETE FROM ge_metric_cache")
+
+
+class SqlAlchemyQueryRecorder(object):
+    """SqlAlchemyQueryRecorder records the SQL, parameters, row count and wall time of every query executed by an
+    instrumented engine while the recorder is active, and optionally the plan of each SELECT query.
+
+    A recorder is active in the thread that entered its recording() scope; query executor threads running queries for
+    that thread record to the same recorder. Row counts are those reported by the DBAPI cursor, which many drivers
+    only provide for data modification statements, so they may be None.
+    """
+
+    # Prefix of the statement giving the plan of a query, by dialect; plans are not captured on other dialects
+    explain_prefixes = {
+        "postgresql": "EXPLAIN ",
+        "redshift": "EXPLAIN ",
+        "mysql": "EXPLAIN ",
+        "snowflake": "EXPLAIN ",
+        "sqlite": "EXPLAIN QUERY PLAN ",
+    }
+
+    _active = threading.local()
+
+    def __init__(self, explain=False):
+        self._explain = explain
+        self._queries = []
+        self._lock = threading.Lock()
+
+    @property
+    def queries(self):
+        return list(self._queries)
+
+    @classmethod
+    def get_active_recorder(cls):
+        return getattr(cls._active, "recorder", None)
+
+    @contextmanager
+    def recording(self):
+        """Record the queries executed by the current thread within the scope."""
+        previous_recorder = self.get_active_recorder()
+        self._active.recorder = self
+        try:
+            yield self
+        finally:
+            self._active.recorder = previous_recorder
+
+    @classmethod
+    def instrument(cls, engine):
+        """Record the queries executed by engine, or by any connection of the engine, for the active recorder."""
+        # A connection's engine property is its engine, and an engine's is the engine itself
+        engine = engine.engine
+        if not sa.event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+            sa.event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+            sa.event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+    def _explain_statement(self, conn, statement, parameters):
+        explain_prefix = self.explain_prefixes.get(conn.dialect.name.lower())
+        if explain_prefix is None or not statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            return None
+        # Use a separate cursor so that the results of the statement are left untouched
+        cursor = conn.connection.cursor()
+        try:
+            cursor.execute(explain_prefix + statement, parameters)
+            return [" | ".join(str(value) for value in row) for row in cursor.fetchall()]
+        except Exception as err:
+            logger.debug("Unable to explain query: %s" % str(err))
+            return None
+        finally:
+            cursor.close()
+
+    def _record(self, query):
+        with self._lock:
+            self._queries.append(query)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    recorder = SqlAlchemyQueryRecorder.get_active_recorder()
+    if recorder is None:
+        return
+    plan = None
+    if recorder._explain and not executemany:
+        plan = recorder._explain_statement(conn, statement, parameters)
+    conn.info.setdefault("ge_query_start_times", []).append((time.time(), plan))
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    recorder = SqlAlchemyQueryRecorder.get_active_recorder()
+    if recorder is None or not conn.info.get("ge_query_start_times"):
+        return
+    start_time, plan = conn.info["ge_query_start_times"].pop()
+    query = {
+        "sql": statement,
+        "parameters": recursively_convert_to_json_serializable(parameters),
+        "row_count": cursor.rowcount if cursor.rowcount is not None and cursor.rowcount >= 0 else None,
+        "duration_seconds": time.time() - start_time,
+    }
+    if recorder._explain:
+        query["plan"] = plan
+    recorder._record(query)
+
+
+class SqlAlchemyQueryExecutor(object):
+    """SqlAlchemyQueryExecutor runs independent queries, or the validations of the columns of a dataset (see
+    SqlAlchemyDataset.validate), concurrently on a pool of worker threads, each on its own connection from the
+    engine's pool.
+
+    An executor is shared by all datasets of a datasource, so max_concurrent_queries limits the number of queries the
+    datasource runs at once. Queries for engines bound to a single connection run sequentially. The worker threads
+    are started when first needed and stopped by close, which the datasource calls when it is closed.
+    """
+
+    def __init__(self, max_concurrent_queries=4):
+        if max_concurrent_queries < 1:
+            raise ValueError("max_concurrent_queries must be positive")
+        self._max_concurrent_queries = max_concurrent_queries
+        self._pool = None
+        self._lock = threading.Lock()
+
+    @property
+    def max_concurrent_queries(self):
+        return self._max_concurrent_queries
+
+    def execute(self, engine, queries):
+        """Execute the queries, returning the list of rows of each query in order."""
+        if len(queries) < 2 or self._max_concurrent_queries < 2 or not isinstance(engine, sa.engine.Engine):
+            return [engine.execute(query).fetchall() for query in queries]
+
+        # Queries run for an instrumented expectation are recorded by its recorder
+        recorder = SqlAlchemyQueryRecorder.get_active_recorder()
+        return self.map(lambda query: self._execute_on_new_connection(engine, query, recorder), queries)
+
+    def map(self, function, items):
+        """Call function on each item on the worker threads, returning the results in order.
+
+        function must not itself use the executor, whose threads could all be waiting for it."""
+        if len(items) < 2 or self._max_concurrent_queries < 2:
+            return [function(item) for item in items]
+        return self._get_pool().map(function, items)
+
+    def _get_pool(self):
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPool(self._max_concurrent_queries)
+            return self._pool
+
+    @staticmethod
+    def _execute_on_new_connection(engine, query, recorder=None):
+        if recorder is not None:
+            with recorder.recording():
+                return SqlAlchemyQueryExecutor._execute_on_new_connection(engine, query)
+        connection = engine.connect()
+        try:
+            return connection.execute(query).fetchall()
+        finally:
+            connection.close()
+
+    def close(self):
+        """Stop the worker threads; they are started again if the executor is used after it is closed."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.close()
+                self._pool.join()
+                self._pool = None
+
+
 class SqlAlchemyBatchReference(object):
 
-    def __init__(self, engine, table_name=None, schema=None, query=None):
+    def __init__(self, engine, table_name=None, schema=None, query=None, create_temp_table=True,
+                 reflection_cache=None, query_executor=None, instrument_queries=False, explain_queries=False,
+                 metric_cache=None, metric_cache_version=None, metric_cache_version_query=None, prior_metrics=None):
         self._engine = engine
         if table_name is None and query is None:
             raise ValueError("Table_name or query must be specified")
@@ -61,6 +441,15 @@ class SqlAlchemyBatchReference(object):
         self._table_name = table_name
         self._schema = schema
         self._query = query
+        self._create_temp_table = create_temp_table
+        self._reflection_cache = reflection_cache
+        self._query_executor = query_executor
+        self._instrument_queries = instrument_queries
+        self._explain_queries = explain_queries
+        self._metric_cache = metric_cache
+        self._metric_cache_version = metric_cache_version
+        self._metric_cache_version_query = metric_cache_version_query
+        self._prior_metrics = prior_metrics
 
     def get_init_kwargs(self):
         if self._table_name and self._query:
@@ -83,6 +472,22 @@ class SqlAlchemyBatchReference(object):
             }
         if self._schema:
             kwargs["schema"] = self._schema
+        if self._query and not self._create_temp_table:
+            kwargs["create_temp_table"] = False
+        if self._reflection_cache is not None:
+            kwargs["reflection_cache"] = self._reflection_cache
+        if self._query_executor is not None:
+            kwargs["query_executor"] = self._query_executor
+        if self._instrument_queries:
+            kwargs["instrument_queries"] = True
+        if self._explain_queries:
+            kwargs["explain_queries"] = True
+        if self._metric_cache is not None:
+            kwargs["metric_cache"] = self._metric_cache
+            kwargs["metric_cache_version"] = self._metric_cache_version
+            kwargs["metric_cache_version_query"] = self._metric_cache_version_query
+        if self._prior_metrics is not None:
+            kwargs["prior_metrics"] = self._prior_metrics
 
         return kwargs
 
@@ -147,7 +552,7 @@ class MetaSqlAlchemyDataset(Dataset):
             else:
                 ignore_values_condition = sa.literal(False)
 
-            count_query = sa.select([
+            count_columns = [
                 sa.func.count().label('element_count'),
                 sa.func.sum(
                     sa.case([(ignore_values_condition, 1)], else_=0)
@@ -163,9 +568,27 @@ class MetaSqlAlchemyDataset(Dataset):
                         )
                     ], else_=0)
                 ).label('unexpected_count')
-            ]).select_from(self._table)
+            ]
 
-            count_results = dict(self.engine.execute(count_query).fetchone())
+            # Retrieve unexpected values along with the counts
+            unexpected_query = sa.select([sa.column(column)]).select_from(self._table).where(
+                sa.and_(sa.not_(expected_condition),
+                        sa.not_(ignore_values_condition)
+                        )
+            ).limit(unexpected_count_limit)
+
+            if self._partition_parent is not None:
+                # The counts of every partition are computed at once by the dataset the partitions were split from;
+                # unexpected values are only fetched for the partitions that have some
+                count_results = self._partition_parent._get_partition_map_counts(
+                    self._partition_by, self._partition_key, count_columns)
+                unexpected_rows = []
+                if count_results.get("unexpected_count") and result_format['result_format'] != 'BOOLEAN_ONLY':
+                    unexpected_rows = self._execute_query(unexpected_query)
+            else:
+                count_query = sa.select(count_columns).select_from(self._table)
+                count_rows, unexpected_rows = self._execute_queries([count_query, unexpected_query])
+                count_results = dict(count_rows[0])
 
             # Handle case of empty table gracefully:
             if "element_count" not in count_results or count_results["element_count"] is None:
@@ -175,29 +598,20 @@ class MetaSqlAlchemyDataset(Dataset):
             if "unexpected_count" not in count_results or count_results["unexpected_count"] is None:
                 count_results["unexpected_count"] = 0
 
-            # Retrieve unexpected values
-            unexpected_query_results = self.engine.execute(
-                sa.select([sa.column(column)]).select_from(self._table).where(
-                    sa.and_(sa.not_(expected_condition),
-                            sa.not_(ignore_values_condition)
-                            )
-                ).limit(unexpected_count_limit)
-            )
-
             nonnull_count = count_results['element_count'] - \
                 count_results['null_count']
 
             if "output_strftime_format" in kwargs:
                 output_strftime_format = kwargs["output_strftime_format"]
                 maybe_limited_unexpected_list = []
-                for x in unexpected_query_results.fetchall():
+                for x in unexpected_rows:
                     if isinstance(x[column], string_types):
                         col = parse(x[column])
                     else:
                         col = x[column]
                     maybe_limited_unexpected_list.append(datetime.strftime(col, output_strftime_format))
             else:
-                maybe_limited_unexpected_list = [x[column] for x in unexpected_query_results.fetchall()]
+                maybe_limited_unexpected_list = [x[column] for x in unexpected_rows]
 
             success_count = nonnull_count - count_results['unexpected_count']
             success, percent_success = self._calc_map_expectation_success(
@@ -228,21 +642,148 @@ class MetaSqlAlchemyDataset(Dataset):
 
         inner_wrapper.__name__ = func.__name__
         inner_wrapper.__doc__ = func.__doc__
+        inner_wrapper.map_expectation = True
+
+        return inner_wrapper
+
+    @classmethod
+    def multicolumn_map_expectation(cls, func):
+        """For SqlAlchemy, this decorator allows individual multicolumn_map_expectations to simply return the filter
+        that describes the expected condition on each row of their data.
+
+        The decorator will then use that filter to obtain unexpected rows, relevant counts, and return the formatted
+        object.
+        """
+        if PY3:
+            argspec = inspect.getfullargspec(func)[0][1:]
+        else:
+            argspec = inspect.getargspec(func)[0][1:]
+
+        @cls.expectation(argspec)
+        @wraps(func)
+        def inner_wrapper(self, column_list, mostly=None, ignore_row_if="all_values_are_missing",
+                          result_format=None, *args, **kwargs):
+            if result_format is None:
+                result_format = self.default_expectation_args["result_format"]
+
+            result_format = parse_result_format(result_format)
+
+            if result_format['result_format'] == 'COMPLETE':
+                warnings.warn("Setting result format to COMPLETE for a SqlAlchemyDataset can be dangerous because it will not limit the number of returned results.")
+                unexpected_count_limit = None
+            else:
+                unexpected_count_limit = result_format['partial_unexpected_count']
+
+            if ignore_row_if == "all_values_are_missing":
+                ignore_row_condition = sa.and_(*[sa.column(column).is_(None) for column in column_list])
+            elif ignore_row_if == "any_value_is_missing":
+                ignore_row_condition = sa.or_(*[sa.column(column).is_(None) for column in column_list])
+            elif ignore_row_if == "never":
+                ignore_row_condition = sa.literal(False)
+            else:
+                raise ValueError(
+                    "Unknown value of ignore_row_if: %s", (ignore_row_if,))
+
+            expected_condition = func(self, column_list, *args, **kwargs)
+
+            unexpected_condition = sa.and_(
+                sa.not_(expected_condition),
+                sa.not_(ignore_row_condition)
+            )
+            count_query = sa.select([
+                sa.func.count().label('element_count'),
+                sa.func.sum(
+                    sa.case([(ignore_row_condition, 1)], else_=0)
+                ).label('ignored_count'),
+                sa.func.sum(
+                    sa.case([(unexpected_condition, 1)], else_=0)
+                ).label('unexpected_count')
+            ]).select_from(self._table)
+            unexpected_query = sa.select([sa.column(column) for column in column_list]).select_from(self._table).where(
+                unexpected_condition
+            ).limit(unexpected_count_limit)
+
+            count_rows, unexpected_rows = self._execute_queries([count_query, unexpected_query])
+            count_results = dict(count_rows[0])
+            element_count = count_results["element_count"] or 0
+            nonnull_count = element_count - (count_results["ignored_count"] or 0)
+            unexpected_count = count_results["unexpected_count"] or 0
+
+            maybe_limited_unexpected_list = [
+                dict((column, row[column]) for column in column_list)
+                for row in unexpected_rows
+            ]
+
+            success_count = nonnull_count - unexpected_count
+            success, percent_success = self._calc_map_expectation_success(
+                success_count, nonnull_count, mostly)
+
+            return self._format_map_output(
+                result_format,
+                success,
+                element_count,
+                nonnull_count,
+                unexpected_count,
+                maybe_limited_unexpected_list,
+                None,
+            )
+
+        inner_wrapper.__name__ = func.__name__
+        inner_wrapper.__doc__ = func.__doc__
+        inner_wrapper.map_expectation = True
 
         return inner_wrapper
 
 
 class SqlAlchemyDataset(MetaSqlAlchemyDataset):
 
+    # Number of rows fetched at a time when streaming column values into a sketch
+    sketch_fetch_size = 10000
+
+    # Dialects on which duplicate values are counted with a COUNT(*) OVER (PARTITION BY column) window; on other
+    # dialects they are counted by aggregating a GROUP BY of the column values
+    window_uniqueness_dialects = ["postgresql", "mssql", "oracle", "snowflake", "redshift", "bigquery"]
+
     @classmethod
     def from_dataset(cls, dataset=None):
         if isinstance(dataset, SqlAlchemyDataset):
+            if dataset._custom_sql is not None and not dataset._create_temp_table:
+                return cls(custom_sql=dataset._custom_sql, create_temp_table=False, engine=dataset.engine)
             return cls(table_name=str(dataset._table.name), engine=dataset.engine)
         else:
             raise ValueError("from_dataset requires a SqlAlchemy dataset")
 
     def __init__(self, table_name=None, engine=None, connection_string=None,
-                 custom_sql=None, schema=None, *args, **kwargs):
+                 custom_sql=None, schema=None, create_temp_table=True, reflection_cache=None, query_executor=None,
+                 instrument_queries=False, explain_queries=False, metric_cache=None, metric_cache_version=None,
+                 metric_cache_version_query=None, *args, **kwargs):
+        """
+        Args:
+            table_name: the table to validate; with custom_sql, the name of the table created for the query
+            engine: a SqlAlchemy engine or connection
+            connection_string: a connection string from which to create an engine, if no engine is provided
+            custom_sql: a query whose result should be validated instead of a table
+            schema: the schema of the table
+            create_temp_table: if True (the default), materialize the result of custom_sql in a temporary table \
+                before validation. If False, validate a "virtual" batch: custom_sql is used as a subquery by every \
+                validation query, so nothing is copied up front, at the cost of evaluating the query each time. \
+                Materializing is best for expensive queries that are validated by many expectations.
+            reflection_cache: an optional SqlAlchemyReflectionCache from which to get the columns of table_name
+            query_executor: an optional SqlAlchemyQueryExecutor with which to validate the expectations of \
+                different columns concurrently, and to run the independent queries of an expectation concurrently \
+                when it is evaluated outside of validate
+            instrument_queries: if True, record the SQL, row count and wall time of the queries run by each \
+                expectation in the meta of its result, and summarize them in the meta of validation results
+            explain_queries: if True, also record the plan of each query; implies instrument_queries
+            metric_cache: an optional SqlAlchemyMetricCache in which to persist the results of metric queries
+            metric_cache_version: a marker of the version of the data, such as a partition identifier, under which \
+                metric results are cached; when it is given, cached metrics are used without querying the database
+            metric_cache_version_query: a query whose result is the version marker, such as \
+                "SELECT max(updated_at) FROM my_table"; it is run once per validation, or once per expectation \
+                evaluated outside of validate. The metric cache is only used if metric_cache_version or \
+                metric_cache_version_query is given: no generic marker, such as the row count, reliably changes \
+                when a table is updated in place
+        """
 
         if custom_sql and not table_name:
             #NOTE: Eugene 2020-01-31: @James, this is a not a proper fix, but without it the "public" schema
@@ -256,7 +797,29 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         if table_name is None:
             raise ValueError("No table_name provided.")
 
-        self._table = sa.Table(table_name, sa.MetaData(), schema=schema)
+        self._custom_sql = custom_sql
+        self._create_temp_table = create_temp_table
+        self._reflection_cache = reflection_cache
+        self._query_executor = query_executor
+        self._instrument_queries = instrument_queries or explain_queries
+        self._explain_queries = explain_queries
+        self._metric_cache = metric_cache
+        self._metric_cache_version = metric_cache_version
+        self._metric_cache_version_query = metric_cache_version_query
+        # The result of metric_cache_version_query, kept while a validation or an expectation evaluation is running
+        self._resolved_metric_cache_version = None
+        self._metric_cache_version_scopes = 0
+        # Set on the datasets of the partitions split from this dataset by validate(partition_by=...)
+        self._partition_parent = None
+        self._partition_by = None
+        self._partition_key = None
+        self._partition_map_counts = {}
+        is_virtual_batch = custom_sql is not None and not create_temp_table
+        if is_virtual_batch:
+            # The query must be usable as a subquery, so drop any statement terminator
+            self._table = sa.text(custom_sql.strip().rstrip(";")).columns().alias(table_name)
+        else:
+            self._table = sa.Table(table_name, sa.MetaData(), schema=schema)
 
         if engine is None and connection_string is None:
             raise ValueError("Engine or connection_string must be provided.")
@@ -270,12 +833,15 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
                 # Currently we do no error handling if the engine doesn't work out of the box.
                 raise err
 
+        if self._instrument_queries:
+            SqlAlchemyQueryRecorder.instrument(self.engine)
+
         # Get the dialect **for purposes of identifying types**
         if self.engine.dialect.name.lower() in ["postgresql", "mysql", "sqlite", "oracle", "mssql", "oracle"]:
             # These are the officially included and supported dialects by sqlalchemy
             self.dialect = import_module("sqlalchemy.dialects." + self.engine.dialect.name)
 
-            if engine and engine.dialect.name.lower() == "sqlite":
+            if engine and engine.dialect.name.lower() == "sqlite" and not is_virtual_batch:
                 # sqlite temp tables only persist within a connection so override the engine
                 self.engine = engine.connect()
         elif self.engine.dialect.name.lower() == "snowflake":
@@ -296,37 +862,195 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
             # raise ValueError("Cannot specify both schema and custom_sql.")
             pass
 
-        if custom_sql is not None and self.engine.dialect.name.lower() == "bigquery":
+        if custom_sql is not None and create_temp_table and self.engine.dialect.name.lower() == "bigquery":
             if generated_table_name is not None and self.engine.dialect.dataset_id is None:
                 raise ValueError("No BigQuery dataset specified. Use bigquery_temp_table batch_kwarg or a specify a "
                                  "default dataset in engine url")
 
-        if (custom_sql is not None and self.engine.dialect.name.lower() == "snowflake" and
+        if (custom_sql is not None and create_temp_table and self.engine.dialect.name.lower() == "snowflake" and
                 generated_table_name is not None):
             raise ValueError("No snowflake_transient_table specified. Snowflake with a query batch_kwarg will create "
                              "a transient table, so you must provide a user-selected name.")
 
-        if custom_sql:
+        if custom_sql and not is_virtual_batch:
             self.create_temporary_table(table_name, custom_sql, schema_name=schema)
 
             if generated_table_name is not None and self.engine.dialect.name.lower() == "bigquery":
                 logger.warning("Created permanent table {table_name}".format(
                     table_name=table_name))
 
-        try:
-            insp = reflection.Inspector.from_engine(self.engine)
-            self.columns = insp.get_columns(table_name, schema=schema)
-        except KeyError:
-            # we will get a KeyError for temporary tables, since
-            # reflection will not find the temporary schema
+        if is_virtual_batch:
             self.columns = self.column_reflection_fallback()
+        else:
+            try:
+                if reflection_cache is not None and custom_sql is None:
+                    self.columns = reflection_cache.get_columns(self.engine, table_name, schema=schema)
+                else:
+                    insp = reflection.Inspector.from_engine(self.engine)
+                    self.columns = insp.get_columns(table_name, schema=schema)
+            except KeyError:
+                # we will get a KeyError for temporary tables, since
+                # reflection will not find the temporary schema
+                self.columns = self.column_reflection_fallback()
 
         # Only call super once connection is established and table_name and columns known to allow autoinspection
         super(SqlAlchemyDataset, self).__init__(*args, **kwargs)
 
+    def validate(self, *args, **kwargs):
+        """Validate the dataset as DataAsset.validate does, running every query of the validation on one connection
+        instead of checking out a connection from the engine's pool for each query.
+
+        With a query executor, the expectations of each column are validated on a worker copy of the dataset, with
+        its own connection, on the threads of the executor, so up to max_concurrent_queries columns are validated
+        at once; results are the same as those of a sequential validation. Validations with sample or partition_by,
+        and datasets that cannot be copied (see _get_worker_copy), are validated sequentially.
+
+        If queries are instrumented, the meta of the validation result summarizes the queries run by each expectation,
+        from the most to the least expensive."""
+        validation_results = None
+        if (self._query_executor is not None and len(args) <= 1 and kwargs.get("sample") is None
+                and kwargs.get("partition_by") is None):
+            validate_kwargs = dict(kwargs)
+            expectation_suite = self._load_expectation_suite(
+                args[0] if args else validate_kwargs.pop("expectation_suite", None)
+            )
+            validation_results = self._validate_columns_concurrently(
+                expectation_suite,
+                self._query_executor.max_concurrent_queries,
+                map_function=self._query_executor.map,
+                **validate_kwargs
+            )
+        if validation_results is None:
+            with self._connection_scope(), self._metric_cache_version_scope():
+                validation_results = super(SqlAlchemyDataset, self).validate(*args, **kwargs)
+
+        if self._instrument_queries and isinstance(validation_results, ExpectationSuiteValidationResult):
+            validation_results.meta["sql_queries"] = self._summarize_queries(validation_results.results)
+        return validation_results
+
+    @staticmethod
+    def _summarize_queries(results):
+        expectations = []
+        for result in results:
+            queries = result.meta.get("sql_queries", [])
+            expectations.append({
+                "expectation_type": result.expectation_config.expectation_type,
+                "kwargs": result.expectation_config.kwargs,
+                "query_count": len(queries),
+                "duration_seconds": sum(query["duration_seconds"] for query in queries)
+            })
+        expectations.sort(key=lambda expectation: expectation["duration_seconds"], reverse=True)
+        return {
+            "query_count": sum(expectation["query_count"] for expectation in expectations),
+            "duration_seconds": sum(expectation["duration_seconds"] for expectation in expectations),
+            "expectations": expectations
+        }
+
+    @contextmanager
+    def _expectation_evaluation_scope(self, expectation_config, evaluation_meta):
+        if not self._instrument_queries:
+            with self._metric_cache_version_scope():
+                yield
+            return
+
+        recorder = SqlAlchemyQueryRecorder(explain=self._explain_queries)
+        try:
+            with recorder.recording(), self._metric_cache_version_scope():
+                yield
+        finally:
+            evaluation_meta["sql_queries"] = recorder.queries
+
+    @contextmanager
+    def _metric_cache_version_scope(self):
+        """Resolve the version marker of the metric cache at most once within the scope, and again in the next
+        scope, since the table may have changed in between."""
+        self._metric_cache_version_scopes += 1
+        try:
+            yield
+        finally:
+            self._metric_cache_version_scopes -= 1
+            if self._metric_cache_version_scopes == 0:
+                self._resolved_metric_cache_version = None
+
+    @contextmanager
+    def _connection_scope(self):
+        """Use a single connection for every query made by the dataset within the scope."""
+        if not isinstance(self.engine, sa.engine.Engine):
+            # Already bound to a connection, as are sqlite datasets and nested scopes
+            yield self.engine
+            return
+
+        engine = self.engine
+        connection = engine.connect()
+        self.engine = connection
+        try:
+            yield connection
+        finally:
+            self.engine = engine
+            connection.close()
+
+    def _execute_query(self, query):
+        """Execute a metric query, or get its rows from the metric cache.
+
+        Returns: the list of rows of the query"""
+        return self._execute_queries([query])[0]
+
+    def _execute_queries(self, queries):
+        """Execute independent metric queries, concurrently if the dataset has a query executor, getting the rows of
+        any cached query from the metric cache.
+
+        Returns: the list of rows of each query, in order"""
+        version = self._get_metric_cache_version()
+        if version is None:
+            return self._execute_uncached_queries(queries)
+
+        keys = [SqlAlchemyMetricCache.get_key(self.engine, query, version) for query in queries]
+        results = [self._metric_cache.get(key) for key in keys]
+        missing = [idx for idx, rows in enumerate(results) if rows is None]
+        if missing:
+            for idx, rows in zip(missing, self._execute_uncached_queries([queries[idx] for idx in missing])):
+                self._metric_cache.set(keys[idx], rows)
+                results[idx] = rows
+        return results
+
+    def _execute_uncached_queries(self, queries):
+        if self._query_executor is None:
+            return [self.engine.execute(query).fetchall() for query in queries]
+        return self._query_executor.execute(self.engine, queries)
+
+    def _get_metric_cache_version(self):
+        """Returns the version marker under which metrics are cached, or None if metrics are not cached."""
+        if self._metric_cache is None:
+            return None
+        if self._metric_cache_version is not None:
+            return self._metric_cache_version
+        if self._metric_cache_version_query is None:
+            return None
+        if self._resolved_metric_cache_version is not None:
+            return self._resolved_metric_cache_version
+
+        version_rows = self.engine.execute(sa.text(self._metric_cache_version_query)).fetchall()
+        version = recursively_convert_to_json_serializable([list(row) for row in version_rows])
+        if self._metric_cache_version_scopes > 0:
+            self._resolved_metric_cache_version = version
+        return version
+
     def head(self, n=5):
         """Returns a *PandasDataset* with the first *n* rows of the given Dataset"""
 
+        if not isinstance(self._table, sa.Table):
+            # a virtual batch has no table to read
+            df = pd.read_sql(sa.select([sa.text("*")]).select_from(self._table).limit(n), con=self.engine)
+            return PandasDataset(
+                df,
+                expectation_suite=self.get_expectation_suite(
+                    discard_failed_expectations=False,
+                    discard_result_format_kwargs=False,
+                    discard_catch_exceptions_kwargs=False,
+                    discard_include_config_kwargs=False
+                )
+            )
+
         try:
             df = next(pd.read_sql_table(
                 table_name=self._table.name,
@@ -359,10 +1083,126 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
             )
         )
 
+    def random_sample(self, n=None, fraction=None, seed=None):
+        """Returns a SqlAlchemyDataset backed by a temporary table holding a random sample of this table's rows.
+
+        Fractions of tables use TABLESAMPLE BERNOULLI on postgresql (where seed is honored through REPEATABLE); other
+        dialects and virtual batches keep each row with probability fraction using a filter on the dialect's random
+        function (honoring seed on mysql), so that the sample is taken in a single scan, without sorting the table or
+        counting its rows. Row limits sample a fraction slightly larger than n / row count the same way, and only
+        order the sampled rows randomly to keep the first n. The sample is always materialized, so that every
+        expectation sees the same rows."""
+        self._validate_random_sample_args(n, fraction)
+        dialect_name = self.engine.dialect.name.lower()
+
+        limit = None
+        if n is not None:
+            row_count = self.get_row_count()
+            if row_count <= n:
+                fraction = 1
+            else:
+                limit = n
+                # Oversample by a few standard deviations, so that the sample almost always holds at least n rows
+                fraction = min(1., (n + 3 * np.sqrt(n) + 10) / row_count)
+
+        if fraction >= 1:
+            sampled_table = self._table
+        elif dialect_name == "postgresql" and isinstance(self._table, sa.Table):
+            sampled_table = self._table.tablesample(
+                sa.func.bernoulli(fraction * 100),
+                name="ge_sample",
+                seed=sa.literal(seed) if seed is not None else None
+            )
+        else:
+            sampled_table = sa.select([sa.text("*")]).select_from(self._table).where(
+                self._get_random_sample_condition(fraction, seed)
+            ).alias("ge_sample")
+
+        query = sa.select([sa.text("*")]).select_from(sampled_table)
+        if limit is not None:
+            if dialect_name in ["mysql", "bigquery"]:
+                random_func = sa.func.rand()
+            elif dialect_name == "mssql":
+                random_func = sa.func.newid()
+            else:
+                random_func = sa.func.random()
+            query = query.order_by(random_func).limit(limit)
+
+        custom_sql = str(query.compile(dialect=self.engine.dialect, compile_kwargs={"literal_binds": True}))
+        table_name = None
+        if dialect_name == "snowflake":
+            # snowflake requires a user-selected name for the transient table created for a query
+            table_name = "ge_tmp_" + str(uuid.uuid4())[:8]
+        return self.__class__(
+            table_name=table_name,
+            engine=self.engine,
+            custom_sql=custom_sql,
+            **self._get_derived_dataset_kwargs()
+        )
+
+    def _get_random_sample_condition(self, fraction, seed=None):
+        """Returns a condition that each row meets with probability fraction, drawn independently for each row."""
+        dialect_name = self.engine.dialect.name.lower()
+        if dialect_name == "mysql" and seed is not None:
+            return sa.func.rand(seed) < fraction
+        if seed is not None:
+            logger.debug("Ignoring random_sample seed, which is not supported for dialect %s" % dialect_name)
+        if dialect_name in ["mysql", "bigquery"]:
+            return sa.func.rand() < fraction
+        if dialect_name == "snowflake":
+            return sa.func.uniform(0., 1., sa.func.random()) < fraction
+        # random() returns integers on sqlite, and rand() is evaluated once per query on mssql
+        if dialect_name == "sqlite":
+            random_integer = sa.func.abs(sa.func.random())
+        elif dialect_name == "mssql":
+            random_integer = sa.func.abs(sa.func.checksum(sa.func.newid()))
+        else:
+            return sa.func.random() < fraction
+        return random_integer % 1000000 < int(round(fraction * 1000000))
+
+    def _get_worker_copy(self):
+        # Temporary tables are only visible to the connection that created them, and in-memory sqlite databases are
+        # only visible to their own connection; virtual batches only hold their query, so they can be shared like
+        # tables. A worker copy runs its queries on its own connection, without the query executor, whose pool may
+        # be the one running the worker (see validate)
+        if not isinstance(self.engine, sa.engine.Engine):
+            return None
+        if self.engine.dialect.name.lower() == "sqlite" and self.engine.url.database in (None, "", ":memory:"):
+            return None
+        if self._custom_sql is not None:
+            if self._create_temp_table:
+                return None
+            worker_copy = self.__class__(
+                table_name=self._table.name,
+                custom_sql=self._custom_sql,
+                create_temp_table=False,
+                engine=self.engine,
+                instrument_queries=self._instrument_queries,
+                explain_queries=self._explain_queries,
+                metric_cache=self._metric_cache,
+                metric_cache_version=self._metric_cache_version,
+                metric_cache_version_query=self._metric_cache_version_query,
+                **self._get_derived_dataset_kwargs()
+            )
+        else:
+            worker_copy = self.__class__(
+                table_name=self._table.name,
+                schema=self._table.schema,
+                engine=self.engine,
+                reflection_cache=self._reflection_cache,
+                instrument_queries=self._instrument_queries,
+                explain_queries=self._explain_queries,
+                metric_cache=self._metric_cache,
+                metric_cache_version=self._metric_cache_version,
+                metric_cache_version_query=self._metric_cache_version_query,
+                **self._get_derived_dataset_kwargs()
+            )
+        return self._share_worker_state(worker_copy)
+
     def get_row_count(self):
         count_query = sa.select([sa.func.count()]).select_from(
             self._table)
-        return int(self.engine.execute(count_query).scalar())
+        return int(self._execute_query(count_query)[0][0])
 
     def get_column_count(self):
         return len(self.columns)
@@ -382,34 +1222,34 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
                     sa.column(column).is_(None) if None in ignore_values else False), 1)], else_=0)
             ).label('null_count'),
         ]).select_from(self._table)
-        count_results = dict(self.engine.execute(count_query).fetchone())
+        count_results = dict(self._execute_query(count_query)[0])
         element_count = int(count_results.get('element_count') or 0)
         null_count = int(count_results.get('null_count') or 0)
         return element_count - null_count
 
     def get_column_sum(self, column):
-        return self.engine.execute(
+        return self._execute_query(
             sa.select([sa.func.sum(sa.column(column))]).select_from(
                 self._table)
-        ).scalar()
+        )[0][0]
 
     def get_column_max(self, column, parse_strings_as_datetimes=False):
         if parse_strings_as_datetimes:
             raise NotImplementedError
-        return self.engine.execute(
+        return self._execute_query(
             sa.select([sa.func.max(sa.column(column))]).select_from(
                 self._table)
-        ).scalar()
+        )[0][0]
 
     def get_column_min(self, column, parse_strings_as_datetimes=False):
         if parse_strings_as_datetimes:
             raise NotImplementedError
-        return self.engine.execute(
+        return self._execute_query(
             sa.select([sa.func.min(sa.column(column))]).select_from(
                 self._table)
-        ).scalar()
+        )[0][0]
 
-    def get_column_value_counts(self, column, sort="value", collate=None):
+    def get_column_value_counts(self, column, sort="value", collate=None, top_k=None, max_distinct=None):
         if sort not in ["value", "count", "none"]:
             raise ValueError(
                 "sort must be either 'value', 'count', or 'none'"
@@ -419,19 +1259,35 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
                 sa.column(column).label("value"),
                 sa.func.count(sa.column(column)).label("count"),
             ]).where(sa.column(column) != None) \
-              .group_by(sa.column(column))
+              .group_by(sa.column(column)) \
+              .select_from(self._table)
+        value = sa.column(column)
+
+        limit = top_k
+        if max_distinct is not None:
+            limit = max_distinct + 1 if limit is None else min(limit, max_distinct + 1)
+        if top_k is not None:
+            # Choose the most frequent values in the database, then sort them as requested
+            query = sa.select([sa.column("value"), sa.column("count")]).select_from(
+                query.order_by(sa.column("count").desc()).limit(limit).alias("top_value_counts")
+            )
+            value = sa.column("value")
+            limit = None
+
         if sort == "value":
             # NOTE: depending on the way the underlying database collates columns,
             # ordering can vary. postgresql collate "C" matches default sort
             # for python and most other systems, but is not universally supported,
             # so we use the default sort for the system, unless specifically overridden
             if collate is not None:
-                query = query.order_by(sa.column(column).collate(collate))
+                query = query.order_by(value.collate(collate))
             else:
-                query = query.order_by(sa.column(column))
+                query = query.order_by(value)
         elif sort == "count":
             query = query.order_by(sa.column("count").desc())
-        results = self.engine.execute(query.select_from(self._table)).fetchall()
+        if limit is not None:
+            query = query.limit(limit)
+        results = self._execute_query(query)
         series = pd.Series(
             [row[1] for row in results],
             index=pd.Index(
@@ -442,28 +1298,42 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         )
         return series
 
+    def get_column_modes(self, column):
+        # Find the highest count, then the values with that count, without fetching the counts of every value
+        value_counts = sa.select([
+            sa.column(column).label("value"),
+            sa.func.count(sa.column(column)).label("count"),
+        ]).where(sa.column(column) != None).group_by(sa.column(column)).select_from(self._table).alias("value_counts")
+        max_count = self._execute_query(
+            sa.select([sa.func.max(value_counts.c["count"])]).select_from(value_counts)
+        )[0][0]
+        if max_count is None:
+            return []
+        modes = self._execute_query(
+            sa.select([value_counts.c.value]).where(value_counts.c["count"] == max_count).order_by(value_counts.c.value)
+        )
+        return [row[0] for row in modes]
+
     def get_column_mean(self, column):
-        return self.engine.execute(
+        return self._execute_query(
             sa.select([sa.func.avg(sa.column(column))]).select_from(
                 self._table)
-        ).scalar()
+        )[0][0]
 
     def get_column_unique_count(self, column):
-        return self.engine.execute(
+        return self._execute_query(
             sa.select([sa.func.count(sa.func.distinct(sa.column(column)))]).select_from(
                 self._table)
-        ).scalar()
+        )[0][0]
 
     def get_column_median(self, column):
         nonnull_count = self.get_column_nonnull_count(column)
-        element_values = self.engine.execute(
+        column_values = self._execute_query(
             sa.select([sa.column(column)]).order_by(sa.column(column)).where(
                 sa.column(column) != None
             ).offset(max(nonnull_count // 2 - 1, 0)).limit(2).select_from(self._table)
         )
 
-        column_values = list(element_values.fetchall())
-
         if len(column_values) == 0:
             column_median = None
         elif nonnull_count % 2 == 0:
@@ -493,13 +1363,13 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
                                      "set allow_relative_error to True to allow approximate quantiles.")
         except (AttributeError, TypeError):
             pass
-        quantiles = self.engine.execute(sa.select(selects).select_from(self._table)).fetchone()
+        quantiles = self._execute_query(sa.select(selects).select_from(self._table))[0]
         return list(quantiles)
 
     def get_column_stdev(self, column):
-        res = self.engine.execute(sa.select([
+        res = self._execute_query(sa.select([
                 sa.func.stddev_samp(sa.column(column))
-            ]).select_from(self._table).where(sa.column(column) != None)).fetchone()
+            ]).select_from(self._table).where(sa.column(column) != None))[0]
         return float(res[0])
 
     def get_column_hist(self, column, bins):
@@ -572,9 +1442,47 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         )\
         .select_from(self._table)
 
-        hist = list(self.engine.execute(query).fetchone())
+        hist = list(self._execute_query(query)[0])
         return hist
 
+    def get_column_type_list_index(self, column, type_lists):
+        col_type = self._get_column_type_class(column)
+        for index, type_list in enumerate(type_lists):
+            if issubclass(col_type, self._get_type_list_classes(type_list)):
+                return index
+        return None
+
+    def _get_column_type_class(self, column):
+        try:
+            col_data = [col for col in self.columns if col["name"] == column][0]
+            return type(col_data["type"])
+        except IndexError:
+            raise ValueError("Unrecognized column: %s" % column)
+        except KeyError:
+            raise ValueError("No database type data available for column: %s" % column)
+
+    def _get_type_list_classes(self, type_list):
+        # Our goal is to be as explicit as possible. We will match the dialect
+        # if that is possible. If there is no dialect available, we *will*
+        # match against a top-level SqlAlchemy type.
+        #
+        # This is intended to be a conservative approach.
+        #
+        # In particular, we *exclude* types that would be valid under an ORM
+        # such as "float" for postgresql with this approach
+        types = []
+        type_module = self._get_dialect_type_module()
+        for type_ in type_list:
+            try:
+                type_class = getattr(type_module, type_)
+                types.append(type_class)
+            except AttributeError:
+                logger.debug("Unrecognized type: %s" % type_)
+        if len(types) == 0:
+            logger.warning("No recognized sqlalchemy types in type_list for dialect %s" %
+                           type_module.__name__)
+        return tuple(types)
+
     def get_column_count_in_range(self, column, min_val=None, max_val=None, strict_min=False, strict_max=True):
         if min_val is None and max_val is None:
             raise ValueError('Must specify either min or max value')
@@ -612,7 +1520,146 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
                 ) \
                 .select_from(self._table)
 
-        return self.engine.execute(query).scalar()
+        return self._execute_query(query)[0][0]
+
+    def _get_column_aggregate_selects(self, column_aggregates):
+        """Returns the (column, aggregate) pairs that can be computed in bulk and the matching select expressions"""
+        aggregate_functions = {
+            "nonnull_count": lambda column: sa.func.count(sa.column(column)),
+            "unique_count": lambda column: sa.func.count(sa.func.distinct(sa.column(column))),
+            "min": lambda column: sa.func.min(sa.column(column)),
+            "max": lambda column: sa.func.max(sa.column(column)),
+            "mean": lambda column: sa.func.avg(sa.column(column)),
+            "stdev": lambda column: sa.func.stddev_samp(sa.column(column)),
+        }
+        if self.engine.dialect.name.lower() == "sqlite":
+            # sqlite has no stddev_samp; leave it to get_column_stdev so that its error is reported as usual
+            aggregate_functions.pop("stdev")
+
+        requested = []
+        for column, aggregates in column_aggregates.items():
+            for aggregate in aggregates:
+                if aggregate in aggregate_functions:
+                    requested.append((column, aggregate))
+        return requested, [aggregate_functions[aggregate](column) for column, aggregate in requested]
+
+    def _get_column_aggregates(self, column_aggregates):
+        # All requested aggregates are computed by a single select over the table
+        requested, selects = self._get_column_aggregate_selects(column_aggregates)
+        if len(requested) == 0:
+            return {}
+
+        query = sa.select(selects).select_from(self._table)
+        try:
+            row = self._execute_query(query)[0]
+        except sa.exc.SQLAlchemyError as e:
+            logger.debug("Unable to compute column aggregates in bulk: %s" % str(e))
+            return {}
+
+        return self._parse_column_aggregates(requested, row)
+
+    @staticmethod
+    def _parse_column_aggregates(requested, row):
+        results = {}
+        for (column, aggregate), value in zip(requested, row):
+            if aggregate == "nonnull_count":
+                value = int(value or 0)
+            elif aggregate == "stdev":
+                if value is None:
+                    continue
+                value = float(value)
+            results.setdefault(column, {})[aggregate] = value
+        return results
+
+    def _get_partitions(self, partition_by, column_aggregates):
+        # One GROUP BY query identifies the partitions and computes their row counts and column aggregates
+        partition_columns = [sa.column(column) for column in partition_by]
+        requested, selects = self._get_column_aggregate_selects(column_aggregates)
+
+        def get_partition_rows(selects):
+            return self._execute_query(
+                sa.select(partition_columns + [sa.func.count()] + selects)
+                .select_from(self._table)
+                .group_by(*partition_columns)
+                .order_by(*partition_columns)
+            )
+
+        try:
+            rows = get_partition_rows(selects)
+        except sa.exc.SQLAlchemyError as e:
+            if len(requested) == 0:
+                raise
+            logger.debug("Unable to compute column aggregates of partitions in bulk: %s" % str(e))
+            requested = []
+            rows = get_partition_rows([])
+
+        self._partition_map_counts = {}
+        partitions = OrderedDict()
+        for row in rows:
+            partition_key = tuple(row[:len(partition_by)])
+            partition_dataset = self._get_partition_dataset(partition_by, partition_key)
+            prefetched_column_aggregates = partition_dataset._prefetched_column_aggregates
+            prefetched_column_aggregates[("get_row_count",)] = row[len(partition_by)]
+            aggregate_values = self._parse_column_aggregates(requested, row[len(partition_by) + 1:])
+            for column, aggregates in aggregate_values.items():
+                for aggregate, value in aggregates.items():
+                    prefetched_column_aggregates[("get_column_" + aggregate, column)] = value
+            partitions[partition_key] = partition_dataset
+        return partitions
+
+    def _get_partition_dataset(self, partition_by, partition_key):
+        """Returns a virtual batch of the rows of one partition of this dataset"""
+        conditions = []
+        for column, value in zip(partition_by, partition_key):
+            if value is None:
+                conditions.append(sa.column(column).is_(None))
+            else:
+                if isinstance(value, date):
+                    # Not every dialect can render date literals; databases compare dates to iso strings
+                    value = str(value)
+                conditions.append(sa.column(column) == sa.literal(value))
+        query = sa.select([sa.text("*")]).select_from(self._table).where(sa.and_(*conditions))
+
+        partition_dataset = self.__class__(
+            custom_sql=str(query.compile(dialect=self.engine.dialect, compile_kwargs={"literal_binds": True})),
+            create_temp_table=False,
+            engine=self.engine,
+            query_executor=self._query_executor,
+            instrument_queries=self._instrument_queries,
+            explain_queries=self._explain_queries,
+            **self._get_partition_dataset_kwargs()
+        )
+        partition_dataset._partition_parent = self
+        partition_dataset._partition_by = partition_by
+        partition_dataset._partition_key = partition_key
+        return partition_dataset
+
+    def _get_partition_map_counts(self, partition_by, partition_key, count_columns):
+        """Returns the counts of a column map expectation on one partition, computing them for every partition with a
+        single grouped query the first time they are requested"""
+        partition_columns = [sa.column(column) for column in partition_by]
+        query = sa.select(partition_columns + count_columns).select_from(self._table).group_by(*partition_columns)
+        compiled = query.compile(dialect=self.engine.dialect)
+        cache_key = (str(compiled), repr(sorted(compiled.params.items())))
+        if cache_key not in self._partition_map_counts:
+            count_names = [count_column.name for count_column in count_columns]
+            self._partition_map_counts[cache_key] = dict(
+                (tuple(row[:len(partition_by)]), dict(zip(count_names, row[len(partition_by):])))
+                for row in self._execute_query(query)
+            )
+        return dict(self._partition_map_counts[cache_key].get(partition_key, {}))
+
+    def _build_column_sketch(self, column, sketch):
+        # Stream the column rather than fetching it all at once so that memory use is bounded by the sketch size
+        result = self.engine.execute(
+            sa.select([sa.column(column)]).where(sa.column(column) != None).select_from(self._table)
+        )
+        while True:
+            rows = result.fetchmany(self.sketch_fetch_size)
+            if not rows:
+                break
+            sketch.update(row[0] for row in rows)
+        return sketch
 
     def create_temporary_table(self, table_name, custom_sql, schema_name=None):
         """
@@ -783,39 +1830,11 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         if mostly is not None:
             raise ValueError("SqlAlchemyDataset does not support column map semantics for column types")
 
-        try:
-            col_data = [col for col in self.columns if col["name"] == column][0]
-            col_type = type(col_data["type"])
-        except IndexError:
-            raise ValueError("Unrecognized column: %s" % column)
-        except KeyError:
-            raise ValueError("No database type data available for column: %s" % column)
-
-        # Our goal is to be as explicit as possible. We will match the dialect
-        # if that is possible. If there is no dialect available, we *will*
-        # match against a top-level SqlAlchemy type.
-        #
-        # This is intended to be a conservative approach.
-        #
-        # In particular, we *exclude* types that would be valid under an ORM
-        # such as "float" for postgresql with this approach
-
+        col_type = self._get_column_type_class(column)
         if type_list is None:
             success = True
         else:
-            types = []
-            type_module = self._get_dialect_type_module()
-            for type_ in type_list:
-                try:
-                    type_class = getattr(type_module, type_)
-                    types.append(type_class)
-                except AttributeError:
-                    logger.debug("Unrecognized type: %s" % type_)
-            if len(types) == 0:
-                logger.warning("No recognized sqlalchemy types in type_list for dialect %s" %
-                               type_module.__name__)
-            types = tuple(types)
-            success = issubclass(col_type, types)
+            success = issubclass(col_type, self._get_type_list_classes(type_list))
 
         return {
                 "success": success,
@@ -963,16 +1982,89 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         elif min_value is not None and max_value is None:
             return sa.func.length(sa.column(column)) >= min_value
 
-    @MetaSqlAlchemyDataset.column_map_expectation
+    @DocInherit
+    @DataAsset.expectation(['column', 'mostly'])
     def expect_column_values_to_be_unique(self, column, mostly=None,
                                           result_format=None, include_config=True, catch_exceptions=None, meta=None):
-        # Duplicates are found by filtering a group by query
-        dup_query = sa.select([sa.column(column)]).\
-            select_from(self._table).\
-            group_by(sa.column(column)).\
-            having(sa.func.count(sa.column(column)) > 1)
+        if result_format is None:
+            result_format = self.default_expectation_args["result_format"]
 
-        return sa.column(column).notin_(dup_query)
+        result_format = parse_result_format(result_format)
+
+        if result_format['result_format'] == 'COMPLETE':
+            warnings.warn("Setting result format to COMPLETE for a SqlAlchemyDataset can be dangerous because it will not limit the number of returned results.")
+            unexpected_count_limit = None
+        else:
+            unexpected_count_limit = result_format['partial_unexpected_count']
+
+        element_count, null_count, unexpected_count, maybe_limited_unexpected_list = \
+            self._get_column_duplicate_counts(column, unexpected_count_limit)
+
+        nonnull_count = element_count - null_count
+        success_count = nonnull_count - unexpected_count
+        success, percent_success = self._calc_map_expectation_success(
+            success_count, nonnull_count, mostly)
+
+        return self._format_map_output(
+            result_format,
+            success,
+            element_count,
+            nonnull_count,
+            unexpected_count,
+            maybe_limited_unexpected_list,
+            None,
+        )
+
+    def _get_column_duplicate_counts(self, column, unexpected_count_limit=None):
+        """Count the rows of a column whose non-null value appears more than once in a single pass over the table.
+
+        Each row is annotated with the number of rows sharing its value, either by a window function or, on dialects
+        without good window function support, by a GROUP BY whose rows are weighted by their counts.
+
+        Returns:
+            A tuple of (element_count, null_count, unexpected_count, unexpected_list), where unexpected_list holds \
+            up to unexpected_count_limit duplicated values, ordered by value
+        """
+        use_window = self.engine.dialect.name.lower() in self.window_uniqueness_dialects
+        if use_window:
+            value_counts = sa.select([
+                sa.column(column),
+                sa.func.count().over(partition_by=sa.column(column)).label("ge_value_count")
+            ]).select_from(self._table).alias("ge_value_counts")
+            row_count = sa.literal_column("1")
+        else:
+            value_counts = sa.select([
+                sa.column(column),
+                sa.func.count().label("ge_value_count")
+            ]).select_from(self._table).group_by(sa.column(column)).alias("ge_value_counts")
+            row_count = value_counts.c.ge_value_count
+
+        value = value_counts.c[column]
+        is_duplicate = sa.and_(value.isnot(None), value_counts.c.ge_value_count > 1)
+        count_query = sa.select([
+            sa.func.sum(row_count).label("element_count"),
+            sa.func.sum(sa.case([(value.is_(None), row_count)], else_=0)).label("null_count"),
+            sa.func.sum(sa.case([(is_duplicate, row_count)], else_=0)).label("unexpected_count")
+        ]).select_from(value_counts)
+        unexpected_query = sa.select([value, value_counts.c.ge_value_count]).select_from(value_counts).where(
+            is_duplicate
+        ).order_by(value).limit(unexpected_count_limit)
+
+        count_rows, unexpected_query_results = self._execute_queries([count_query, unexpected_query])
+        count_results = count_rows[0]
+        unexpected_list = []
+        for row in unexpected_query_results:
+            # Rows of the GROUP BY stand for ge_value_count rows of the table
+            unexpected_list += [row[0]] * (1 if use_window else row[1])
+        if unexpected_count_limit is not None:
+            unexpected_list = unexpected_list[:unexpected_count_limit]
+
+        return (
+            int(count_results["element_count"] or 0),
+            int(count_results["null_count"] or 0),
+            int(count_results["unexpected_count"] or 0),
+            unexpected_list
+        )
 
     def _get_dialect_regex_fn(self, positive=True):
         try:
@@ -1082,3 +2174,32 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         return sa.and_(
             *[BinaryExpression(sa.column(column), literal(regex), custom_op(regex_fn)) for regex in regex_list]
         )
+
+    ###
+    ###
+    ###
+    #
+    # Multicolumn Map Expectation Implementations
+    #
+    ###
+    ###
+    ###
+
+    @DocInherit
+    @MetaSqlAlchemyDataset.multicolumn_map_expectation
+    def expect_multicolumn_values_to_be_unique(self,
+                                               column_list,
+                                               ignore_row_if="all_values_are_missing",
+                                               result_format=None, include_config=True, catch_exceptions=None, meta=None
+                                               ):
+        # As in PandasDataset, missing values are considered equal to each other
+        duplicate_conditions = []
+        for idx, column_a in enumerate(column_list):
+            for column_b in column_list[idx + 1:]:
+                duplicate_conditions.append(sa.or_(
+                    sa.column(column_a) == sa.column(column_b),
+                    sa.and_(sa.column(column_a).is_(None), sa.column(column_b).is_(None))
+                ))
+        if len(duplicate_conditions) == 0:
+            return sa.true()
+        return sa.not_(sa.or_(*duplicate_conditions))
@@ -2,6 +2,8 @@
 
 from __future__ import division
 
+from numbers import Integral
+
 from scipy import stats
 import pandas as pd
 import numpy as np
@@ -529,3 +531,86 @@ def create_multiple_expectations(df, columns, expectation_type, *args, **kwargs)
         results.append(expectation(column, *args,  **kwargs))
 
     return results
+
+
+def get_sample_config(sample):
+    """Parses the sample argument of profilers and validation into random_sample keyword arguments.
+
+    Args:
+        sample (int, float or dict): a number of rows, a fraction of rows, or a dict with the keys n or fraction \
+            and optionally seed
+
+    Returns:
+        A dict of random_sample keyword arguments
+    """
+    if isinstance(sample, dict):
+        sample_config = dict(sample)
+        if not set(sample_config.keys()) <= {"n", "fraction", "seed"}:
+            raise ValueError("sample may only contain the keys n, fraction and seed")
+    elif isinstance(sample, bool):
+        raise ValueError("sample must be a row limit, a fraction or a dict")
+    elif isinstance(sample, Integral):
+        sample_config = {"n": sample}
+    elif isinstance(sample, float):
+        sample_config = {"fraction": sample}
+    else:
+        raise ValueError("sample must be a row limit, a fraction or a dict")
+    return sample_config
+
+
+def wilson_interval(successes, n, confidence=0.95):
+    """Computes the Wilson score interval for a binomial proportion.
+
+    Args:
+        successes (int): the number of observed successes
+        n (int): the number of trials
+        confidence (float): the confidence level of the interval
+
+    Returns:
+        A [lower, upper] list bounding the proportion, or None if n is 0
+    """
+    if n == 0:
+        return None
+    z = stats.norm.ppf(1 - (1 - confidence) / 2)
+    p = successes / n
+    denominator = 1 + z ** 2 / n
+    center = (p + z ** 2 / (2 * n)) / denominator
+    half_width = z * np.sqrt(p * (1 - p) / n + z ** 2 / (4 * n ** 2)) / denominator
+    lower = 0. if successes == 0 else max(0., center - half_width)
+    upper = 1. if successes == n else min(1., center + half_width)
+    return [float(lower), float(upper)]
+
+
+def mean_confidence_interval(mean, stdev, n, confidence=0.95):
+    """Computes the Student's t confidence interval for a population mean estimated from a sample.
+
+    Args:
+        mean (float): the sample mean
+        stdev (float): the sample standard deviation
+        n (int): the sample size
+        confidence (float): the confidence level of the interval
+
+    Returns:
+        A [lower, upper] list bounding the mean, or None if n is less than 2
+    """
+    if n < 2 or mean is None or stdev is None:
+        return None
+    half_width = stats.t.ppf(1 - (1 - confidence) / 2, n - 1) * float(stdev) / np.sqrt(n)
+    return [float(mean) - half_width, float(mean) + half_width]
+
+
+def quantile_confidence_rank_bounds(quantile, n, confidence=0.95):
+    """Computes the quantiles of a sample that bound a population quantile with the given confidence, using the
+    normal approximation to the binomial distribution of the number of sample values below the population quantile.
+
+    Args:
+        quantile (float): the population quantile, between 0 and 1
+        n (int): the sample size
+        confidence (float): the confidence level of the bounds
+
+    Returns:
+        A (lower, upper) tuple of sample quantiles
+    """
+    z = stats.norm.ppf(1 - (1 - confidence) / 2)
+    half_width = z * np.sqrt(quantile * (1 - quantile) / n)
+    return max(0., quantile - half_width), min(1., quantile + half_width)
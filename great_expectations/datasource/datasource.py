@@ -166,7 +166,7 @@ class Datasource(object):
         #     }
         # generator_config.update(kwargs)
         kwargs["class_name"] = class_name
-        generator = self._build_generator(**kwargs)
+        generator = self._build_generator(name=name, **kwargs)
         if "generators" not in self._datasource_config:
             self._datasource_config["generators"] = dict()
         self._datasource_config["generators"][name] = kwargs
@@ -203,7 +203,7 @@ class Datasource(object):
             raise ValueError(
                 "Unable to load generator %s -- no configuration found or invalid configuration." % generator_name
             )
-        generator = self._build_generator(**generator_config)
+        generator = self._build_generator(name=generator_name, **generator_config)
         self._generators[generator_name] = generator
         return generator
 
@@ -1,11 +1,20 @@
+import datetime
+import json
 import logging
+import os
 from string import Template
 
 from marshmallow import Schema, fields, post_load, ValidationError
 
 from .batch_kwargs_generator import BatchKwargsGenerator
 from great_expectations.exceptions import BatchKwargsError, GreatExpectationsError
-from great_expectations.datasource.types import SqlAlchemyDatasourceTableBatchKwargs
+from great_expectations.datasource.types import (
+    SqlAlchemyDatasourceQueryBatchKwargs,
+    SqlAlchemyDatasourceTableBatchKwargs,
+)
+from great_expectations.core import convert_to_json_serializable
+from great_expectations.dataset.partial_metrics import PartialMetrics
+from ...data_context.util import instantiate_class_from_config
 
 
 logger = logging.getLogger(__name__)
@@ -24,6 +33,7 @@ except ImportError:
 class AssetConfigurationSchema(Schema):
     table = fields.Str()
     schema = fields.Str()
+    watermark_column = fields.Str()
 
     @post_load(pass_many=False)
     def make_asset_configuration(self, data):
@@ -31,9 +41,10 @@ class AssetConfigurationSchema(Schema):
 
 
 class AssetConfiguration(object):
-    def __init__(self, table, schema=None):
+    def __init__(self, table, schema=None, watermark_column=None):
         self.__table = table
         self.__schema = schema
+        self.__watermark_column = watermark_column
 
     @property
     def table(self):
@@ -43,6 +54,10 @@ class AssetConfiguration(object):
     def schema(self):
         return self.__schema
 
+    @property
+    def watermark_column(self):
+        return self.__watermark_column
+
 
 assetConfigurationSchema = AssetConfigurationSchema()
 
@@ -68,10 +83,26 @@ class TableBatchKwargsGenerator(BatchKwargsGenerator):
     In that case, the asset my_datasource/my_generator/my_asset will refer to a table called my_table in a schema
     defined in batch_kwargs.
 
+    Append-only tables can be validated incrementally. An asset configured with a watermark_column (a column whose
+    values only grow as rows are appended, such as an id or an insertion timestamp), or any table when a
+    watermark_column batch parameter is provided, produces with the incremental batch parameter a query batch of the
+    rows beyond the last watermark recorded for the asset, up to the current maximum of the column::
+
+        batch_kwargs = generator.build_batch_kwargs("events", incremental=True)
+        batch = context.get_batch(batch_kwargs, "events.warning")
+        results = batch.validate()
+        if results.success:
+            generator.update_watermark(batch)
+
+    update_watermark records the new watermark, and the partial metrics (see PartialMetrics) of the table up to it,
+    in the watermark store (by default, json files next to the generator's configuration in the data context). The
+    next incremental batch is given these metrics as prior_metrics, so its table-level and aggregate expectations
+    describe the whole table while only the new rows are read.
+
     """
-    recognized_batch_parameters = {'name', 'limit', 'offset', 'query_parameters'}
+    recognized_batch_parameters = {'name', 'limit', 'offset', 'query_parameters', 'incremental', 'watermark_column'}
 
-    def __init__(self, name="default", datasource=None, assets=None):
+    def __init__(self, name="default", datasource=None, assets=None, watermark_store_backend=None):
         super(TableBatchKwargsGenerator, self).__init__(name=name, datasource=datasource)
         if not assets:
             assets = {}
@@ -84,6 +115,32 @@ class TableBatchKwargsGenerator(BatchKwargsGenerator):
             raise GreatExpectationsError("Unable to load asset configuration in TableBatchKwargsGenerator '%s': "
                                          "validation error: %s." % (name, str(err)))
 
+        root_directory = None
+        if watermark_store_backend is None:
+            # As for the queries of a QueryBatchKwargsGenerator, we use a Tuple store if there is a configured
+            # DataContext with a root_directory, and an InMemoryStore otherwise
+            if datasource and datasource.data_context and datasource.data_context.root_directory:
+                watermark_store_backend = {
+                    "class_name": "TupleFilesystemStoreBackend",
+                    "base_directory": os.path.join(datasource.data_context.root_directory, "datasources",
+                                                   datasource.name, "generators", name, "watermarks"),
+                    "filepath_suffix": ".json"
+                }
+                root_directory = datasource.data_context.root_directory
+            else:
+                watermark_store_backend = {
+                    "class_name": "InMemoryStoreBackend"
+                }
+        self._watermark_store_backend = instantiate_class_from_config(
+            config=watermark_store_backend,
+            runtime_environment={
+                "root_directory": root_directory
+            },
+            config_defaults={
+                "module_name": "great_expectations.data_context.store"
+            }
+        )
+
         if datasource is not None:
             self.engine = datasource.engine
             try:
@@ -193,7 +250,7 @@ class TableBatchKwargsGenerator(BatchKwargsGenerator):
                 }
 
     def _build_batch_kwargs(self, batch_parameters):
-        return next(
+        batch_kwargs = next(
             self._get_iterator(
                 batch_parameters.get("name"),
                 query_parameters=batch_parameters.get("query_parameters", {}),
@@ -201,6 +258,133 @@ class TableBatchKwargsGenerator(BatchKwargsGenerator):
                 offset=batch_parameters.get("offset")
             )
         )
+        if batch_parameters.get("incremental"):
+            batch_kwargs = self._build_incremental_batch_kwargs(
+                batch_parameters.get("name"),
+                batch_kwargs,
+                watermark_column=batch_parameters.get("watermark_column")
+            )
+        return batch_kwargs
+
+    def _build_incremental_batch_kwargs(self, generator_asset, table_batch_kwargs, watermark_column=None):
+        """Build query batch_kwargs for the rows of the table beyond the last watermark of the generator asset."""
+        if watermark_column is None and generator_asset in self._assets:
+            watermark_column = self._assets[generator_asset].watermark_column
+        if watermark_column is None:
+            raise BatchKwargsError("Unable to generate incremental batch kwargs for asset '" + generator_asset + "': "
+                                   "no watermark_column is configured",
+                                   {"generator_asset": generator_asset})
+        if "limit" in table_batch_kwargs or "offset" in table_batch_kwargs:
+            logger.warning("Limit and offset parameters are ignored when generating incremental batch kwargs.")
+
+        watermark_state = self._get_watermark_state(generator_asset)
+        low = None
+        if watermark_state is not None:
+            if watermark_state["column"] != watermark_column:
+                raise BatchKwargsError("Unable to generate incremental batch kwargs for asset '" + generator_asset +
+                                       "': its watermark was recorded for column '" + watermark_state["column"] + "'",
+                                       {"generator_asset": generator_asset,
+                                        "watermark_column": watermark_column})
+            low = watermark_state["watermark"]
+
+        table = sqlalchemy.schema.Table(table_batch_kwargs["table"], sqlalchemy.MetaData(),
+                                        schema=table_batch_kwargs.get("schema"))
+        column = sqlalchemy.column(watermark_column)
+        high = self.engine.execute(
+            sqlalchemy.select([sqlalchemy.func.max(column)]).select_from(table)
+        ).scalar()
+        high = self._to_watermark_value(high)
+        if high is None:
+            high = low
+
+        if high is None:
+            condition = sqlalchemy.false()
+        elif low is None:
+            condition = column <= sqlalchemy.literal(high)
+        else:
+            condition = sqlalchemy.and_(column > sqlalchemy.literal(low), column <= sqlalchemy.literal(high))
+        query = sqlalchemy.select([sqlalchemy.text("*")]).select_from(table).where(condition)
+
+        return SqlAlchemyDatasourceQueryBatchKwargs(
+            query=str(query.compile(self.engine, compile_kwargs={"literal_binds": True})),
+            watermark={
+                "generator": self.name,
+                "generator_asset": generator_asset,
+                "column": watermark_column,
+                "low": low,
+                "high": high
+            }
+        )
+
+    @staticmethod
+    def _to_watermark_value(value):
+        # Watermarks are stored as json; dates are stored in the format in which databases compare them to strings
+        if isinstance(value, datetime.date):
+            return str(value)
+        return convert_to_json_serializable(value)
+
+    def _get_watermark_state(self, generator_asset):
+        key = (generator_asset,)
+        if not self._watermark_store_backend.has_key(key):
+            return None
+        return json.loads(self._watermark_store_backend.get(key))
+
+    def get_watermark(self, generator_asset):
+        """Get the last watermark recorded for the generator asset, or None if it has not been validated
+        incrementally yet."""
+        watermark_state = self._get_watermark_state(generator_asset)
+        if watermark_state is None:
+            return None
+        return watermark_state["watermark"]
+
+    def get_prior_metrics(self, watermark):
+        """Get the PartialMetrics of the rows preceding an incremental batch.
+
+        Args:
+            watermark (dict): the watermark element of batch_kwargs built in incremental mode
+
+        Returns:
+            PartialMetrics, or None if the batch starts at the beginning of the table
+        """
+        watermark_state = self._get_watermark_state(watermark["generator_asset"])
+        recorded_watermark = watermark_state["watermark"] if watermark_state is not None else None
+        if recorded_watermark != watermark["low"]:
+            raise BatchKwargsError("The watermark of asset '" + watermark["generator_asset"] + "' has changed since "
+                                   "the incremental batch kwargs were generated",
+                                   {"watermark": watermark,
+                                    "recorded_watermark": recorded_watermark})
+        if watermark_state is None:
+            return None
+        return PartialMetrics.from_json_dict(watermark_state["metrics"])
+
+    def update_watermark(self, data_asset):
+        """Record the high watermark of a validated incremental batch, and the partial metrics of the table up to it.
+
+        Args:
+            data_asset (Dataset): a batch loaded from batch_kwargs built by this generator in incremental mode
+
+        Returns:
+            the new watermark
+        """
+        watermark = data_asset.batch_kwargs.get("watermark")
+        if watermark is None or watermark.get("generator") != self.name:
+            raise BatchKwargsError("Unable to update the watermark: the batch was not built incrementally by generator "
+                                   "'" + self.name + "'",
+                                   {"batch_kwargs": data_asset.batch_kwargs})
+        prior_metrics = self.get_prior_metrics(watermark)
+        if prior_metrics is not None and data_asset.prior_metrics is None:
+            raise BatchKwargsError("Unable to update the watermark: the batch was loaded without its prior metrics",
+                                   {"batch_kwargs": data_asset.batch_kwargs})
+
+        self._watermark_store_backend.set(
+            (watermark["generator_asset"],),
+            json.dumps({
+                "column": watermark["column"],
+                "watermark": watermark["high"],
+                "metrics": data_asset.get_partial_metrics().to_json_dict()
+            })
+        )
+        return watermark["high"]
 
     def get_available_partition_ids(self, generator_asset):
         raise BatchKwargsError("TableBatchKwargsGenerator cannot identify partitions, however any existing table may"
@@ -1,4 +1,5 @@
 import logging
+import os
 import datetime
 from string import Template
 
@@ -8,7 +9,12 @@ from great_expectations.datasource.types import (
     SqlAlchemyDatasourceTableBatchKwargs,
     BatchMarkers
 )
-from great_expectations.dataset.sqlalchemy_dataset import SqlAlchemyBatchReference
+from great_expectations.dataset.sqlalchemy_dataset import (
+    SqlAlchemyBatchReference,
+    SqlAlchemyMetricCache,
+    SqlAlchemyQueryExecutor,
+    SqlAlchemyReflectionCache,
+)
 from great_expectations.exceptions import DatasourceInitializationError
 from great_expectations.types import ClassConfig
 from great_expectations.core.batch import Batch
@@ -32,10 +38,34 @@ class SqlAlchemyDatasource(Datasource):
         to that table
       - if the batch_kwargs include a query key, the datasource will create a temporary table using that
         that query. The query can be parameterized according to the standard python Template engine, which
-        uses $parameter, with additional kwargs passed to the get_batch method.
+        uses $parameter, with additional kwargs passed to the get_batch method. If the batch_kwargs also include
+        create_temp_table: False, the query is validated as a subquery instead of being materialized.
+
+    The connection pool of the datasource's engine can be configured with the pool_size, max_overflow, pool_timeout,
+    pool_recycle and pool_pre_ping arguments of sqlalchemy.create_engine. If reflection_cache_ttl is set, the columns
+    of each table are reflected at most once per reflection_cache_ttl seconds and shared by all of its batches. If
+    max_concurrent_queries is set, the expectations of different columns are validated concurrently, each column on
+    its own connection, at most max_concurrent_queries at a time across all batches of the datasource; pool_size
+    should then be at least max_concurrent_queries, and close stops the threads that run them. If instrument_queries is
+    True, the results of expectations record the queries they ran and how long each took (see SqlAlchemyDataset), and
+    explain_queries also records their plans.
+
+    If metric_cache is set to a dictionary of SqlAlchemyMetricCache arguments (cache_path, relative to the data
+    context root directory, ttl and max_entries), metric results are persisted and reused by later runs on unchanged
+    data. The version of the data is given by the metric_cache_version batch_kwarg (for example a partition
+    identifier), or else by the result of the metric_cache_version_query batch_kwarg (for example
+    "SELECT max(updated_at) FROM my_table"); batches with neither are not cached, since no generic marker, such as the
+    row count, reliably changes when a table is updated in place.
+
+    Batches built by a TableBatchKwargsGenerator in incremental mode hold only the rows beyond the generator's last
+    watermark; the datasource gives their datasets the stored partial metrics of the earlier rows as prior_metrics, so
+    that table-level and aggregate expectations describe the whole table.
     """
     recognized_batch_parameters = {'query_parameters', 'limit'}
 
+    # Arguments of sqlalchemy.create_engine that configure the connection pool
+    pool_kwarg_names = {"pool_size", "max_overflow", "pool_timeout", "pool_recycle", "pool_pre_ping"}
+
     @classmethod
     def build_configuration(cls, data_asset_type=None, generators=None, **kwargs):
         """
@@ -89,36 +119,73 @@ class SqlAlchemyDatasource(Datasource):
         else:
             credentials = {}
 
+        reflection_cache_ttl = kwargs.pop("reflection_cache_ttl", None)
+        if reflection_cache_ttl is not None:
+            self._reflection_cache = SqlAlchemyReflectionCache(ttl=reflection_cache_ttl)
+        else:
+            self._reflection_cache = None
+
+        max_concurrent_queries = kwargs.pop("max_concurrent_queries", None)
+        if max_concurrent_queries is not None:
+            self._query_executor = SqlAlchemyQueryExecutor(max_concurrent_queries=max_concurrent_queries)
+        else:
+            self._query_executor = None
+
+        self._instrument_queries = kwargs.pop("instrument_queries", False)
+        self._explain_queries = kwargs.pop("explain_queries", False)
+
+        metric_cache_config = kwargs.pop("metric_cache", None)
+        if metric_cache_config is not None:
+            metric_cache_config = dict(metric_cache_config)
+            cache_path = metric_cache_config.pop("cache_path")
+            if not os.path.isabs(cache_path) and data_context is not None and data_context.root_directory:
+                cache_path = os.path.join(data_context.root_directory, cache_path)
+            self._metric_cache = SqlAlchemyMetricCache(cache_path, **metric_cache_config)
+        else:
+            self._metric_cache = None
+
+        pool_kwargs = dict((key, kwargs.pop(key)) for key in list(kwargs.keys()) if key in self.pool_kwarg_names)
+
         try:
             # if an engine was provided, use that
             if "engine" in kwargs:
                 self.engine = kwargs.pop("engine")
+                if len(pool_kwargs) > 0:
+                    logger.warning("Connection pool options are ignored when an engine is provided.")
 
             # if a connection string or url was provided, use that
             elif "connection_string" in kwargs:
                 connection_string = kwargs.pop("connection_string")
+                kwargs.update(pool_kwargs)
                 self.engine = create_engine(connection_string, **kwargs)
-                self.engine.connect()
+                self.engine.connect().close()
             elif "url" in credentials:
                 url = credentials.pop("url")
                 # TODO perhaps we could carefully regex out the driver from the
                 #  url. It would need to be cautious to avoid leaking secrets.
                 self.drivername = "other"
+                kwargs.update(pool_kwargs)
                 self.engine = create_engine(url, **kwargs)
-                self.engine.connect()
+                self.engine.connect().close()
 
             # Otherwise, connect using remaining kwargs
             else:
                 options, drivername = self._get_sqlalchemy_connection_options(**kwargs)
                 self.drivername = drivername
-                self.engine = create_engine(options)
-                self.engine.connect()
+                self.engine = create_engine(options, **pool_kwargs)
+                self.engine.connect().close()
 
         except (sqlalchemy.exc.OperationalError, sqlalchemy.exc.DatabaseError) as sqlalchemy_error:
             raise DatasourceInitializationError(self._name, str(sqlalchemy_error))
 
         self._build_generators()
 
+    def close(self):
+        """Stop the threads of the datasource's query executor, if it has one. The datasource can still be used
+        afterwards; the threads are started again when needed."""
+        if self._query_executor is not None:
+            self._query_executor.close()
+
     def _get_sqlalchemy_connection_options(self, **kwargs):
         drivername = None
         if "credentials" in self._datasource_config:
@@ -142,6 +209,30 @@ class SqlAlchemyDatasource(Datasource):
             options = sqlalchemy.engine.url.URL(drivername, **credentials)
         return options, drivername
 
+    def _get_metric_cache_kwargs(self, batch_kwargs):
+        if self._metric_cache is None:
+            return {}
+        return {
+            "metric_cache": self._metric_cache,
+            "metric_cache_version": batch_kwargs.get("metric_cache_version"),
+            "metric_cache_version_query": batch_kwargs.get("metric_cache_version_query"),
+        }
+
+    def _get_prior_metrics_kwargs(self, batch_kwargs):
+        watermark = batch_kwargs.get("watermark")
+        if watermark is None:
+            return {}
+        generator = self.get_generator(watermark["generator"])
+        prior_metrics = generator.get_prior_metrics(watermark)
+        if prior_metrics is None:
+            return {}
+        return {"prior_metrics": prior_metrics}
+
+    def _get_batch_reference_kwargs(self, batch_kwargs):
+        batch_reference_kwargs = self._get_metric_cache_kwargs(batch_kwargs)
+        batch_reference_kwargs.update(self._get_prior_metrics_kwargs(batch_kwargs))
+        return batch_reference_kwargs
+
     def get_batch(self, batch_kwargs, batch_parameters=None):
         # We need to build a batch_id to be used in the dataframe
         batch_markers = BatchMarkers({
@@ -165,7 +256,13 @@ class SqlAlchemyDatasource(Datasource):
             else:
                 query = batch_kwargs["query"]
             batch_reference = SqlAlchemyBatchReference(engine=self.engine, query=query, table_name=query_support_table_name,
-                                                       schema=batch_kwargs.get("schema"))
+                                                       schema=batch_kwargs.get("schema"),
+                                                       create_temp_table=batch_kwargs.get("create_temp_table", True),
+                                                       reflection_cache=self._reflection_cache,
+                                                       query_executor=self._query_executor,
+                                                       instrument_queries=self._instrument_queries,
+                                                       explain_queries=self._explain_queries,
+                                                       **self._get_batch_reference_kwargs(batch_kwargs))
         elif "table" in batch_kwargs:
             limit = batch_kwargs.get('limit')
             offset = batch_kwargs.get('offset')
@@ -178,10 +275,21 @@ class SqlAlchemyDatasource(Datasource):
                     .limit(limit)
                 query = str(raw_query.compile(self.engine, compile_kwargs={"literal_binds": True}))
                 batch_reference = SqlAlchemyBatchReference(engine=self.engine, query=query, table_name=query_support_table_name,
-                                                           schema=batch_kwargs.get("schema"))
+                                                           schema=batch_kwargs.get("schema"),
+                                                           create_temp_table=batch_kwargs.get("create_temp_table", True),
+                                                           reflection_cache=self._reflection_cache,
+                                                           query_executor=self._query_executor,
+                                                           instrument_queries=self._instrument_queries,
+                                                           explain_queries=self._explain_queries,
+                                                           **self._get_batch_reference_kwargs(batch_kwargs))
             else:
                 batch_reference = SqlAlchemyBatchReference(engine=self.engine, table_name=batch_kwargs["table"],
-                                                           schema=batch_kwargs.get("schema"))
+                                                           schema=batch_kwargs.get("schema"),
+                                                           reflection_cache=self._reflection_cache,
+                                                           query_executor=self._query_executor,
+                                                           instrument_queries=self._instrument_queries,
+                                                           explain_queries=self._explain_queries,
+                                                           **self._get_batch_reference_kwargs(batch_kwargs))
         else:
             raise ValueError("Invalid batch_kwargs: exactly one of 'table' or 'query' must be specified")
 
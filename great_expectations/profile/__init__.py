@@ -1,2 +1,3 @@
 from .columns_exist import ColumnsExistProfiler
 from .basic_dataset_profiler import BasicDatasetProfiler
+from .multi_batch_dataset_profiler import MultiBatchDatasetProfiler
@@ -3,6 +3,13 @@ import logging
 
 from ..data_asset import DataAsset
 from ..dataset import Dataset
+from ..dataset.util import (
+    get_sample_config,
+    mean_confidence_interval,
+    quantile_confidence_rank_bounds,
+    wilson_interval,
+)
+from great_expectations.core import convert_to_json_serializable
 from great_expectations.exceptions import GreatExpectationsError
 
 logger = logging.getLogger(__name__)
@@ -55,15 +62,42 @@ class DatasetProfiler(DataAssetProfiler):
         return expectation_suite
 
     @classmethod
-    def profile(cls, data_asset, run_id=None):
+    def profile(cls, data_asset, run_id=None, sample=None, max_workers=None):
+        """Profile a dataset, returning the generated expectation suite and its validation results.
+
+        Args:
+            data_asset: the dataset to profile
+            run_id: the run_id of the validation results
+            sample: optional - profile a random sample of the dataset instead of all of its rows; either an int \
+                row limit, a float fraction of rows, or a dict with "n" or "fraction" and an optional "seed". The \
+                sample size and confidence intervals for the observed statistics are recorded in the suite meta.
+            max_workers: optional - validate the expectations of up to this many columns concurrently, each on \
+                its own copy of the dataset, which reuses the aggregates already computed while profiling; ignored \
+                when the dataset cannot be used from several threads
+
+        Returns:
+            A tuple of (expectation_suite, validation_results)
+        """
         if not cls.validate(data_asset):
             raise GreatExpectationsError("Invalid data_asset for profiler; aborting")
 
+        sample_config = None
+        if sample is not None:
+            sample_config = get_sample_config(sample)
+            data_asset = data_asset.random_sample(**sample_config)
+
         expectation_suite = cls._profile(data_asset)
 
         batch_kwargs = data_asset.batch_kwargs
         expectation_suite = cls.add_meta(expectation_suite, batch_kwargs)
-        validation_results = data_asset.validate(expectation_suite, run_id=run_id, result_format="SUMMARY")
+        if max_workers is not None and max_workers > 1:
+            validation_results = cls._validate_columns_concurrently(data_asset, expectation_suite, run_id, max_workers)
+        else:
+            validation_results = data_asset.validate(expectation_suite, run_id=run_id, result_format="SUMMARY")
+        if sample_config is not None:
+            expectation_suite.meta[str(cls.__name__)]["sample"] = cls._get_sample_meta(
+                data_asset, sample_config, validation_results
+            )
         expectation_suite.add_citation(
             comment=str(cls.__name__) + " added a citation based on the current batch.",
             batch_kwargs=data_asset.batch_kwargs,
@@ -72,6 +106,77 @@ class DatasetProfiler(DataAssetProfiler):
         )
         return expectation_suite, validation_results
 
+    @classmethod
+    def _validate_columns_concurrently(cls, dataset, expectation_suite, run_id, max_workers):
+        """Validate the expectation suite with the expectations of each column evaluated on a pool of threads (see
+        Dataset._validate_columns_concurrently), or sequentially if the dataset cannot be validated concurrently."""
+        validation_results = dataset._validate_columns_concurrently(
+            expectation_suite, max_workers, run_id=run_id, result_format="SUMMARY"
+        )
+        if validation_results is None:
+            logger.debug("%s cannot be validated concurrently; validating sequentially" % type(dataset).__name__)
+            validation_results = dataset.validate(expectation_suite, run_id=run_id, result_format="SUMMARY")
+        return validation_results
+
+    @classmethod
+    def _get_sample_meta(cls, dataset, sample_config, validation_results, confidence=0.95):
+        confidence_intervals = {}
+        for evr in validation_results.results:
+            column = evr.expectation_config.kwargs.get("column")
+            if column is None or (evr.exception_info and evr.exception_info.get("raised_exception")):
+                continue
+            try:
+                intervals = cls._get_confidence_intervals(dataset, evr, confidence)
+            except Exception as e:
+                logger.debug("Unable to compute confidence intervals for %s on column %s: %s" % (
+                    evr.expectation_config.expectation_type, column, str(e)))
+                continue
+            if intervals:
+                confidence_intervals.setdefault(column, {}).update(intervals)
+
+        sample_meta = dict(sample_config)
+        sample_meta.update({
+            "sample_size": dataset.get_row_count(),
+            "confidence_level": confidence,
+            "confidence_intervals": confidence_intervals
+        })
+        return convert_to_json_serializable(sample_meta)
+
+    @classmethod
+    def _get_confidence_intervals(cls, dataset, evr, confidence):
+        """Returns a dict mapping metric names (e.g. "expect_column_mean_to_be_between.result.observed_value") to
+        confidence intervals for the population value of that metric, estimated from the sampled dataset."""
+        expectation_type = evr.expectation_config.expectation_type
+        column = evr.expectation_config.kwargs["column"]
+        result = evr.result
+        intervals = {}
+
+        if result.get("element_count") and result.get("unexpected_count") is not None:
+            interval = wilson_interval(result["unexpected_count"], result["element_count"], confidence)
+            intervals[expectation_type + ".result.unexpected_percent"] = [bound * 100 for bound in interval]
+
+        elif expectation_type == "expect_column_mean_to_be_between":
+            interval = mean_confidence_interval(result["observed_value"], dataset.get_column_stdev(column),
+                                                dataset.get_column_nonnull_count(column), confidence)
+            if interval is not None:
+                intervals[expectation_type + ".result.observed_value"] = interval
+
+        elif expectation_type == "expect_column_median_to_be_between":
+            bounds = quantile_confidence_rank_bounds(0.5, dataset.get_column_nonnull_count(column), confidence)
+            intervals[expectation_type + ".result.observed_value"] = dataset.get_column_quantiles(column, bounds)
+
+        elif expectation_type == "expect_column_quantile_values_to_be_between":
+            nonnull_count = dataset.get_column_nonnull_count(column)
+            bounds = []
+            for quantile in result["observed_value"]["quantiles"]:
+                bounds.extend(quantile_confidence_rank_bounds(quantile, nonnull_count, confidence))
+            values = dataset.get_column_quantiles(column, tuple(bounds))
+            intervals[expectation_type + ".result.observed_value.values"] = [
+                list(values[i:i + 2]) for i in range(0, len(values), 2)
+            ]
+
+        return intervals
+
     @classmethod
     def _profile(cls, dataset):
         raise NotImplementedError
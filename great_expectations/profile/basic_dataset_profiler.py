@@ -1,4 +1,5 @@
 import logging
+from collections import OrderedDict
 
 # Gross legacy python 2 hacks
 try:
@@ -29,33 +30,45 @@ class BasicDatasetProfilerBase(DatasetProfiler):
 
     @classmethod
     def _get_column_type(cls, df, column):
+        """Infer the type of the column and expect the column values to be in the type list of that type."""
+        type_ = cls._infer_column_type(df, column)
+        df.set_config_value('interactive_evaluation', False)
+        cls._expect_column_type(df, column, type_)
+        return type_
 
-        # list of types is used to support pandas and sqlalchemy
-        df.set_config_value("interactive_evaluation", True)
-        try:
-            if df.expect_column_values_to_be_in_type_list(column, type_list=sorted(list(cls.INT_TYPE_NAMES))).success:
-                type_ = "int"
-
-            elif df.expect_column_values_to_be_in_type_list(column, type_list=sorted(list(cls.FLOAT_TYPE_NAMES))).success:
-                type_ = "float"
-
-            elif df.expect_column_values_to_be_in_type_list(column, type_list=sorted(list(cls.STRING_TYPE_NAMES))).success:
-                type_ = "string"
-
-            elif df.expect_column_values_to_be_in_type_list(column, type_list=sorted(list(cls.BOOLEAN_TYPE_NAMES))).success:
-                type_ = "bool"
-
-            elif df.expect_column_values_to_be_in_type_list(column, type_list=sorted(list(cls.DATETIME_TYPE_NAMES))).success:
-                type_ = "datetime"
+    @classmethod
+    def _get_type_names(cls):
+        return OrderedDict([
+            ("int", cls.INT_TYPE_NAMES),
+            ("float", cls.FLOAT_TYPE_NAMES),
+            ("string", cls.STRING_TYPE_NAMES),
+            ("bool", cls.BOOLEAN_TYPE_NAMES),
+            ("datetime", cls.DATETIME_TYPE_NAMES),
+        ])
 
-            else:
-                df.expect_column_values_to_be_in_type_list(column, type_list=None)
-                type_ = "unknown"
+    @classmethod
+    def _infer_column_type(cls, df, column):
+        """Returns the first of "int", "float", "string", "bool" and "datetime" whose type list the column's values
+        are in, or "unknown". The type is read from the dtype, schema or reflected columns of the dataset (see
+        Dataset.get_column_type_list_index), without evaluating an expectation for each type list."""
+        type_names = cls._get_type_names()
+        try:
+            index = df.get_column_type_list_index(
+                column, [sorted(list(names)) for names in type_names.values()]
+            )
         except NotImplementedError:
-            type_ = "unknown"
+            return "unknown"
+        if index is None:
+            return "unknown"
+        return list(type_names.keys())[index]
 
-        df.set_config_value('interactive_evaluation', False)
-        return type_
+    @classmethod
+    def _expect_column_type(cls, df, column, type_):
+        """Add the expectation that the column values are in the type list of type_, which is evaluated with the rest
+        of the suite."""
+        type_names = cls._get_type_names().get(type_)
+        type_list = sorted(list(type_names)) if type_names is not None else None
+        df.expect_column_values_to_be_in_type_list(column, type_list=type_list)
 
     @classmethod
     def _get_column_cardinality(cls, df, column):
@@ -104,6 +117,25 @@ class BasicDatasetProfilerBase(DatasetProfiler):
 
         return cardinality
 
+    @classmethod
+    def _prefetch_column_aggregates(cls, df, column_types):
+        """Ask the dataset to compute the aggregates used for cardinality and column statistics for all columns in
+        one bulk call. The expectations evaluated afterwards read the prefetched values, so their results are
+        unchanged; if the bulk call fails, they simply compute the values themselves."""
+        column_aggregates = {}
+        for column, type_ in column_types.items():
+            aggregates = ["nonnull_count", "unique_count"]
+            if type_ in ["int", "float"]:
+                aggregates += ["min", "max", "mean", "stdev"]
+            elif type_ == "datetime":
+                aggregates += ["min", "max"]
+            column_aggregates[column] = aggregates
+
+        try:
+            df.prefetch_column_aggregates(column_aggregates)
+        except Exception as e:
+            logger.debug("Unable to prefetch column aggregates - continuing: %s" % str(e))
+
 
 class BasicDatasetProfiler(BasicDatasetProfilerBase):
     """BasicDatasetProfiler is inspired by the beloved pandas_profiling project.
@@ -131,13 +163,21 @@ class BasicDatasetProfiler(BasicDatasetProfilerBase):
         for column in columns:
             meta_columns[column] = {"description": ""}
 
+        # Infer all column types up front so that the statistics for every column can be computed in a single
+        # bulk call
+        column_types = OrderedDict()
+        for column in columns:
+            column_types[column] = cls._infer_column_type(df, column)
+        cls._prefetch_column_aggregates(df, column_types)
+
         number_of_columns = len(columns)
         for i, column in enumerate(columns):
             logger.info("            Preparing column {} of {}: {}".format(i+1, number_of_columns, column))
 
             # df.expect_column_to_exist(column)
 
-            type_ = cls._get_column_type(df, column)
+            type_ = column_types[column]
+            cls._expect_column_type(df, column, type_)
             cardinality = cls._get_column_cardinality(df, column)
             df.expect_column_values_to_not_be_null(column, mostly=0.5) # The renderer will show a warning for columns that do not meet this expectation
             df.expect_column_values_to_be_in_set(column, [], result_format="SUMMARY")
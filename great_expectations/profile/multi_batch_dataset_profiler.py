@@ -0,0 +1,297 @@
+import logging
+import math
+from collections import OrderedDict
+
+from great_expectations.core import ExpectationConfiguration, ExpectationSuite
+from great_expectations.core.metric import ValidationMetricIdentifier
+from great_expectations.dataset.sketch import merge_sketches, sketch_from_json_dict
+
+from .basic_dataset_profiler import BasicDatasetProfilerBase
+from .metrics_utils import kwargs_to_tuple, tuple_to_hash
+
+logger = logging.getLogger(__name__)
+
+
+class MultiBatchDatasetProfiler(BasicDatasetProfilerBase):
+    """MultiBatchDatasetProfiler profiles a growing data asset, such as a daily-partitioned table, one batch at a time.
+
+    For each batch, the profiler records mergeable column statistics (null counts, min, max and mean, and cardinality,
+    quantile and frequent value sketches) as validation metrics in a MetricStore, using the StoreMetricsAction and
+    the id of the batch's partition as the run_id. Batches whose statistics are already in the store are not loaded
+    again, so only new partitions are profiled.
+
+    The expectation suite for the whole history is built from the stored statistics: ranges for the row count and
+    the column min, max, mean, quantiles and number of unique values that cover every profiled batch, and value sets
+    for columns whose merged frequent value sketch has seen every distinct value.
+    """
+
+    QUANTILES = [0.05, 0.25, 0.5, 0.75, 0.95]
+    MAX_VALUE_SET_SIZE = 20
+
+    # The validation metrics stored for each batch, by the expectation that produces them
+    TABLE_METRICS = ["expect_table_row_count_to_be_between.result.observed_value"]
+    COLUMN_METRICS = OrderedDict([
+        ("expect_column_values_to_not_be_null", [
+            "expect_column_values_to_not_be_null.result.element_count",
+            "expect_column_values_to_not_be_null.result.unexpected_count",
+        ]),
+        ("expect_column_min_to_be_between", ["expect_column_min_to_be_between.result.observed_value"]),
+        ("expect_column_max_to_be_between", ["expect_column_max_to_be_between.result.observed_value"]),
+        ("expect_column_mean_to_be_between", ["expect_column_mean_to_be_between.result.observed_value"]),
+        ("expect_column_unique_value_count_to_be_between", [
+            "expect_column_unique_value_count_to_be_between.result.details.sketch"
+        ]),
+        ("expect_column_quantile_values_to_be_between", [
+            "expect_column_quantile_values_to_be_between.result.details.sketch"
+        ]),
+        ("expect_column_most_common_value_to_be_in_set", [
+            "expect_column_most_common_value_to_be_in_set.result.details.sketch"
+        ]),
+    ])
+
+    @classmethod
+    def _profile(cls, dataset):
+        df = dataset
+
+        df.set_default_expectation_argument("catch_exceptions", True)
+
+        df.expect_table_row_count_to_be_between(min_value=0, max_value=None)
+        df.set_config_value('interactive_evaluation', False)
+
+        for column in df.get_table_columns():
+            type_ = cls._get_column_type(df, column)
+            df.expect_column_values_to_not_be_null(column, result_format="SUMMARY")
+            df.expect_column_unique_value_count_to_be_between(column, None, None, approximate=True)
+            df.expect_column_most_common_value_to_be_in_set(column, [], approximate=True)
+
+            if type_ in ["int", "float"]:
+                df.expect_column_min_to_be_between(column, min_value=None, max_value=None)
+                df.expect_column_max_to_be_between(column, min_value=None, max_value=None)
+                df.expect_column_mean_to_be_between(column, min_value=None, max_value=None)
+                df.expect_column_quantile_values_to_be_between(
+                    column,
+                    quantile_ranges={
+                        "quantiles": cls.QUANTILES,
+                        "value_ranges": [[None, None] for _ in cls.QUANTILES]
+                    },
+                    approximate=True
+                )
+
+        df.set_config_value("interactive_evaluation", True)
+        return df.get_expectation_suite(suppress_warnings=True, discard_failed_expectations=False)
+
+    @classmethod
+    def get_requested_metrics(cls, expectation_suite):
+        """Get the requested_metrics configuration that stores the statistics of a batch profiled with this profiler.
+
+        The configuration can be used with a StoreMetricsAction in a validation operator that validates the suite
+        returned by `profile`.
+        """
+        column_metrics = OrderedDict()
+        for expectation in expectation_suite.expectations:
+            column = expectation.kwargs.get("column")
+            metric_names = cls.COLUMN_METRICS.get(expectation.expectation_type)
+            if column is not None and metric_names is not None:
+                column_metrics.setdefault(column, []).extend(metric_names)
+
+        metrics = list(cls.TABLE_METRICS)
+        if len(column_metrics) > 0:
+            metrics.append({"column": column_metrics})
+        return {expectation_suite.expectation_suite_name: metrics}
+
+    @classmethod
+    def get_partition_id(cls, batch_kwargs):
+        """Get a stable id for the partition of the data asset that batch_kwargs load, ignoring the ge_batch_id that
+        datasources add to every batch they build."""
+        partition_kwargs = dict((key, value) for key, value in batch_kwargs.items() if key != "ge_batch_id")
+        if len(partition_kwargs) == 0:
+            raise ValueError("Unable to identify the partition of a batch without batch_kwargs")
+        return tuple_to_hash(kwargs_to_tuple(partition_kwargs))
+
+    @classmethod
+    def get_profiled_partition_ids(cls, metric_store, expectation_suite_name):
+        """Get the ids of the partitions whose statistics are stored in the metric store."""
+        return set(key.run_id for key in cls._get_statistics_keys(metric_store, expectation_suite_name))
+
+    @classmethod
+    def profile_batches(cls, data_context, batch_kwargs_list, expectation_suite_name,
+                        target_store_name="metrics_store"):
+        """Profile the batches that have not been profiled yet and build an expectation suite for the whole history.
+
+        Args:
+            data_context: the data context used to load batches and store statistics
+            batch_kwargs_list: batch_kwargs for every partition of the data asset, for example from a generator
+            expectation_suite_name: the name of the expectation suite to build; statistics are stored under this name
+            target_store_name: the name of the MetricStore in which to keep the statistics of every batch
+
+        Returns:
+            A tuple of (expectation_suite, validation_results), with the validation results of the newly profiled \
+            batches.
+        """
+        # Imported here to avoid a circular import through the data context
+        from great_expectations.data_context.types.resource_identifiers import ValidationResultIdentifier
+        from great_expectations.validation_operators.actions import StoreMetricsAction
+
+        metric_store = data_context.stores[target_store_name]
+        profiled_partition_ids = cls.get_profiled_partition_ids(metric_store, expectation_suite_name)
+
+        validation_results = []
+        for batch_kwargs in batch_kwargs_list:
+            partition_id = cls.get_partition_id(batch_kwargs)
+            if partition_id in profiled_partition_ids:
+                logger.debug("Statistics for partition %s are already stored; skipping" % partition_id)
+                continue
+
+            batch = data_context.get_batch(batch_kwargs, ExpectationSuite(expectation_suite_name))
+            statistics_suite, batch_validation_results = cls.profile(batch, run_id=partition_id)
+            action = StoreMetricsAction(
+                data_context,
+                requested_metrics=cls.get_requested_metrics(statistics_suite),
+                target_store_name=target_store_name
+            )
+            action.run(
+                batch_validation_results,
+                ValidationResultIdentifier.from_object(batch_validation_results),
+                batch
+            )
+            profiled_partition_ids.add(partition_id)
+            validation_results.append(batch_validation_results)
+
+        return cls.build_expectation_suite(metric_store, expectation_suite_name), validation_results
+
+    @classmethod
+    def build_expectation_suite(cls, metric_store, expectation_suite_name):
+        """Build an expectation suite from the statistics of every batch stored in the metric store."""
+        statistics = OrderedDict()
+        partition_ids = set()
+        for key in cls._get_statistics_keys(metric_store, expectation_suite_name):
+            partition_ids.add(key.run_id)
+            value = metric_store.get(key)
+            if value is not None:
+                statistics.setdefault((key.metric_name, key.metric_kwargs_id), []).append(value)
+
+        expectations = []
+        row_counts = statistics.get((cls.TABLE_METRICS[0], None))
+        if row_counts:
+            expectations.append(ExpectationConfiguration(
+                "expect_table_row_count_to_be_between",
+                {"min_value": min(row_counts), "max_value": max(row_counts)}
+            ))
+
+        columns = []
+        for metric_name, metric_kwargs_id in statistics.keys():
+            if metric_kwargs_id is not None and metric_kwargs_id.startswith("column="):
+                column = metric_kwargs_id[len("column="):]
+                if column not in columns:
+                    columns.append(column)
+
+        for column in columns:
+            column_statistics = dict(
+                (metric_name, values) for (metric_name, metric_kwargs_id), values in statistics.items()
+                if metric_kwargs_id == "column=" + column
+            )
+            expectations.append(ExpectationConfiguration("expect_column_to_exist", {"column": column}))
+            expectations.extend(cls._build_column_expectations(column, column_statistics))
+
+        expectation_suite = ExpectationSuite(expectation_suite_name, expectations=expectations)
+        expectation_suite = cls.add_meta(expectation_suite)
+        expectation_suite.meta[str(cls.__name__)]["batch_count"] = len(partition_ids)
+        return expectation_suite
+
+    @classmethod
+    def _get_statistics_keys(cls, metric_store, expectation_suite_name):
+        keys = []
+        for key in metric_store.list_keys():
+            if not isinstance(key, ValidationMetricIdentifier):
+                key = ValidationMetricIdentifier.from_tuple(key)
+            if key.expectation_suite_identifier.expectation_suite_name == expectation_suite_name:
+                keys.append(key)
+        return keys
+
+    @classmethod
+    def _build_column_expectations(cls, column, column_statistics):
+        expectations = []
+
+        element_counts = column_statistics.get("expect_column_values_to_not_be_null.result.element_count", [])
+        unexpected_counts = column_statistics.get("expect_column_values_to_not_be_null.result.unexpected_count", [])
+        nonnull_fractions = [
+            float(element_count - unexpected_count) / element_count
+            for element_count, unexpected_count in zip(element_counts, unexpected_counts) if element_count > 0
+        ]
+        if len(nonnull_fractions) > 0:
+            mostly = min(nonnull_fractions)
+            if mostly == 1:
+                expectations.append(ExpectationConfiguration(
+                    "expect_column_values_to_not_be_null", {"column": column}
+                ))
+            elif mostly > 0:
+                # Round down so that the threshold still covers the batch with the most nulls
+                expectations.append(ExpectationConfiguration(
+                    "expect_column_values_to_not_be_null", {"column": column, "mostly": math.floor(mostly * 100) / 100}
+                ))
+
+        mins = column_statistics.get("expect_column_min_to_be_between.result.observed_value")
+        maxes = column_statistics.get("expect_column_max_to_be_between.result.observed_value")
+        if mins and maxes:
+            expectations.append(ExpectationConfiguration(
+                "expect_column_values_to_be_between",
+                {"column": column, "min_value": min(mins), "max_value": max(maxes)}
+            ))
+        for expectation_type in [
+            "expect_column_min_to_be_between",
+            "expect_column_max_to_be_between",
+            "expect_column_mean_to_be_between",
+        ]:
+            values = column_statistics.get(expectation_type + ".result.observed_value")
+            if values:
+                expectations.append(ExpectationConfiguration(
+                    expectation_type, {"column": column, "min_value": min(values), "max_value": max(values)}
+                ))
+
+        quantile_sketches = [
+            sketch_from_json_dict(sketch_dict) for sketch_dict in
+            column_statistics.get("expect_column_quantile_values_to_be_between.result.details.sketch", [])
+        ]
+        quantile_values = [sketch.get_quantiles(cls.QUANTILES) for sketch in quantile_sketches if sketch.n > 0]
+        if len(quantile_values) > 0:
+            expectations.append(ExpectationConfiguration(
+                "expect_column_quantile_values_to_be_between",
+                {
+                    "column": column,
+                    "quantile_ranges": {
+                        "quantiles": cls.QUANTILES,
+                        "value_ranges": [[min(values), max(values)] for values in zip(*quantile_values)]
+                    }
+                }
+            ))
+
+        cardinality_sketches = [
+            sketch_from_json_dict(sketch_dict) for sketch_dict in
+            column_statistics.get("expect_column_unique_value_count_to_be_between.result.details.sketch", [])
+        ]
+        if len(cardinality_sketches) > 0:
+            unique_value_counts = [int(round(sketch.get_estimate())) for sketch in cardinality_sketches]
+            expectations.append(ExpectationConfiguration(
+                "expect_column_unique_value_count_to_be_between",
+                {
+                    "column": column,
+                    "min_value": min(unique_value_counts),
+                    "max_value": max(unique_value_counts),
+                    "approximate": True
+                }
+            ))
+
+        frequent_items_sketches = [
+            sketch_from_json_dict(sketch_dict) for sketch_dict in
+            column_statistics.get("expect_column_most_common_value_to_be_in_set.result.details.sketch", [])
+        ]
+        if len(frequent_items_sketches) > 0:
+            frequent_items_sketch = merge_sketches(frequent_items_sketches)
+            # The sketch has counted every distinct value only if it never had to drop a value
+            value_set = [value for value, count in frequent_items_sketch.get_frequent_items()]
+            if frequent_items_sketch.max_error == 0 and 0 < len(value_set) <= cls.MAX_VALUE_SET_SIZE:
+                expectations.append(ExpectationConfiguration(
+                    "expect_column_values_to_be_in_set", {"column": column, "value_set": value_set}
+                ))
+
+        return expectations
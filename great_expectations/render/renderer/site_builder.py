@@ -213,6 +213,8 @@ class SiteBuilder(object):
 
 
 class DefaultSiteSectionBuilder(object):
+    # Rendered pages are written to the target store in batches of this size
+    page_write_batch_size = 32
 
     def __init__(
             self,
@@ -262,10 +264,12 @@ class DefaultSiteSectionBuilder(object):
         )
 
     def build(self, resource_identifiers=None):
-        source_store_keys = self.source_store.list_keys()
         if self.name == "validations" and self.validation_results_limit:
-            source_store_keys = sorted(source_store_keys, key=lambda x: x.run_id, reverse=True)[:self.validation_results_limit]
+            source_store_keys = self.source_store.list_run_keys(limit=self.validation_results_limit)
+        else:
+            source_store_keys = self.source_store.list_keys()
 
+        pages = []
         for resource_key in source_store_keys:
 
             # if no resource_identifiers are passed, the section builder will build
@@ -302,13 +306,19 @@ class DefaultSiteSectionBuilder(object):
                 logger.error("Exception occurred during data docs rendering: ", e, exc_info=True)
                 continue
 
-            self.target_store.set(
+            pages.append((
                 SiteSectionIdentifier(
                     site_section_name=self.name,
                     resource_identifier=resource_key,
                 ),
                 viewable_content
-            )
+            ))
+            if len(pages) >= self.page_write_batch_size:
+                self.target_store.set_many(pages)
+                pages = []
+
+        if len(pages) > 0:
+            self.target_store.set_many(pages)
 
     def _resource_key_passes_run_id_filter(self, resource_key):
         if type(resource_key) == ValidationResultIdentifier:
@@ -15,7 +15,11 @@ class ValidationAction(object):
     and are aware of a data context namespace structure.
 
     The data context is passed to this class in its constructor.
+
+    Actions that only write the validation result (or values computed from it) to stores set write_behind to True:
+    a validation operator configured with write_behind runs them in the background.
     """
+    write_behind = False
 
     def __init__(self, data_context):
         self.data_context = data_context
@@ -113,6 +117,8 @@ class StoreValidationResultAction(ValidationAction):
     """
     StoreValidationResultAction stores a validation result in the ValidationsStore.
     """
+    write_behind = True
+
 
     def __init__(self,
                  data_context,
@@ -154,6 +160,8 @@ class StoreEvaluationParametersAction(ValidationAction):
     Evaluation parameters allow expectations to refer to statistics/metrics computed
     in the process of validating other prior expectations.
     """
+    write_behind = True
+
 
     def __init__(self, data_context, target_store_name=None):
         """
@@ -185,6 +193,8 @@ class StoreEvaluationParametersAction(ValidationAction):
 
 
 class StoreMetricsAction(ValidationAction):
+    write_behind = True
+
     def __init__(self, data_context, requested_metrics, target_store_name="metrics_store"):
         """
 
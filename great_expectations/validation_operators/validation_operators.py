@@ -15,6 +15,7 @@ from great_expectations.data_asset import (
     DataAsset,
 )
 from .util import send_slack_notification
+from .write_behind_queue import WriteBehindQueue
 
 # NOTE: Abe 2019/08/24 : This is first implementation of all these classes. Consider them UNSTABLE for now. 
 
@@ -66,11 +67,35 @@ class ActionListValidationOperator(ValidationOperator):
                   renderer:
                     module_name: great_expectations.render.renderer.slack_renderer
                     class_name: SlackRenderer
+
+    With write_behind, the actions that write to stores (StoreValidationResultAction,
+    StoreEvaluationParametersAction and StoreMetricsAction) run in the background while the
+    next batches are validated, and run returns once they have all completed. write_behind
+    may be true, or the options of the queue of background writes::
+
+        write_behind:
+          num_workers: 4 # number of writes run at once
+          max_queue_size: 100 # validation waits when this many writes are pending for a worker
+
+    Writes of the same validation result run in the order of the action list. An action that
+    does not write in the background waits for the writes of its validation result before it
+    runs, and a batch whose expectation suite depends on evaluation parameters waits for all
+    pending writes before it is validated. If a background write fails, its action result is
+    {"error": "<description of the exception>"}.
     """
 
-    def __init__(self, data_context, action_list):
+    def __init__(self, data_context, action_list, write_behind=None):
         self.data_context = data_context
 
+        if write_behind is True:
+            write_behind = {}
+        if write_behind:
+            self._write_behind_queue = WriteBehindQueue(**write_behind)
+        else:
+            self._write_behind_queue = None
+        # (action results of a batch, action name, WriteBehindTask) of the actions running in the background
+        self._write_behind_tasks = []
+
         self.action_list = action_list
         self.actions = {}
         for action_config in action_list:
@@ -121,21 +146,25 @@ class ActionListValidationOperator(ValidationOperator):
             "details": {}
         }
 
-        for item in assets_to_validate:
-            batch = self._build_batch_from_item(item)
-            expectation_suite_identifier = ExpectationSuiteIdentifier(
-                expectation_suite_name=batch._expectation_suite.expectation_suite_name
-            )
-            # validation_result_id = ValidationResultIdentifier(
-            #     batch_identifier=BatchIdentifier(batch.batch_id),
-            #     expectation_suite_identifier=expectation_suite_identifier,
-            #     run_id=run_id,
-            # )
-            result_object["details"][expectation_suite_identifier] = {}
-            batch_validation_result = batch.validate(run_id=run_id, result_format="SUMMARY")
-            result_object["details"][expectation_suite_identifier]["validation_result"] = batch_validation_result
-            batch_actions_results = self._run_actions(batch, expectation_suite_identifier, batch._expectation_suite, batch_validation_result, run_id)
-            result_object["details"][expectation_suite_identifier]["actions_results"] = batch_actions_results
+        try:
+            for item in assets_to_validate:
+                batch = self._build_batch_from_item(item)
+                expectation_suite_identifier = ExpectationSuiteIdentifier(
+                    expectation_suite_name=batch._expectation_suite.expectation_suite_name
+                )
+                # validation_result_id = ValidationResultIdentifier(
+                #     batch_identifier=BatchIdentifier(batch.batch_id),
+                #     expectation_suite_identifier=expectation_suite_identifier,
+                #     run_id=run_id,
+                # )
+                result_object["details"][expectation_suite_identifier] = {}
+                self._wait_for_evaluation_parameters(batch._expectation_suite)
+                batch_validation_result = batch.validate(run_id=run_id, result_format="SUMMARY")
+                result_object["details"][expectation_suite_identifier]["validation_result"] = batch_validation_result
+                batch_actions_results = self._run_actions(batch, expectation_suite_identifier, batch._expectation_suite, batch_validation_result, run_id)
+                result_object["details"][expectation_suite_identifier]["actions_results"] = batch_actions_results
+        finally:
+            self._flush_write_behind_actions()
 
         result_object["success"] = all([val["validation_result"].success for val in result_object["details"].values()])
 
@@ -164,6 +193,21 @@ class ActionListValidationOperator(ValidationOperator):
                 run_id=run_id,
                 batch_identifier=batch.batch_id
             )
+            if self._write_behind_queue is not None:
+                if self.actions[action["name"]].write_behind:
+                    # The result of the action is recorded once it has run
+                    batch_actions_results[action["name"]] = {}
+                    task = self._write_behind_queue.submit(
+                        validation_result_id,
+                        self.actions[action["name"]].run,
+                        validation_result_suite_identifier=validation_result_id,
+                        validation_result_suite=batch_validation_result,
+                        data_asset=batch
+                    )
+                    self._write_behind_tasks.append((batch_actions_results, action["name"], task))
+                    continue
+                # Other actions may read what the actions before them wrote
+                self._write_behind_queue.wait(validation_result_id)
             try:
                 action_result = self.actions[action["name"]].run(
                                                 validation_result_suite_identifier=validation_result_id,
@@ -199,6 +243,30 @@ class ActionListValidationOperator(ValidationOperator):
         # NOTE: Eugene: 2019-09-24: Need to define this result object. Discussion required!
         return result_object
 
+    def _wait_for_evaluation_parameters(self, expectation_suite):
+        """Waits for the writes running in the background before validating against an expectation suite that may
+        use the evaluation parameters they store."""
+        if self._write_behind_queue is not None and self._write_behind_tasks and \
+                expectation_suite.get_evaluation_parameter_dependencies():
+            self._write_behind_queue.join()
+
+    def _flush_write_behind_actions(self):
+        """Waits for the actions running in the background, and records their results in the action results of
+        their batches."""
+        if self._write_behind_queue is None:
+            return
+        self._write_behind_queue.join()
+        write_behind_tasks = self._write_behind_tasks
+        self._write_behind_tasks = []
+        for batch_actions_results, action_name, task in write_behind_tasks:
+            if task.error is not None:
+                logger.error("Error running action with name {}".format(action_name), exc_info=task.exc_info)
+                batch_actions_results[action_name] = {
+                    "error": "{}: {}".format(type(task.error).__name__, task.error)
+                }
+            else:
+                batch_actions_results[action_name] = {} if task.result is None else task.result
+
 
 class WarningAndFailureExpectationSuitesValidationOperator(ActionListValidationOperator):
     """WarningAndFailureExpectationSuitesValidationOperator is a validation operator
@@ -279,11 +347,13 @@ class WarningAndFailureExpectationSuitesValidationOperator(ActionListValidationO
         expectation_suite_name_suffixes=[".failure", ".warning"],
         stop_on_first_error=False,
         slack_webhook=None,
-        notify_on="all"
+        notify_on="all",
+        write_behind=None
     ):
         super(WarningAndFailureExpectationSuitesValidationOperator, self).__init__(
             data_context,
             action_list,
+            write_behind=write_behind
         )
 
         self.stop_on_first_error = stop_on_first_error
@@ -405,87 +475,92 @@ class WarningAndFailureExpectationSuitesValidationOperator(ActionListValidationO
             "run_id": run_id
         }
 
-        for item in assets_to_validate:
-            batch = self._build_batch_from_item(item)
-
-            batch_id = batch.batch_id
-            run_id = run_id
+        try:
+            for item in assets_to_validate:
+                batch = self._build_batch_from_item(item)
 
-            assert not batch_id is None
-            assert not run_id is None
+                batch_id = batch.batch_id
+                run_id = run_id
 
-            return_obj["batch_identifiers"].append(batch_id)
+                assert not batch_id is None
+                assert not run_id is None
 
-            failure_expectation_suite_identifier = ExpectationSuiteIdentifier(
-                expectation_suite_name=base_expectation_suite_name + self.expectation_suite_name_suffixes[0]
-            )
+                return_obj["batch_identifiers"].append(batch_id)
 
-            failure_validation_result_id = ValidationResultIdentifier(
-                expectation_suite_identifier=failure_expectation_suite_identifier,
-                run_id=run_id,
-                batch_identifier=batch_id
-            )
-
-            failure_expectation_suite = None
-            try:
-                failure_expectation_suite = self.data_context.stores[self.data_context.expectations_store_name].get(
-                    failure_expectation_suite_identifier
+                failure_expectation_suite_identifier = ExpectationSuiteIdentifier(
+                    expectation_suite_name=base_expectation_suite_name + self.expectation_suite_name_suffixes[0]
                 )
 
-            # NOTE : Abe 2019/09/17 : I'm concerned that this may be too permissive, since
-            # it will catch any error in the Store, not just KeyErrors. In the longer term, a better
-            # solution will be to have the Stores catch other known errors and raise KeyErrors,
-            # so that methods like this can catch and handle a single error type.
-            except Exception as e:
-                logger.debug("Failure expectation suite not found: {}".format(failure_expectation_suite_identifier))
-
-            if failure_expectation_suite:
-                return_obj["failure"][failure_validation_result_id] = {}
-                failure_validation_result = batch.validate(failure_expectation_suite, result_format="SUMMARY")
-                return_obj["failure"][failure_validation_result_id]["validation_result"] = failure_validation_result
-                failure_actions_results = self._run_actions(
-                    batch,
-                    failure_expectation_suite_identifier,
-                    failure_expectation_suite,
-                    failure_validation_result,
-                    run_id
+                failure_validation_result_id = ValidationResultIdentifier(
+                    expectation_suite_identifier=failure_expectation_suite_identifier,
+                    run_id=run_id,
+                    batch_identifier=batch_id
                 )
-                return_obj["failure"][failure_validation_result_id]["actions_results"] = failure_actions_results
-
-                if not failure_validation_result.success and self.stop_on_first_error:
-                    break
-
-
-            warning_expectation_suite_identifier = ExpectationSuiteIdentifier(
-                expectation_suite_name=base_expectation_suite_name + self.expectation_suite_name_suffixes[1]
-            )
 
-            warning_validation_result_id = ValidationResultIdentifier(
-                expectation_suite_identifier=warning_expectation_suite_identifier,
-                run_id=run_id,
-                batch_identifier=batch.batch_id
-            )
-
-            warning_expectation_suite = None
-            try:
-                warning_expectation_suite = self.data_context.stores[self.data_context.expectations_store_name].get(
-                    warning_expectation_suite_identifier
+                failure_expectation_suite = None
+                try:
+                    failure_expectation_suite = self.data_context.stores[self.data_context.expectations_store_name].get(
+                        failure_expectation_suite_identifier
+                    )
+
+                # NOTE : Abe 2019/09/17 : I'm concerned that this may be too permissive, since
+                # it will catch any error in the Store, not just KeyErrors. In the longer term, a better
+                # solution will be to have the Stores catch other known errors and raise KeyErrors,
+                # so that methods like this can catch and handle a single error type.
+                except Exception as e:
+                    logger.debug("Failure expectation suite not found: {}".format(failure_expectation_suite_identifier))
+
+                if failure_expectation_suite:
+                    return_obj["failure"][failure_validation_result_id] = {}
+                    self._wait_for_evaluation_parameters(failure_expectation_suite)
+                    failure_validation_result = batch.validate(failure_expectation_suite, result_format="SUMMARY")
+                    return_obj["failure"][failure_validation_result_id]["validation_result"] = failure_validation_result
+                    failure_actions_results = self._run_actions(
+                        batch,
+                        failure_expectation_suite_identifier,
+                        failure_expectation_suite,
+                        failure_validation_result,
+                        run_id
+                    )
+                    return_obj["failure"][failure_validation_result_id]["actions_results"] = failure_actions_results
+
+                    if not failure_validation_result.success and self.stop_on_first_error:
+                        break
+
+
+                warning_expectation_suite_identifier = ExpectationSuiteIdentifier(
+                    expectation_suite_name=base_expectation_suite_name + self.expectation_suite_name_suffixes[1]
                 )
-            except Exception as e:
-                logger.debug("Warning expectation suite not found: {}".format(warning_expectation_suite_identifier))
-
-            if warning_expectation_suite:
-                return_obj["warning"][warning_validation_result_id] = {}
-                warning_validation_result = batch.validate(warning_expectation_suite, result_format="SUMMARY")
-                return_obj["warning"][warning_validation_result_id]["validation_result"] = warning_validation_result
-                warning_actions_results = self._run_actions(
-                    batch,
-                    warning_expectation_suite_identifier,
-                    warning_expectation_suite,
-                    warning_validation_result,
-                    run_id
+
+                warning_validation_result_id = ValidationResultIdentifier(
+                    expectation_suite_identifier=warning_expectation_suite_identifier,
+                    run_id=run_id,
+                    batch_identifier=batch.batch_id
                 )
-                return_obj["warning"][warning_validation_result_id]["actions_results"] = warning_actions_results
+
+                warning_expectation_suite = None
+                try:
+                    warning_expectation_suite = self.data_context.stores[self.data_context.expectations_store_name].get(
+                        warning_expectation_suite_identifier
+                    )
+                except Exception as e:
+                    logger.debug("Warning expectation suite not found: {}".format(warning_expectation_suite_identifier))
+
+                if warning_expectation_suite:
+                    return_obj["warning"][warning_validation_result_id] = {}
+                    self._wait_for_evaluation_parameters(warning_expectation_suite)
+                    warning_validation_result = batch.validate(warning_expectation_suite, result_format="SUMMARY")
+                    return_obj["warning"][warning_validation_result_id]["validation_result"] = warning_validation_result
+                    warning_actions_results = self._run_actions(
+                        batch,
+                        warning_expectation_suite_identifier,
+                        warning_expectation_suite,
+                        warning_validation_result,
+                        run_id
+                    )
+                    return_obj["warning"][warning_validation_result_id]["actions_results"] = warning_actions_results
+        finally:
+            self._flush_write_behind_actions()
 
         return_obj["success"] = all([val["validation_result"].success for val in return_obj["failure"].values()])
 
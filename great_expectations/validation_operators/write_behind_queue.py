@@ -0,0 +1,132 @@
+import sys
+import threading
+
+from six.moves import queue
+
+
+class WriteBehindTask(object):
+    """A call run in the background by a WriteBehindQueue. Once the call has run, its result or the exception it
+    raised are available as result and error."""
+
+    def __init__(self, key, function, args, kwargs):
+        self.key = key
+        self._function = function
+        self._args = args
+        self._kwargs = kwargs
+        self.result = None
+        self.error = None
+        self.exc_info = None
+        self._done = threading.Event()
+
+    @property
+    def done(self):
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        return self._done.wait(timeout)
+
+    def run(self):
+        try:
+            self.result = self._function(*self._args, **self._kwargs)
+        except Exception as e:
+            self.error = e
+            self.exc_info = sys.exc_info()
+        finally:
+            # The arguments (e.g. a validation result) are not kept once the call has run
+            self._args = None
+            self._kwargs = None
+            self._done.set()
+
+
+class WriteBehindQueue(object):
+    """Runs calls (typically writes to stores) on a fixed number of background threads.
+
+    Calls submitted with the same key run on the same thread, in the order in which they were submitted. Each thread
+    queues at most max_queue_size calls: when the background calls fall behind, submit blocks until there is room in
+    the queue, which bounds the memory held by pending calls.
+    """
+
+    def __init__(self, num_workers=4, max_queue_size=100):
+        if num_workers < 1:
+            raise ValueError("num_workers must be positive")
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be positive")
+        self._num_workers = num_workers
+        self._max_queue_size = max_queue_size
+        self._queues = None
+        self._threads = None
+        self._last_tasks = {}
+        self._lock = threading.Lock()
+
+    @property
+    def num_workers(self):
+        return self._num_workers
+
+    @property
+    def max_queue_size(self):
+        return self._max_queue_size
+
+    def _start(self):
+        # Threads are only started once a call is submitted
+        with self._lock:
+            if self._queues is None:
+                self._queues = [queue.Queue(self._max_queue_size) for _ in range(self._num_workers)]
+                self._threads = []
+                for worker_queue in self._queues:
+                    thread = threading.Thread(target=self._work, args=(worker_queue,))
+                    thread.daemon = True
+                    thread.start()
+                    self._threads.append(thread)
+            return self._queues
+
+    @staticmethod
+    def _work(worker_queue):
+        while True:
+            task = worker_queue.get()
+            try:
+                if task is None:
+                    return
+                task.run()
+            finally:
+                worker_queue.task_done()
+
+    def submit(self, key, function, *args, **kwargs):
+        """Queue a call of function with args and kwargs, returning its WriteBehindTask."""
+        queues = self._start()
+        task = WriteBehindTask(key, function, args, kwargs)
+        with self._lock:
+            self._last_tasks[key] = task
+        queues[hash(key) % self._num_workers].put(task)
+        return task
+
+    def wait(self, key):
+        """Wait until the calls submitted with key have run."""
+        with self._lock:
+            task = self._last_tasks.get(key)
+        if task is not None:
+            task.wait()
+
+    def join(self):
+        """Wait until all submitted calls have run."""
+        with self._lock:
+            queues = self._queues
+        if queues is not None:
+            for worker_queue in queues:
+                worker_queue.join()
+        with self._lock:
+            self._last_tasks = dict(
+                (key, task) for key, task in self._last_tasks.items() if not task.done
+            )
+
+    def close(self):
+        """Wait until all submitted calls have run and stop the background threads."""
+        with self._lock:
+            queues, threads = self._queues, self._threads
+            self._queues = None
+            self._threads = None
+            self._last_tasks = {}
+        if queues is not None:
+            for worker_queue in queues:
+                worker_queue.put(None)
+            for thread in threads:
+                thread.join()
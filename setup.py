@@ -22,7 +22,9 @@ config = {
     'extras_require': {
         'spark':  ['pyspark>=2.3.2'],
         'sqlalchemy': ['sqlalchemy>=1.2'],
-        'airflow': ['apache-airflow[s3]>=1.9.0', 'boto3>=1.7.3']
+        'airflow': ['apache-airflow[s3]>=1.9.0', 'boto3>=1.7.3'],
+        'msgpack': ['msgpack>=0.6.0'],
+        'zstd': ['zstandard>=0.11.0']
     },
     'packages': find_packages(exclude=['docs', 'tests', 'examples']),
     'entry_points': {
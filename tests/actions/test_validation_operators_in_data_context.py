@@ -11,6 +11,7 @@ from great_expectations.data_context import (
 from great_expectations.util import (
     gen_directory_tree_str
 )
+from great_expectations.validation_operators import ActionListValidationOperator
 
 
 @pytest.fixture
@@ -98,3 +99,59 @@ def test_warning_and_failure_validation_operator(validation_operators_data_conte
     suite_names = [key.expectation_suite_identifier.expectation_suite_name for key in validations_keys]
     assert "f1.warning" in suite_names
     assert "f1.failure" in suite_names
+
+
+def test_action_list_operator_write_behind(validation_operators_data_context):
+    data_context = validation_operators_data_context
+    validator_batch_kwargs = data_context.build_batch_kwargs("my_datasource", "subdir_reader", "f1")
+
+    operator = ActionListValidationOperator(
+        data_context=data_context,
+        action_list=[
+            {
+                "name": "store_validation_result",
+                "action": {
+                    "class_name": "StoreValidationResultAction",
+                    "target_store_name": "validation_result_store",
+                }
+            },
+            {
+                "name": "extract_and_store_eval_parameters",
+                "action": {
+                    "class_name": "StoreEvaluationParametersAction",
+                    "target_store_name": "evaluation_parameter_store",
+                }
+            },
+            {
+                "name": "read_validation_result",
+                "action": {
+                    "class_name": "NoOpAction",
+                }
+            },
+        ],
+        write_behind={"num_workers": 2, "max_queue_size": 1}
+    )
+    validation_result_store = data_context.stores["validation_result_store"]
+    stored_before_read = []
+    operator.actions["read_validation_result"]._run = lambda validation_result_suite, \
+        validation_result_suite_identifier, data_asset: stored_before_read.append(
+            validation_result_store.has_key(validation_result_suite_identifier))
+
+    def fail_to_store_evaluation_parameters(validation_result_suite):
+        raise ValueError("evaluation parameter store is not available")
+    data_context.store_evaluation_parameters = fail_to_store_evaluation_parameters
+
+    operator_result = operator.run(
+        assets_to_validate=[(validator_batch_kwargs, "f1.failure"), (validator_batch_kwargs, "f1.warning")],
+        run_id="test-100",
+    )
+
+    assert len(validation_result_store.list_keys()) == 2
+    # Actions that do not write in the background wait for the writes of their validation result
+    assert stored_before_read == [True, True]
+    assert operator_result["success"]
+    for details in operator_result["details"].values():
+        assert details["actions_results"]["store_validation_result"] == {}
+        assert details["actions_results"]["extract_and_store_eval_parameters"] == {
+            "error": "ValueError: evaluation parameter store is not available"
+        }
@@ -3,6 +3,11 @@ import os
 from click.testing import CliRunner
 
 from great_expectations.cli import cli
+from great_expectations.core import ExpectationSuiteValidationResult
+from great_expectations.data_context.types.resource_identifiers import (
+    ExpectationSuiteIdentifier,
+    ValidationResultIdentifier,
+)
 from tests.cli.utils import assert_no_logging_messages_or_tracebacks
 
 
@@ -47,3 +52,79 @@ def test_project_check_on_project_with_missing_config_file_guides_user(
     assert "Checking your config files for validity" in result.output
     assert "Unfortunately, your config appears to be invalid" in result.output
     assert_no_logging_messages_or_tracebacks(caplog, result)
+
+
+def test_project_rebuild_store_indexes(caplog, titanic_data_context):
+    project_dir = titanic_data_context.root_directory
+    runner = CliRunner(mix_stderr=False)
+    result = runner.invoke(
+        cli, ["project", "rebuild-store-indexes", "-d", project_dir], catch_exceptions=False
+    )
+    assert result.exit_code == 0
+    assert "None of the stores of this project have a key index" in result.output
+
+    titanic_data_context.add_store("indexed_validations_store", {
+        "class_name": "ValidationsStore",
+        "store_backend": {
+            "class_name": "TupleFilesystemStoreBackend",
+            "base_directory": "uncommitted/indexed_validations/",
+            "key_index": True,
+        }
+    })
+    titanic_data_context._save_project_config()
+    result = runner.invoke(
+        cli, ["project", "rebuild-store-indexes", "-d", project_dir], catch_exceptions=False
+    )
+    assert result.exit_code == 0
+    assert "Rebuilt the key index of store indexed_validations_store (0 keys)" in result.output
+    assert_no_logging_messages_or_tracebacks(caplog, result)
+
+
+def test_project_apply_retention_policies(caplog, titanic_data_context):
+    project_dir = titanic_data_context.root_directory
+    runner = CliRunner(mix_stderr=False)
+    result = runner.invoke(
+        cli, ["project", "apply-retention-policies", "-d", project_dir], catch_exceptions=False
+    )
+    assert result.exit_code == 0
+    assert "None of the stores of this project have a retention policy" in result.output
+
+    titanic_data_context.add_store("retained_validations_store", {
+        "class_name": "ValidationsStore",
+        "retention_policy": {"keep_last_runs": 1},
+        "store_backend": {
+            "class_name": "TupleFilesystemStoreBackend",
+            "base_directory": "uncommitted/retained_validations/",
+        }
+    })
+    titanic_data_context._save_project_config()
+    store = titanic_data_context.stores["retained_validations_store"]
+    for run_id in ["20200101T000000.000000Z", "20200102T000000.000000Z"]:
+        store.set(
+            ValidationResultIdentifier(ExpectationSuiteIdentifier("my_suite"), run_id, "batch"),
+            ExpectationSuiteValidationResult(success=True)
+        )
+
+    result = runner.invoke(
+        cli, ["project", "apply-retention-policies", "-d", project_dir, "--dry-run"], catch_exceptions=False
+    )
+    assert result.exit_code == 0
+    assert "Store retained_validations_store would have: 1 removed, 0 archived" in result.output
+    assert len(store.list_keys()) == 2
+
+    result = runner.invoke(
+        cli, ["project", "apply-retention-policies", "-d", project_dir, "-s", "retained_validations_store"],
+        catch_exceptions=False
+    )
+    assert result.exit_code == 0
+    assert "Applied the retention policy of store retained_validations_store: 1 removed, 0 archived" in \
+        result.output
+    assert [key.run_id for key in store.list_keys()] == ["20200102T000000.000000Z"]
+
+    result = runner.invoke(
+        cli, ["project", "apply-retention-policies", "-d", project_dir, "-s", "expectations_store"],
+        catch_exceptions=False
+    )
+    assert result.exit_code == 1
+    assert "Store expectations_store has no retention_policy" in result.output
+    assert_no_logging_messages_or_tracebacks(caplog, result)
@@ -174,3 +174,37 @@ def test_database_evaluation_parameter_store_get_bind_params(param_store):
         'urn:great_expectations:validations:asset2.warning:'
         'expect_column_values_to_match_regex.result.unexpected_percent:column=mycol': 12.3456789,
     }
+
+
+def test_evaluation_parameter_store_get_bind_params_with_sqlite():
+    param_store = instantiate_class_from_config(
+        config={
+            "class_name": "EvaluationParameterStore",
+            "store_backend": {
+                "class_name": "DatabaseStoreBackend",
+                "credentials": {"drivername": "sqlite"}
+            }
+        },
+        config_defaults={
+            "module_name": "great_expectations.data_context.store",
+        },
+        runtime_environment={}
+    )
+    for run_id, metric_value in [("run_1", 1), ("run_2", 2)]:
+        for metric_kwargs_id in ["column=a", "column=b"]:
+            param_store.set(
+                ValidationMetricIdentifier(
+                    run_id=run_id,
+                    expectation_suite_identifier="asset.warning",
+                    metric_name="expect_column_max_to_be_between.result.observed_value",
+                    metric_kwargs_id=metric_kwargs_id
+                ),
+                metric_value
+            )
+
+    assert param_store.get_bind_params("run_2") == {
+        'urn:great_expectations:validations:asset.warning:'
+        'expect_column_max_to_be_between.result.observed_value:column=a': 2,
+        'urn:great_expectations:validations:asset.warning:'
+        'expect_column_max_to_be_between.result.observed_value:column=b': 2,
+    }
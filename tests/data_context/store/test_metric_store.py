@@ -0,0 +1,110 @@
+import datetime
+
+import pytest
+
+from great_expectations.core.metric import ValidationMetricIdentifier
+from great_expectations.data_context.store import MetricStore
+from great_expectations.exceptions import DataContextError
+
+
+@pytest.mark.parametrize("store_backend", [
+    {"class_name": "InMemoryStoreBackend"},
+    {"class_name": "InMemoryStoreBackend", "fixed_length_key": True},
+    {"class_name": "TupleFilesystemStoreBackend", "base_directory": "metrics/", "key_index": True},
+    {"class_name": "DatabaseStoreBackend", "credentials": {"drivername": "sqlite"}},
+])
+def test_metric_store_get_metric_series(tmp_path_factory, store_backend):
+    if store_backend["class_name"] == "TupleFilesystemStoreBackend":
+        store_backend["root_directory"] = str(tmp_path_factory.mktemp("test_metric_store_get_metric_series__dir"))
+    metric_store = MetricStore(store_backend=store_backend)
+
+    metric_name = "expect_column_mean_to_be_between.result.observed_value"
+    metric_store.set_many([
+        (
+            ValidationMetricIdentifier(
+                run_id="2020010%dT000000.000000Z" % day,
+                expectation_suite_identifier=suite_name,
+                metric_name=metric_name,
+                metric_kwargs_id="column=" + column
+            ),
+            day * 10 + len(column)
+        )
+        for day in range(1, 6) for suite_name in ["asset.warning", "asset.warning.strict"] for column in ["a", "bb"]
+    ] + [(
+        ValidationMetricIdentifier(
+            run_id="20200103T000000.000000Z",
+            expectation_suite_identifier="asset.warning",
+            metric_name="statistics.success_percent",
+            metric_kwargs_id=None
+        ),
+        100.0
+    )])
+
+    series = metric_store.get_metric_series(
+        expectation_suite_name="asset.warning",
+        metric_name=metric_name,
+        metric_kwargs_id="column=bb",
+        start_run_id=datetime.datetime(2020, 1, 2),
+        end_run_id="20200104T000000.000000Z"
+    )
+    assert list(series.columns) == ["run_id", "expectation_suite_name", "metric_name", "metric_kwargs_id", "value"]
+    assert list(series["run_id"]) == [
+        "20200102T000000.000000Z", "20200103T000000.000000Z", "20200104T000000.000000Z"
+    ]
+    assert list(series["value"]) == [22, 32, 42]
+    assert set(series["expectation_suite_name"]) == {"asset.warning"}
+
+    series = metric_store.get_metric_series(expectation_suite_name="asset.warning", start_run_id="20200103")
+    assert len(series) == 7
+    assert series["run_id"].is_monotonic_increasing
+    assert list(series[series["metric_name"] == "statistics.success_percent"]["metric_kwargs_id"]) == [None]
+
+    assert len(metric_store.get_metric_series()) == 21
+    assert len(metric_store.get_metric_series(metric_name="not_a_metric")) == 0
+
+
+@pytest.mark.parametrize("store_backend", [
+    {"class_name": "InMemoryStoreBackend"},
+    {"class_name": "DatabaseStoreBackend", "credentials": {"drivername": "sqlite"}},
+])
+def test_metric_store_apply_retention_policy(store_backend):
+    metric_store = MetricStore(
+        store_backend=store_backend,
+        retention_policy={"max_age_days": 60, "downsample_after_days": 7, "downsample_period": "week"}
+    )
+    metric_name = "expect_column_mean_to_be_between.result.observed_value"
+    # Daily runs from 2020-01-01 to 2020-03-10
+    run_ids = [
+        (datetime.datetime(2020, 1, 1) + datetime.timedelta(days=day)).strftime("%Y%m%dT%H%M%S.%fZ")
+        for day in range(70)
+    ]
+    metric_store.set_many([
+        (
+            ValidationMetricIdentifier(
+                run_id=run_id,
+                expectation_suite_identifier="asset.warning",
+                metric_name=metric_name,
+                metric_kwargs_id="column=" + column
+            ),
+            idx
+        )
+        for idx, run_id in enumerate(run_ids) for column in ["a", "b"]
+    ])
+
+    now = datetime.datetime(2020, 3, 10, 12)
+    report = metric_store.apply_retention_policy(dry_run=True, now=now)
+    assert len(metric_store.list_keys()) == 140
+    # Runs before 2020-01-10T12 are older than 60 days
+    assert set(key.run_id for key in report["removed_keys"]) == set(run_ids[:10])
+
+    metric_store.apply_retention_policy(now=now)
+    series = metric_store.get_metric_series(metric_kwargs_id="column=a")
+    # One run per week until 2020-03-03, then every day
+    assert list(series["run_id"]) == [
+        "20200112T000000.000000Z", "20200119T000000.000000Z", "20200126T000000.000000Z", "20200202T000000.000000Z",
+        "20200209T000000.000000Z", "20200216T000000.000000Z", "20200223T000000.000000Z", "20200301T000000.000000Z",
+    ] + run_ids[62:]
+    assert len(metric_store.get_metric_series(metric_kwargs_id="column=b")) == len(series)
+
+    with pytest.raises(DataContextError):
+        MetricStore(retention_policy={"archive_after_days": 30})
@@ -0,0 +1,50 @@
+import datetime
+
+import pytest
+
+from great_expectations.data_context.store import RetentionPolicy
+
+
+def test_RetentionPolicy():
+    now = datetime.datetime(2020, 3, 10)
+    run_ids = [
+        "20200309T120000.000000Z",
+        "20200301T000000.000000Z",
+        "20200201T000000.000000Z",
+        "20200101T230000.000000Z",
+        "20200101T000000.000000Z",
+        "2019-12-31",
+        "profiling",
+        "my_run",
+    ]
+
+    assert RetentionPolicy().select_runs_to_remove(run_ids, now) == set()
+    assert RetentionPolicy(keep_last_runs=2).select_runs_to_remove(run_ids, now) == {
+        "20200201T000000.000000Z", "20200101T230000.000000Z", "20200101T000000.000000Z", "2019-12-31"
+    }
+    assert RetentionPolicy(max_age_days=30).select_runs_to_remove(run_ids, now) == {
+        "20200201T000000.000000Z", "20200101T230000.000000Z", "20200101T000000.000000Z", "2019-12-31"
+    }
+    # Runs are kept by either option
+    assert RetentionPolicy(keep_last_runs=4, max_age_days=30).select_runs_to_remove(run_ids, now) == {
+        "20200101T000000.000000Z", "2019-12-31"
+    }
+
+    assert RetentionPolicy(downsample_after_days=5).select_runs_to_downsample(run_ids, now) == {
+        "20200101T000000.000000Z"
+    }
+    assert RetentionPolicy(downsample_after_days=5, downsample_period="month").select_runs_to_downsample(
+        run_ids, now) == {"20200101T000000.000000Z"}
+    assert RetentionPolicy(downsample_after_days=0, downsample_period="month").select_runs_to_downsample(
+        run_ids, now) == {"20200301T000000.000000Z", "20200101T000000.000000Z"}
+
+    assert RetentionPolicy(archive_after_days=40).select_runs_to_archive(run_ids, now) == {
+        "20200101T230000.000000Z", "20200101T000000.000000Z", "2019-12-31"
+    }
+    assert RetentionPolicy.get_archive_month("20200101T230000.000000Z") == "2020-01"
+    assert RetentionPolicy.get_archive_month("profiling") is None
+
+    with pytest.raises(ValueError):
+        RetentionPolicy(downsample_period="hour")
+    with pytest.raises(ValueError):
+        RetentionPolicy(keep_last_runs=-1)
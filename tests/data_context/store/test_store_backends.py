@@ -1,6 +1,10 @@
+import json
+
 import pytest
+import threading
 import os
 import boto3
+import sqlalchemy
 from moto import mock_s3
 from mock import patch
 
@@ -13,6 +17,9 @@ if six.PY2:
 
 
 from great_expectations.data_context.store import (
+    CachingStoreBackend,
+    DatabaseStoreBackend,
+    ExpectationsStore,
     InMemoryStoreBackend,
     TupleFilesystemStoreBackend,
     TupleS3StoreBackend,
@@ -59,6 +66,8 @@ def test_InMemoryStoreBackend():
     assert my_store.has_key(("A",)) is True
     assert my_store.has_key(("C",)) is False
     assert my_store.list_keys() == [("A",), ("B",)]
+    assert my_store.get_many([("B",), ("A",)]) == [{"x": 1}, "aaa"]
+    assert my_store.list_items(("B",)) == [(("B",), {"x": 1})]
 
     with pytest.raises(NotImplementedError):
         my_store.get_url_for_key(my_key)
@@ -139,6 +148,227 @@ test_TupleFilesystemStoreBackend__dir0/
 """
 
 
+def test_TupleFilesystemStoreBackend_key_index(tmp_path_factory):
+    project_path = str(tmp_path_factory.mktemp('test_TupleFilesystemStoreBackend_key_index__dir'))
+    base_directory = os.path.join(project_path, "store")
+
+    my_store = TupleFilesystemStoreBackend(
+        root_directory=project_path,
+        base_directory="store",
+        filepath_suffix=".json",
+    )
+    my_store.set(("suite_a", "run_1", "batch_1"), "a11")
+    my_store.set(("suite_a", "run_2", "batch_1"), "a21")
+
+    # The index is built from the existing files when it is first enabled
+    my_store = TupleFilesystemStoreBackend(
+        root_directory=project_path,
+        base_directory="store",
+        filepath_suffix=".json",
+        key_index=True,
+    )
+    assert len(my_store.key_index) == 2
+    assert os.path.isfile(os.path.join(base_directory, ".ge_store_key_index.db"))
+
+    my_store.set(("suite_b", "run_1", "batch_1"), "b11")
+    my_store.set(("suite_ab", "run_1", "batch_1"), "ab11")
+    assert my_store.get(("suite_b", "run_1", "batch_1")) == "b11"
+    assert my_store.list_keys() == [
+        ("suite_a", "run_1", "batch_1"),
+        ("suite_a", "run_2", "batch_1"),
+        ("suite_ab", "run_1", "batch_1"),
+        ("suite_b", "run_1", "batch_1"),
+    ]
+    assert my_store.list_keys(("suite_a",)) == [
+        ("suite_a", "run_1", "batch_1"),
+        ("suite_a", "run_2", "batch_1"),
+    ]
+    assert my_store.list_keys(("suite_a", "run_2")) == [("suite_a", "run_2", "batch_1")]
+    assert sorted(my_store.list_keys()) == sorted(my_store._list_keys_from_files())
+
+    # Files written by other means are only listed once the index is rebuilt
+    os.remove(os.path.join(base_directory, "suite_a", "run_1", "batch_1.json"))
+    assert len(my_store.list_keys(("suite_a",))) == 2
+    assert my_store.rebuild_key_index() == 3
+    assert my_store.list_keys(("suite_a",)) == [("suite_a", "run_2", "batch_1")]
+
+    assert TupleFilesystemStoreBackend(
+        root_directory=project_path,
+        base_directory="store",
+        filepath_suffix=".json",
+    ).rebuild_key_index() is None
+
+
+def test_DatabaseStoreBackend_bulk_get(monkeypatch):
+    my_store = DatabaseStoreBackend(
+        credentials={"drivername": "sqlite"},
+        table_name="test_bulk_get",
+        key_columns=["run_id", "metric_name"],
+    )
+    for run_id in ["run_1", "run_2"]:
+        for idx in range(5):
+            my_store.set((run_id, "metric_" + str(idx)), run_id + "_" + str(idx))
+
+    monkeypatch.setattr(DatabaseStoreBackend, "get_many_chunk_size", 2)
+    assert my_store.get_many([("run_2", "metric_4"), ("run_1", "metric_0"), ("run_1", "metric_9")]) == \
+        ["run_2_4", "run_1_0", None]
+    assert my_store.get(("run_1", "metric_3")) == "run_1_3"
+    assert sorted(my_store.list_items(("run_1",))) == [
+        (("run_1", "metric_" + str(idx)), "run_1_" + str(idx)) for idx in range(5)
+    ]
+    assert len(my_store.list_items()) == 10
+
+
+
+@pytest.mark.parametrize("use_upsert", [True, False])
+def test_DatabaseStoreBackend_upsert_and_set_many(use_upsert):
+    my_store = DatabaseStoreBackend(
+        credentials={"drivername": "sqlite"},
+        table_name="test_upsert",
+        key_columns=["run_id", "metric_name"],
+    )
+    if not use_upsert:
+        # Dialects without an upsert update existing keys and insert the others
+        my_store._upsert_statement = None
+
+    assert my_store.has_key(("run_1", "metric_0")) is False
+    my_store.set(("run_1", "metric_0"), "a")
+    my_store.set(("run_1", "metric_0"), "b")
+    assert my_store.has_key(("run_1", "metric_0")) is True
+    assert my_store.get(("run_1", "metric_0")) == "b"
+
+    my_store.set_many([(("run_1", "metric_" + str(idx)), str(idx)) for idx in range(100)])
+    assert len(my_store.list_keys()) == 100
+    assert my_store.get(("run_1", "metric_0")) == "0"
+    assert my_store.get(("run_1", "metric_99")) == "99"
+
+    # Existing and new keys are written together; a key set twice keeps its last value
+    statements = []
+    sqlalchemy.event.listen(
+        my_store.engine, "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement)
+    )
+    my_store.set_many(
+        [(("run_1", "metric_" + str(idx)), "new_" + str(idx)) for idx in range(95, 105)] +
+        [(("run_1", "metric_100"), "last")]
+    )
+    set_many_statements = list(statements)
+    assert len(my_store.list_keys()) == 105
+    assert my_store.get_many([("run_1", "metric_95"), ("run_1", "metric_100"), ("run_1", "metric_104")]) == [
+        "new_95", "last", "new_104"
+    ]
+    if not use_upsert:
+        # One query for the existing keys, one executemany UPDATE and one executemany INSERT
+        assert len(set_many_statements) == 3
+        assert set_many_statements[0].startswith("SELECT")
+        assert set_many_statements[1].startswith("UPDATE")
+        assert set_many_statements[2].startswith("INSERT")
+
+    with pytest.raises(TypeError):
+        my_store.set_many([(("run_1", 1), "value")])
+
+
+def test_DatabaseStoreBackend_value_types():
+    json_store = DatabaseStoreBackend(
+        credentials={"drivername": "sqlite"},
+        table_name="test_json_values",
+        key_columns=["run_id"],
+        value_type="json",
+    )
+    json_store.set(("run_1",), json.dumps({"value": [1, 2]}))
+    assert json.loads(json_store.get(("run_1",))) == {"value": [1, 2]}
+    assert json_store.engine.execute(
+        "SELECT json_extract(value, '$.value[1]') FROM test_json_values"
+    ).fetchone()[0] == 2
+
+    binary_store = DatabaseStoreBackend(
+        credentials={"drivername": "sqlite"},
+        table_name="test_binary_values",
+        key_columns=["run_id"],
+        value_type="binary",
+    )
+    binary_store.set_many([(("run_1",), b"\x00\x01"), (("run_2",), u"caf\u00e9")])
+    assert binary_store.get_many([("run_1",), ("run_2",)]) == [b"\x00\x01", u"caf\u00e9".encode("utf-8")]
+
+    with pytest.raises(ValueError):
+        DatabaseStoreBackend(
+            credentials={"drivername": "sqlite"},
+            table_name="test_invalid_values",
+            key_columns=["run_id"],
+            value_type="xml",
+        )
+
+
+
+def test_CachingStoreBackend(tmp_path_factory):
+    project_path = str(tmp_path_factory.mktemp('test_CachingStoreBackend__dir'))
+    backend = TupleFilesystemStoreBackend(
+        root_directory=project_path,
+        base_directory="store",
+        filepath_suffix=".json",
+    )
+    my_store = CachingStoreBackend(backend, max_size=2)
+    my_store.set(("a",), "aaa")
+    my_store.set(("b",), "bbb")
+
+    assert my_store.get(("a",)) == "aaa"
+    assert my_store.get(("a",)) == "aaa"
+    assert my_store.get_many([("a",), ("b",)]) == ["aaa", "bbb"]
+    assert my_store.cache_info == {"hits": 2, "misses": 2, "size": 2, "max_size": 2}
+
+    # Sets through the cache invalidate the key
+    my_store.set(("a",), "aaaa")
+    assert my_store.get(("a",)) == "aaaa"
+
+    # Changes of the files are detected from their modification time and size
+    with open(os.path.join(project_path, "store", "b.json"), "w") as outfile:
+        outfile.write("bbbb")
+    assert my_store.get(("b",)) == "bbbb"
+
+    # The least recently used value is evicted
+    my_store.set(("c",), "ccc")
+    my_store.get(("c",))
+    assert my_store.cache_info["size"] == 2
+    misses = my_store.cache_info["misses"]
+    my_store.get(("a",))
+    assert my_store.cache_info["misses"] == misses + 1
+
+    assert sorted(my_store.list_keys()) == [("a",), ("b",), ("c",)]
+    assert my_store.has_key(("c",))
+
+
+def test_CachingStoreBackend_ttl(monkeypatch):
+    backend = InMemoryStoreBackend()
+    my_store = CachingStoreBackend(backend, ttl=10)
+    my_store.set(("a",), "aaa")
+
+    now = [1000.0]
+    monkeypatch.setattr("great_expectations.data_context.store.caching_store_backend.time.time", lambda: now[0])
+    assert my_store.get(("a",)) == "aaa"
+
+    # Changes that do not go through the cache are only seen once the ttl has expired
+    backend.set(("a",), "aaaa")
+    now[0] += 5
+    assert my_store.get(("a",)) == "aaa"
+    now[0] += 10
+    assert my_store.get(("a",)) == "aaaa"
+
+
+def test_store_backend_cache_configuration(tmp_path_factory):
+    project_path = str(tmp_path_factory.mktemp('test_store_backend_cache_configuration__dir'))
+    my_store = ExpectationsStore(
+        store_backend={
+            "class_name": "TupleFilesystemStoreBackend",
+            "base_directory": "expectations/",
+            "cache": {"max_size": 10},
+        },
+        runtime_environment={"root_directory": project_path}
+    )
+    assert isinstance(my_store.store_backend, CachingStoreBackend)
+    assert isinstance(my_store.store_backend.store_backend, TupleFilesystemStoreBackend)
+    assert my_store.store_backend.store_backend.filepath_suffix == ".json"
+
+
 @mock_s3
 def test_TupleS3StoreBackend():
     """
@@ -184,6 +414,53 @@ def test_TupleS3StoreBackend():
         'this_is_a_test_prefix/my_file_AAA', 'this_is_a_test_prefix/my_file_BBB'}
 
 
+@mock_s3
+def test_TupleS3StoreBackend_concurrent_and_paginated_operations():
+    bucket = "leakybucket"
+    conn = boto3.resource('s3', region_name='us-east-1')
+    conn.create_bucket(Bucket=bucket)
+    # Objects of another store in the same bucket
+    conn.Object(bucket, "other_prefix/suite/a.json").put(Body=b"{}")
+
+    my_store = TupleS3StoreBackend(
+        bucket=bucket,
+        prefix="",
+        filepath_suffix=".json",
+        max_workers=4
+    )
+    # More keys than are returned in a page of a listing
+    items = [(("suite_%d" % (i % 3), "run_%04d" % i), "value %d" % i) for i in range(1005)]
+    thread_count = threading.active_count()
+    my_store.set_many(items, content_type="application/json")
+    # The threads sending the requests are stopped once they are all sent
+    assert threading.active_count() == thread_count
+
+    keys = my_store.list_keys()
+    assert len(keys) == 1006
+    assert set(keys) == set([key for key, _ in items] + [("other_prefix", "suite", "a")])
+    assert set(my_store.list_keys(("suite_1",))) == set([key for key, _ in items if key[0] == "suite_1"])
+    assert my_store.list_keys(("suite_1", "run_0004")) == [("suite_1", "run_0004")]
+    assert my_store.list_keys(("suite",)) == []
+
+    assert my_store.get_many([("suite_2", "run_0005"), ("suite_0", "run_0000")]) == ["value 5", "value 0"]
+    assert my_store.has_key(("suite_0", "run_0003"))
+    assert not my_store.has_key(("suite_0", "run_0004"))
+
+    obj = boto3.client('s3').get_object(Bucket=bucket, Key="suite_0/run_0003.json")
+    assert obj["ContentType"] == "application/json"
+    assert threading.active_count() == thread_count
+
+    templated_store = TupleS3StoreBackend(
+        bucket=bucket,
+        prefix="templated",
+        filepath_template="{0}/runs/{1}.json",
+    )
+    templated_store.set_many([(("suite_a", "run_1"), "1"), (("suite_a", "run_2"), "2"), (("suite_b", "run_1"), "3")])
+    assert templated_store._get_list_prefix(("suite_a",)) == "templated/suite_a/runs/"
+    assert set(templated_store.list_keys(("suite_a",))) == {("suite_a", "run_1"), ("suite_a", "run_2")}
+    assert len(templated_store.list_keys()) == 3
+
+
 def test_TupleGCSStoreBackend():
 
     """
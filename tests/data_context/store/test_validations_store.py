@@ -1,6 +1,9 @@
+import datetime
 import json
+import os
 
 import pytest
+from mock import patch
 from moto import mock_s3
 import boto3
 
@@ -10,6 +13,7 @@ from great_expectations.data_context.store import (
 )
 from great_expectations.data_context.types.resource_identifiers import ValidationResultIdentifier, \
     ExpectationSuiteIdentifier
+from great_expectations.exceptions import DataContextError
 
 from great_expectations.util import (
     gen_directory_tree_str,
@@ -185,3 +189,242 @@ def test_ValidationsStore_with_DatabaseStoreBackend():
         ns_1,
         ns_2,
     }
+
+
+@pytest.mark.parametrize("store_backend", [
+    {"class_name": "InMemoryStoreBackend"},
+    {"class_name": "TupleFilesystemStoreBackend", "base_directory": "validations/"},
+    {"class_name": "TupleFilesystemStoreBackend", "base_directory": "validations/", "key_index": True},
+    {"class_name": "DatabaseStoreBackend", "credentials": {"drivername": "sqlite"}},
+])
+def test_ValidationsStore_run_lookups(tmp_path_factory, store_backend):
+    path = str(tmp_path_factory.mktemp('test_ValidationsStore_run_lookups__dir'))
+    my_store = ValidationsStore(
+        store_backend=store_backend,
+        runtime_environment={
+            "root_directory": path
+        }
+    )
+    for suite_name, run_id, batch_identifier in [
+        ("asset.warning", "20200101T000000.000000Z", "batch_1"),
+        ("asset.warning", "20200102T000000.000000Z", "batch_1"),
+        ("asset.warning", "20200102T000000.000000Z", "batch_2"),
+        ("asset.warning", "20200103T000000.000000Z", "batch_1"),
+        ("asset.warning.strict", "20200104T000000.000000Z", "batch_2"),
+        ("asset", "20200105T000000.000000Z", "batch_1"),
+    ]:
+        my_store.set(
+            ValidationResultIdentifier(ExpectationSuiteIdentifier(suite_name), run_id, batch_identifier),
+            ExpectationSuiteValidationResult(success=True)
+        )
+
+    assert my_store.get_latest_run_key("asset.warning") == ValidationResultIdentifier(
+        ExpectationSuiteIdentifier("asset.warning"), "20200103T000000.000000Z", "batch_1"
+    )
+    assert my_store.get_latest_run_key("asset.warning", batch_identifier="batch_2") == ValidationResultIdentifier(
+        ExpectationSuiteIdentifier("asset.warning"), "20200102T000000.000000Z", "batch_2"
+    )
+    assert my_store.get_latest_run_key("asset") == ValidationResultIdentifier(
+        ExpectationSuiteIdentifier("asset"), "20200105T000000.000000Z", "batch_1"
+    )
+    assert my_store.get_latest_run_key("asset.error") is None
+
+    run_keys = my_store.list_run_keys(
+        "asset.warning",
+        start_run_id=datetime.datetime(2020, 1, 2),
+        end_run_id="20200103T000000.000000Z"
+    )
+    assert [(key.run_id, key.batch_identifier) for key in run_keys] == [
+        ("20200103T000000.000000Z", "batch_1"),
+        ("20200102T000000.000000Z", "batch_2"),
+        ("20200102T000000.000000Z", "batch_1"),
+    ]
+    run_keys = my_store.list_run_keys(start_run_id="20200103T000000.000000Z", limit=2)
+    assert [(key.expectation_suite_identifier.expectation_suite_name, key.run_id) for key in run_keys] == [
+        ("asset", "20200105T000000.000000Z"),
+        ("asset.warning.strict", "20200104T000000.000000Z"),
+    ]
+
+
+def test_ValidationsStore_with_gzip_json_serialization_format(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('test_ValidationsStore_with_gzip_json_serialization_format__dir'))
+    store_backend = {
+        "class_name": "TupleFilesystemStoreBackend",
+        "base_directory": "my_store/",
+    }
+    runtime_environment = {
+        "root_directory": path
+    }
+    ns_1 = ValidationResultIdentifier(ExpectationSuiteIdentifier("asset.warning"), "20200101T000000.000000Z", "batch")
+    ns_2 = ValidationResultIdentifier(ExpectationSuiteIdentifier("asset.warning"), "20200102T000000.000000Z", "batch")
+    json_store = ValidationsStore(store_backend=dict(store_backend), runtime_environment=runtime_environment)
+    json_store.set(ns_1, ExpectationSuiteValidationResult(success=True))
+
+    my_store = ValidationsStore(
+        store_backend=dict(store_backend),
+        runtime_environment=runtime_environment,
+        serialization_format="gzip_json"
+    )
+    assert my_store.serialization_format == "gzip_json"
+    my_store.set(ns_2, ExpectationSuiteValidationResult(success=False))
+    with open(os.path.join(path, "my_store", "asset", "warning", "20200102T000000.000000Z", "batch.json.gz"),
+              "rb") as infile:
+        assert infile.read(2) == b"\x1f\x8b"
+
+    # Results written as json before the format was changed are still listed and read
+    assert set(my_store.list_keys()) == {ns_1, ns_2}
+    assert my_store.get(ns_1) == ExpectationSuiteValidationResult(success=True, statistics={}, results=[])
+    assert my_store.get(ns_2) == ExpectationSuiteValidationResult(success=False, statistics={}, results=[])
+    assert my_store.list_run_keys("asset.warning") == [ns_2, ns_1]
+
+    with pytest.raises(ValueError):
+        ValidationsStore(serialization_format="xml")
+
+
+def test_ValidationsStore_with_gzip_json_serialization_format_and_TupleGCSStoreBackend():
+    my_store = ValidationsStore(
+        store_backend={
+            "class_name": "TupleGCSStoreBackend",
+            "bucket": "leakybucket",
+            "prefix": "validations",
+            "project": "dummy-project",
+        },
+        serialization_format="gzip_json"
+    )
+    ns_1 = ValidationResultIdentifier(ExpectationSuiteIdentifier("asset.warning"), "20200101T000000.000000Z", "batch")
+    ns_2 = ValidationResultIdentifier(ExpectationSuiteIdentifier("asset.warning"), "20200102T000000.000000Z", "batch")
+
+    class Blob(object):
+        def __init__(self, name):
+            self.name = name
+
+    blobs = [
+        # Written as json before the format was changed
+        Blob("validations/asset/warning/20200101T000000.000000Z/batch.json"),
+        Blob("validations/asset/warning/20200102T000000.000000Z/batch.json.gz"),
+    ]
+    with patch("google.cloud.storage.Client", autospec=True) as mock_gcs_client:
+        mock_client = mock_gcs_client.return_value
+        mock_client.list_blobs.side_effect = lambda bucket, prefix: [
+            blob for blob in blobs if blob.name.startswith(prefix)
+        ]
+
+        assert set(my_store.list_keys()) == {ns_1, ns_2}
+
+
+def test_ValidationsStore_with_msgpack_serialization_format_and_DatabaseStoreBackend():
+    pytest.importorskip("msgpack")
+    my_store = ValidationsStore(
+        store_backend={
+            "class_name": "DatabaseStoreBackend",
+            "credentials": {"drivername": "sqlite"}
+        },
+        serialization_format="msgpack"
+    )
+    assert my_store.store_backend.value_type == "binary"
+
+    ns_1 = ValidationResultIdentifier(ExpectationSuiteIdentifier("asset.warning"), "20200101T000000.000000Z", "batch")
+    my_store.set(ns_1, ExpectationSuiteValidationResult(success=True, meta={"run_id": "20200101T000000.000000Z"}))
+    assert my_store.get(ns_1) == ExpectationSuiteValidationResult(
+        success=True, statistics={}, results=[], meta={"run_id": "20200101T000000.000000Z"}
+    )
+
+
+@pytest.mark.parametrize("store_config", [
+    {"store_backend": {"class_name": "TupleFilesystemStoreBackend", "base_directory": "validations/"}},
+    {
+        "store_backend": {"class_name": "TupleFilesystemStoreBackend", "base_directory": "validations/",
+                          "key_index": True},
+        "serialization_format": "gzip_json"
+    },
+])
+def test_ValidationsStore_apply_retention_policy(tmp_path_factory, store_config):
+    path = str(tmp_path_factory.mktemp('test_ValidationsStore_apply_retention_policy__dir'))
+    my_store = ValidationsStore(
+        runtime_environment={
+            "root_directory": path
+        },
+        retention_policy={"keep_last_runs": 2, "max_age_days": 90, "archive_after_days": 20},
+        **store_config
+    )
+    keys = [
+        ValidationResultIdentifier(ExpectationSuiteIdentifier(suite_name), run_id, batch_identifier)
+        for suite_name, run_id, batch_identifier in [
+            ("asset.warning", "20191001T000000.000000Z", "batch_1"),
+            ("asset.warning", "20200105T000000.000000Z", "batch_1"),
+            ("asset.warning", "20200105T000000.000000Z", "batch_2"),
+            ("asset.warning", "20200115T000000.000000Z", "batch_1"),
+            ("asset.warning", "20200210T000000.000000Z", "batch_1"),
+            ("asset.warning", "20200301T000000.000000Z", "batch_1"),
+            ("asset.warning", "profiling", "batch_1"),
+            ("asset", "20190101T000000.000000Z", "batch_1"),
+        ]
+    ]
+    for key in keys:
+        my_store.set(key, ExpectationSuiteValidationResult(success=True, meta={"run_id": key.run_id}))
+
+    now = datetime.datetime(2020, 3, 10)
+    report = my_store.apply_retention_policy(dry_run=True, now=now)
+    # Runs of asset.warning older than 90 days and not among its 2 most recent runs are removed
+    assert set(report["removed_keys"]) == {keys[0]}
+    # The results of runs older than 20 days are archived
+    assert set(report["archived_keys"]) == {keys[1], keys[2], keys[3], keys[4], keys[7]}
+    assert set(my_store.list_keys()) == set(keys)
+
+    my_store.apply_retention_policy(now=now)
+    assert set(my_store.list_keys()) == set(keys[1:])
+    archive_directory = os.path.join(path, "validations", "archives")
+    assert sorted(os.listdir(archive_directory)) == [
+        "2019-01.ge_archive.gz", "2020-01.ge_archive.gz", "2020-02.ge_archive.gz"
+    ]
+    assert not os.path.exists(os.path.join(path, "validations", "asset", "warning", "20200105T000000.000000Z"))
+
+    # Archived results are read and listed through the store
+    assert my_store.get(keys[2]) == ExpectationSuiteValidationResult(
+        success=True, statistics={}, results=[], meta={"run_id": keys[2].run_id}
+    )
+    assert my_store.has_key(keys[3])
+    assert my_store.list_run_keys("asset.warning", end_run_id="20200201") == [keys[3], keys[2], keys[1]]
+    assert my_store.get_latest_run_key("asset") == keys[7]
+
+    # Only the archives of the months covered by a range of runs are read
+    with patch.object(my_store, "_read_archive", wraps=my_store._read_archive) as mock_read_archive:
+        assert my_store.list_run_keys("asset.warning", start_run_id="20200201", end_run_id="20200228") == [keys[4]]
+        assert set(call[0][0] for call in mock_read_archive.call_args_list) == {"2020-02"}
+
+    # Applying the policy again changes nothing
+    report = my_store.apply_retention_policy(now=now)
+    assert report == {"removed_keys": [], "archived_keys": []}
+
+    my_store.remove_many([keys[1], keys[2]])
+    my_store.remove_key(keys[3])
+    assert set(my_store.list_keys()) == set(keys[4:])
+    assert sorted(os.listdir(archive_directory)) == ["2019-01.ge_archive.gz", "2020-02.ge_archive.gz"]
+
+
+def test_ValidationsStore_without_archives_does_not_list_archives(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('test_ValidationsStore_without_archives_does_not_list_archives__dir'))
+    my_store = ValidationsStore(
+        store_backend={"class_name": "TupleFilesystemStoreBackend", "base_directory": "validations/"},
+        runtime_environment={
+            "root_directory": path
+        },
+        retention_policy={"keep_last_runs": 2},
+    )
+    keys = [
+        ValidationResultIdentifier(ExpectationSuiteIdentifier("asset.warning"), run_id, "batch_1")
+        for run_id in ["20200105T000000.000000Z", "20200115T000000.000000Z"]
+    ]
+    for key in keys:
+        my_store.set(key, ExpectationSuiteValidationResult(success=True))
+
+    # Without archive_after_days, the store has no archives to read
+    assert my_store._archive_store_backend is None
+    with patch.object(my_store, "_read_archive") as mock_read_archive:
+        assert set(my_store.list_keys()) == set(keys)
+        assert my_store.get_latest_run_key("asset.warning") == keys[1]
+        assert my_store.has_key(keys[0])
+    assert mock_read_archive.call_count == 0
+
+    with pytest.raises(DataContextError):
+        my_store.archive(keys)
@@ -1,4 +1,5 @@
 import pytest
+from mock import patch
 
 from tests.test_utils import get_dataset
 from collections import OrderedDict
@@ -35,6 +36,195 @@ def test_caching(test_backend):
         dataset.get_column_max.cache_info()
 
 
+def test_prefetch_column_aggregates(test_backend):
+    dataset = get_dataset(test_backend, data, schemas=schemas.get(test_backend), caching=True)
+    reference = get_dataset(test_backend, data, schemas=schemas.get(test_backend), caching=False)
+    dataset.prefetch_column_aggregates({
+        "a": ["nonnull_count", "unique_count", "min", "max", "mean"],
+        "d": ["nonnull_count", "min", "max"],
+    })
+    assert dataset.get_column_nonnull_count("a") == reference.get_column_nonnull_count("a")
+    assert dataset.get_column_unique_count("a") == reference.get_column_unique_count("a")
+    assert dataset.get_column_min("a") == reference.get_column_min("a")
+    assert dataset.get_column_max("a") == reference.get_column_max("a")
+    assert dataset.get_column_mean("a") == reference.get_column_mean("a")
+    assert dataset.get_column_nonnull_count("d") == reference.get_column_nonnull_count("d") == 1
+    assert dataset.get_column_max("d") == reference.get_column_max("d")
+
+    with pytest.raises(ValueError):
+        dataset.prefetch_column_aggregates({"a": ["not_an_aggregate"]})
+
+
+def test_prefetched_column_aggregates_are_used(test_backend):
+    dataset = get_dataset(test_backend, data, schemas=schemas.get(test_backend), caching=True)
+    dataset._get_column_aggregates = lambda column_aggregates: {"b": {"max": 100, "nonnull_count": 42}}
+    dataset.prefetch_column_aggregates({"b": ["max", "nonnull_count"]})
+    assert dataset.get_column_max("b") == 100
+    assert dataset.get_column_nonnull_count("b") == 42
+    # only the default options are prefetched
+    assert dataset.get_column_max("b", parse_strings_as_datetimes=False) == 100
+    assert dataset.get_column_min("b") == 5
+
+
+def test_worker_copies_share_cached_getter_results():
+    with patch.object(PandasDataset, "get_column_median", autospec=True, return_value=3.5) as mock_get_column_median:
+        dataset = PandasDataset(data)
+        assert dataset.get_column_median("a") == 3.5
+        worker_copy = dataset._get_worker_copy()
+        assert worker_copy.get_column_median("a") == 3.5
+        assert mock_get_column_median.call_count == 1
+
+        # Results computed by a worker copy are shared too
+        another_worker_copy = dataset._get_worker_copy()
+        assert worker_copy.get_column_median("b") == 3.5
+        assert another_worker_copy.get_column_median("b") == 3.5
+        assert mock_get_column_median.call_count == 2
+
+
+def test_random_sample(test_backend):
+    sample_data = {"x": list(range(100)), "y": [str(i) for i in range(100)]}
+    dataset = get_dataset(test_backend, sample_data, caching=True)
+    dataset.expect_column_values_to_not_be_null("x")
+
+    sample = dataset.random_sample(n=10, seed=42)
+    assert isinstance(sample, dataset.__class__)
+    assert sample.get_row_count() == 10
+    assert sample.get_table_columns() == ["x", "y"]
+    assert set(sample.get_column_value_counts("x").index) <= set(range(100))
+    assert sample.get_expectation_suite() == dataset.get_expectation_suite()
+    assert sample.batch_kwargs == dataset.batch_kwargs
+
+    assert dataset.random_sample(n=1000).get_row_count() == 100
+    assert 0 < dataset.random_sample(fraction=0.5, seed=42).get_row_count() <= 100
+
+    with pytest.raises(ValueError):
+        dataset.random_sample()
+    with pytest.raises(ValueError):
+        dataset.random_sample(n=10, fraction=0.1)
+    with pytest.raises(ValueError):
+        dataset.random_sample(fraction=1.5)
+
+
+def test_validate_sample(test_backend):
+    sample_data = {
+        "x": list(range(1000)),
+        "y": ["a"] * 990 + ["b"] * 10,
+        "w": ["a"] * 1000,
+        "z": ["a"] * 500 + ["b"] * 500,
+    }
+    dataset = get_dataset(test_backend, sample_data, caching=True)
+    dataset.expect_column_values_to_not_be_null("x")
+    dataset.expect_column_values_to_be_in_set("y", ["a"], mostly=0.5)
+    dataset.expect_column_values_to_be_in_set("w", ["a"], mostly=0.99)
+    dataset.expect_column_values_to_be_in_set("z", ["a"], mostly=0.95)
+    dataset.expect_table_row_count_to_equal(1000)
+
+    def by_expectation(results):
+        return dict(
+            ((result.expectation_config.expectation_type, result.expectation_config.kwargs.get("column")), result)
+            for result in results.results
+        )
+
+    results = dataset.validate(sample={"n": 200, "seed": 42}, result_format="SUMMARY")
+    sampled_results = by_expectation(results)
+    assert sampled_results[("expect_column_values_to_not_be_null", "x")].meta["sample"]["outcome"] == "inconclusive"
+    assert sampled_results[("expect_column_values_to_be_in_set", "y")].meta["sample"]["outcome"] == "pass"
+    assert sampled_results[("expect_column_values_to_be_in_set", "w")].meta["sample"]["outcome"] == "inconclusive"
+    assert sampled_results[("expect_column_values_to_be_in_set", "z")].meta["sample"]["outcome"] == "fail"
+    assert sampled_results[("expect_column_values_to_be_in_set", "y")].success is True
+    assert sampled_results[("expect_column_values_to_be_in_set", "z")].success is False
+    # the row count is evaluated on the full dataset
+    assert "sample" not in sampled_results[("expect_table_row_count_to_equal", None)].meta
+    assert sampled_results[("expect_table_row_count_to_equal", None)].success is True
+    assert results.meta["sample"]["sample_size"] == 200
+    assert results.meta["sample"]["outcomes"] == {"pass": 1, "fail": 1, "inconclusive": 2}
+    lower, upper = sampled_results[("expect_column_values_to_be_in_set", "y")].meta["sample"]["success_ratio_interval"]
+    assert 0.5 <= lower <= upper <= 1
+
+    results = dataset.validate(sample={"n": 200, "seed": 42}, escalate_inconclusive=True)
+    sampled_results = by_expectation(results)
+    assert sampled_results[("expect_column_values_to_be_in_set", "w")].success is True
+    assert sampled_results[("expect_column_values_to_be_in_set", "w")].meta["sample"]["escalated"] is True
+    assert sampled_results[("expect_column_values_to_be_in_set", "w")].result["element_count"] == 1000
+    assert sampled_results[("expect_column_values_to_be_in_set", "y")].result["element_count"] == 200
+    assert results.statistics["unsuccessful_expectations"] == 1
+
+
+def test_validate_sample_evaluates_other_expectations_on_the_full_dataset_only(test_backend):
+    dataset_class = type(get_dataset(test_backend, {"x": [1]}))
+    # Getters are bound when a dataset is created
+    with patch.object(dataset_class, "get_column_max", autospec=True,
+                      side_effect=dataset_class.get_column_max) as mock_get_column_max:
+        dataset = get_dataset(test_backend, {"x": list(range(100))}, caching=False)
+        dataset.expect_column_max_to_be_between("x", 0, 99)
+        dataset.expect_column_values_to_be_between("x", 0, 99)
+        mock_get_column_max.reset_mock()
+        results = dataset.validate(sample={"n": 10, "seed": 42})
+    assert mock_get_column_max.call_count == 1
+    assert mock_get_column_max.call_args[0][0] is dataset
+    # Results keep the order of the suite
+    expectation_types = [result.expectation_config.expectation_type for result in results.results]
+    assert expectation_types.index("expect_column_max_to_be_between") < \
+        expectation_types.index("expect_column_values_to_be_between")
+    results_by_type = dict((result.expectation_config.expectation_type, result) for result in results.results)
+    assert results_by_type["expect_column_max_to_be_between"].result["observed_value"] == 99
+    assert results_by_type["expect_column_values_to_be_between"].result["element_count"] == 10
+    assert results.meta["sample"]["sample_size"] == 10
+
+    # Without map expectations, the dataset is not sampled
+    dataset = get_dataset(test_backend, {"x": list(range(100))}, caching=False)
+    dataset.expect_column_max_to_be_between("x", 0, 99)
+    with patch.object(dataset_class, "random_sample", autospec=True) as mock_random_sample:
+        results = dataset.validate(sample={"n": 10, "seed": 42})
+    assert mock_random_sample.call_count == 0
+    assert results.success
+    assert results.meta["sample"]["sample_size"] == 0
+
+
+def test_validate_partition_by(test_backend):
+    partitioned_data = {
+        "country": ["US", "US", "FR", "FR", "FR", "DE"],
+        "day": [1, 2, 1, 1, 2, 1],
+        "x": [1, 2, 3, 30, 4, 5],
+    }
+    dataset = get_dataset(test_backend, partitioned_data, caching=True)
+    dataset.expect_column_values_to_be_between("x", min_value=0, max_value=10)
+    dataset.expect_column_max_to_be_between("x", min_value=0, max_value=10)
+    dataset.expect_table_row_count_to_be_between(min_value=2)
+
+    def by_expectation(results):
+        return dict((result.expectation_config.expectation_type, result) for result in results.results)
+
+    results = dataset.validate(partition_by="country", result_format="SUMMARY")
+    assert list(results.keys()) == [("DE",), ("FR",), ("US",)]
+    assert results[("DE",)].meta["partition"] == {"country": "DE"}
+    assert [results[key].success for key in results] == [False, False, True]
+
+    fr_results = by_expectation(results[("FR",)])
+    assert fr_results["expect_column_values_to_be_between"].result["element_count"] == 3
+    assert fr_results["expect_column_values_to_be_between"].result["partial_unexpected_list"] == [30]
+    assert fr_results["expect_column_max_to_be_between"].result["observed_value"] == 30
+    assert fr_results["expect_table_row_count_to_be_between"].result["observed_value"] == 3
+    de_results = by_expectation(results[("DE",)])
+    assert de_results["expect_column_values_to_be_between"].success is True
+    assert de_results["expect_table_row_count_to_be_between"].success is False
+
+    results = dataset.validate(partition_by=["country", "day"], only_return_failures=True)
+    assert list(results.keys()) == [("DE", 1), ("FR", 1), ("FR", 2), ("US", 1), ("US", 2)]
+    assert results[("FR", 1)].meta["partition"] == {"country": "FR", "day": 1}
+    assert len(results[("FR", 1)].results) == 2
+    assert len(results[("FR", 2)].results) == 1
+
+    # The whole dataset is still validated as usual
+    results = dataset.validate()
+    assert results.statistics["evaluated_expectations"] == \
+        len(dataset.get_expectation_suite(discard_failed_expectations=False).expectations)
+    assert results.statistics["unsuccessful_expectations"] == 2
+
+    with pytest.raises(ValueError):
+        dataset.validate(partition_by="not_a_column")
+
+
 def test_head(test_backend):
     dataset = get_dataset(test_backend, data, schemas=schemas.get(test_backend), caching=True)
     dataset.expect_column_mean_to_be_between("b", 5, 5)
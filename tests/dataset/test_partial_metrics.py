@@ -0,0 +1,117 @@
+import json
+from decimal import Decimal
+
+import pandas as pd
+import pytest
+
+from great_expectations.dataset import PandasDataset
+from great_expectations.dataset.partial_metrics import PartialMetrics
+from great_expectations.exceptions import GreatExpectationsError
+
+from ..test_utils import get_dataset
+
+
+def test_prior_metrics_combine_with_new_rows(test_backend):
+    old_rows = {"a": [1, 2, 2, None], "b": ["x", "y", "y", "z"]}
+    new_rows = {"a": [3, 5, None], "b": ["z", "w", "w"]}
+    full_dataset = get_dataset(test_backend, {column: old_rows[column] + new_rows[column] for column in old_rows})
+
+    prior_metrics = get_dataset(test_backend, old_rows).get_partial_metrics()
+    prior_metrics = PartialMetrics.from_json_dict(json.loads(json.dumps(prior_metrics.to_json_dict())))
+    assert prior_metrics.row_count == 4
+    assert "sum" not in prior_metrics.to_json_dict()["columns"]["b"]
+
+    dataset = get_dataset(test_backend, new_rows)
+    dataset.set_prior_metrics(prior_metrics)
+    assert dataset.get_row_count() == full_dataset.get_row_count() == 7
+    for column in ["a", "b"]:
+        assert dataset.get_column_nonnull_count(column) == full_dataset.get_column_nonnull_count(column)
+        assert dataset.get_column_min(column) == full_dataset.get_column_min(column)
+        assert dataset.get_column_max(column) == full_dataset.get_column_max(column)
+        assert dataset.get_column_cardinality_sketch(column) == full_dataset.get_column_cardinality_sketch(column)
+        assert dataset.get_column_frequent_items_sketch(column).get_modes() == \
+            full_dataset.get_column_frequent_items_sketch(column).get_modes()
+    assert dataset.get_column_sum("a") == full_dataset.get_column_sum("a") == 13
+    assert dataset.get_column_mean("a") == full_dataset.get_column_mean("a") == 2.6
+    assert dataset.get_partial_metrics() == full_dataset.get_partial_metrics()
+    assert dataset.expect_table_row_count_to_equal(7).success
+
+    # Without prior metrics, only the new rows are described
+    dataset.set_prior_metrics(None)
+    assert dataset.get_row_count() == 3
+    assert dataset.get_column_min("a") == 3
+
+    # Columns that are not in the prior metrics cannot be combined
+    dataset = get_dataset(test_backend, {"c": [1, 2]})
+    dataset.set_prior_metrics(prior_metrics)
+    with pytest.raises(GreatExpectationsError):
+        dataset.get_column_nonnull_count("c")
+
+
+def test_partial_metrics_of_datetime_and_decimal_columns_round_trip_through_json():
+    old_rows = {
+        "ts": pd.to_datetime(["2020-01-01", "2020-01-02", "2020-01-02", None]),
+        "amount": [Decimal("1.5"), Decimal("2.5"), Decimal("2.5"), None],
+    }
+    new_rows = {
+        "ts": pd.to_datetime(["2020-01-02", "2020-01-03", "2020-01-03"]),
+        "amount": [Decimal("4"), Decimal("2.5"), None],
+    }
+    full_dataset = PandasDataset({column: list(old_rows[column]) + list(new_rows[column]) for column in old_rows})
+
+    prior_metrics = PandasDataset(old_rows).get_partial_metrics()
+    metrics_json = json.dumps(prior_metrics.to_json_dict())
+    loaded_metrics = PartialMetrics.from_json_dict(json.loads(metrics_json))
+    assert loaded_metrics == prior_metrics
+    assert loaded_metrics.to_json_dict()["columns"]["ts"]["frequent_items_sketch"]["items"][0] == \
+        ["2020-01-02T00:00:00", 2]
+
+    dataset = PandasDataset(new_rows)
+    dataset.set_prior_metrics(loaded_metrics)
+    assert dataset.get_column_min("ts") == full_dataset.get_column_min("ts")
+    assert dataset.get_column_max("ts") == full_dataset.get_column_max("ts")
+    assert dataset.get_column_frequent_items_sketch("ts").get_modes() == [pd.Timestamp("2020-01-02")]
+    assert dataset.get_column_cardinality_sketch("ts") == full_dataset.get_column_cardinality_sketch("ts")
+    assert dataset.get_column_sum("amount") == 13
+    assert dataset.get_column_frequent_items_sketch("amount").get_modes() == [Decimal("2.5")]
+    assert dataset.get_partial_metrics() == full_dataset.get_partial_metrics()
+
+
+def test_prior_metrics_proportion_of_unique_values_uses_combined_sketch(test_backend):
+    prior_metrics = get_dataset(test_backend, {"a": list(range(1, 101))}).get_partial_metrics()
+    dataset = get_dataset(test_backend, {"a": list(range(101, 111))})
+    dataset.set_prior_metrics(prior_metrics)
+
+    # The unique values of the new rows are not divided by the non-null count of the whole asset
+    result = dataset.expect_column_proportion_of_unique_values_to_be_between(
+        "a", min_value=0.95, result_format="SUMMARY"
+    )
+    assert result.success
+    assert result.result["observed_value"] >= 0.95
+    assert "sketch" in result.result["details"]
+
+
+def test_prior_metrics_kl_divergence_cannot_be_combined(test_backend):
+    prior_metrics = get_dataset(test_backend, {"a": [1, 2, 2, 3]}).get_partial_metrics()
+    dataset = get_dataset(test_backend, {"a": [1, 2, 3, 3]})
+    dataset.set_prior_metrics(prior_metrics)
+    partition_object = {"values": [1, 2, 3], "weights": [0.25, 0.5, 0.25]}
+
+    with pytest.raises(GreatExpectationsError):
+        dataset.expect_column_kl_divergence_to_be_less_than("a", partition_object=partition_object, threshold=0.1)
+
+    result = dataset.expect_column_kl_divergence_to_be_less_than(
+        "a", partition_object=partition_object, threshold=0.1, catch_exceptions=True
+    )
+    assert not result.success
+    assert "cannot be evaluated with prior_metrics" in result.exception_info["exception_message"]
+
+
+def test_prior_metrics_chisquare_test_cannot_be_combined(test_backend):
+    prior_metrics = get_dataset(test_backend, {"a": [1, 2, 2, 3]}).get_partial_metrics()
+    dataset = get_dataset(test_backend, {"a": [1, 2, 3, 3]})
+    dataset.set_prior_metrics(prior_metrics)
+    partition_object = {"values": [1, 2, 3], "weights": [0.25, 0.5, 0.25]}
+
+    with pytest.raises(GreatExpectationsError):
+        dataset.expect_column_chisquare_test_p_value_to_be_greater_than("a", partition_object=partition_object)
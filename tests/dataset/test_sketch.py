@@ -0,0 +1,162 @@
+import json
+
+import numpy as np
+import pytest
+
+from great_expectations.core.metric import ValidationMetricIdentifier
+from great_expectations.data_context.store import MetricStore
+from great_expectations.dataset.sketch import (
+    FrequentItemsSketch,
+    HyperLogLogSketch,
+    KLLSketch,
+    merge_sketches,
+    sketch_from_json_dict,
+)
+from great_expectations.exceptions import GreatExpectationsError
+
+from ..test_utils import get_dataset
+
+
+@pytest.fixture
+def random_values():
+    return np.random.RandomState(42).normal(size=20000)
+
+
+def test_hll_estimate_and_merge():
+    values = np.random.RandomState(0).randint(0, 5000, size=20000)
+    sketch = HyperLogLogSketch().update(values)
+    assert abs(sketch.get_estimate() - len(set(values))) / len(set(values)) < 0.05
+
+    left = HyperLogLogSketch().update(values[:10000])
+    right = HyperLogLogSketch().update(values[10000:])
+    assert left.merge(right) == sketch
+
+    assert round(HyperLogLogSketch().update(["a", "b", "c", "a"]).get_estimate()) == 3
+    assert HyperLogLogSketch().get_estimate() == 0
+
+
+def test_hll_treats_integral_floats_as_integers():
+    assert HyperLogLogSketch().update([1, 2, 3]) == HyperLogLogSketch().update([1.0, 2.0, np.int64(3)])
+
+
+def test_kll_quantiles_and_merge(random_values):
+    quantiles = [0.05, 0.25, 0.5, 0.75, 0.95]
+    sketch = KLLSketch(seed=1).update(random_values)
+    assert sketch.n == len(random_values)
+    assert np.allclose(sketch.get_quantiles(quantiles), np.quantile(random_values, quantiles), atol=0.05)
+    assert sketch.get_quantiles([0, 1]) == [random_values.min(), random_values.max()]
+
+    merged = KLLSketch(seed=1).update(random_values[:5000])
+    merged.merge(KLLSketch(seed=2).update(random_values[5000:]))
+    assert merged.n == len(random_values)
+    assert np.allclose(merged.get_quantiles(quantiles), np.quantile(random_values, quantiles), atol=0.05)
+    assert abs(merged.get_rank(0) - 0.5) < 0.02
+
+    assert KLLSketch().get_quantiles([0.5]) == [None]
+
+
+def test_frequent_items_bounds_and_merge():
+    values = np.random.RandomState(0).zipf(2, size=20000)
+    true_counts = np.bincount(values)
+    sketch = FrequentItemsSketch(max_items=10).update(values)
+    assert sketch.get_modes() == [1]
+    assert sketch.max_error <= len(values) / 11
+    for value, count in sketch.get_frequent_items():
+        assert count <= true_counts[value] <= count + sketch.max_error
+
+    merged = FrequentItemsSketch(max_items=10).update(values[:10000])
+    merged.merge(FrequentItemsSketch(max_items=10).update(values[10000:]))
+    assert merged.n == len(values)
+    assert merged.get_modes() == [1]
+
+    assert FrequentItemsSketch().update(["a", "b", "b", "a"]).get_modes() == ["a", "b"]
+
+
+def test_sketch_json_round_trip(random_values):
+    for sketch in [
+        HyperLogLogSketch(precision=10).update(random_values),
+        KLLSketch().update(random_values),
+        FrequentItemsSketch().update(np.round(random_values)),
+    ]:
+        sketch_dict = json.loads(json.dumps(sketch.to_json_dict()))
+        assert sketch_from_json_dict(sketch_dict) == sketch
+
+    with pytest.raises(GreatExpectationsError):
+        sketch_from_json_dict({"sketch_type": "not_a_sketch"})
+
+
+def test_merge_requires_compatible_sketches():
+    with pytest.raises(GreatExpectationsError):
+        HyperLogLogSketch(precision=10).merge(HyperLogLogSketch(precision=12))
+    with pytest.raises(GreatExpectationsError):
+        KLLSketch().merge(HyperLogLogSketch())
+    with pytest.raises(ValueError):
+        merge_sketches([])
+
+
+def test_dataset_sketches(test_backend):
+    data = {
+        "a": [1, 2, 2, 3, 3, 3, None, 4, 4, 4, 4],
+        "b": ["x", "y", "y", "z", "z", "z", None, "w", "w", "w", "w"]
+    }
+    dataset = get_dataset(test_backend, data)
+
+    assert round(dataset.get_column_cardinality_sketch("a").get_estimate()) == 4
+    assert round(dataset.get_column_cardinality_sketch("b").get_estimate()) == 4
+    assert dataset.get_column_quantile_sketch("a").get_quantiles([0, 0.5, 1]) == [1, 3, 4]
+    assert dataset.get_column_frequent_items_sketch("b").get_modes() == ["w"]
+    assert dataset.get_column_frequent_items_sketch("b").n == 10
+
+
+def test_approximate_aggregate_expectations(test_backend):
+    data = {
+        "a": [1, 2, 2, 3, 3, 3, None, 4, 4, 4, 4],
+    }
+    dataset = get_dataset(test_backend, data)
+
+    result = dataset.expect_column_unique_value_count_to_be_between("a", 3, 5, approximate=True,
+                                                                    result_format="SUMMARY")
+    assert result.success
+    assert result.result["observed_value"] == 4
+    assert sketch_from_json_dict(result.result["details"]["sketch"]) == dataset.get_column_cardinality_sketch("a")
+
+    result = dataset.expect_column_proportion_of_unique_values_to_be_between("a", 0.3, 0.5, approximate=True)
+    assert result.success
+    assert result.result["observed_value"] == 0.4
+
+    result = dataset.expect_column_most_common_value_to_be_in_set("a", [4], approximate=True)
+    assert result.success
+    assert result.result["observed_value"] == [4]
+
+    result = dataset.expect_column_quantile_values_to_be_between(
+        "a",
+        quantile_ranges={
+            "quantiles": [0., 0.5, 1.],
+            "value_ranges": [[1, 1], [2, 3], [4, 4]]
+        },
+        approximate=True
+    )
+    assert result.success
+    assert result.result["observed_value"]["values"] == [1, 3, 4]
+
+
+def test_sketches_from_metric_store_can_be_merged_across_batches():
+    metric_store = MetricStore()
+    batches = [
+        get_dataset("PandasDataset", {"a": list(range(0, 100))}),
+        get_dataset("PandasDataset", {"a": list(range(50, 150))}),
+    ]
+    for idx, batch in enumerate(batches):
+        result = batch.expect_column_unique_value_count_to_be_between("a", approximate=True, result_format="SUMMARY")
+        metric_store.set(
+            ValidationMetricIdentifier(
+                run_id="run_" + str(idx),
+                expectation_suite_identifier="my_suite",
+                metric_name="expect_column_unique_value_count_to_be_between.result.details.sketch",
+                metric_kwargs_id="column=a"
+            ),
+            result.result["details"]["sketch"]
+        )
+
+    stored_sketches = [metric_store.get(key) for key in metric_store.list_keys()]
+    assert abs(merge_sketches(stored_sketches).get_estimate() - 150) < 5
@@ -7,7 +7,13 @@ import numpy as np
 import sqlalchemy.dialects.sqlite as sqlite_dialect
 
 from great_expectations.dataset import SqlAlchemyDataset
-from great_expectations.dataset.util import build_continuous_partition_object, is_valid_continuous_partition_object
+from great_expectations.dataset.util import (
+    build_continuous_partition_object,
+    is_valid_continuous_partition_object,
+    mean_confidence_interval,
+    quantile_confidence_rank_bounds,
+    wilson_interval,
+)
 
 
 def test_build_continuous_partition_object(numeric_high_card_dataset, numeric_high_card_dict):
@@ -53,3 +59,19 @@ def test_build_continuous_partition_object(numeric_high_card_dataset, numeric_hi
     assert np.allclose(partition["weights"], weights / n)
     assert np.allclose(partition["bins"], bin_edges)
     assert is_valid_continuous_partition_object(partition)
+
+
+def test_confidence_intervals():
+    lower, upper = wilson_interval(10, 100)
+    assert lower < 0.1 < upper
+    assert np.allclose([lower, upper], [0.0552, 0.1744], atol=1e-4)
+    assert wilson_interval(0, 100)[0] == 0
+    assert wilson_interval(0, 0) is None
+
+    lower, upper = mean_confidence_interval(5, 2, 100)
+    assert np.allclose([lower, upper], [4.6032, 5.3968], atol=1e-4)
+    assert mean_confidence_interval(5, None, 100) is None
+
+    lower, upper = quantile_confidence_rank_bounds(0.5, 100)
+    assert np.allclose([lower, upper], [0.402, 0.598], atol=1e-3)
+    assert quantile_confidence_rank_bounds(0.99, 10)[1] == 1
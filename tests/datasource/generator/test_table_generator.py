@@ -1,9 +1,16 @@
+import pandas as pd
 import pytest
 
+from great_expectations.core import ExpectationSuite
+from great_expectations.dataset import SqlAlchemyDataset
 from great_expectations.exceptions import BatchKwargsError
 from great_expectations.datasource import SqlAlchemyDatasource
-from great_expectations.datasource.types import SqlAlchemyDatasourceTableBatchKwargs
+from great_expectations.datasource.types import (
+    SqlAlchemyDatasourceQueryBatchKwargs,
+    SqlAlchemyDatasourceTableBatchKwargs,
+)
 from great_expectations.datasource.generator import TableBatchKwargsGenerator
+from great_expectations.validator.validator import Validator
 
 
 def test_basic_operation(basic_sqlalchemy_datasource):
@@ -99,3 +106,72 @@ def test_query_generator_view(sqlite_view_engine):
         ("main.test_table", "table"),
         ("main.test_view", "view")
     }
+
+
+def test_incremental_batch_kwargs(sqlitedb_engine):
+    pd.DataFrame({"id": [1, 2, 3, 4, 5], "amount": [10., 20., 30., 40., 50.]}).to_sql(
+        "events", con=sqlitedb_engine, index=False)
+    datasource = SqlAlchemyDatasource(engine=sqlitedb_engine, generators={
+        "table": {
+            "class_name": "TableBatchKwargsGenerator",
+            "assets": {
+                "events": {
+                    "table": "events",
+                    "watermark_column": "id"
+                }
+            }
+        }
+    })
+    table_generator = datasource.get_generator("table")
+
+    def get_dataset(batch_kwargs):
+        return Validator(datasource.get_batch(batch_kwargs), expectation_suite=ExpectationSuite("test"),
+                         expectation_engine=SqlAlchemyDataset).get_dataset()
+
+    batch_kwargs = table_generator.build_batch_kwargs("events", incremental=True)
+    assert isinstance(batch_kwargs, SqlAlchemyDatasourceQueryBatchKwargs)
+    assert batch_kwargs["watermark"]["low"] is None
+    assert batch_kwargs["watermark"]["high"] == 5
+    dataset = get_dataset(batch_kwargs)
+    assert dataset.prior_metrics is None
+    assert dataset.get_row_count() == 5
+    assert table_generator.update_watermark(dataset) == 5
+    assert table_generator.get_watermark("events") == 5
+
+    pd.DataFrame({"id": [6, 7, 8], "amount": [60., 70., None]}).to_sql(
+        "events", con=sqlitedb_engine, index=False, if_exists="append")
+    batch_kwargs = table_generator.build_batch_kwargs("events", incremental=True)
+    assert batch_kwargs["watermark"]["low"] == 5
+    assert batch_kwargs["watermark"]["high"] == 8
+    dataset = get_dataset(batch_kwargs)
+    assert dataset.prior_metrics.row_count == 5
+    # Only the new rows are read...
+    assert len(dataset.head(10)) == 3
+    assert dataset.expect_column_values_to_be_between("id", min_value=6, max_value=8).success
+    # ... but table-level and aggregate expectations describe the whole table
+    assert dataset.expect_table_row_count_to_equal(8).success
+    assert dataset.expect_column_min_to_be_between("id", 1, 1).success
+    assert dataset.expect_column_max_to_be_between("amount", 70, 70).success
+    assert dataset.expect_column_sum_to_be_between("amount", 280, 280).success
+    assert dataset.expect_column_mean_to_be_between("amount", 40, 40).success
+    result = dataset.expect_column_values_to_not_be_null("amount", mostly=0.6)
+    assert result.success
+    assert result.result["element_count"] == 3
+    result = dataset.expect_column_unique_value_count_to_be_between("id", 8, 8, approximate=True)
+    assert result.success
+
+    assert table_generator.update_watermark(dataset) == 8
+    assert table_generator.get_watermark("events") == 8
+    # Batches built from a superseded watermark cannot be loaded
+    with pytest.raises(BatchKwargsError):
+        datasource.get_batch(batch_kwargs)
+
+    # Without new rows, the batch is empty but still describes the whole table
+    dataset = get_dataset(table_generator.build_batch_kwargs("events", incremental=True))
+    assert len(dataset.head(10)) == 0
+    assert dataset.get_row_count() == 8
+    assert dataset.get_column_nonnull_count("amount") == 7
+
+    with pytest.raises(BatchKwargsError) as exc:
+        table_generator.build_batch_kwargs("main.events", incremental=True)
+    assert "no watermark_column is configured" in exc.value.message
@@ -174,6 +174,71 @@ def test_sqlalchemy_source_limit(sqlitedb_engine):
     assert limited_dataset.head(10)['col_1'][0] == 3  # offset should have been applied
 
 
+def test_sqlalchemy_source_query_without_temp_table(sqlitedb_engine):
+    pd.DataFrame({'col_1': [1, 2, 3]}).to_sql('table_3', con=sqlitedb_engine, index=False)
+    datasource = SqlAlchemyDatasource('SqlAlchemy', engine=sqlitedb_engine)
+    batch = datasource.get_batch({"query": "select * from table_3 where col_1 > 1", "create_temp_table": False})
+    dataset = Validator(batch, expectation_suite=ExpectationSuite("test"),
+                        expectation_engine=SqlAlchemyDataset).get_dataset()
+    assert dataset._create_temp_table is False  # the query is used as a subquery
+    assert dataset.get_row_count() == 2
+    assert dataset.expect_column_values_to_be_between("col_1", min_value=2, max_value=3).success is True
+
+
+def test_sqlalchemy_datasource_pool_and_reflection_cache_options(tmp_path_factory):
+    db_file = os.path.join(str(tmp_path_factory.mktemp("db")), "test.db")
+    datasource = SqlAlchemyDatasource('SqlAlchemy', connection_string="sqlite:///" + db_file,
+                                      pool_pre_ping=True, reflection_cache_ttl=60)
+    assert datasource.engine.pool._pre_ping is True
+    assert datasource.config["reflection_cache_ttl"] == 60
+    pd.DataFrame({'col_1': [1, 2, 3]}).to_sql('table_1', con=datasource.engine, index=False)
+
+    datasets = [
+        Validator(datasource.get_batch({"table": "table_1"}), expectation_suite=ExpectationSuite("test"),
+                  expectation_engine=SqlAlchemyDataset).get_dataset()
+        for _ in range(2)
+    ]
+    assert datasets[0]._reflection_cache is datasets[1]._reflection_cache is datasource._reflection_cache
+    assert datasets[1].get_table_columns() == ["col_1"]
+
+
+def test_sqlalchemy_datasource_close_stops_query_executor(tmp_path_factory):
+    db_file = os.path.join(str(tmp_path_factory.mktemp("db")), "test.db")
+    datasource = SqlAlchemyDatasource('SqlAlchemy', connection_string="sqlite:///" + db_file,
+                                      max_concurrent_queries=2)
+    pd.DataFrame({'col_1': [1, 2, 3], 'col_2': [4, 5, 6]}).to_sql('table_1', con=datasource.engine, index=False)
+
+    # sqlite tables are bound to a single connection, but virtual batches can be validated concurrently
+    batch = datasource.get_batch({"query": "SELECT * FROM table_1", "create_temp_table": False})
+    dataset = Validator(batch, expectation_suite=ExpectationSuite("test"),
+                        expectation_engine=SqlAlchemyDataset).get_dataset()
+    assert dataset._query_executor is datasource._query_executor
+    dataset.expect_column_values_to_not_be_null("col_1")
+    dataset.expect_column_values_to_not_be_null("col_2")
+    assert dataset.validate().success is True
+    assert datasource._query_executor._pool is not None
+
+    datasource.close()
+    assert datasource._query_executor._pool is None
+    # The datasource can still be used after it is closed
+    assert dataset.validate().success is True
+    datasource.close()
+
+
+def test_sqlalchemy_datasource_metric_cache(tmp_path_factory):
+    cache_dir = str(tmp_path_factory.mktemp("cache"))
+    datasource = SqlAlchemyDatasource('SqlAlchemy', connection_string="sqlite://",
+                                      metric_cache={"cache_path": os.path.join(cache_dir, "metrics.db"), "ttl": 3600})
+    pd.DataFrame({'col_1': [1, 2, 3]}).to_sql('table_1', con=datasource.engine, index=False)
+
+    batch = datasource.get_batch({"table": "table_1", "metric_cache_version": "20200301"})
+    dataset = Validator(batch, expectation_suite=ExpectationSuite("test"),
+                        expectation_engine=SqlAlchemyDataset).get_dataset()
+    assert dataset._metric_cache is datasource._metric_cache
+    assert dataset._metric_cache_version == "20200301"
+    assert os.path.isfile(os.path.join(cache_dir, "metrics.db"))
+
+
 def test_sqlalchemy_datasource_query_and_table_handling(sqlitedb_engine):
     # MANUALLY SET DIALECT NAME FOR TEST
     datasource = SqlAlchemyDatasource('SqlAlchemy', engine=sqlitedb_engine)
@@ -182,7 +247,10 @@ def test_sqlalchemy_datasource_query_and_table_handling(sqlitedb_engine):
         datasource.get_batch({
             "query": "select * from foo;"
         })
-    mock_batch.assert_called_once_with(engine=sqlitedb_engine, schema=None, query="select * from foo;", table_name=None)
+    mock_batch.assert_called_once_with(engine=sqlitedb_engine, schema=None, query="select * from foo;", table_name=None,
+                                       create_temp_table=True, reflection_cache=None,
+                                       query_executor=None, instrument_queries=False,
+                                       explain_queries=False)
 
     # Normally, we do not allow both query and table_name
     with mock.patch("great_expectations.dataset.sqlalchemy_dataset.SqlAlchemyBatchReference.__init__",
@@ -191,7 +259,10 @@ def test_sqlalchemy_datasource_query_and_table_handling(sqlitedb_engine):
             "query": "select * from foo;",
             "table_name": "bar"
         })
-    mock_batch.assert_called_once_with(engine=sqlitedb_engine, schema=None, query="select * from foo;", table_name=None)
+    mock_batch.assert_called_once_with(engine=sqlitedb_engine, schema=None, query="select * from foo;", table_name=None,
+                                       create_temp_table=True, reflection_cache=None,
+                                       query_executor=None, instrument_queries=False,
+                                       explain_queries=False)
 
     # Snowflake should require query *and* snowflake_transient_table
     sqlitedb_engine.dialect.name = "snowflake"
@@ -202,4 +273,6 @@ def test_sqlalchemy_datasource_query_and_table_handling(sqlitedb_engine):
             "snowflake_transient_table": "bar"
         })
     mock_batch.assert_called_once_with(engine=sqlitedb_engine, schema=None, query="select * from foo;",
-                                       table_name="bar")
+                                       table_name="bar", create_temp_table=True, reflection_cache=None,
+                                       query_executor=None, instrument_queries=False,
+                                       explain_queries=False)
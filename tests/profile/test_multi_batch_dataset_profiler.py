@@ -0,0 +1,98 @@
+import os
+
+import pandas as pd
+import pytest
+
+from great_expectations.core import ExpectationSuite
+from great_expectations.data_context.data_context import _get_metric_configuration_tuples
+from great_expectations.profile.multi_batch_dataset_profiler import MultiBatchDatasetProfiler
+
+
+@pytest.fixture
+def partitioned_data_context(empty_data_context, tmp_path_factory):
+    base_dir = str(tmp_path_factory.mktemp("partitioned_asset"))
+    empty_data_context.add_datasource(
+        "partitioned_datasource",
+        module_name="great_expectations.datasource",
+        class_name="PandasDatasource",
+    )
+    empty_data_context.add_store("metrics_store", {
+        "class_name": "MetricStore",
+        "store_backend": {"class_name": "InMemoryStoreBackend"}
+    })
+    return empty_data_context, base_dir
+
+
+def _write_partition(base_dir, day, df):
+    path = os.path.join(base_dir, "events_%s.csv" % day)
+    df.to_csv(path, index=False)
+    return {"datasource": "partitioned_datasource", "path": path}
+
+
+def _expectation_kwargs(suite, expectation_type, column=None):
+    matches = [expectation.kwargs for expectation in suite.expectations
+               if expectation.expectation_type == expectation_type and expectation.kwargs.get("column") == column]
+    assert len(matches) == 1
+    return matches[0]
+
+
+def test_multi_batch_profiler_profiles_only_new_partitions(partitioned_data_context):
+    context, base_dir = partitioned_data_context
+    batch_kwargs_list = [
+        _write_partition(base_dir, "2020-01-01", pd.DataFrame({
+            "amount": [1.0, 2.0, 3.0, 4.0], "status": ["ok", "ok", "failed", "ok"]
+        })),
+        _write_partition(base_dir, "2020-01-02", pd.DataFrame({
+            "amount": [2.0, 4.0, None, 6.0, 8.0], "status": ["ok", "ok", "ok", "ok", None]
+        })),
+    ]
+
+    suite, validation_results = MultiBatchDatasetProfiler.profile_batches(context, batch_kwargs_list, "events")
+    assert len(validation_results) == 2
+    assert suite.meta["MultiBatchDatasetProfiler"]["batch_count"] == 2
+    assert _expectation_kwargs(suite, "expect_table_row_count_to_be_between") == {"min_value": 4, "max_value": 5}
+    assert _expectation_kwargs(suite, "expect_column_min_to_be_between", "amount") == {
+        "column": "amount", "min_value": 1.0, "max_value": 2.0
+    }
+    assert _expectation_kwargs(suite, "expect_column_mean_to_be_between", "amount") == {
+        "column": "amount", "min_value": 2.5, "max_value": 5.0
+    }
+    assert _expectation_kwargs(suite, "expect_column_values_to_not_be_null", "amount") == {
+        "column": "amount", "mostly": 0.8
+    }
+    assert sorted(_expectation_kwargs(suite, "expect_column_values_to_be_in_set", "status")["value_set"]) == [
+        "failed", "ok"
+    ]
+
+    batch_kwargs_list.append(_write_partition(base_dir, "2020-01-03", pd.DataFrame({
+        "amount": [10.0, 20.0], "status": ["ok", "retried"]
+    })))
+    suite, validation_results = MultiBatchDatasetProfiler.profile_batches(context, batch_kwargs_list, "events")
+    assert len(validation_results) == 1
+    assert suite.meta["MultiBatchDatasetProfiler"]["batch_count"] == 3
+    assert _expectation_kwargs(suite, "expect_table_row_count_to_be_between") == {"min_value": 2, "max_value": 5}
+    assert _expectation_kwargs(suite, "expect_column_values_to_be_between", "amount") == {
+        "column": "amount", "min_value": 1.0, "max_value": 20.0
+    }
+    assert sorted(_expectation_kwargs(suite, "expect_column_values_to_be_in_set", "status")["value_set"]) == [
+        "failed", "ok", "retried"
+    ]
+
+    # The suite built from the history validates every partition
+    for batch_kwargs in batch_kwargs_list:
+        batch = context.get_batch(batch_kwargs, suite)
+        assert batch.validate().success
+
+
+def test_multi_batch_profiler_partition_id_ignores_ge_batch_id():
+    partition_id = MultiBatchDatasetProfiler.get_partition_id({"path": "a.csv", "ge_batch_id": "1"})
+    assert partition_id == MultiBatchDatasetProfiler.get_partition_id({"path": "a.csv", "ge_batch_id": "2"})
+    assert partition_id != MultiBatchDatasetProfiler.get_partition_id({"path": "b.csv"})
+    with pytest.raises(ValueError):
+        MultiBatchDatasetProfiler.get_partition_id({"ge_batch_id": "1"})
+
+
+def test_metric_configuration_tuples_keep_kwargs_of_each_column():
+    assert _get_metric_configuration_tuples({"column": {"a": ["metric_1"], "b": ["metric_2"]}}) == [
+        ("metric_1", {"column": "a"}), ("metric_2", {"column": "b"})
+    ]
@@ -1,8 +1,12 @@
 import json
 import os
+import shutil
 from collections import OrderedDict
 
+import numpy as np
+import pandas as pd
 import pytest
+from mock import patch
 from six import PY2
 
 import great_expectations as ge
@@ -461,3 +465,138 @@ def test_snapshot_BasicDatasetProfiler_on_titanic():
     # DISABLE TEST IN PY2 BECAUSE OF ORDER ISSUE AND NEAR-EOL
     if not PY2:
         assert expected_evrs == evrs
+
+
+def test_BasicDatasetProfiler_bulk_aggregates_do_not_change_results(titanic_sqlite_db):
+    from great_expectations.dataset import SqlAlchemyDataset
+
+    # Without caching the profiler cannot use prefetched aggregates, so every statistic is queried separately
+    profiled = []
+    for caching in [True, False]:
+        dataset = SqlAlchemyDataset("titanic", engine=titanic_sqlite_db, caching=caching)
+        suite, evrs = BasicDatasetProfiler.profile(dataset)
+        profiled.append((suite, evrs))
+
+    (bulk_suite, bulk_evrs), (suite, evrs) = profiled
+    assert bulk_suite.expectations == suite.expectations
+
+    def to_json_dict_without_traceback(evr):
+        # Cached getters are wrapped, so the tracebacks of the exceptions that they raise have more frames
+        evr_dict = evr.to_json_dict()
+        evr_dict["exception_info"].pop("exception_traceback", None)
+        return evr_dict
+
+    assert [to_json_dict_without_traceback(evr) for evr in bulk_evrs.results] == \
+        [to_json_dict_without_traceback(evr) for evr in evrs.results]
+
+
+def test_BasicDatasetProfiler_infers_column_types_without_evaluating_type_expectations():
+    dataset = PandasDataset({
+        "int": [1, 2, 3, None],
+        "float": [1.5, 2.5, 3.5, 4.5],
+        "string": ["a", "b", None, "d"],
+        "bool": [True, False, True, True],
+        "date": pd.to_datetime(["2020-01-01", "2020-01-02", "2020-01-03", "2020-01-04"]),
+        "mixed": ["a", 1, 2.5, None],
+    })
+    assert [BasicDatasetProfiler._infer_column_type(dataset, column) for column in dataset.columns] == [
+        "float", "float", "string", "bool", "datetime", "unknown"
+    ]
+
+    with patch.object(PandasDataset, "_expect_column_values_to_be_in_type_list__map", autospec=True,
+                      side_effect=PandasDataset._expect_column_values_to_be_in_type_list__map) as type_map:
+        suite, evrs = BasicDatasetProfiler.profile(dataset)
+
+    # The type expectation of each object column is only evaluated by the validation of the profiler
+    assert type_map.call_count == 2
+    for column in dataset.columns:
+        column_expectations = [expectation for expectation in suite.expectations
+                               if expectation.kwargs.get("column") == column]
+        assert column_expectations[0].expectation_type == "expect_column_values_to_be_in_type_list"
+        assert len([expectation for expectation in column_expectations
+                    if expectation.expectation_type == "expect_column_values_to_be_in_type_list"]) == 1
+    type_results = [evr for evr in evrs.results
+                    if evr.expectation_config.expectation_type == "expect_column_values_to_be_in_type_list"]
+    assert all(evr.success for evr in type_results)
+
+
+def test_BasicDatasetProfiler_with_sample():
+    np.random.seed(0)
+    values = np.round(np.random.normal(10, 2, 5000), 1)
+    dataset = PandasDataset({"x": values, "y": np.where(np.arange(5000) % 10 == 0, None, "a")})
+
+    suite, evrs = BasicDatasetProfiler.profile(dataset, sample={"n": 1000, "seed": 42})
+
+    sample_meta = suite.meta["BasicDatasetProfiler"]["sample"]
+    assert sample_meta["n"] == 1000
+    assert sample_meta["seed"] == 42
+    assert sample_meta["sample_size"] == 1000
+    assert sample_meta["confidence_level"] == 0.95
+
+    intervals = sample_meta["confidence_intervals"]
+    lower, upper = intervals["x"]["expect_column_mean_to_be_between.result.observed_value"]
+    assert lower < values.mean() < upper
+    lower, upper = intervals["x"]["expect_column_median_to_be_between.result.observed_value"]
+    assert lower <= np.median(values) <= upper
+    assert len(intervals["x"]["expect_column_quantile_values_to_be_between.result.observed_value.values"]) == 5
+    lower, upper = intervals["y"]["expect_column_values_to_not_be_null.result.unexpected_percent"]
+    assert lower < 10 < upper
+
+    row_count_evr = [evr for evr in evrs.results
+                     if evr.expectation_config.expectation_type == "expect_table_row_count_to_be_between"][0]
+    assert row_count_evr.result["observed_value"] == 1000
+    json.dumps(suite.meta)
+
+    suite, evrs = BasicDatasetProfiler.profile(dataset, sample=0.1)
+    assert suite.meta["BasicDatasetProfiler"]["sample"]["fraction"] == 0.1
+    assert suite.meta["BasicDatasetProfiler"]["sample"]["sample_size"] == 500
+
+    with pytest.raises(ValueError):
+        BasicDatasetProfiler.profile(dataset, sample="all")
+
+
+def test_BasicDatasetProfiler_concurrent_column_validation():
+    dataset = PandasDataset({
+        "x": [1, 2, 3, 4, 5, None],
+        "y": ["a", "b", "b", "c", "c", "c"],
+        "z": [1.5, 2.5, 2.5, 3.5, None, None],
+    })
+
+    suite, evrs = BasicDatasetProfiler.profile(dataset)
+    concurrent_suite, concurrent_evrs = BasicDatasetProfiler.profile(dataset, max_workers=3)
+
+    assert concurrent_suite.expectations == suite.expectations
+    assert concurrent_evrs.statistics == evrs.statistics
+    assert [evr.to_json_dict() for evr in concurrent_evrs.results] == [evr.to_json_dict() for evr in evrs.results]
+
+
+def test_context_profiler_with_max_workers(not_empty_datacontext, filesystem_csv_2):
+    context = not_empty_datacontext
+    for filename in ["f2.csv", "f3.csv"]:
+        shutil.copy(os.path.join(str(filesystem_csv_2), "f1.csv"), os.path.join(str(filesystem_csv_2), filename))
+
+    profiling_result = context.profile_datasource(
+        "rad_datasource", profiler=BasicDatasetProfiler, max_workers=2, max_column_workers=2
+    )
+
+    assert profiling_result["success"]
+    assert [suite.expectation_suite_name for suite, evrs in profiling_result["results"]] == [
+        "rad_datasource.subdir_reader.%s.BasicDatasetProfiler" % name for name in ["f1", "f2", "f3"]
+    ]
+    assert len(context.list_expectation_suites()) == 3
+    assert len(context.validations_store.list_keys()) == 3
+
+
+def test_context_profile_data_asset_without_saving_results(not_empty_datacontext):
+    context = not_empty_datacontext
+
+    profiling_result = context.profile_data_asset(
+        "rad_datasource", "subdir_reader", "f1", profiler=BasicDatasetProfiler, save_results=False
+    )
+
+    assert profiling_result["success"]
+    suite, evrs = profiling_result["results"][0]
+    assert suite.expectation_suite_name == "rad_datasource.subdir_reader.f1.BasicDatasetProfiler"
+    assert len(suite.expectations) > 0
+    assert context.list_expectation_suites() == []
+    assert context.validations_store.list_keys() == []
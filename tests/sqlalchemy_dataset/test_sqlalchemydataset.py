@@ -2,11 +2,23 @@ try:
     from unittest import mock
 except ImportError:
     import mock
+import datetime
+import json
+import os
+import sqlite3
+from decimal import Decimal
+
 import pytest
 import pandas as pd
 from ..test_utils import get_dataset
 
 from great_expectations.dataset import MetaSqlAlchemyDataset, SqlAlchemyDataset
+from great_expectations.dataset.sqlalchemy_dataset import (
+    SqlAlchemyCachedRow,
+    SqlAlchemyMetricCache,
+    SqlAlchemyQueryExecutor,
+    SqlAlchemyReflectionCache,
+)
 
 @pytest.fixture
 def custom_dataset(sa):
@@ -141,6 +153,31 @@ def test_sqlalchemydataset_with_custom_sql(sa):
     assert result.success is False
 
 
+def test_sqlalchemydataset_with_custom_sql_without_temp_table(sa):
+    engine = sa.create_engine('sqlite://')
+    data = pd.DataFrame({
+        "name": ["Frank", "Steve", "Jane", "Frank", "Michael"],
+        "age": [16, 21, 38, 22, 10],
+    })
+    data.to_sql(name='test_sql_data', con=engine, index=False)
+
+    custom_sql = "SELECT name, age FROM test_sql_data WHERE age > 12;"
+    dataset = SqlAlchemyDataset(engine=engine, custom_sql=custom_sql, create_temp_table=False)
+
+    # Nothing is materialized: the query is a subquery of every validation query
+    assert engine.execute("SELECT count(*) FROM sqlite_temp_master").scalar() == 0
+    assert dataset.get_table_columns() == ["name", "age"]
+    assert dataset.get_row_count() == 4
+    assert dataset.expect_column_values_to_be_unique("name").result["unexpected_count"] == 2
+    assert dataset.expect_column_max_to_be_between("age", 38, 38).success is True
+    assert len(dataset.head(2)) == 2
+
+    # Samples are still materialized so that every expectation sees the same rows
+    sample = dataset.random_sample(n=2)
+    assert sample._create_temp_table is True
+    assert sample.get_row_count() == 2
+
+
 def test_column_fallback(sa):
     engine = sa.create_engine('sqlite://')
 
@@ -208,3 +245,264 @@ def test_sqlalchemy_dataset_unexpected_count_calculations(sa, unexpected_count_d
 def test_result_format_warning(sa, unexpected_count_df):
     with pytest.warns(UserWarning, match=r'Setting result format to COMPLETE for a SqlAlchemyDataset can be dangerous'):
         unexpected_count_df.expect_column_values_to_be_in_set("a", value_set=[1], result_format={"result_format": "COMPLETE", "partial_unexpected_count": 2})
+
+
+@pytest.mark.parametrize("use_window", [True, False])
+def test_expect_column_values_to_be_unique_strategies(sa, use_window):
+    engine = sa.create_engine('sqlite://')
+    pd.DataFrame({
+        "a": [1, 2, 2, 3, 3, 3, None, None, 4],
+    }).to_sql(name='test_unique', con=engine, index=False)
+    dataset = SqlAlchemyDataset('test_unique', engine=engine)
+    # sqlite supports window functions from 3.25, but is not configured to use them by default
+    dataset.window_uniqueness_dialects = ["sqlite"] if use_window else []
+
+    res = dataset.expect_column_values_to_be_unique("a", result_format={"result_format": "SUMMARY",
+                                                                        "partial_unexpected_count": 4})
+    assert res.success is False
+    assert res.result["element_count"] == 9
+    assert res.result["missing_count"] == 2
+    assert res.result["unexpected_count"] == 5
+    assert res.result["partial_unexpected_list"] == [2, 2, 3, 3]
+
+    res = dataset.expect_column_values_to_be_unique("a", mostly=0.2)
+    assert res.success is True
+
+
+def test_expect_multicolumn_values_to_be_unique(sa):
+    engine = sa.create_engine('sqlite://')
+    pd.DataFrame({
+        "a": [1, 2, None, None, 5],
+        "b": [2, 2, None, 4, 6],
+        "c": [3, 4, None, None, 5],
+    }).to_sql(name='test_multicolumn', con=engine, index=False)
+    dataset = SqlAlchemyDataset('test_multicolumn', engine=engine)
+
+    res = dataset.expect_multicolumn_values_to_be_unique(["a", "b", "c"], result_format="COMPLETE")
+    assert res.success is False
+    assert res.result["element_count"] == 5
+    assert res.result["missing_count"] == 1
+    assert res.result["unexpected_list"] == [
+        {"a": 2.0, "b": 2.0, "c": 4.0},
+        {"a": None, "b": 4.0, "c": None},
+        {"a": 5.0, "b": 6.0, "c": 5.0},
+    ]
+
+    res = dataset.expect_multicolumn_values_to_be_unique(["a", "b"], ignore_row_if="any_value_is_missing")
+    assert res.result["missing_count"] == 2
+    assert res.result["unexpected_count"] == 1
+
+    res = dataset.expect_multicolumn_values_to_be_unique(["a", "c"], ignore_row_if="never")
+    assert res.result["unexpected_count"] == 3
+
+
+def test_validate_uses_one_connection(sa):
+    engine = sa.create_engine('sqlite://')
+    pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]}).to_sql(name='test_data', con=engine, index=False)
+    # A virtual batch keeps the engine rather than a single connection
+    dataset = SqlAlchemyDataset(custom_sql="SELECT * FROM test_data", engine=engine, create_temp_table=False)
+    dataset.expect_column_values_to_be_unique("a")
+    dataset.expect_column_max_to_be_between("a", 0, 3)
+    dataset.expect_column_values_to_be_in_set("b", ["x", "y", "z"])
+
+    checkouts = []
+    sa.event.listen(engine, "checkout", lambda *args: checkouts.append(args))
+    result = dataset.validate()
+
+    assert result.success is True
+    assert len(checkouts) == 1
+    assert dataset.engine is engine
+
+
+def test_query_executor_matches_sequential_results(sa, tmp_path_factory):
+    db_file = os.path.join(str(tmp_path_factory.mktemp("db")), "test.db")
+    engine = sa.create_engine("sqlite:///" + db_file)
+    pd.DataFrame({
+        "a": [1, 2, 2, 3, None],
+        "b": ["x", "y", "z", "z", "w"]
+    }).to_sql(name='test_data', con=engine, index=False)
+    query_executor = SqlAlchemyQueryExecutor(max_concurrent_queries=2)
+
+    results = []
+    for executor in [None, query_executor]:
+        # A virtual batch keeps the engine, so the executor can use several connections
+        dataset = SqlAlchemyDataset(custom_sql="SELECT * FROM test_data", engine=engine, create_temp_table=False,
+                                    query_executor=executor)
+        dataset.expect_column_values_to_be_in_set("b", ["x", "y", "z"], result_format="COMPLETE")
+        dataset.expect_column_values_to_be_unique("a", result_format="COMPLETE")
+        dataset.expect_multicolumn_values_to_be_unique(["a", "b"], result_format="COMPLETE")
+        results.append([evr.to_json_dict() for evr in dataset.validate().results])
+
+    assert results[0] == results[1]
+    # The expectations of each column are validated on the executor's threads, each on its own connection
+    checkouts = []
+    sa.event.listen(engine, "checkout", lambda *args: checkouts.append(args))
+    with mock.patch.object(query_executor, "map", wraps=query_executor.map) as executor_map:
+        result = dataset.validate(only_return_failures=True)
+    assert executor_map.call_count == 1
+    assert len(executor_map.call_args[0][1]) == 3
+    # Each of the two worker copies reflects its columns, then each of the three columns is validated on one connection
+    assert len(checkouts) == 5
+    assert result.statistics["evaluated_expectations"] == 3
+    assert [evr.expectation_config.expectation_type for evr in result.results] == [
+        "expect_column_values_to_be_in_set", "expect_column_values_to_be_unique"
+    ]
+
+    with mock.patch.object(query_executor, "_execute_on_new_connection",
+                           wraps=query_executor._execute_on_new_connection) as execute:
+        dataset.expect_column_values_to_be_in_set("b", ["x", "y", "z"])
+    assert execute.call_count == 2
+    query_executor.close()
+
+    with pytest.raises(ValueError):
+        SqlAlchemyQueryExecutor(max_concurrent_queries=0)
+
+
+def test_query_instrumentation(sa):
+    engine = sa.create_engine('sqlite://')
+    pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "q"]}).to_sql(name='test_data', con=engine, index=False)
+    dataset = SqlAlchemyDataset("test_data", engine=engine, explain_queries=True)
+
+    result = dataset.expect_column_values_to_be_in_set("b", ["x", "y", "z"])
+    queries = result.meta["sql_queries"]
+    assert len(queries) == 2
+    assert all(query["sql"].startswith("SELECT") and query["duration_seconds"] >= 0 for query in queries)
+    assert all("test_data" in " ".join(query["plan"]) for query in queries)
+
+    dataset.expect_column_max_to_be_between("a", 0, 3)
+    validation_results = dataset.validate()
+    summary = validation_results.meta["sql_queries"]
+    # The maximum of "a" is cached since the expectation was first evaluated, so only the map expectation queries
+    assert summary["query_count"] == 2
+    assert summary["query_count"] == sum(len(result.meta["sql_queries"]) for result in validation_results.results)
+    durations = [expectation["duration_seconds"] for expectation in summary["expectations"]]
+    assert durations == sorted(durations, reverse=True)
+    assert "plan" in validation_results.results[0].meta["sql_queries"][0]
+
+    # Other datasets of the engine are not instrumented
+    result = SqlAlchemyDataset("test_data", engine=engine).expect_column_max_to_be_between("a", 0, 3)
+    assert "sql_queries" not in result.meta
+
+
+def test_metric_cache(sa, tmp_path_factory):
+    engine = sa.create_engine('sqlite://')
+    pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "q"]}).to_sql(name='test_data', con=engine, index=False)
+    metric_cache = SqlAlchemyMetricCache(os.path.join(str(tmp_path_factory.mktemp("cache")), "metrics.db"))
+    dataset = SqlAlchemyDataset("test_data", engine=engine)
+    dataset.expect_column_values_to_be_in_set("b", ["x", "y", "z"])
+    dataset.expect_column_mean_to_be_between("a", 1, 3)
+    expectation_suite = dataset.get_expectation_suite(discard_failed_expectations=False)
+
+    def validate(**kwargs):
+        statements = []
+
+        def record_statement(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        dataset = SqlAlchemyDataset("test_data", engine=engine, expectation_suite=expectation_suite,
+                                    metric_cache=metric_cache, **kwargs)
+        sa.event.listen(engine, "before_cursor_execute", record_statement)
+        try:
+            return dataset.validate(), statements
+        finally:
+            sa.event.remove(engine, "before_cursor_execute", record_statement)
+
+    results, statements = validate(metric_cache_version="2020-03-01")
+    # Two queries for the map expectation; the row count, non-null count and mean for the aggregate expectation
+    assert len(statements) == 5
+    assert len(metric_cache) == 5
+    cached_results, statements = validate(metric_cache_version="2020-03-01")
+    assert len(statements) == 0
+    assert cached_results.results == results.results
+
+    # Without a version or a version query, the metric cache is not used
+    results, statements = validate()
+    assert len(statements) == 5
+    assert len(metric_cache) == 5
+    assert results.results == cached_results.results
+
+    engine.execute("INSERT INTO test_data VALUES (4, 'z')")
+    results, statements = validate(metric_cache_version_query="SELECT max(a) FROM test_data")
+    assert len(statements) == 6
+    assert results.results[1].result["observed_value"] == 2.5
+
+
+def test_metric_cache_version_query_is_run_for_each_evaluation(sa, tmp_path_factory):
+    engine = sa.create_engine('sqlite://')
+    pd.DataFrame({"a": [1, 2, 3]}).to_sql(name='test_data', con=engine, index=False)
+    metric_cache = SqlAlchemyMetricCache(os.path.join(str(tmp_path_factory.mktemp("cache")), "metrics.db"))
+    # Without caching, getters are evaluated again by each expectation
+    dataset = SqlAlchemyDataset("test_data", engine=engine, metric_cache=metric_cache, caching=False,
+                                metric_cache_version_query="SELECT max(a) FROM test_data")
+
+    assert dataset.expect_column_max_to_be_between("a", 0, 10).result["observed_value"] == 3
+    # The table changes outside of validate, so the version is resolved again for the next evaluation
+    engine.execute("INSERT INTO test_data VALUES (4)")
+    assert dataset.expect_column_max_to_be_between("a", 0, 10).result["observed_value"] == 4
+    assert dataset._resolved_metric_cache_version is None
+
+    statements = []
+    sa.event.listen(engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+    dataset.validate()
+    assert statements.count("SELECT max(a) FROM test_data") == 1
+
+
+def test_metric_cache_stores_rows_as_json(tmp_path_factory):
+    cache_path = os.path.join(str(tmp_path_factory.mktemp("cache")), "metrics.db")
+    metric_cache = SqlAlchemyMetricCache(cache_path)
+    row = SqlAlchemyCachedRow(
+        ["decimal", "datetime", "date", "bytes", "text", "count"],
+        [Decimal("1.50"), datetime.datetime(2020, 3, 1, 12, 30, 15, 250), datetime.date(2020, 3, 1), b"\x00\x01",
+         "x", 3]
+    )
+    metric_cache.set("key", [row, (None, 2.5)])
+
+    rows = metric_cache.get("key")
+    assert rows == [tuple(row), (None, 2.5)]
+    assert dict(rows[0]) == dict(zip(row.keys(), row))
+    assert rows[0]["decimal"] == Decimal("1.50")
+    assert isinstance(rows[0]["datetime"], datetime.datetime)
+    with sqlite3.connect(cache_path) as connection:
+        value = connection.execute("SELECT value FROM ge_metric_cache").fetchone()[0]
+    assert json.loads(value)[1] == {"keys": None, "values": [None, 2.5]}
+
+    # Rows that cannot be stored as JSON are not cached, and entries that are not JSON are ignored
+    metric_cache.set("other", [(object(),)])
+    assert metric_cache.get("other") is None
+    with sqlite3.connect(cache_path) as connection:
+        connection.execute("UPDATE ge_metric_cache SET value = ?", (sqlite3.Binary(b"\x80\x02]q\x00."),))
+    assert metric_cache.get("key") is None
+    assert len(metric_cache) == 0
+
+
+def test_metric_cache_eviction(tmp_path_factory):
+    cache_path = os.path.join(str(tmp_path_factory.mktemp("cache")), "metrics.db")
+    metric_cache = SqlAlchemyMetricCache(cache_path, max_entries=2)
+    for key in ["a", "b", "c"]:
+        metric_cache.set(key, [(key,)])
+    assert len(metric_cache) == 2
+    assert metric_cache.get("a") is None
+    assert metric_cache.get("c") == [("c",)]
+
+    metric_cache = SqlAlchemyMetricCache(cache_path, ttl=-1)
+    assert metric_cache.get("c") is None
+    assert len(metric_cache) == 1
+
+
+def test_reflection_cache(sa):
+    engine = sa.create_engine('sqlite://')
+    pd.DataFrame({"a": [1, 2, 3]}).to_sql(name='test_data', con=engine, index=False)
+    reflection_cache = SqlAlchemyReflectionCache(ttl=60)
+
+    dataset = SqlAlchemyDataset("test_data", engine=engine, reflection_cache=reflection_cache)
+    with mock.patch("great_expectations.dataset.sqlalchemy_dataset.reflection.Inspector.from_engine") as inspector:
+        cached_dataset = SqlAlchemyDataset("test_data", engine=engine, reflection_cache=reflection_cache)
+    assert not inspector.called
+    assert cached_dataset.columns == dataset.columns
+
+    reflection_cache = SqlAlchemyReflectionCache(ttl=0)
+    SqlAlchemyDataset("test_data", engine=engine, reflection_cache=reflection_cache)
+    with mock.patch("great_expectations.dataset.sqlalchemy_dataset.reflection.Inspector.from_engine",
+                    wraps=sa.engine.reflection.Inspector.from_engine) as inspector:
+        SqlAlchemyDataset("test_data", engine=engine, reflection_cache=reflection_cache)
+    assert inspector.called
@@ -163,3 +163,32 @@ def test_get_column_value_counts(test_backend):
     expected.index.name = "value"
     expected.name = "count"
     assert res.equals(expected)
+
+
+def test_get_column_value_counts_limits(test_backend):
+    schemas = {
+        "SparkDFDataset": {
+            "a": "StringType",
+        }
+    }
+    data = {
+        "a": ["a", "b", "b", "c", "c", "c", "d", "d", "d", "d", None],
+    }
+    dataset = get_dataset(test_backend, data, schemas=schemas)
+
+    res = dataset.get_column_value_counts("a", top_k=2)
+    assert list(res.index) == ["c", "d"]
+    assert list(res) == [3, 4]
+
+    res = dataset.get_column_value_counts("a", sort="count", top_k=3)
+    assert list(res.index) == ["d", "c", "b"]
+
+    # At most max_distinct + 1 values, so that exceeding the limit can be detected
+    assert len(dataset.get_column_value_counts("a", max_distinct=2)) == 3
+    assert len(dataset.get_column_value_counts("a", max_distinct=4)) == 4
+
+    result = dataset.expect_column_distinct_values_to_be_in_set("a", ["a", "b"], result_format="BOOLEAN_ONLY")
+    assert result.success is False
+    result = dataset.expect_column_distinct_values_to_equal_set("a", ["a", "b", "c", "d"],
+                                                                result_format="BOOLEAN_ONLY")
+    assert result.success is True
@@ -335,12 +335,12 @@ def get_dataset(dataset_type, data, schemas=None, profiler=ColumnsExistProfiler,
 def candidate_getter_is_on_temporary_notimplemented_list(context, getter):
     if context in ["sqlite"]:
         return getter in [
-            'get_column_modes',
+            # 'get_column_modes',
             'get_column_stdev'
         ]
     if context in ["postgresql", "mysql"]:
         return getter in [
-            'get_column_modes'
+            # 'get_column_modes'
         ]
     if context == 'SparkDFDataset':
         return getter in []
@@ -382,7 +382,7 @@ def candidate_test_is_on_temporary_notimplemented_list(context, expectation_type
             "expect_column_stdev_to_be_between",
             # "expect_column_unique_value_count_to_be_between",
             # "expect_column_proportion_of_unique_values_to_be_between",
-            "expect_column_most_common_value_to_be_in_set",
+            # "expect_column_most_common_value_to_be_in_set",
             # "expect_column_sum_to_be_between",
             # "expect_column_min_to_be_between",
             # "expect_column_max_to_be_between",
@@ -393,7 +393,7 @@ def candidate_test_is_on_temporary_notimplemented_list(context, expectation_type
             "expect_column_pair_values_to_be_equal",
             "expect_column_pair_values_A_to_be_greater_than_B",
             "expect_column_pair_values_to_be_in_set",
-            "expect_multicolumn_values_to_be_unique"
+            # "expect_multicolumn_values_to_be_unique"
         ]
     if context == "SparkDFDataset":
         return expectation_type in [